@@ -4,6 +4,10 @@ import subprocess
 # third party
 import numpy as np
 import pyperf
+from syft_benchmarks import run_action_suite
+from syft_benchmarks import run_adp_suite
+from syft_benchmarks import run_message_suite
+from syft_benchmarks import run_recursive_serde_suite
 from syft_benchmarks import run_rept_suite
 from syft_benchmarks import run_sept_suite
 
@@ -32,6 +36,12 @@ def run_suite() -> None:
         lower_bound=inf.min,
         upper_bound=inf.max,
     )
+    run_message_suite(runner=runner, n_args=50)
+    run_recursive_serde_suite(
+        runner=runner, rows=100, cols=10, lower_bound=inf.min, upper_bound=inf.max
+    )
+    run_action_suite(runner=runner, sizes=[10**3, 10**5, 10**7])
+    run_adp_suite(runner=runner, n_scalars=100)
 
 
 run_suite()
@@ -1,3 +1,7 @@
 # relative
+from .actions.suite import run_action_suite  # noqa: F401
+from .adp.suite import run_adp_suite  # noqa: F401
+from .messages.suite import run_message_suite  # noqa: F401
+from .recursive_serde.suite import run_recursive_serde_suite  # noqa: F401
 from .repts.suite import run_rept_suite  # noqa: F401
 from .septs.suite import run_sept_suite  # noqa: F401
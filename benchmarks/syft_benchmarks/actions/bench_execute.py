@@ -0,0 +1,17 @@
+# third party
+import pyperf
+
+# relative
+from .util import make_method_action
+from .util import make_node_and_client
+
+
+def create_bench_method_execute(runner: pyperf.Runner, path: str, size: int) -> None:
+    node, client = make_node_and_client()
+    action = make_method_action(client, path, size)
+
+    def execute() -> None:
+        action.execute_action(node=node, verify_key=client.verify_key)
+
+    method_name = path.split(".")[-1]
+    runner.bench_func(f"execute_method_{method_name}_size_{size}", execute)
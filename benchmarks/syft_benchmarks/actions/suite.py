@@ -0,0 +1,16 @@
+# stdlib
+from typing import List
+
+# third party
+import pyperf
+
+# relative
+from .bench_execute import create_bench_method_execute
+
+
+def run_action_suite(runner: pyperf.Runner, sizes: List[int]) -> None:
+    # sum is known to be pure so self isn't snapshotted, unique is not known to be
+    # pure so self is serialized before and after the call
+    for size in sizes:
+        create_bench_method_execute(runner, "torch.Tensor.sum", size)
+        create_bench_method_execute(runner, "torch.Tensor.unique", size)
@@ -0,0 +1,31 @@
+# stdlib
+from typing import Tuple
+
+# third party
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
+from syft.core.node.common.client import Client
+from syft.core.node.vm.vm import VirtualMachine
+
+
+def make_node_and_client() -> Tuple[VirtualMachine, Client]:
+    node = sy.VirtualMachine(name="bob")
+    return node, node.get_root_client()
+
+
+def make_method_action(client: Client, path: str, size: int) -> RunClassMethodAction:
+    """Build a RunClassMethodAction calling path on a tensor of size floats which
+    is already stored on the node of the client"""
+    ptr = th.rand(size).send(client)
+    return RunClassMethodAction(
+        path=path,
+        _self=ptr,
+        args=[],
+        kwargs={},
+        id_at_location=UID(),
+        address=client.address,
+    )
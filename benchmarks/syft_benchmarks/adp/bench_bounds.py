@@ -0,0 +1,28 @@
+# third party
+import pyperf
+
+# syft absolute
+from syft.core.adp.publish import get_mechanism_inputs
+from syft.core.adp.search import flatten_and_maximize_poly
+
+# relative
+from .util import make_phi_polynomials
+
+
+def create_bench_publish_inputs_interval(runner: pyperf.Runner, n_scalars: int) -> None:
+    def publish_inputs() -> None:
+        # the bounds are cached on the scalars, so fresh ones are needed every time
+        get_mechanism_inputs(make_phi_polynomials(n_scalars), public_only=True)
+
+    runner.bench_func(f"publish_inputs_interval_n_{n_scalars}", publish_inputs)
+
+
+def create_bench_publish_inputs_shgo(runner: pyperf.Runner, n_scalars: int) -> None:
+    def publish_inputs() -> None:
+        scalars = make_phi_polynomials(n_scalars)
+        for scalar in scalars:
+            scalar._min_val = float(flatten_and_maximize_poly(scalar.poly)[-1].fun)
+            scalar._max_val = float(-flatten_and_maximize_poly(-scalar.poly)[-1].fun)
+        get_mechanism_inputs(scalars, public_only=True)
+
+    runner.bench_func(f"publish_inputs_shgo_n_{n_scalars}", publish_inputs)
@@ -0,0 +1,12 @@
+# third party
+import pyperf
+
+# relative
+from .bench_bounds import create_bench_publish_inputs_interval
+from .bench_bounds import create_bench_publish_inputs_shgo
+
+
+def run_adp_suite(runner: pyperf.Runner, n_scalars: int) -> None:
+    # bounding the scalars with interval arithmetic against searching with SHGO
+    create_bench_publish_inputs_interval(runner, n_scalars)
+    create_bench_publish_inputs_shgo(runner, n_scalars)
@@ -0,0 +1,20 @@
+# stdlib
+from typing import List
+
+# syft absolute
+from syft.core.adp.entity import Entity
+from syft.core.adp.scalar.abstract.intermediate_scalar import IntermediateScalar
+from syft.core.adp.scalar.phi_scalar import PhiScalar
+
+
+def make_phi_polynomials(n_scalars: int) -> List[IntermediateScalar]:
+    """Build n_scalars polynomials of the kind DP tensors produce (sums, scalar
+    products and low-degree products), each over the data of one entity"""
+    scalars: List[IntermediateScalar] = []
+    for i in range(n_scalars):
+        entity = Entity(name=f"entity_{i}")
+        x = PhiScalar(min_val=0, value=1, max_val=5, entity=entity)
+        y = PhiScalar(min_val=-2, value=1, max_val=3, entity=entity)
+        z = PhiScalar(min_val=1, value=2, max_val=4, entity=entity)
+        scalars.append(x * y + z * 3 - x * z)
+    return scalars
@@ -0,0 +1,34 @@
+# stdlib
+import functools
+
+# third party
+import pyperf
+
+# syft absolute
+import syft as sy
+
+# relative
+from .util import make_client
+from .util import make_signed_action
+
+
+def create_bench_nested_message_deserialize(runner: pyperf.Runner, n_args: int) -> None:
+    client = make_client()
+    serialized_msg = sy.serialize(make_signed_action(client, n_args), to_bytes=True)
+    partially_evaluated_func = functools.partial(
+        sy.deserialize, serialized_msg, from_bytes=True
+    )
+    runner.bench_func(
+        f"deserialize_nested_message_args_{n_args}", partially_evaluated_func
+    )
+
+
+def create_bench_nested_action_deserialize(runner: pyperf.Runner, n_args: int) -> None:
+    client = make_client()
+    signed_msg = make_signed_action(client, n_args)
+    partially_evaluated_func = functools.partial(
+        sy.deserialize, signed_msg.serialized_message, from_bytes=True
+    )
+    runner.bench_func(
+        f"deserialize_nested_action_args_{n_args}", partially_evaluated_func
+    )
@@ -0,0 +1,11 @@
+# third party
+import pyperf
+
+# relative
+from .bench_deserialization import create_bench_nested_action_deserialize
+from .bench_deserialization import create_bench_nested_message_deserialize
+
+
+def run_message_suite(runner: pyperf.Runner, n_args: int) -> None:
+    create_bench_nested_message_deserialize(runner, n_args)
+    create_bench_nested_action_deserialize(runner, n_args)
@@ -0,0 +1,31 @@
+# third party
+from nacl.signing import SigningKey
+
+# syft absolute
+import syft as sy
+from syft.core.common.message import SignedImmediateSyftMessageWithoutReply
+from syft.core.common.uid import UID
+from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
+from syft.core.node.common.client import Client
+
+
+def make_client() -> Client:
+    return sy.VirtualMachine(name="bob").get_root_client()
+
+
+def make_signed_action(
+    client: Client, n_args: int
+) -> SignedImmediateSyftMessageWithoutReply:
+    """Build a SignedMessage -> RunClassMethodAction -> Pointer -> UID nesting with
+    lots of small objects and no large payload, so that the time spent is dominated
+    by resolving the types of the nested messages"""
+    ptr = sy.lib.python.List([1, 2, 3]).send(client)
+    action = RunClassMethodAction(
+        path="syft.lib.python.List.append",
+        _self=ptr,
+        args=[ptr for _ in range(n_args)],
+        kwargs={f"kwarg_{i}": ptr for i in range(n_args)},
+        id_at_location=UID(),
+        address=client.address,
+    )
+    return action.sign(signing_key=SigningKey.generate())
@@ -0,0 +1,32 @@
+# stdlib
+import functools
+
+# third party
+import pyperf
+
+# syft absolute
+import syft as sy
+
+# relative
+from .util import flat_recursive_serde
+from .util import make_gamma
+
+
+def create_bench_gamma_deserialize(
+    runner: pyperf.Runner,
+    rows: int,
+    cols: int,
+    lower_bound: int,
+    upper_bound: int,
+    flat: bool,
+) -> None:
+    gamma = make_gamma(rows, cols, lower_bound, upper_bound)
+    with flat_recursive_serde(flat):
+        serialized_gamma = sy.serialize(gamma, to_bytes=True)
+    partially_evaluated_func = functools.partial(
+        sy.deserialize, serialized_gamma, from_bytes=True
+    )
+    layout = "flat" if flat else "nested"
+    runner.bench_func(
+        f"deserialize_{layout}_gamma_rows_{rows}_cols_{cols}", partially_evaluated_func
+    )
@@ -0,0 +1,27 @@
+# third party
+import pyperf
+
+# syft absolute
+import syft as sy
+
+# relative
+from .util import flat_recursive_serde
+from .util import make_gamma
+
+
+def create_bench_gamma_serialize(
+    runner: pyperf.Runner,
+    rows: int,
+    cols: int,
+    lower_bound: int,
+    upper_bound: int,
+    flat: bool,
+) -> None:
+    gamma = make_gamma(rows, cols, lower_bound, upper_bound)
+
+    def serialize() -> bytes:
+        with flat_recursive_serde(flat):
+            return sy.serialize(gamma, to_bytes=True)
+
+    layout = "flat" if flat else "nested"
+    runner.bench_func(f"serialize_{layout}_gamma_rows_{rows}_cols_{cols}", serialize)
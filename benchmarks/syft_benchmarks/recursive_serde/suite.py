@@ -0,0 +1,16 @@
+# third party
+import pyperf
+
+# relative
+from .bench_deserialization import create_bench_gamma_deserialize
+from .bench_serialization import create_bench_gamma_serialize
+
+
+def run_recursive_serde_suite(
+    runner: pyperf.Runner, rows: int, cols: int, lower_bound: int, upper_bound: int
+) -> None:
+    for flat in [False, True]:
+        create_bench_gamma_serialize(runner, rows, cols, lower_bound, upper_bound, flat)
+        create_bench_gamma_deserialize(
+            runner, rows, cols, lower_bound, upper_bound, flat
+        )
@@ -0,0 +1,29 @@
+# stdlib
+from contextlib import contextmanager
+from typing import Iterator
+
+# syft absolute
+from syft.core.tensor.autodp.dp_tensor_converter import convert_to_gamma_tensor
+from syft.core.tensor.autodp.initial_gamma import InitialGammaTensor
+from syft.experimental_flags import flags
+
+# relative
+from ..septs.util import generate_data
+from ..septs.util import make_sept
+
+
+def make_gamma(
+    rows: int, cols: int, lower_bound: int, upper_bound: int
+) -> InitialGammaTensor:
+    data = generate_data(rows, cols, lower_bound, upper_bound)
+    return convert_to_gamma_tensor(make_sept(data, upper_bound, lower_bound))
+
+
+@contextmanager
+def flat_recursive_serde(flat: bool) -> Iterator[None]:
+    previous = flags.FLAT_RECURSIVE_SERDE
+    flags.FLAT_RECURSIVE_SERDE = flat
+    try:
+        yield
+    finally:
+        flags.FLAT_RECURSIVE_SERDE = previous
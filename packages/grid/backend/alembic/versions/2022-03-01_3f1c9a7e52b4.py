@@ -0,0 +1,37 @@
+"""store the object type and how to point to it as meta information
+
+Revision ID: 3f1c9a7e52b4
+Revises: 70fcad0b1795
+Create Date: 2022-03-01 11:02:41.218377
+
+"""
+# third party
+from alembic import op  # type: ignore
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3f1c9a7e52b4"
+down_revision = "70fcad0b1795"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "obj_metadata",
+        sa.Column("object_type", sa.String(), nullable=True),
+    )
+    op.add_column(
+        "obj_metadata",
+        sa.Column("pointer_path", sa.String(), nullable=True),
+    )
+    op.add_column(
+        "obj_metadata",
+        sa.Column("own_pointer", sa.Boolean(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("obj_metadata", "own_pointer")
+    op.drop_column("obj_metadata", "pointer_path")
+    op.drop_column("obj_metadata", "object_type")
@@ -0,0 +1,71 @@
+"""index the search permissions of the objects
+
+Revision ID: 9b2e41d7c6a0
+Revises: 3f1c9a7e52b4
+Create Date: 2022-03-04 16:27:09.548120
+
+"""
+# third party
+from alembic import op  # type: ignore
+import sqlalchemy as sa
+
+# syft absolute
+from syft.core.node.common.node_table.bin_obj_metadata import deserialize_permissions
+from syft.core.node.common.node_table.bin_obj_metadata import search_permission_key
+
+# revision identifiers, used by Alembic.
+revision = "9b2e41d7c6a0"
+down_revision = "3f1c9a7e52b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    obj_search_permission = op.create_table(
+        "obj_search_permission",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("obj", sa.String(length=256), nullable=True),
+        sa.Column("verify_key", sa.String(length=256), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_obj_search_permission_obj"),
+        "obj_search_permission",
+        ["obj"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_obj_search_permission_verify_key"),
+        "obj_search_permission",
+        ["verify_key"],
+        unique=False,
+    )
+
+    # index the search permissions of the objects which are already stored
+    obj_metadata = sa.table(
+        "obj_metadata",
+        sa.column("obj", sa.String()),
+        sa.column("search_permissions", sa.JSON()),
+    )
+    rows = op.get_bind().execute(
+        sa.select([obj_metadata.c.obj, obj_metadata.c.search_permissions])
+    )
+    op.bulk_insert(
+        obj_search_permission,
+        [
+            {"obj": obj, "verify_key": search_permission_key(verify_key)}
+            for obj, search_permissions in rows
+            if search_permissions
+            for verify_key in deserialize_permissions(search_permissions).keys()
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_obj_search_permission_verify_key"), table_name="obj_search_permission"
+    )
+    op.drop_index(
+        op.f("ix_obj_search_permission_obj"), table_name="obj_search_permission"
+    )
+    op.drop_table("obj_search_permission")
@@ -0,0 +1,85 @@
+"""accumulate the RDP spent on every entity by every user
+
+Revision ID: c4a1e97d52f3
+Revises: 9b2e41d7c6a0
+Create Date: 2022-03-09 11:42:37.216904
+
+"""
+# stdlib
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# third party
+from alembic import op  # type: ignore
+import sqlalchemy as sa
+
+# syft absolute
+from syft import deserialize
+from syft.core.adp.idp_gaussian_mechanism import individual_RDP_gaussian_curve
+
+# revision identifiers, used by Alembic.
+revision = "c4a1e97d52f3"
+down_revision = "9b2e41d7c6a0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    rdp_accumulator = op.create_table(
+        "rdp_accumulator",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("entity_name", sa.String(length=1024), nullable=True),
+        sa.Column("user_key", sa.LargeBinary(length=2048), nullable=True),
+        sa.Column("private_rdp", sa.Float(), nullable=True),
+        sa.Column("public_rdp", sa.Float(), nullable=True),
+        sa.Column("n_mechanisms", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_rdp_accumulator_entity_name"),
+        "rdp_accumulator",
+        ["entity_name"],
+        unique=False,
+    )
+
+    # sum up the mechanisms which are already in the ledger. Every mechanism
+    # stores the entity it was spent on and the user who spent it
+    mechanism = sa.table(
+        "mechanism",
+        sa.column("user_key", sa.LargeBinary()),
+        sa.column("entity_name", sa.String()),
+        sa.column("mechanism_bin", sa.LargeBinary()),
+    )
+    rows = op.get_bind().execute(
+        sa.select(
+            [mechanism.c.entity_name, mechanism.c.user_key, mechanism.c.mechanism_bin]
+        )
+    )
+    curves: Dict[Tuple[str, bytes], List[float]] = {}
+    for entity_name, user_key, mechanism_bin in rows:
+        params = deserialize(mechanism_bin, from_bytes=True).params
+        private_rdp, public_rdp = individual_RDP_gaussian_curve(params)
+        curve = curves.setdefault((entity_name, user_key), [0.0, 0.0, 0])
+        curve[0] += private_rdp
+        curve[1] += public_rdp
+        curve[2] += 1
+
+    op.bulk_insert(
+        rdp_accumulator,
+        [
+            {
+                "entity_name": entity_name,
+                "user_key": user_key,
+                "private_rdp": curve[0],
+                "public_rdp": curve[1],
+                "n_mechanisms": curve[2],
+            }
+            for (entity_name, user_key), curve in curves.items()
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_rdp_accumulator_entity_name"), table_name="rdp_accumulator")
+    op.drop_table("rdp_accumulator")
@@ -0,0 +1,46 @@
+"""index the tags of the objects
+
+Revision ID: 5d7e0b3f8a21
+Revises: c4a1e97d52f3
+Create Date: 2022-03-12 10:14:52.630718
+
+"""
+# third party
+from alembic import op  # type: ignore
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5d7e0b3f8a21"
+down_revision = "c4a1e97d52f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    obj_tag = op.create_table(
+        "obj_tag",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("obj", sa.String(length=256), nullable=True),
+        sa.Column("tag", sa.String(length=1024), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_obj_tag_obj"), "obj_tag", ["obj"], unique=False)
+    op.create_index(op.f("ix_obj_tag_tag"), "obj_tag", ["tag"], unique=False)
+
+    # index the tags of the objects which are already stored
+    obj_metadata = sa.table(
+        "obj_metadata",
+        sa.column("obj", sa.String()),
+        sa.column("tags", sa.JSON()),
+    )
+    rows = op.get_bind().execute(sa.select([obj_metadata.c.obj, obj_metadata.c.tags]))
+    op.bulk_insert(
+        obj_tag,
+        [{"obj": obj, "tag": tag} for obj, tags in rows for tag in set(tags or [])],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_obj_tag_tag"), table_name="obj_tag")
+    op.drop_index(op.f("ix_obj_tag_obj"), table_name="obj_tag")
+    op.drop_table("obj_tag")
@@ -1,6 +1,7 @@
 # stdlib
 import json
 from typing import Any
+from typing import Optional
 
 # third party
 from fastapi import APIRouter
@@ -22,6 +23,8 @@ from grid.api.dependencies.current_user import get_current_user
 from grid.api.users.models import UserPrivate
 from grid.core.celery_app import celery_app
 from grid.core.config import settings
+from grid.core.message_executor import ExecutorSaturatedError
+from grid.core.message_executor import message_executor
 from grid.core.node import node
 
 router = APIRouter()
@@ -51,6 +54,47 @@ async def delete(current_user: UserPrivate = Depends(get_current_user)) -> Respo
     return Response(json.dumps(response))
 
 
+def handle_message(data: bytes) -> Optional[bytes]:
+    # runs on a worker of the message_executor, off the event loop
+    obj_msg = deserialize(blob=data, from_bytes=True)
+    is_isr = isinstance(obj_msg, SignedImmediateSyftMessageWithReply) or isinstance(
+        obj_msg, SignedMessage
+    )
+    if is_isr:
+        reply = node.recv_immediate_msg_with_reply(msg=obj_msg)
+        return serialize(obj=reply, to_bytes=True)
+    elif isinstance(obj_msg, SignedImmediateSyftMessageWithoutReply):
+        node.recv_immediate_msg_without_reply(msg=obj_msg)
+    else:
+        node.recv_eventual_msg_without_reply(msg=obj_msg)
+    return None
+
+
+def handle_stream_message(data: bytes) -> None:
+    obj_msg = deserialize(blob=data, from_bytes=True)
+    if isinstance(obj_msg, SignedImmediateSyftMessageWithReply):
+        raise Exception("MessageWithReply not supported on the stream endpoint")
+    elif isinstance(obj_msg, SignedImmediateSyftMessageWithoutReply):
+        node.recv_immediate_msg_without_reply(msg=obj_msg)
+    else:
+        raise Exception("MessageWithReply not supported on the stream endpoint")
+
+
+def saturated_response(e: ExecutorSaturatedError) -> Response:
+    return Response(
+        json.dumps({RequestAPIFields.ERROR: f"The node is busy. {e}"}),
+        status_code=503,
+        headers={"Retry-After": "1"},
+    )
+
+
+@router.get("/executor", response_model=str)
+async def syft_executor_metrics(
+    current_user: UserPrivate = Depends(get_current_user),
+) -> Response:
+    return Response(json.dumps(message_executor.metrics))
+
+
 @router.post("", response_model=str)
 async def syft_route(
     request: Request,
@@ -60,21 +104,12 @@ async def syft_route(
 ) -> Any:
     with tracer.start_as_current_span("POST syft_route"):
         data = await request.body()
-        obj_msg = deserialize(blob=data, from_bytes=True)
-        is_isr = isinstance(obj_msg, SignedImmediateSyftMessageWithReply) or isinstance(
-            obj_msg, SignedMessage
-        )
-        if is_isr:
-            reply = node.recv_immediate_msg_with_reply(msg=obj_msg)
-            r = Response(
-                serialize(obj=reply, to_bytes=True),
-                media_type="application/octet-stream",
-            )
-            return r
-        elif isinstance(obj_msg, SignedImmediateSyftMessageWithoutReply):
-            node.recv_immediate_msg_without_reply(msg=obj_msg)
-        else:
-            node.recv_eventual_msg_without_reply(msg=obj_msg)
+        try:
+            reply = await message_executor.run(handle_message, data)
+        except ExecutorSaturatedError as e:
+            return saturated_response(e)
+        if reply is not None:
+            return Response(reply, media_type="application/octet-stream")
         return ""
 
 
@@ -95,11 +130,8 @@ async def syft_stream(
                 print(f"Failed to queue work on streaming endpoint. {type(data)}. {e}")
         else:
             print("Processing streaming message on web node")
-            obj_msg = deserialize(blob=data, from_bytes=True)
-            if isinstance(obj_msg, SignedImmediateSyftMessageWithReply):
-                raise Exception("MessageWithReply not supported on the stream endpoint")
-            elif isinstance(obj_msg, SignedImmediateSyftMessageWithoutReply):
-                node.recv_immediate_msg_without_reply(msg=obj_msg)
-            else:
-                raise Exception("MessageWithReply not supported on the stream endpoint")
+            try:
+                await message_executor.run(handle_stream_message, data)
+            except ExecutorSaturatedError as e:
+                return saturated_response(e)
         return ""
@@ -94,6 +94,13 @@ class Settings(BaseSettings):
 
     DOMAIN_NAME: str = "default_node_name"
     STREAM_QUEUE: bool = False
+    # number of workers of the ActionScheduler of the node, 0 executes the actions
+    # one after the other as they are received
+    ACTION_SCHEDULER_WORKERS: int = 0
+    # number of syft messages processed at the same time off the event loop, and
+    # waiting for a worker before new ones are rejected with a 503
+    SYFT_MESSAGE_WORKERS: int = 16
+    SYFT_MESSAGE_QUEUE_SIZE: int = 256
     NODE_TYPE: str = "Domain"
 
     OPEN_REGISTRATION: bool = True
@@ -0,0 +1,111 @@
+# stdlib
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+# grid absolute
+from grid.core.config import settings
+
+
+class ExecutorSaturatedError(Exception):
+    """Raised when every worker is busy and the queue of the executor is full"""
+
+
+class MessageExecutor:
+    """
+    MessageExecutor runs the handling of syft messages (deserialization, processing
+    by the node and serialization of the reply) on a pool of threads, so the event
+    loop keeps reading requests and writing responses while a slow message is
+    processed.
+
+    At most max_workers messages are processed at the same time and at most
+    max_queue more wait for a worker. Messages arriving when the queue is full are
+    rejected with ExecutorSaturatedError instead of piling up in memory.
+
+    Attributes:
+        max_workers (int): the number of messages processed at the same time.
+        max_queue (int): the number of messages waiting for a worker.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="MessageExecutor"
+        )
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queue_depth": self._queued,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+            }
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls func on a worker thread and waits for its result without blocking the
+        event loop.
+
+        Raises:
+            ExecutorSaturatedError: if the queue is full.
+        """
+        with self._lock:
+            if self._running + self._queued >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ExecutorSaturatedError(
+                    f"{self._running} messages are processed and {self._queued} wait"
+                )
+            self._queued += 1
+
+        # the worker sees the context of the request, e.g. its tracing span
+        context = contextvars.copy_context()
+        future = self._pool.submit(context.run, self._call, func, *args, **kwargs)
+        future.add_done_callback(self._forget_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _forget_cancelled(self, future: Future) -> None:
+        # a message cancelled while queued, e.g. if the client went away, never ran
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def _call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+                self._failed += failed
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+message_executor = MessageExecutor(
+    max_workers=settings.SYFT_MESSAGE_WORKERS,
+    max_queue=settings.SYFT_MESSAGE_QUEUE_SIZE,
+)
@@ -9,6 +9,7 @@ from nacl.signing import SigningKey
 # syft absolute
 from syft import Domain  # type: ignore
 from syft import Network  # type: ignore
+from syft.core.node.common.action.action_scheduler import ActionScheduler
 from syft.core.node.common.client import Client
 from syft.core.node.common.node_table.utils import seed_db
 
@@ -49,7 +50,6 @@ def thread_function(*args, **kwargs) -> None:  # type: ignore
         requests.get(NETWORK_PUBLIC_HOST + "/api/v1/exam/asdf", timeout=1).status_code
         != 502
     ):
-
         network_root = sy.login(
             email="info@openmined.org",
             password="changethis",
@@ -87,6 +87,11 @@ else:
         + "NODE_TYPE to either 'Domain' or 'Network'."
     )
 
+if settings.ACTION_SCHEDULER_WORKERS > 0:
+    node.action_scheduler = ActionScheduler(
+        node=node, max_workers=settings.ACTION_SCHEDULER_WORKERS
+    )
+
 node.loud_print()
 
 if len(node.setup):  # Check if setup was defined previously
@@ -0,0 +1,111 @@
+# stdlib
+import asyncio
+import time
+from typing import Any
+
+# third party
+from fastapi import FastAPI
+from httpx import AsyncClient
+from nacl.signing import SigningKey
+import pytest
+from starlette import status
+
+# syft absolute
+from syft import serialize
+from syft.core.common.message import SignedImmediateSyftMessageWithReply
+from syft.core.node.common.node_service.ping.ping_messages import PingMessageWithReply
+
+# grid absolute
+from grid.api.syft import syft
+from grid.core.message_executor import MessageExecutor
+from grid.core.node import node
+
+# seconds the node takes to process a slow message
+SLOW = 1.0
+
+
+def ping(slow: bool) -> bytes:
+    msg = (
+        PingMessageWithReply(kwargs={"slow": slow})
+        .to(address=node.address, reply_to=node.address)
+        .sign(signing_key=SigningKey.generate())
+    )
+    return serialize(msg, to_bytes=True)
+
+
+def recv_immediate_msg_with_reply(
+    msg: SignedImmediateSyftMessageWithReply,
+) -> SignedImmediateSyftMessageWithReply:
+    if msg.message.payload.kwargs["slow"]:
+        time.sleep(SLOW)
+    return msg
+
+
+class TestSyftRoutes:
+    @pytest.mark.asyncio
+    async def test_slow_messages_do_not_block_fast_ones(
+        self, app: FastAPI, client: AsyncClient, monkeypatch: Any
+    ) -> None:
+        monkeypatch.setattr(
+            node, "recv_immediate_msg_with_reply", recv_immediate_msg_with_reply
+        )
+        monkeypatch.setattr(
+            syft, "message_executor", MessageExecutor(max_workers=8, max_queue=64)
+        )
+        headers = {"Content-Type": "application/octet-stream"}
+
+        async def post(blob: bytes) -> float:
+            start = time.perf_counter()
+            res = await client.post(
+                app.url_path_for("syft_route"), content=blob, headers=headers
+            )
+            assert res.status_code == status.HTTP_200_OK
+            return time.perf_counter() - start
+
+        n_slow, n_fast = 4, 32
+        latencies = await asyncio.gather(
+            *[post(ping(slow=True)) for _ in range(n_slow)],
+            *[post(ping(slow=False)) for _ in range(n_fast)],
+        )
+        slow_latencies, fast_latencies = latencies[:n_slow], latencies[n_slow:]
+
+        # processed on the event loop, the fast messages would wait for the slow ones
+        assert min(slow_latencies) >= SLOW
+        assert max(fast_latencies) < SLOW
+        assert max(slow_latencies) < n_slow * SLOW
+
+        res = await client.get(app.url_path_for("syft_executor_metrics"))
+        metrics = res.json()
+        assert metrics["completed"] == n_slow + n_fast
+        assert metrics["queue_depth"] == 0
+        assert metrics["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_rejected(
+        self, app: FastAPI, client: AsyncClient, monkeypatch: Any
+    ) -> None:
+        monkeypatch.setattr(
+            node, "recv_immediate_msg_with_reply", recv_immediate_msg_with_reply
+        )
+        monkeypatch.setattr(
+            syft, "message_executor", MessageExecutor(max_workers=1, max_queue=1)
+        )
+        headers = {"Content-Type": "application/octet-stream"}
+
+        responses = await asyncio.gather(
+            *[
+                client.post(
+                    app.url_path_for("syft_route"),
+                    content=ping(slow=True),
+                    headers=headers,
+                )
+                for _ in range(3)
+            ]
+        )
+        status_codes = sorted(res.status_code for res in responses)
+        assert status_codes == [
+            status.HTTP_200_OK,
+            status.HTTP_200_OK,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        ]
+        assert syft.message_executor.metrics["rejected"] == 1
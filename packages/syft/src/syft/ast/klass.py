@@ -109,6 +109,7 @@ def get_run_class_method(attr_path_and_name: str, SMPC: bool = False) -> Callabl
     # relative
     from ..core.node.common.action import smpc_action_functions
     from ..core.node.common.action.smpc_action_functions import MAP_FUNC_TO_ACTION
+    from ..core.tensor.smpc.mpc_session import MPCSession
 
     def run_class_smpc_method(
         __self: Any,
@@ -170,7 +171,11 @@ def get_run_class_method(attr_path_and_name: str, SMPC: bool = False) -> Callabl
             id_at_location=result.id_at_location,
             address=__self.client.address,
         )
-        __self.client.send_immediate_msg_without_reply(msg=cmd)
+        session = MPCSession.current()
+        if session is not None:
+            session.record(__self.client, cmd)
+        else:
+            __self.client.send_immediate_msg_without_reply(msg=cmd)
 
         inherit_tags(
             attr_path_and_name=attr_path_and_name,
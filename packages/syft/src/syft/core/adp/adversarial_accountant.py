@@ -7,6 +7,7 @@
 # stdlib
 from functools import lru_cache
 import math
+import threading
 from typing import Dict as TypeDict
 from typing import Iterable
 from typing import KeysView as TypeKeysView
@@ -20,6 +21,7 @@ from typing import Union
 from autodp.autodp_core import Mechanism
 from autodp.transformer_zoo import Composition
 from nacl.signing import VerifyKey
+import numpy as np
 from sqlalchemy.engine import Engine
 
 # relative
@@ -29,6 +31,7 @@ from ..node.common.node_manager.ledger_manager import DictLedger
 from .entity import DataSubjectGroup
 from .entity import Entity
 from .idp_gaussian_mechanism import iDPGaussianMechanism
+from .idp_gaussian_mechanism import individual_RDP_gaussian_curve
 
 
 def compose_mechanisms(
@@ -85,6 +88,24 @@ def compose_mechanisms_via_simplified_args_for_lru_cache(
     return eps
 
 
+@lru_cache(maxsize=4096)
+def compose_RDP_gaussian_curve(rdp: float, delta: float) -> float:
+    """
+    Converts the RDP of composed gaussian mechanisms to approximate DP the way
+    autodp's Composition does.
+
+    Args:
+        rdp (float): the sum of the RDP at alpha = 1 of the composed mechanisms.
+        delta (float): the delta of the approximate DP guarantee.
+
+    Returns:
+        float: the epsilon of the approximate DP guarantee.
+    """
+    composed_mech = Mechanism()
+    composed_mech.propagate_updates(lambda alpha: alpha * rdp, "RDP")
+    return composed_mech.get_approxDP(delta)
+
+
 class AdversarialAccountant:
     """Adversarial Accountant class that keeps track of budget and maintains a privacy ledger."""
 
@@ -102,6 +123,10 @@ class AdversarialAccountant:
         # this is a temporary lookup table for mechanisms we're not sure
         # we're going to keep (See publish.py for how this is used)
         self.temp_entity2ledger: TypeDict = {}
+        # the messages of a node are handled concurrently, publish holds this lock
+        # from resetting the temporary ledger to saving it, so two publishes neither
+        # mix up their mechanisms nor both spend the budget left for one of them
+        self.lock = threading.RLock()
         self.max_budget = max_budget
         self.delta = delta
 
@@ -128,74 +153,57 @@ class AdversarialAccountant:
     def save_temp_ledger_to_longterm_ledger(self) -> None:
         self.append(entity2mechanisms=self.temp_entity2ledger)
 
-    # return epsilons for each entity
-    def get_eps_for_entity(
+    # return the summed RDP of the mechanisms of each entity
+    def get_rdp_for_entity(
         self,
         entity: Entity,
         user_key: Optional[VerifyKey] = None,
         returned_epsilon_is_private: bool = False,
-    ) -> float:
-
-        # fetch mechanisms from the database
-        table_mechanisms = self.entity2ledger.query(entity_name=entity.name)  # type: ignore
-        mechanisms = [x.obj for x in table_mechanisms]
-
-        # filter out mechanisms that weren't created by this data scientist user
-        if user_key is not None:
-            filtered_mechanisms = []
-            for mech in mechanisms:
-                if mech.user_key == user_key:
-                    filtered_mechanisms.append(mech)
-
-            mechanisms = filtered_mechanisms
-
-        if entity in self.temp_entity2ledger.keys():
-            mechanisms = mechanisms + self.temp_entity2ledger[entity]
-
-        # # filter out mechanisms that weren't created by this data scientist user
-        # if user_key is not None:
-        #     filtered_mechanisms = []
-        #     for mech in mechanisms:
-        #         # left = _deserialize(mech.user_key, from_bytes=True)
-        #         # print("Comparing Left:" + str(mech.user_key) + " of type " + str(type(mech.user_key)))
-        #         # print("Comparing Right:" + str(user_key) + " of type " + str(type(user_key)))
-
-        #         # user_key = VerifyKey(user_key.encode("utf-8"), encoder=HexEncoder)
-
-        #         if mech.user_key == user_key:
-        #             filtered_mechanisms.append(mech)
-
-        #     mechanisms = filtered_mechanisms
-
-        # print("Num mechanisms after TEMP:" + str(len(mechanisms)))
-        # for m in mechanisms:
-        # print("Filtered Mechanism Entity:" + str(m.entity_name))
+    ) -> Tuple[float, int]:
+        """
+        Returns the RDP at alpha = 1 of the mechanisms spent on an entity, the
+        registered ones and the ones of the publish in progress, composed, and the
+        number of these mechanisms. The RDP of the composed gaussian mechanisms at
+        alpha is alpha times this value.
+        """
+        # the ledger keeps the RDP of the mechanisms registered for every entity and
+        # user summed up, so only the mechanisms of this publish are added to it
+        private_rdp, public_rdp, n_mechanisms = self.entity2ledger.get_rdp(
+            entity_name=entity.name, user_key=user_key
+        )
 
-        # print("Mechanisma after filtering: ", mechanisms)
-        # use verify key to specify the user
-        # for all entities in the db,
-        # how do we ensure that no data scientist
-        # exceeds the budget of any entity?
+        for mech in self.temp_entity2ledger.get(entity, []):
+            mech_private_rdp, mech_public_rdp = individual_RDP_gaussian_curve(
+                mech.params
+            )
+            private_rdp += mech_private_rdp
+            public_rdp += mech_public_rdp
+            n_mechanisms += 1
 
-        if returned_epsilon_is_private:
-            for mech in mechanisms:
+            if returned_epsilon_is_private:
                 mech.params["value"] = mech.params["private_value"]
-        else:
-            for mech in mechanisms:
+            else:
                 mech.params["value"] = mech.params["public_value"]
 
-        # map dataset
-        if len(mechanisms) > 0:
-            eps = compose_mechanisms(tuple(mechanisms), self.delta)
-
-            # if we have a user key, get the budget and clamp the epsilon
-            # if user_key is not None:
-            #     user_budget = self.entity2ledger.get_user_budget(user_key=user_key)
-            #     print("USER BUDGET:" + str(user_budget))
-            #     print(f"EPS: {eps}")
-            #     if eps > user_budget:
-            #         print("setting the eps to the user budget")
-            #         eps = user_budget
+        if returned_epsilon_is_private:
+            return private_rdp, n_mechanisms
+        return public_rdp, n_mechanisms
+
+    # return epsilons for each entity
+    def get_eps_for_entity(
+        self,
+        entity: Entity,
+        user_key: Optional[VerifyKey] = None,
+        returned_epsilon_is_private: bool = False,
+    ) -> float:
+        rdp, n_mechanisms = self.get_rdp_for_entity(
+            entity=entity,
+            user_key=user_key,
+            returned_epsilon_is_private=returned_epsilon_is_private,
+        )
+
+        if n_mechanisms > 0:
+            eps = compose_RDP_gaussian_curve(rdp, self.delta)
         else:
             eps = 0
 
@@ -233,25 +241,87 @@ class AdversarialAccountant:
         # print("USER BUDGET:" + str(user_budget))
         return has_budget
 
+    # returns the summed RDP of the mechanisms of every entity at once
+    def get_rdps(
+        self,
+        user_key: Optional[VerifyKey] = None,
+        returned_epsilon_is_private: bool = False,
+    ) -> TypeDict[str, Tuple[float, int]]:
+        """
+        Returns get_rdp_for_entity for every entity with mechanisms, by entity name.
+        The registered mechanisms of every entity are loaded in a single query.
+        """
+        value_index = 0 if returned_epsilon_is_private else 1
+        rdps = {
+            entity_name: (curve[value_index], curve[2])
+            for entity_name, curve in self.entity2ledger.get_rdps(
+                user_key=user_key
+            ).items()
+        }
+
+        for entity, mechs in self.temp_entity2ledger.items():
+            # like get_rdp_for_entity, only count the mechanisms kept for an Entity
+            if not isinstance(entity, Entity):
+                continue
+            rdp, n_mechanisms = rdps.get(entity.name, (0.0, 0))
+            for mech in mechs:
+                rdp += individual_RDP_gaussian_curve(mech.params)[value_index]
+                n_mechanisms += 1
+
+                if returned_epsilon_is_private:
+                    mech.params["value"] = mech.params["private_value"]
+                else:
+                    mech.params["value"] = mech.params["public_value"]
+            rdps[entity.name] = (rdp, n_mechanisms)
+        return rdps
+
+    def _compose_rdp(self, rdp: float, n_mechanisms: int) -> float:
+        if n_mechanisms > 0:
+            return float(compose_RDP_gaussian_curve(rdp, self.delta))
+        return 0.0
+
+    def _exceeds_budget(
+        self, rdps: np.ndarray, n_mechanisms: np.ndarray, budget: float
+    ) -> np.ndarray:
+        """
+        Returns which of the entities spent more than the budget. The epsilon only
+        grows with the RDP, so the entities over budget are the ones after the first
+        entity over budget in the order of the RDP, which a binary search finds by
+        converting the RDP of log(entities) of them to approximate DP.
+        """
+        # spending nothing is less than spending the RDP of any mechanism
+        order = np.argsort(np.where(n_mechanisms > 0, rdps, -1.0), kind="stable")
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            i = order[middle]
+            if self._compose_rdp(rdps[i], n_mechanisms[i]) > budget:
+                high = middle
+            else:
+                low = middle + 1
+
+        exceeds = np.zeros(len(order), dtype=bool)
+        exceeds[order[low:]] = True
+        return exceeds
+
     # returns maximum entity epsilon
     def user_budget(
         self, user_key: VerifyKey, returned_epsilon_is_private: bool = False
     ) -> float:
-        max_spend = 0.0
-
-        for ent in self.entities:
-            spend = self.get_eps_for_entity(
-                entity=ent,
-                user_key=user_key,
-                returned_epsilon_is_private=returned_epsilon_is_private,
-            )
-            if math.isnan(spend) or math.isinf(spend):
-                print(f"Warning: Spend is {spend}")
+        rdps = self.get_rdps(
+            user_key=user_key, returned_epsilon_is_private=returned_epsilon_is_private
+        )
+        if len(rdps) == 0:
+            return 0.0
 
-            if spend > max_spend:
-                max_spend = float(spend)
+        # the epsilon only grows with the RDP so the entity with the largest RDP
+        # spent the most
+        max_rdp, n_mechanisms = max(rdps.values())
+        max_spend = self._compose_rdp(max_rdp, n_mechanisms)
+        if math.isnan(max_spend) or math.isinf(max_spend):
+            print(f"Warning: Spend is {max_spend}")
 
-        return float(max_spend)
+        return float(max(max_spend, 0.0))
 
     def get_remaining_budget(
         self, user_key: VerifyKey, returned_epsilon_is_private: bool = False
@@ -284,28 +354,37 @@ class AdversarialAccountant:
         user_key: VerifyKey,
         returned_epsilon_is_private: bool = False,
     ) -> Union[TypeSet[Entity], TypeSet[DataSubjectGroup]]:
-        entities = set()
-
-        for entity, _ in temp_entities.items():
+        entity_names = set()
+        for entity in temp_entities.keys():
             if isinstance(entity, DataSubjectGroup):
-                for e in entity.entity_set:
-                    if not self.has_budget(
-                        e,
-                        user_key=user_key,
-                        returned_epsilon_is_private=returned_epsilon_is_private,
-                    ):
-                        entities.add(
-                            entity
-                        )  # Leave out the whole group if ANY of its entities are over budget
+                entity_names.update(e.name for e in entity.entity_set)
             elif isinstance(entity, Entity):
-                if not self.has_budget(
-                    entity,
-                    user_key=user_key,
-                    returned_epsilon_is_private=returned_epsilon_is_private,
-                ):
-                    entities.add(entity)  # type: ignore
+                entity_names.add(entity.name)
             else:
                 raise Exception
+
+        # check the budget of every entity at once instead of one after the other
+        rdps = self.get_rdps(
+            user_key=user_key, returned_epsilon_is_private=returned_epsilon_is_private
+        )
+        names = list(entity_names)
+        entity_rdps = np.array([rdps.get(name, (0.0, 0))[0] for name in names])
+        entity_n_mechanisms = np.array([rdps.get(name, (0.0, 0))[1] for name in names])
+        exceeds = self._exceeds_budget(
+            rdps=entity_rdps,
+            n_mechanisms=entity_n_mechanisms,
+            budget=self.entity2ledger.get_user_budget(user_key=user_key),
+        )
+        overbudgeted_names = {name for name, over in zip(names, exceeds) if over}
+
+        entities = set()
+        for entity in temp_entities.keys():
+            if isinstance(entity, DataSubjectGroup):
+                # Leave out the whole group if ANY of its entities are over budget
+                if any(e.name in overbudgeted_names for e in entity.entity_set):
+                    entities.add(entity)
+            elif entity.name in overbudgeted_names:
+                entities.add(entity)  # type: ignore
         return entities
 
     # prints entity and its epsilon value
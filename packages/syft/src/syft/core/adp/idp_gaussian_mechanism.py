@@ -9,6 +9,7 @@ from functools import lru_cache
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 # third party
 from autodp import dp_bank
@@ -60,6 +61,23 @@ def individual_RDP_gaussian(params: Dict, alpha: float) -> np.float64:
     return _individual_RDP_gaussian(sigma=sigma, alpha=alpha, value=value, L=L)
 
 
+def individual_RDP_gaussian_curve(params: Dict) -> Tuple[float, float]:
+    """
+    :param params: the params of an iDPGaussianMechanism
+    :return: the RDP's epsilon of the mechanism at alpha = 1 for its private and its
+        public value. The RDP of the gaussian mechanism is linear in alpha, so these
+        define the whole curve and add up when mechanisms are composed.
+    """
+    sigma = params["sigma"]
+    L = params["L"]
+    if sigma <= 0:
+        raise Exception("Sigma should be above 0")
+
+    private_rdp = ((L**2) * (params["private_value"] ** 2)) / (2 * (sigma**2))
+    public_rdp = ((L**2) * (params["public_value"] ** 2)) / (2 * (sigma**2))
+    return private_rdp, public_rdp
+
+
 # Example of a specific mechanism that inherits the Mechanism class
 @serializable(recursive_serde=True)
 class iDPGaussianMechanism(Mechanism):
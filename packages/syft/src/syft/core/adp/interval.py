@@ -0,0 +1,217 @@
+# stdlib
+from collections import Counter
+from itertools import product as cartesian_product
+from numbers import Integral
+from numbers import Number
+from typing import Any
+from typing import Dict as TypeDict
+from typing import List as TypeList
+from typing import Optional
+from typing import Tuple as TypeTuple
+
+# third party
+from pymbolic.mapper import Mapper
+from pymbolic.mapper.evaluator import EvaluationMapper as EM
+
+# relative
+from .search import ssid2obj
+
+Interval = TypeTuple[float, float]
+
+# the bound is kept if it is at most this fraction wider than the range spanned by
+# the points the polynomial was evaluated at, otherwise the optimizer is used
+DEFAULT_TOLERANCE = 0.05
+
+# the corners of the input box are only evaluated for up to this many symbols
+MAX_CORNER_SYMBOLS = 8
+
+
+class UnsupportedPolynomial(Exception):
+    """Raised by IntervalBoundMapper for expressions it can't bound soundly"""
+
+
+def interval_add(a: Interval, b: Interval) -> Interval:
+    return a[0] + b[0], a[1] + b[1]
+
+
+def interval_mul(a: Interval, b: Interval) -> Interval:
+    corners = [a[0] * b[0], a[0] * b[1], a[1] * b[0], a[1] * b[1]]
+    return min(corners), max(corners)
+
+
+def interval_pow(a: Interval, exponent: int) -> Interval:
+    lo, hi = a
+    if exponent == 0:
+        return 1.0, 1.0
+    if exponent % 2 == 1 or lo >= 0:
+        # x**n is increasing over the interval
+        return lo**exponent, hi**exponent
+    if hi <= 0:
+        return hi**exponent, lo**exponent
+    return 0.0, max(-lo, hi) ** exponent
+
+
+class IntervalBoundMapper(Mapper):
+    """
+    Computes an interval containing every value a polynomial can take when each of
+    its symbols ranges over the [min_val, max_val] of its PhiScalar or GammaScalar.
+
+    Sums, products, quotients by intervals excluding zero and non-negative integer
+    powers are supported, anything else raises UnsupportedPolynomial. The mapper
+    also counts how often each symbol is used: the interval is the exact range of
+    the polynomial if no symbol is used twice (repeated factors of a product count
+    once, as a power), otherwise it may be wider.
+    """
+
+    def __init__(self) -> None:
+        self.symbol_counts: TypeDict[str, int] = Counter()
+        self.ranges: TypeDict[str, Interval] = {}
+
+    def map_constant(self, expr: Any) -> Interval:
+        if not isinstance(expr, Number) or isinstance(expr, complex):
+            raise UnsupportedPolynomial(f"Can't bound constant {expr}")
+        return float(expr), float(expr)  # type: ignore
+
+    def map_variable(self, expr: Any) -> Interval:
+        self.symbol_counts[expr.name] += 1
+        if expr.name not in self.ranges:
+            scalar = ssid2obj.get(expr.name, None)
+            if scalar is None or scalar.min_val is None or scalar.max_val is None:
+                raise UnsupportedPolynomial(f"Symbol {expr.name} has no bounds")
+            self.ranges[expr.name] = (float(scalar.min_val), float(scalar.max_val))
+        return self.ranges[expr.name]
+
+    def map_sum(self, expr: Any) -> Interval:
+        result: Interval = (0.0, 0.0)
+        for child in expr.children:
+            result = interval_add(result, self.rec(child))
+        return result
+
+    def map_product(self, expr: Any) -> Interval:
+        # x * x is bounded as x**2, which is tighter
+        result: Interval = (1.0, 1.0)
+        for child, exponent in Counter(expr.children).items():
+            result = interval_mul(result, interval_pow(self.rec(child), exponent))
+        return result
+
+    def map_quotient(self, expr: Any) -> Interval:
+        lo, hi = self.rec(expr.denominator)
+        if lo <= 0 <= hi:
+            raise UnsupportedPolynomial("The denominator can be zero")
+        return interval_mul(self.rec(expr.numerator), (1 / hi, 1 / lo))
+
+    def map_power(self, expr: Any) -> Interval:
+        exponent = expr.exponent
+        if isinstance(exponent, float) and exponent.is_integer():
+            exponent = int(exponent)
+        if not isinstance(exponent, Integral) or exponent < 0:
+            raise UnsupportedPolynomial(f"Can't bound the power {exponent}")
+        return interval_pow(self.rec(expr.base), int(exponent))
+
+    def map_foreign(self, expr: Any, *args: Any, **kwargs: Any) -> Interval:
+        if isinstance(expr, Number):
+            return self.map_constant(expr)
+        raise UnsupportedPolynomial(f"Can't bound {type(expr)}")
+
+
+class DegreeMapper(Mapper):
+    """
+    Computes the highest power each symbol of a polynomial is raised to. Only
+    called on expressions IntervalBoundMapper supports, so denominators are
+    treated as constants.
+    """
+
+    def map_constant(self, expr: Any) -> TypeDict[str, int]:
+        return {}
+
+    def map_variable(self, expr: Any) -> TypeDict[str, int]:
+        return {expr.name: 1}
+
+    def map_sum(self, expr: Any) -> TypeDict[str, int]:
+        degrees: TypeDict[str, int] = {}
+        for child in expr.children:
+            for name, degree in self.rec(child).items():
+                degrees[name] = max(degrees.get(name, 0), degree)
+        return degrees
+
+    def map_product(self, expr: Any) -> TypeDict[str, int]:
+        degrees: TypeDict[str, int] = Counter()
+        for child in expr.children:
+            degrees.update(self.rec(child))
+        return degrees
+
+    def map_quotient(self, expr: Any) -> TypeDict[str, int]:
+        if len(self.rec(expr.denominator)) > 0:
+            # not a polynomial, so never multilinear
+            return {name: 2 for name in self.rec(expr.numerator)}
+        return self.rec(expr.numerator)
+
+    def map_power(self, expr: Any) -> TypeDict[str, int]:
+        return {
+            name: degree * int(expr.exponent)
+            for name, degree in self.rec(expr.base).items()
+        }
+
+    def map_foreign(self, expr: Any, *args: Any, **kwargs: Any) -> TypeDict[str, int]:
+        return {}
+
+
+def sample_range(poly: Any, ranges: TypeDict[str, Interval]) -> Interval:
+    """
+    Evaluates poly at the values of its symbols and, if there are few enough of them,
+    at the corners of the box of their ranges. The true range of poly contains the
+    returned interval, and equals it if poly is multilinear (no symbol is raised to
+    a power above one) since multilinear polynomials reach their extrema at corners.
+    """
+    names = list(ranges.keys())
+    points: TypeList[TypeDict[str, float]] = [
+        {name: float(ssid2obj[name].value) for name in names}
+    ]
+    if len(names) <= MAX_CORNER_SYMBOLS:
+        for corner in cartesian_product(*[ranges[name] for name in names]):
+            points.append(dict(zip(names, corner)))
+
+    samples = [float(EM(context=point)(poly)) for point in points]
+    return min(samples), max(samples)
+
+
+def interval_bounds(
+    poly: Any, tolerance: float = DEFAULT_TOLERANCE
+) -> Optional[Interval]:
+    """
+    Bounds a polynomial with interval arithmetic instead of searching for its extrema.
+
+    The bound is always sound, but when a symbol is used more than once it may be
+    looser than the true range. In that case the exact range of a multilinear poly
+    over a few symbols is found at the corners of the input box. Otherwise poly is
+    evaluated at a few points and the bound is only returned if it is at most
+    tolerance wider than the range they span.
+
+    Args:
+        poly: the pymbolic polynomial to bound.
+        tolerance (float): how much looser than the sampled range the bound may be.
+
+    Returns:
+        Optional[Interval]: the (min_val, max_val) bound, or None if poly isn't
+            supported or the bound is too loose, in which case the optimizer is needed.
+    """
+    mapper = IntervalBoundMapper()
+    try:
+        lo, hi = mapper(poly)
+    except UnsupportedPolynomial:
+        return None
+
+    if all(count == 1 for count in mapper.symbol_counts.values()):
+        return lo, hi
+
+    try:
+        sample_lo, sample_hi = sample_range(poly, mapper.ranges)
+    except (TypeError, ValueError, KeyError):
+        return None
+    if len(mapper.ranges) <= MAX_CORNER_SYMBOLS and all(
+        degree <= 1 for degree in DegreeMapper()(poly).values()
+    ):
+        return sample_lo, sample_hi
+    if (hi - lo) - (sample_hi - sample_lo) > tolerance * (hi - lo):
+        return None
+    return lo, hi
@@ -18,6 +18,7 @@ from .....proto.core.adp.scalar_pb2 import IntermediateScalar as IntermediateSca
 from ....common import UID
 from ....common.serde.serializable import serializable
 from ...entity import Entity
+from ...interval import interval_bounds
 from ...search import GetSymbolsMapper
 from ...search import flatten_and_maximize_poly
 from ...search import ssid2obj
@@ -89,6 +90,17 @@ class IntermediateScalar(Scalar):
         mapper(self.poly)
         return mapper.free_symbols
 
+    def _interval_bounds(self) -> bool:
+        """Sets both bounds with interval arithmetic, if it gives a tight enough bound"""
+        bounds = interval_bounds(self.poly)
+        if bounds is None:
+            return False
+        if self._min_val is None:
+            self._min_val = bounds[0]
+        if self._max_val is None:
+            self._max_val = bounds[1]
+        return True
+
     @property
     def max_val(self) -> Optional[float]:
         # TODO: Verify that his doesnt change anything with budget spend
@@ -96,6 +108,9 @@ class IntermediateScalar(Scalar):
             return self._max_val
 
         if self.poly is not None:
+            if self._interval_bounds():
+                return self._max_val
+
             results = flatten_and_maximize_poly(-self.poly)
             if len(results) >= 1:
                 self._max_val = float(-results[-1].fun)
@@ -109,6 +124,9 @@ class IntermediateScalar(Scalar):
             return self._min_val
 
         if self.poly is not None:
+            if self._interval_bounds():
+                return self._min_val
+
             results = flatten_and_maximize_poly(self.poly)
             if len(results) >= 1:
                 self._min_val = float(results[-1].fun)
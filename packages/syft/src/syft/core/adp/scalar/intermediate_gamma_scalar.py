@@ -12,6 +12,7 @@ from sympy.core.basic import Basic as BasicSymbol
 # relative
 from ...common import UID
 from ..entity import Entity
+from ..interval import interval_mul
 from ..search import create_lookup_tables_for_symbol
 from ..search import create_searchable_function_from_polynomial
 from ..search import max_lipschitz_via_jacobian
@@ -70,8 +71,8 @@ class IntermediateGammaScalar(IntermediateScalar):
                 other = other.gamma
             return IntermediateGammaScalar(
                 poly=self.poly - other.poly,
-                min_val=self.min_val - other.min_val,
-                max_val=self.max_val - other.max_val,
+                min_val=self.min_val - other.max_val,
+                max_val=self.max_val - other.min_val,
             )
         return IntermediateGammaScalar(
             poly=self.poly - other,
@@ -87,17 +88,8 @@ class IntermediateGammaScalar(IntermediateScalar):
             if isinstance(other, IntermediatePhiScalar):
                 other = other.gamma
 
-            max_val = max(
-                self.min_val * other.min_val,
-                self.min_val * other.max_val,
-                self.max_val * other.min_val,
-                self.max_val * other.max_val,
-            )
-
-            min_val = min(
-                self.min_val * other.min_val,
-                self.min_val * other.max_val,
-                self.max_val * other.min_val,
+            min_val, max_val = interval_mul(
+                (self.min_val, self.max_val), (other.min_val, other.max_val)
             )
 
             return IntermediateGammaScalar(
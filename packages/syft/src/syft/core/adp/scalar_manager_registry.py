@@ -0,0 +1,96 @@
+# stdlib
+from typing import Any
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+# relative
+from ..common.serde.scope import SerdeScope
+from ..common.serde.scope import current_serde_scope
+from ..common.uid import UID
+
+
+class ScalarManagerState(NamedTuple):
+    """
+    The address of the content of a VirtualMachinePrivateScalarManager: its first
+    size symbols and n_entities entities, as of its generation. Symbols are only
+    appended to a manager until its generation changes, so the content at an
+    address never changes.
+    """
+
+    id: UID
+    generation: int
+    size: int
+    n_entities: int
+
+
+class UnknownScalarManagerError(KeyError):
+    """Raised when a scalar manager references a manager not read earlier in its
+    message"""
+
+
+# what is kept of a received manager: the state at the sender, the local manager
+# and its local generation when it was received
+ReceivedManager = Tuple[ScalarManagerState, Any, int]
+
+
+def _matches(entry: ReceivedManager, reference: ScalarManagerState) -> bool:
+    state, manager, generation = entry
+    return (
+        state.generation == reference.generation
+        and reference.size <= state.size
+        and reference.n_entities <= state.n_entities
+        and manager.generation == generation
+    )
+
+
+def unknown_manager(reference: ScalarManagerState) -> UnknownScalarManagerError:
+    return UnknownScalarManagerError(
+        f"Unknown scalar manager {reference.id} at generation "
+        f"{reference.generation} with {reference.size} symbols"
+    )
+
+
+def known_state(
+    scope: SerdeScope, manager_id: UID, generation: int
+) -> Optional[ScalarManagerState]:
+    """
+    The state of a manager written earlier in the message of scope. Only the
+    message itself is known to reach the receiver, nothing acknowledges what an
+    earlier message delivered, so states are never shared across messages.
+    """
+    state = scope.written.get(("scalar_manager", manager_id), None)
+    if state is None or state.generation != generation:
+        return None
+    return state
+
+
+def record_state(scope: SerdeScope, state: ScalarManagerState) -> None:
+    """Remembers that the receiver of the message of scope will have state"""
+    scope.written[("scalar_manager", state.id)] = state
+
+
+def register_received(state: ScalarManagerState, manager: Any) -> None:
+    """Keeps a received manager for the references to it later in the message"""
+    scope = current_serde_scope()
+    if scope is not None:
+        key = ("scalar_manager", state.id, state.generation)
+        scope.read[key] = (state, manager, manager.generation)
+
+
+def resolve_received(reference: ScalarManagerState) -> Any:
+    """
+    Returns a received manager whose first reference.size symbols and
+    reference.n_entities entities are the ones at the reference.
+
+    Raises:
+        UnknownScalarManagerError: if no such manager was read earlier in the
+            message.
+    """
+    scope = current_serde_scope()
+    if scope is not None:
+        key = ("scalar_manager", reference.id, reference.generation)
+        entry = scope.read.get(key, None)
+        if entry is not None and _matches(entry, reference):
+            return entry[1]
+    raise unknown_manager(reference)
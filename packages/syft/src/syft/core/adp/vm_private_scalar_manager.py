@@ -2,15 +2,20 @@
 from __future__ import annotations
 
 # stdlib
-from copy import deepcopy
+from collections.abc import Mapping
 from typing import Any
 from typing import Dict
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
+import numpy as np
 from primesieve.numpy import primes
+import pyarrow as pa
 
 # relative
 from ...logger import warning
@@ -19,13 +24,25 @@ from ...proto.core.adp.scalar_manager_pb2 import (
 )
 from ...proto.core.adp.scalar_manager_pb2 import PrimeFactory as PrimeFactory_PB
 from ..common.serde.deserialize import _deserialize as deserialize
+from ..common.serde.scope import SerdeScope
+from ..common.serde.scope import current_serde_scope
 from ..common.serde.serializable import serializable
 from ..common.serde.serialize import _serialize as serialize
+from ..common.uid import UID
+from .entity import DataSubjectGroup
 from .entity import Entity
 from .scalar.gamma_scalar import GammaScalar
+from .scalar_manager_registry import ScalarManagerState
+from .scalar_manager_registry import known_state
+from .scalar_manager_registry import record_state
+from .scalar_manager_registry import register_received
+from .scalar_manager_registry import resolve_received
 
 prime_exp_cache = {}
 
+# the number of states a copied manager remembers it was taken from
+MAX_BASES = 8
+
 
 def get_cached_primes(total: int) -> list:
     global prime_exp_cache
@@ -55,6 +72,12 @@ class PrimeFactory:
             self.prime_numbers = get_cached_primes(total=10**self.exp)
         return self.prime_numbers[index]
 
+    def get_range(self, start: int, stop: int) -> np.ndarray:
+        """Returns the primes from index start up to, but excluding, index stop"""
+        if stop > start:
+            self.get(stop - 1)
+        return np.asarray(self.prime_numbers[start:stop])
+
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, PrimeFactory):
             return (
@@ -76,8 +99,48 @@ class PrimeFactory:
         return PrimeFactory_PB
 
 
+class PrimeSymbolView(Mapping):
+    """
+    Read-only dict-like view of the symbols of a VirtualMachinePrivateScalarManager,
+    keyed by prime. The GammaScalars are only built when they are looked up.
+    """
+
+    def __init__(self, manager: VirtualMachinePrivateScalarManager) -> None:
+        self.manager = manager
+
+    def __getitem__(self, prime: Any) -> GammaScalar:
+        return self.manager.symbol(prime)
+
+    def __contains__(self, prime: Any) -> bool:
+        return prime in self.manager
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.manager.primes_allocated)
+
+    def __len__(self) -> int:
+        return len(self.manager)
+
+
 @serializable()
 class VirtualMachinePrivateScalarManager:
+    """
+    Keeps the symbols (the GammaScalars) of the data of the private tensors of a VM.
+
+    The symbols are stored column by column in NumPy arrays of their primes, min
+    values, values and max values, and their entities are stored once in an entity
+    table which the entity column indexes. Symbols can be allocated in bulk with
+    get_symbols, looked up by prime in O(1) and the columns are serialized as a
+    single Arrow record batch. GammaScalar objects are only built when a symbol is
+    looked up through symbol() or prime2symbol.
+
+    Managers are content-addressed by their id, generation and size (see
+    ScalarManagerState): symbols are only appended until the generation changes.
+    A manager remembers the states it was copied or received from (bases), so when
+    the receiver of a message already has one of them, because it was written
+    earlier in the same message, only a reference and the symbols appended since
+    are written.
+    """
+
     def __init__(
         self,
         prime_factory: Optional[PrimeFactory] = None,
@@ -87,13 +150,144 @@ class VirtualMachinePrivateScalarManager:
             prime_factory if prime_factory is not None else PrimeFactory()
         )
 
-        if prime2symbol is None:
-            prime2symbol = {}
+        # the columns have some spare capacity, only the first _size rows are used
+        self._size = 0
+        self._primes = np.empty(0, dtype=np.int64)
+        self._min_vals = np.empty(0, dtype=np.float64)
+        self._values = np.empty(0, dtype=np.float64)
+        self._max_vals = np.empty(0, dtype=np.float64)
+        self._entity_index = np.empty(0, dtype=np.int64)
+
+        self.entities: List[Union[Entity, DataSubjectGroup]] = []
+        self._entity_ids: Dict[Tuple[type, Any], int] = {}
+        self._prime_index: Dict[int, int] = {}
+        self._symbols: Dict[int, GammaScalar] = {}
 
-        self.prime2symbol = prime2symbol
         self.hash_cache: Optional[int] = None
         self.index = 0
 
+        self.id = UID()
+        self.generation = 0
+        # the states of other managers the first symbols of this one are taken from
+        self.bases: List[ScalarManagerState] = []
+
+        if prime2symbol is not None:
+            for prime, gs in prime2symbol.items():
+                self._append(
+                    np.array([prime], dtype=np.int64),
+                    np.array([gs.min_val], dtype=np.float64),
+                    np.array([gs.value], dtype=np.float64),
+                    np.array([gs.max_val], dtype=np.float64),
+                    np.array([self._intern(gs.entity)], dtype=np.int64),
+                )
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, prime: Any) -> bool:
+        return int(prime) in self._prime_index
+
+    @property
+    def primes(self) -> np.ndarray:
+        return self._primes[: self._size]
+
+    @property
+    def min_vals(self) -> np.ndarray:
+        return self._min_vals[: self._size]
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values[: self._size]
+
+    @property
+    def max_vals(self) -> np.ndarray:
+        return self._max_vals[: self._size]
+
+    @property
+    def entity_index(self) -> np.ndarray:
+        return self._entity_index[: self._size]
+
+    @property
+    def prime2symbol(self) -> PrimeSymbolView:
+        return PrimeSymbolView(self)
+
+    @property
+    def state(self) -> ScalarManagerState:
+        return ScalarManagerState(
+            id=self.id,
+            generation=self.generation,
+            size=self._size,
+            n_entities=len(self.entities),
+        )
+
+    def _rewrite(self) -> None:
+        # symbols which were already allocated changed, so the earlier states and
+        # bases of this manager don't describe its content anymore
+        self.generation += 1
+        self.bases = []
+        self.hash_cache = None
+
+    @property
+    def primes_allocated(self) -> list:
+        return self.primes.tolist()
+
+    def _intern(self, entity: Union[Entity, DataSubjectGroup]) -> int:
+        # Entity and DataSubjectGroup can't be compared with each other
+        key = (type(entity), entity)
+        if key not in self._entity_ids:
+            self._entity_ids[key] = len(self.entities)
+            self.entities.append(entity)
+        return self._entity_ids[key]
+
+    def _append(
+        self,
+        primes: np.ndarray,
+        min_vals: np.ndarray,
+        values: np.ndarray,
+        max_vals: np.ndarray,
+        entity_index: np.ndarray,
+    ) -> None:
+        # a prime which is already allocated is overwritten in place
+        is_new = ~np.isin(primes, self.primes)
+        if not is_new.all():
+            self._rewrite()
+            for i in np.flatnonzero(~is_new):
+                prime = int(primes[i])
+                row = self._prime_index[prime]
+                self._min_vals[row] = min_vals[i]
+                self._values[row] = values[i]
+                self._max_vals[row] = max_vals[i]
+                self._entity_index[row] = entity_index[i]
+                self._symbols.pop(prime, None)
+            primes, min_vals, values, max_vals, entity_index = (
+                column[is_new]
+                for column in (primes, min_vals, values, max_vals, entity_index)
+            )
+
+        start, stop = self._size, self._size + len(primes)
+        if stop > len(self._primes):
+            capacity = max(stop, 2 * len(self._primes))
+            for name in [
+                "_primes",
+                "_min_vals",
+                "_values",
+                "_max_vals",
+                "_entity_index",
+            ]:
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:start] = column[:start]
+                setattr(self, name, grown)
+
+        self._primes[start:stop] = primes
+        self._min_vals[start:stop] = min_vals
+        self._values[start:stop] = values
+        self._max_vals[start:stop] = max_vals
+        self._entity_index[start:stop] = entity_index
+        self._prime_index.update(zip(primes.tolist(), range(start, stop)))
+        self._size = stop
+        self.hash_cache = None
+
     def get_symbol(
         self,
         min_val: Union[bool, int, float],
@@ -103,62 +297,265 @@ class VirtualMachinePrivateScalarManager:
     ) -> int:
         # NOTE: this is overly conservative because it always creates a new scalar even when
         # a computationally equivalent one might exist somewhere already.
+        return int(self.get_symbols(min_val, value, max_val, entity, size=1)[0])
+
+    def get_symbols(
+        self,
+        min_vals: Any,
+        values: Any,
+        max_vals: Any,
+        entities: Any,
+        size: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Allocates a new symbol for every element of values at once.
+
+        Args:
+            min_vals: the min values of the symbols, or one min value for all of them.
+            values: the values of the symbols.
+            max_vals: the max values of the symbols, or one max value for all of them.
+            entities: the entity (or DataSubjectGroup) of every symbol, or a single
+                one shared by all of them.
+            size (Optional[int]): the number of symbols, by default the size of values.
+
+        Returns:
+            np.ndarray: the primes of the new symbols, in the order of values.
+        """
+        if size is None:
+            size = np.size(values)
+
+        if isinstance(entities, (Entity, DataSubjectGroup)):
+            entity_index = np.full(size, self._intern(entities), dtype=np.int64)
+        else:
+            entity_index = np.fromiter(
+                (self._intern(entity) for entity in entities),
+                dtype=np.int64,
+                count=size,
+            )
+
+        primes = self.prime_factory.get_range(self.index, self.index + size)
+        self._append(
+            primes.astype(np.int64),
+            np.broadcast_to(np.asarray(min_vals, dtype=np.float64).flatten(), size),
+            np.broadcast_to(np.asarray(values, dtype=np.float64).flatten(), size),
+            np.broadcast_to(np.asarray(max_vals, dtype=np.float64).flatten(), size),
+            entity_index,
+        )
+        self.index += size
+        return primes
+
+    def symbol(self, prime: Any) -> GammaScalar:
+        """Returns the GammaScalar of a prime, building it on the first lookup"""
+        prime = int(prime)
+        if prime not in self._symbols:
+            row = self._prime_index[prime]
+            self._symbols[prime] = GammaScalar(
+                min_val=self._min_vals[row],
+                value=self._values[row],
+                max_val=self._max_vals[row],
+                entity=self.entities[self._entity_index[row]],
+                prime=prime,
+            )
+        return self._symbols[prime]
 
-        gs = GammaScalar(
-            min_val=min_val,
-            value=value,
-            max_val=max_val,
-            entity=entity,
-            prime=int(self.prime_factory.get(self.index)),
+    def _rows(self, primes: np.ndarray) -> np.ndarray:
+        return np.fromiter(
+            (self._prime_index[prime] for prime in np.asarray(primes).tolist()),
+            dtype=np.int64,
+            count=len(primes),
         )
 
-        self.prime2symbol[gs.prime] = gs
-        self.hash_cache = None
-        self.index += 1
-        return gs.prime
+    def _sorted_columns(self) -> Tuple[np.ndarray, ...]:
+        # the symbols ordered by prime, with their entities resolved
+        order = np.argsort(self.primes, kind="stable")
+        entities = np.empty(self._size, dtype=object)
+        for i, entity_id in enumerate(self.entity_index[order]):
+            entities[i] = self.entities[entity_id]
+        return (
+            self.primes[order],
+            self.min_vals[order],
+            self.values[order],
+            self.max_vals[order],
+            entities,
+        )
 
     def __hash__(self) -> int:
-        # TODO: safely invalidate the hash_cache when prime2symbol is mutated
         if self.hash_cache is None:
-            prime2symbol = frozenset(self.prime2symbol.items())
-            self.hash_cache = hash(self.prime_factory.exp) + hash(prime2symbol)
+            primes, min_vals, values, max_vals, entities = self._sorted_columns()
+            self.hash_cache = hash(
+                (
+                    self.prime_factory.exp,
+                    primes.tobytes(),
+                    min_vals.tobytes(),
+                    values.tobytes(),
+                    max_vals.tobytes(),
+                    tuple(hash(entity) for entity in entities),
+                )
+            )
         return self.hash_cache
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, VirtualMachinePrivateScalarManager):
-            return (
-                self.prime_factory == other.prime_factory
-                and self.prime2symbol == other.prime2symbol
+            if self.prime_factory != other.prime_factory or len(self) != len(other):
+                return False
+            columns = self._sorted_columns()
+            other_columns = other._sorted_columns()
+            return all(
+                np.array_equal(column, other_column)
+                for column, other_column in zip(columns[:4], other_columns[:4])
+            ) and all(
+                type(a) is type(b) and a == b
+                for a, b in zip(columns[4], other_columns[4])
             )
         return self == other
 
-    @property
-    def primes_allocated(self) -> list:
-        return list(self.prime2symbol.keys())
+    def symbol_arrays(
+        self, primes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Look up the symbols of many primes at once.
 
-    def copy(self) -> VirtualMachinePrivateScalarManager:
+        Args:
+            primes (np.ndarray): 1D array of primes allocated by this manager.
 
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the min values,
+            values, max values and entities of the symbols, aligned with primes.
+        """
+        rows = self._rows(primes)
+        # filled one by one so numpy doesn't look inside the entities
+        entities = np.empty(len(rows), dtype=object)
+        for i, entity_id in enumerate(self.entity_index[rows]):
+            entities[i] = self.entities[entity_id]
+        return self.min_vals[rows], self.values[rows], self.max_vals[rows], entities
+
+    def copy(self) -> VirtualMachinePrivateScalarManager:
         # intentionally avoiding accidentally copying the prime factory
-        new_mgr = VirtualMachinePrivateScalarManager(
-            prime2symbol=deepcopy(self.prime2symbol)
+        new_mgr = VirtualMachinePrivateScalarManager()
+        new_mgr._append(
+            self.primes.copy(),
+            self.min_vals.copy(),
+            self.values.copy(),
+            self.max_vals.copy(),
+            self.entity_index.copy(),
         )
-
+        new_mgr.entities = list(self.entities)
+        new_mgr._entity_ids = dict(self._entity_ids)
+        new_mgr.index = self.index
+        new_mgr.bases = [self.state] + self.bases[: MAX_BASES - 1]
         return new_mgr
 
+    def _reference_for(
+        self, scope: Optional[SerdeScope]
+    ) -> Optional[ScalarManagerState]:
+        # the largest prefix of this manager the receiver of the message already has
+        if scope is None:
+            return None
+
+        reference: Optional[ScalarManagerState] = None
+        for candidate in [self.state] + self.bases:
+            known = known_state(scope, candidate.id, candidate.generation)
+            if known is None:
+                continue
+            size = min(known.size, candidate.size)
+            if size > 0 and (reference is None or size > reference.size):
+                reference = candidate._replace(
+                    size=size, n_entities=min(known.n_entities, candidate.n_entities)
+                )
+        return reference
+
     def _object2proto(self) -> VirtualMachinePrivateScalarManager_PB:
-        return VirtualMachinePrivateScalarManager_PB(
+        scope = current_serde_scope()
+        reference = self._reference_for(scope)
+        offset = reference.size if reference is not None else 0
+        entity_offset = reference.n_entities if reference is not None else 0
+        if scope is not None:
+            record_state(scope, self.state)
+
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array(self.primes[offset:]),
+                pa.array(self.min_vals[offset:]),
+                pa.array(self.values[offset:]),
+                pa.array(self.max_vals[offset:]),
+                pa.array(self.entity_index[offset:]),
+            ],
+            names=["prime", "min_val", "value", "max_val", "entity"],
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+
+        proto = VirtualMachinePrivateScalarManager_PB(
             prime_factory=serialize(self.prime_factory),
-            prime2symbol=serialize(self.prime2symbol),
+            symbols=sink.getvalue().to_pybytes(),
+            entities=[
+                serialize(entity, to_bytes=True)
+                for entity in self.entities[entity_offset:]
+            ],
+            index=self.index,
+            id=serialize(self.id),
+            generation=self.generation,
         )
+        if reference is not None:
+            proto.reference_id.CopyFrom(serialize(reference.id))
+            proto.reference_generation = reference.generation
+            proto.offset = offset
+            proto.entity_offset = entity_offset
+        return proto
 
     @staticmethod
     def _proto2object(
         proto: VirtualMachinePrivateScalarManager_PB,
     ) -> VirtualMachinePrivateScalarManager:
-        return VirtualMachinePrivateScalarManager(
-            prime_factory=deserialize(proto.prime_factory),
-            prime2symbol=deserialize(proto.prime2symbol),
+        if proto.HasField("prime2symbol"):
+            # written before the symbols were stored as columns
+            return VirtualMachinePrivateScalarManager(
+                prime_factory=deserialize(proto.prime_factory),
+                prime2symbol=deserialize(proto.prime2symbol),
+            )
+
+        manager = VirtualMachinePrivateScalarManager(
+            prime_factory=deserialize(proto.prime_factory)
         )
+        if proto.HasField("reference_id"):
+            reference = resolve_received(
+                ScalarManagerState(
+                    id=deserialize(proto.reference_id),
+                    generation=proto.reference_generation,
+                    size=proto.offset,
+                    n_entities=proto.entity_offset,
+                )
+            )
+            for entity in reference.entities[: proto.entity_offset]:
+                manager._intern(entity)
+            manager._append(
+                reference.primes[: proto.offset].copy(),
+                reference.min_vals[: proto.offset],
+                reference.values[: proto.offset],
+                reference.max_vals[: proto.offset],
+                reference.entity_index[: proto.offset],
+            )
+
+        for entity in proto.entities:
+            manager._intern(deserialize(entity, from_bytes=True))
+        table = pa.ipc.open_stream(proto.symbols).read_all()
+        manager._append(
+            *(
+                table.column(name).to_numpy()
+                for name in ["prime", "min_val", "value", "max_val", "entity"]
+            )
+        )
+        manager.index = proto.index
+
+        if proto.HasField("id"):
+            # the manager can be referenced by the state it had at the sender
+            sender_state = manager.state._replace(
+                id=deserialize(proto.id), generation=proto.generation
+            )
+            manager.bases = [sender_state]
+            register_received(sender_state, manager)
+        return manager
 
     @staticmethod
     def get_protobuf_schema() -> GeneratedProtocolMessageType:
@@ -170,19 +567,42 @@ class VirtualMachinePrivateScalarManager:
         ASSUME: vsm1 is the source of truth; we won't be changing its prime numbers
         """
 
-        # To check: vsm2.prime2symbol size doesn't change
-        if id(self.prime2symbol) != id(vsm2.prime2symbol):
-            copy_dict = vsm2.prime2symbol.copy()
-            length = len(self.primes_allocated)
-            for prime_number, gs in copy_dict.items():
-                if prime_number in self.prime2symbol:  # If there's a collision
-                    new_prime = self.prime_factory.get(length)
-                    gs.prime = new_prime
-                    self.prime2symbol[new_prime] = gs
-                    del vsm2.prime2symbol[prime_number]
-                    vsm2.prime2symbol[new_prime] = gs
-                    length += 1
-                else:
-                    self.prime2symbol[gs.prime] = gs
-        else:
+        if self is vsm2:
             warning("Detected prime2symbol where two tensors were using the same dict")
+            return
+
+        # the symbols of vsm2 whose prime is taken here get a new prime, in vsm2 too
+        other_primes = vsm2.primes
+        collides = np.isin(other_primes, self.primes)
+        n_collisions = int(collides.sum())
+        if n_collisions > 0:
+            taken = set(self.primes_allocated) | set(vsm2.primes_allocated)
+            new_primes: List[int] = []
+            index = len(self)
+            while len(new_primes) < n_collisions:
+                prime = int(self.prime_factory.get(index))
+                if prime not in taken:
+                    new_primes.append(prime)
+                index += 1
+
+            rows = np.flatnonzero(collides)
+            for row, prime in zip(rows.tolist(), new_primes):
+                old_prime = int(vsm2._primes[row])
+                del vsm2._prime_index[old_prime]
+                vsm2._symbols.pop(old_prime, None)
+                vsm2._prime_index[prime] = row
+                vsm2._primes[row] = prime
+            vsm2._rewrite()
+
+        entity_index = np.array(
+            [self._intern(entity) for entity in vsm2.entities], dtype=np.int64
+        )
+        self._append(
+            vsm2.primes.copy(),
+            vsm2.min_vals,
+            vsm2.values,
+            vsm2.max_vals,
+            entity_index[vsm2.entity_index]
+            if len(entity_index) > 0
+            else vsm2.entity_index,
+        )
@@ -20,6 +20,7 @@ from ...util import validate_type
 from ..io.address import Address
 from .object import ObjectWithID
 from .serde.deserialize import _deserialize
+from .serde.scope import serde_scope
 from .serde.serializable import serializable
 from .serde.serialize import _serialize as serialize
 from .uid import UID
@@ -88,7 +89,8 @@ class SyftMessage(AbstractMessage):
 
         """
         debug(f"> Signing with {self.address.key_emoji(key=signing_key.verify_key)}")
-        signed_message = signing_key.sign(serialize(self, to_bytes=True))
+        with serde_scope():
+            signed_message = signing_key.sign(serialize(self, to_bytes=True))
 
         # signed_type will be the final subclass callee's closest parent signed_type
         # for example ReprMessage -> ImmediateSyftMessageWithoutReply.signed_type
@@ -141,9 +143,11 @@ class SignedMessage(SyftMessage):
     @property
     def message(self) -> "SyftMessage":
         if self.cached_deseralized_message is None:
-            _syft_msg = validate_type(
-                _deserialize(blob=self.serialized_message, from_bytes=True), SyftMessage
-            )
+            with serde_scope():
+                _syft_msg = validate_type(
+                    _deserialize(blob=self.serialized_message, from_bytes=True),
+                    SyftMessage,
+                )
             self.cached_deseralized_message = _syft_msg
 
         if self.cached_deseralized_message is None:
@@ -179,9 +183,10 @@ class SignedMessage(SyftMessage):
     @staticmethod
     def _proto2object(proto: SignedMessage_PB) -> SignedMessageT:
         # TODO: horrible temp hack, need to rethink address on SignedMessage
-        sub_message = validate_type(
-            _deserialize(blob=proto.message, from_bytes=True), SyftMessage
-        )
+        with serde_scope():
+            sub_message = validate_type(
+                _deserialize(blob=proto.message, from_bytes=True), SyftMessage
+            )
 
         address = sub_message.address
 
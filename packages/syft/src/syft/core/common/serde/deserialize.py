@@ -1,5 +1,4 @@
 # stdlib
-import re
 from typing import Any
 
 # third party
@@ -8,10 +7,44 @@ from google.protobuf.message import Message
 # relative
 from ....logger import traceback_and_raise
 from ....proto.util.data_message_pb2 import DataMessage
-from ....util import index_syft_by_module_name
+from .registry import lookup_type
+from .registry import resolve_shared_schema
 from .types import Deserializeable
 
 
+def _deserialization_error() -> TypeError:
+    return TypeError(
+        "You tried to deserialize an unsupported type. This can be caused by "
+        "several reasons. Either you are actively writing Syft code and forgot "
+        "to create one, or you are trying to deserialize an object which was "
+        "serialized using a different version of Syft and the object you tried "
+        "to deserialize is not supported in this version."
+    )
+
+
+def _parse_content(fully_qualified_name: str, content: bytes) -> Message:
+    """Parse the serialized protobuf of an object of the given type
+
+    :param fully_qualified_name: the type of the serialized object
+    :param content: the bytes of the protobuf returned by its _object2proto
+    :return: the protobuf message, ready to be passed to _deserialize
+    """
+    obj_type = lookup_type(fully_qualified_name=fully_qualified_name)
+    get_protobuf_schema = getattr(obj_type, "get_protobuf_schema", None)
+
+    if not callable(get_protobuf_schema):
+        traceback_and_raise(_deserialization_error())
+
+    protobuf_type = get_protobuf_schema()
+    blob = protobuf_type()
+
+    if not isinstance(blob, Message):
+        traceback_and_raise(_deserialization_error())
+
+    blob.ParseFromString(content)
+    return blob
+
+
 # WARNING: This code has more 🐉 Dragons than a game of D&D 🗡🧙🎲
 # you were warned...
 # enter at your own peril...
@@ -48,30 +81,14 @@ def _deserialize(
     :rtype: Serializable
     """
 
-    deserialization_error = TypeError(
-        "You tried to deserialize an unsupported type. This can be caused by "
-        "several reasons. Either you are actively writing Syft code and forgot "
-        "to create one, or you are trying to deserialize an object which was "
-        "serialized using a different version of Syft and the object you tried "
-        "to deserialize is not supported in this version."
-    )
+    deserialization_error = _deserialization_error()
 
     if from_bytes:
         data_message = DataMessage()
         data_message.ParseFromString(blob)
-        obj_type = index_syft_by_module_name(fully_qualified_name=data_message.obj_type)
-        get_protobuf_schema = getattr(obj_type, "get_protobuf_schema", None)
-
-        if not callable(get_protobuf_schema):
-            traceback_and_raise(deserialization_error)
-
-        protobuf_type = get_protobuf_schema()
-        blob = protobuf_type()
-
-        if not isinstance(blob, Message):
-            traceback_and_raise(deserialization_error)
-
-        blob.ParseFromString(data_message.content)
+        blob = _parse_content(
+            fully_qualified_name=data_message.obj_type, content=data_message.content
+        )
 
     # lets try to lookup the type we are deserializing
     # TODO: This needs to be cleaned up in GenerateWrapper and made more consistent.
@@ -94,10 +111,9 @@ def _deserialize(
         if obj_type is None:
             traceback_and_raise(deserialization_error)
 
-        obj_type = index_syft_by_module_name(fully_qualified_name=obj_type)  # type: ignore
+        obj_type = lookup_type(fully_qualified_name=obj_type)  # type: ignore
         obj_type = getattr(obj_type, "_sy_serializable_wrapper_type", obj_type)
     elif isinstance(obj_type, list):
-
         if isinstance(blob, rs_get_protobuf_schema()):
             res = rs_proto2object(proto=blob)
             if getattr(res, "temporary_box", False) and hasattr(res, "upcast"):
@@ -108,26 +124,9 @@ def _deserialize(
         else:
             # this means we have multiple classes that use the same proto but use the
             # obj_type field to differentiate, so lets figure out which one in the list
-            obj_type_re = r'obj_type: "(.+)"'
-            # the first obj_type in the protobuf will be the main outer type
-            obj_types = re.findall(obj_type_re, str(blob))
-            if len(obj_types) > 0:
-                real_obj_type = obj_types[0]
-                for possible_type in obj_type:
-                    possible_type_match = possible_type
-                    if hasattr(possible_type, "wrapped_type"):
-                        possible_type_match = possible_type.wrapped_type()
-                    # get the str inside <class ...>, fqn in sympy is different
-                    real_obj_type_str = str(possible_type_match).split("'")[1]
-                    if real_obj_type.endswith("Wrapper"):
-                        real_obj_type = real_obj_type[:-7]  # remove the last Wrapper
-
-                    if real_obj_type == real_obj_type_str or real_obj_type.endswith(
-                        real_obj_type_str
-                    ):
-                        # found it, lets overwrite obj_type and break
-                        obj_type = possible_type
-                        break
+            real_obj_type = resolve_shared_schema(blob=blob, candidates=obj_type)
+            if real_obj_type is not None:
+                obj_type = real_obj_type
 
     if not isinstance(obj_type, type):
         traceback_and_raise(f"{deserialization_error}. {type(blob)}")
@@ -1,5 +1,10 @@
 # stdlib
 from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
@@ -8,56 +13,152 @@ from google.protobuf.reflection import GeneratedProtocolMessageType
 import syft as sy
 
 # relative
+from ....experimental_flags import flags
+from ....proto.core.common.recursive_serde_pb2 import (
+    FlatRecursiveSerde as FlatRecursiveSerde_PB,
+)
 from ....proto.core.common.recursive_serde_pb2 import (
     RecursiveSerde as RecursiveSerde_PB,
 )
 from ....util import get_fully_qualified_name
-from ....util import index_syft_by_module_name
+from .deserialize import _deserialize
+from .deserialize import _parse_content
+from .registry import lookup_type
+from .serialize import _to_serializable
 
 
-def rs_object2proto(self: Any) -> RecursiveSerde_PB:
+def _rs_fields(obj: Any) -> Iterator[Tuple[str, Any]]:
     # if __attr_allowlist__ then only include attrs from that list
-    msg = RecursiveSerde_PB(fully_qualified_name=get_fully_qualified_name(self))
-
-    if self.__attr_allowlist__ is None:
-        attribute_dict = self.__dict__.keys()
+    if obj.__attr_allowlist__ is None:
+        attribute_dict = obj.__dict__.keys()
     else:
-        attribute_dict = self.__attr_allowlist__
+        attribute_dict = obj.__attr_allowlist__
 
     for attr_name in attribute_dict:
-        if hasattr(self, attr_name):
-            msg.fields_name.append(attr_name)
-            transforms = self.__serde_overrides__.get(attr_name, None)
+        if hasattr(obj, attr_name):
+            transforms = obj.__serde_overrides__.get(attr_name, None)
+            if transforms is None:
+                field_obj = getattr(obj, attr_name)
+            else:
+                field_obj = transforms[0](getattr(obj, attr_name))
+            yield attr_name, field_obj
+
+
+def _rs_set_field(obj: Any, attr_name: str, attr_value: Any) -> None:
+    transforms = obj.__serde_overrides__.get(attr_name, None)
+    try:
+        if transforms is None:
+            setattr(obj, attr_name, attr_value)
+        else:
+            setattr(obj, attr_name, transforms[1](attr_value))
+    except AttributeError:
+        # if its an ID we need to set the _id instead
+        if attr_name == "id":
+            attr_name = "_id"
             if transforms is None:
-                field_obj = getattr(self, attr_name)
+                setattr(obj, attr_name, attr_value)
             else:
-                field_obj = transforms[0](getattr(self, attr_name))
-            msg.fields_data.append(sy.serialize(field_obj, to_bytes=True))
+                setattr(obj, attr_name, transforms[1](attr_value))
+
+
+def _is_recursive_serde(obj: Any) -> bool:
+    return getattr(type(obj), "_object2proto", None) is rs_object2proto
+
+
+def rs_object2proto(self: Any) -> RecursiveSerde_PB:
+    if flags.FLAT_RECURSIVE_SERDE:
+        msg = RecursiveSerde_PB()
+        # the type of self is stored in the type table of the flat message
+        rs_object2flat(self, flat=msg.flat)
+        return msg
+
+    msg = RecursiveSerde_PB(fully_qualified_name=get_fully_qualified_name(self))
+    for attr_name, field_obj in _rs_fields(self):
+        msg.fields_name.append(attr_name)
+        msg.fields_data.append(sy.serialize(field_obj, to_bytes=True))
     return msg
 
 
 def rs_proto2object(proto: RecursiveSerde_PB) -> Any:
-    class_type = index_syft_by_module_name(proto.fully_qualified_name)
+    if proto.HasField("flat"):
+        return rs_flat2object(proto.flat)
+
+    class_type = lookup_type(proto.fully_qualified_name)
     obj = class_type.__new__(class_type)  # type: ignore
     for attr_name, attr_bytes in zip(proto.fields_name, proto.fields_data):
         attr_value = sy.deserialize(attr_bytes, from_bytes=True)
-        transforms = obj.__serde_overrides__.get(attr_name, None)
-        try:
-            if transforms is None:
-                setattr(obj, attr_name, attr_value)
-            else:
-                setattr(obj, attr_name, transforms[1](attr_value))
-        except AttributeError:
-            # if its an ID we need to set the _id instead
-            if attr_name == "id":
-                attr_name = "_id"
-                if transforms is None:
-                    setattr(obj, attr_name, attr_value)
-                else:
-                    setattr(obj, attr_name, transforms[1](attr_value))
+        _rs_set_field(obj, attr_name, attr_value)
 
     return obj
 
 
+def rs_object2flat(
+    self: Any, flat: Optional[FlatRecursiveSerde_PB] = None
+) -> FlatRecursiveSerde_PB:
+    """Serialize the whole tree of a recursive serde object into a single message
+
+    Unlike rs_object2proto, the fields are not serialized into their own DataMessage
+    one by one: every object of the tree becomes a node of the same message, type and
+    field names are only stored once, and the objects which are not recursive serde
+    have their protobuf written once as the content of their node.
+    """
+    if flat is None:
+        flat = FlatRecursiveSerde_PB()
+    names: Dict[str, int] = {}
+
+    def intern(name: str) -> int:
+        index = names.get(name, None)
+        if index is None:
+            index = len(names)
+            names[name] = index
+        return index
+
+    def add_node(obj: Any) -> int:
+        if _is_recursive_serde(obj):
+            fields_name = []
+            fields_node = []
+            for attr_name, field_obj in _rs_fields(obj):
+                fields_name.append(intern(attr_name))
+                fields_node.append(add_node(field_obj))
+            flat.nodes.add(
+                type_name=intern(get_fully_qualified_name(obj)),
+                fields_name=fields_name,
+                fields_node=fields_node,
+                recursive=True,
+            )
+        else:
+            is_serializable = _to_serializable(obj=obj)
+            flat.nodes.add(
+                type_name=intern(get_fully_qualified_name(is_serializable)),
+                content=is_serializable._object2proto().SerializeToString(),
+            )
+        return len(flat.nodes) - 1
+
+    add_node(self)
+    flat.names.extend(names.keys())
+    return flat
+
+
+def rs_flat2object(proto: FlatRecursiveSerde_PB) -> Any:
+    objs: List[Any] = []
+    # children are always stored before their parent and the root is the last node
+    for node in proto.nodes:
+        type_name = proto.names[node.type_name]
+        if node.recursive:
+            class_type = lookup_type(type_name)
+            obj = class_type.__new__(class_type)  # type: ignore
+            for name_index, node_index in zip(node.fields_name, node.fields_node):
+                _rs_set_field(obj, proto.names[name_index], objs[node_index])
+        else:
+            obj = _deserialize(
+                blob=_parse_content(
+                    fully_qualified_name=type_name, content=node.content
+                )
+            )
+        objs.append(obj)
+
+    return objs[-1]
+
+
 def rs_get_protobuf_schema() -> GeneratedProtocolMessageType:
     return RecursiveSerde_PB
@@ -0,0 +1,122 @@
+# stdlib
+import re
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+from google.protobuf.message import Message
+
+# relative
+from ....util import index_syft_by_module_name
+
+# classes decorated with @serializable which still have to be indexed, we index them
+# lazily because some of them get renamed after the decorator ran (see GenerateWrapper
+# and the syft.lib.python primitives which overwrite their __module__)
+_pending_types: List[type] = []
+
+# fully qualified name -> class, this is the dispatch table used by deserialize
+_fqn2type: Dict[str, Any] = {}
+
+# (protobuf type, outer obj_type) -> class, for protobufs shared by multiple classes
+_shared_schema2type: Dict[Tuple[type, str], type] = {}
+
+OBJ_TYPE_RE = re.compile(r'obj_type: "(.+)"')
+
+
+def register_serializable(cls: type) -> None:
+    """Add a class to the process wide serde dispatch table
+
+    This is called by the @serializable decorators so that every class which can be
+    serialized can also be found by the fully qualified name stored in the protobufs
+    without walking the syft module tree.
+
+    Args:
+        cls: the serializable class
+    """
+    _pending_types.append(cls)
+
+
+def _index_pending_types() -> None:
+    while len(_pending_types) > 0:
+        cls = _pending_types.pop(0)
+        _fqn2type[f"{cls.__module__}.{cls.__name__}"] = cls
+
+
+def lookup_type(fully_qualified_name: str) -> Any:
+    """Look up a serializable class from its fully qualified name
+
+    The first miss indexes all the classes registered so far, any name which is
+    still unknown is resolved once with index_syft_by_module_name and then cached,
+    so every following lookup is a single dict access.
+
+    Args:
+        fully_qualified_name: the name stored in a DataMessage or a RecursiveSerde
+
+    Returns:
+        a reference to the class at that path
+    """
+    obj_type = _fqn2type.get(fully_qualified_name, None)
+    if obj_type is None:
+        _index_pending_types()
+        obj_type = _fqn2type.get(fully_qualified_name, None)
+        if obj_type is None:
+            obj_type = index_syft_by_module_name(
+                fully_qualified_name=fully_qualified_name
+            )
+            _fqn2type[fully_qualified_name] = obj_type
+    return obj_type
+
+
+def _outer_obj_type(blob: Message) -> Optional[str]:
+    # most of the shared protobufs carry the type of the outer object in an
+    # obj_type field, in that case there is no need to render the whole message
+    if "obj_type" in type(blob).DESCRIPTOR.fields_by_name:
+        obj_type = getattr(blob, "obj_type", "")
+        if isinstance(obj_type, str) and obj_type != "":
+            return obj_type
+
+    obj_types = OBJ_TYPE_RE.findall(str(blob))
+    if len(obj_types) > 0:
+        return obj_types[0]
+    return None
+
+
+def resolve_shared_schema(blob: Message, candidates: List[type]) -> Optional[type]:
+    """Find which of the classes sharing a protobuf schema a message belongs to
+
+    Args:
+        blob: the protobuf message to deserialize
+        candidates: the classes registered against the protobuf type of blob
+
+    Returns:
+        the matching class or None if the message carries no obj_type
+    """
+    real_obj_type = _outer_obj_type(blob)
+    if real_obj_type is None:
+        return None
+
+    key = (type(blob), real_obj_type)
+    obj_type = _shared_schema2type.get(key, None)
+    if obj_type is not None:
+        return obj_type
+
+    if real_obj_type.endswith("Wrapper"):
+        real_obj_type = real_obj_type[:-7]  # remove the last Wrapper
+
+    for possible_type in candidates:
+        possible_type_match = possible_type
+        if hasattr(possible_type, "wrapped_type"):
+            possible_type_match = possible_type.wrapped_type()
+        # get the str inside <class ...>, fqn in sympy is different
+        real_obj_type_str = str(possible_type_match).split("'")[1]
+
+        if real_obj_type == real_obj_type_str or real_obj_type.endswith(
+            real_obj_type_str
+        ):
+            _shared_schema2type[key] = possible_type
+            return possible_type
+
+    return None
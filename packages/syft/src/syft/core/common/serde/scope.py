@@ -0,0 +1,48 @@
+# stdlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+
+class SerdeScope:
+    """
+    State shared by all the objects serialized as part of the same message, so an
+    object shared by several parts of the message, like the scalar manager of many
+    tensors, can be written once and referenced by the other parts. The parts are
+    read back in the order they were written, in a scope of their own.
+
+    Attributes:
+        written (Dict[Any, Any]): what was already written in this scope, by key.
+        read (Dict[Any, Any]): what was already read in this scope, by key.
+    """
+
+    def __init__(self) -> None:
+        self.written: Dict[Any, Any] = {}
+        self.read: Dict[Any, Any] = {}
+
+
+_current_scope: ContextVar[Optional[SerdeScope]] = ContextVar(
+    "serde_scope", default=None
+)
+
+
+def current_serde_scope() -> Optional[SerdeScope]:
+    return _current_scope.get()
+
+
+@contextmanager
+def serde_scope() -> Iterator[SerdeScope]:
+    """
+    Opens a SerdeScope for the serialization or the deserialization of a message. A
+    message signed while another one is serialized gets its own scope, since its
+    bytes may be read separately from the outer message.
+    """
+    scope = SerdeScope()
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
@@ -11,6 +11,7 @@ import syft
 
 # relative
 from ....util import aggressive_set_attr
+from .registry import register_serializable
 
 module_type = type(syft)
 
@@ -53,6 +54,8 @@ def GenerateWrapper(
     klass = module_parts.pop()
     Wrapper.__name__ = f"{klass}Wrapper"
     Wrapper.__module__ = f"syft.wrappers.{'.'.join(module_parts)}"
+    # register again now that the wrapper has its final name
+    register_serializable(Wrapper)
     # create a fake module `wrappers` under `syft`
     if "wrappers" not in syft.__dict__:
         syft.__dict__["wrappers"] = module_type(name="wrappers")
@@ -112,6 +115,7 @@ def serializable(
         cls._object2proto = rs_object2proto
         cls._proto2object = staticmethod(rs_proto2object)
         cls.get_protobuf_schema = staticmethod(rs_get_protobuf_schema)
+        register_serializable(cls)
         return cls
 
     def serializable_decorator(cls: Any) -> Any:
@@ -125,6 +129,7 @@ def serializable(
                 protobuf_schema.schema2type = [protobuf_schema.schema2type, cls]
         else:
             protobuf_schema.schema2type = cls
+        register_serializable(cls)
         return cls
 
     if generate_wrapper:
@@ -1,3 +1,6 @@
+# stdlib
+from typing import Any
+
 # third party
 from google.protobuf.message import Message
 
@@ -41,24 +44,7 @@ def _serialize(
     :rtype: Union[str, bytes, Message]
     """
 
-    # relative
-    from ....lib.python.primitive_factory import isprimitive
-
-    # we have an unboxed primitive type so we need to mirror that on deserialize
-    if isprimitive(obj):
-        # relative
-        from ....lib.python.primitive_factory import PrimitiveFactory
-
-        obj = PrimitiveFactory.generate_primitive(value=obj, temporary_box=True)
-        if hasattr(obj, "temporary_box"):
-            # TODO: can remove this once all of PrimitiveFactory.generate_primitive
-            # supports temporary_box and is tested
-            obj.temporary_box = True  # type: ignore
-
-    if hasattr(obj, "_sy_serializable_wrapper_type"):
-        is_serializable = obj._sy_serializable_wrapper_type(value=obj)  # type: ignore
-    else:
-        is_serializable = obj
+    is_serializable = _to_serializable(obj=obj)
 
     # traceback_and_raise(
     #     Exception(
@@ -86,3 +72,35 @@ def _serialize(
                         to_proto, to_bytes."""
             )
         )
+
+
+def _to_serializable(obj: object) -> Any:
+    """Return the object which implements _object2proto for obj
+
+    Unboxed primitives are boxed into a temporary Syft primitive and objects which
+    can't be serialized directly are wrapped into their _sy_serializable_wrapper_type.
+
+    :param obj: the object to serialize
+    :return: obj or the box / wrapper which serializes it
+    """
+
+    # relative
+    from ....lib.python.primitive_factory import isprimitive
+
+    # we have an unboxed primitive type so we need to mirror that on deserialize
+    if isprimitive(obj):
+        # relative
+        from ....lib.python.primitive_factory import PrimitiveFactory
+
+        obj = PrimitiveFactory.generate_primitive(value=obj, temporary_box=True)
+        if hasattr(obj, "temporary_box"):
+            # TODO: can remove this once all of PrimitiveFactory.generate_primitive
+            # supports temporary_box and is tested
+            obj.temporary_box = True  # type: ignore
+
+    if hasattr(obj, "_sy_serializable_wrapper_type"):
+        is_serializable = obj._sy_serializable_wrapper_type(value=obj)  # type: ignore
+    else:
+        is_serializable = obj
+
+    return is_serializable
@@ -40,7 +40,6 @@ class AbstractNodeClient(Address):
 
 
 class AbstractNode(Address):
-
     name: Optional[str]
     signing_key: Optional[SigningKey]
     verify_key: Optional[VerifyKey]
@@ -70,6 +69,7 @@ class AbstractNode(Address):
     store: ObjectStore
     requests: List
     lib_ast: Any  # Can't import Globals (circular reference)
+    action_scheduler: Optional[Any]  # Can't import ActionScheduler (circular reference)
     """"""
 
     @property
@@ -0,0 +1,351 @@
+# stdlib
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+# third party
+from nacl.signing import VerifyKey
+
+# relative
+from .....logger import error
+from .....logger import traceback
+from ....common.uid import UID
+from ...abstract.node import AbstractNode
+from . import greenlets_switch
+from .common import Action
+
+# how often the parked actions check the store again for objects set in a way the
+# watch of the store didn't report, e.g. before the keys were watched
+PARKED_RECHECK_INTERVAL = 1.0
+
+
+class ScheduledAction:
+    """An action waiting in the ActionScheduler for the actions it depends on"""
+
+    def __init__(
+        self,
+        action: Action,
+        verify_key: Optional[VerifyKey],
+        read_ids: Optional[List[UID]],
+        write_ids: Optional[List[UID]],
+    ) -> None:
+        self.action = action
+        self.verify_key = verify_key
+        self.read_ids = read_ids
+        self.write_ids = write_ids
+        self.future: Future = Future()
+        # number of scheduled actions which have to finish before this one can run
+        self.blocked_by = 0
+        self.dependents: List["ScheduledAction"] = []
+        # set if an action writing an object this one reads failed
+        self.failed_dependency: Optional[BaseException] = None
+        # the objects this action reads which an earlier pending action writes
+        self.reads_pending_writes: Set[UID] = set()
+        # the objects this action reads which are not in the store yet
+        self.missing: Set[UID] = set()
+        self.parked_at = 0.0
+
+    @property
+    def is_barrier(self) -> bool:
+        # without knowing what an action touches it has to run on its own
+        return self.read_ids is None or self.write_ids is None
+
+    def reads_output_of(self, other: "ScheduledAction") -> bool:
+        # what barriers touch is unknown, so a failed barrier doesn't fail the others
+        if self.is_barrier or other.is_barrier:
+            return False
+        return not set(self.read_ids).isdisjoint(other.write_ids)  # type: ignore
+
+
+class ActionScheduler:
+    """
+    ActionScheduler runs the actions received by a node on a pool of workers, as soon
+    as the actions they depend on have finished, instead of one after the other.
+
+    Every action tells which objects it reads and writes (Action.read_ids and
+    Action.write_ids). An action waits for the earlier actions which write what it
+    reads or writes, and for the earlier actions which read what it writes, so
+    actions touching the same objects still run in the order they arrived while
+    independent branches of a computation run concurrently. An earlier reader of an
+    object which is neither stored nor written by an earlier action waits for the
+    object instead, so the action writing it doesn't wait for that reader. Waiting actions are
+    parked in the scheduler and don't use a worker. Actions which can't tell what
+    they touch run alone, after every earlier action and before every later one.
+
+    An action reading an object that no scheduled action writes, e.g. one sent by
+    another node, is parked until the object is in the store instead of waiting for it
+    on a worker. Actions which only deliver what other nodes send
+    (Action.delivers_inputs) run on a pool of their own, so they are never stuck
+    behind the actions waiting for them.
+
+    Failed actions are logged with their traceback and kept in failures, as nothing
+    waits on the futures of the actions the node services submit.
+
+    Attributes:
+        node (AbstractNode): the node executing the actions.
+        max_workers (int): the maximum number of actions running at the same time.
+        failures (Deque[Tuple[Action, BaseException]]): the last actions which failed.
+    """
+
+    def __init__(self, node: AbstractNode, max_workers: int = 16) -> None:
+        self.node = node
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ActionScheduler"
+        )
+        self._delivery_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ActionScheduler-delivery"
+        )
+        self.failures: Deque[Tuple[Action, BaseException]] = deque(maxlen=100)
+        self._lock = threading.Lock()
+        # the scheduled actions which haven't finished
+        self._pending: Set[ScheduledAction] = set()
+        # the last pending writer and the pending readers since of every object
+        self._last_writer: Dict[UID, ScheduledAction] = {}
+        self._readers: Dict[UID, List[ScheduledAction]] = {}
+        # the last pending barrier
+        self._last_barrier: Optional[ScheduledAction] = None
+        # the parked actions waiting for each object which isn't in the store yet
+        self._parked: Dict[UID, Set[ScheduledAction]] = {}
+        self._parked_changed = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def submit(self, action: Action, verify_key: Optional[VerifyKey]) -> Future:
+        """
+        Schedules action to be executed on the node once its dependencies finished.
+
+        Args:
+            action (Action): the action to execute.
+            verify_key (Optional[VerifyKey]): the key of the sender of the action.
+
+        Returns:
+            Future: the future of the result of the execution of the action.
+        """
+        scheduled = ScheduledAction(
+            action=action,
+            verify_key=verify_key,
+            read_ids=action.read_ids(),
+            write_ids=action.write_ids(),
+        )
+        with self._lock:
+            for dependency in self._dependencies(scheduled):
+                dependency.dependents.append(scheduled)
+                scheduled.blocked_by += 1
+            self._track(scheduled)
+            ready = scheduled.blocked_by == 0
+        if ready:
+            self._dispatch(scheduled)
+        return scheduled.future
+
+    def _dependencies(self, scheduled: ScheduledAction) -> Set[ScheduledAction]:
+        if scheduled.is_barrier:
+            return set(self._pending)
+
+        dependencies: Set[ScheduledAction] = set()
+        if self._last_barrier is not None:
+            dependencies.add(self._last_barrier)
+        for uid in scheduled.read_ids:  # type: ignore
+            if uid in self._last_writer:
+                dependencies.add(self._last_writer[uid])
+        for uid in scheduled.write_ids:  # type: ignore
+            if uid in self._last_writer:
+                dependencies.add(self._last_writer[uid])
+            # deliveries create the objects other actions wait for
+            if scheduled.action.delivers_inputs:
+                continue
+            for reader in self._readers.get(uid, []):
+                if not self._waits_for(reader, uid):
+                    dependencies.add(reader)
+        dependencies.discard(scheduled)
+        return dependencies
+
+    def _waits_for(self, reader: ScheduledAction, uid: UID) -> bool:
+        """Whether reader waits for uid to be stored rather than reading the object
+        an action writing uid would replace."""
+        if uid in reader.missing:
+            return True
+        if self.node is None or uid in reader.reads_pending_writes:
+            return False
+        return uid not in self.node.store
+
+    def _track(self, scheduled: ScheduledAction) -> None:
+        self._pending.add(scheduled)
+        if scheduled.is_barrier:
+            self._last_barrier = scheduled
+            return
+
+        for uid in scheduled.read_ids:  # type: ignore
+            if uid in self._last_writer:
+                scheduled.reads_pending_writes.add(uid)
+            self._readers.setdefault(uid, []).append(scheduled)
+        for uid in scheduled.write_ids:  # type: ignore
+            self._last_writer[uid] = scheduled
+            self._readers.pop(uid, None)
+
+    def _untrack(self, scheduled: ScheduledAction) -> None:
+        self._pending.discard(scheduled)
+        if scheduled.is_barrier:
+            if self._last_barrier is scheduled:
+                self._last_barrier = None
+            return
+
+        for uid in scheduled.write_ids:  # type: ignore
+            if self._last_writer.get(uid, None) is scheduled:
+                del self._last_writer[uid]
+        for uid in scheduled.read_ids:  # type: ignore
+            readers = self._readers.get(uid, None)
+            if readers is not None and scheduled in readers:
+                readers.remove(scheduled)
+                if len(readers) == 0:
+                    del self._readers[uid]
+
+    def _dispatch(self, scheduled: ScheduledAction) -> None:
+        if scheduled.action.delivers_inputs:
+            self._delivery_pool.submit(self._run, scheduled)
+        elif scheduled.failed_dependency is not None or not self._park(scheduled):
+            self._pool.submit(self._run, scheduled)
+
+    def _park(self, scheduled: ScheduledAction) -> bool:
+        """Parks scheduled until the objects it reads are in the store. Returns False
+        if they are all there already."""
+        if scheduled.is_barrier or self.node is None:
+            return False
+        read_ids: List[UID] = scheduled.read_ids  # type: ignore
+        missing = {uid for uid in read_ids if uid not in self.node.store}
+        if len(missing) == 0:
+            return False
+
+        with self._lock:
+            scheduled.missing = missing
+            scheduled.parked_at = time.monotonic()
+            for uid in missing:
+                self._parked.setdefault(uid, set()).add(scheduled)
+            if self._watcher is None:
+                self._watcher = threading.Thread(
+                    target=self._watch_parked,
+                    name="ActionScheduler-parked",
+                    daemon=True,
+                )
+                self._watcher.start()
+        self._parked_changed.set()
+        # the objects may have been set before the actions were parked
+        self._release(missing)
+        return True
+
+    def _watch_parked(self) -> None:
+        while not self._closed:
+            with self._lock:
+                keys = list(self._parked.keys())
+            if len(keys) == 0:
+                self._parked_changed.wait()
+                self._parked_changed.clear()
+                continue
+
+            self._parked_changed.clear()
+            # the watch starts before the store is checked so no set can be missed
+            with self.node.store.watch(keys=keys) as key_watch:
+                self._release(keys)
+                self._expire_parked()
+                if not self._parked_changed.is_set():
+                    key_watch.wait(timeout=PARKED_RECHECK_INTERVAL)
+
+    def _release(self, keys: Iterable[UID]) -> None:
+        """Dispatches the parked actions which stop waiting once keys are stored."""
+        with self._lock:
+            keys = [uid for uid in keys if uid in self._parked]
+        if len(keys) == 0:
+            return
+        stored = [uid for uid in keys if uid in self.node.store]
+
+        ready: List[ScheduledAction] = []
+        with self._lock:
+            for uid in stored:
+                for scheduled in self._parked.pop(uid, ()):
+                    scheduled.missing.discard(uid)
+                    if len(scheduled.missing) == 0:
+                        ready.append(scheduled)
+        for scheduled in ready:
+            self._pool.submit(self._run, scheduled)
+
+    def _expire_parked(self) -> None:
+        timeout = greenlets_switch.OBJECT_RETRIEVAL_TIMEOUT
+        if timeout is None:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            expired = {
+                scheduled
+                for parked in self._parked.values()
+                for scheduled in parked
+                if now - scheduled.parked_at >= timeout
+            }
+            for scheduled in expired:
+                for uid in scheduled.missing:
+                    parked = self._parked.get(uid, set())
+                    parked.discard(scheduled)
+                    if len(parked) == 0:
+                        self._parked.pop(uid, None)
+                scheduled.failed_dependency = TimeoutError(
+                    f"{scheduled.action} is missing the objects at {scheduled.missing}"
+                    + f" after waiting {timeout} seconds"
+                )
+        for scheduled in expired:
+            self._pool.submit(self._run, scheduled)
+
+    def _run(self, scheduled: ScheduledAction) -> None:
+        exception: Optional[BaseException] = scheduled.failed_dependency
+        result = None
+        if exception is None:
+            try:
+                result = scheduled.action.execute_action(
+                    node=self.node, verify_key=scheduled.verify_key  # type: ignore
+                )
+            except Exception as e:
+                traceback(f"Exception executing {scheduled.action}. {e}")
+                exception = e
+        else:
+            error(f"{scheduled.action} was not executed. {exception}")
+
+        ready: List[ScheduledAction] = []
+        with self._lock:
+            self._untrack(scheduled)
+            for dependent in scheduled.dependents:
+                # an action can't run without the objects of a failed action
+                if exception is not None and dependent.reads_output_of(scheduled):
+                    dependent.failed_dependency = exception
+                dependent.blocked_by -= 1
+                if dependent.blocked_by == 0:
+                    ready.append(dependent)
+            if exception is not None:
+                self.failures.append((scheduled.action, exception))
+
+        if exception is None:
+            scheduled.future.set_result(result)
+        else:
+            scheduled.future.set_exception(exception)
+        # the objects written by the action wake up the actions parked for them
+        if exception is None and not scheduled.is_barrier:
+            self._release(scheduled.write_ids)  # type: ignore
+        for dependent in ready:
+            self._dispatch(dependent)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._closed = True
+        self._parked_changed.set()
+        self._pool.shutdown(wait=wait)
+        self._delivery_pool.shutdown(wait=wait)
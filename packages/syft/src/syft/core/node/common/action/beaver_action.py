@@ -1,5 +1,9 @@
 # stdlib
+from contextlib import contextmanager
+import threading
+from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 
@@ -14,19 +18,28 @@ import syft as sy
 from .....proto.core.node.common.action.beaver_action_pb2 import (
     BeaverAction as BeaverAction_PB,
 )
+from .....proto.core.node.common.action.beaver_action_pb2 import (
+    BeaverBatchAction as BeaverBatchAction_PB,
+)
 from ....common.serde.serializable import serializable
 from ....common.uid import UID
 from ....io.address import Address
+from ....store.key_notifier import KeyNotifier
 from ....store.storeable_object import StorableObject
 from ....tensor.smpc.share_tensor import ShareTensor
 from ...abstract.node import AbstractNode
 from .common import ImmediateActionWithoutReply
 
 BEAVER_CACHE: Dict[UID, StorableObject] = {}  # Global cache for spdz mask values
+BEAVER_CACHE_NOTIFIER = KeyNotifier()  # Wakes up the actions waiting for mask values
+# The BeaverActions held back while a round of SMPC actions is executed
+BEAVER_OUTBOX = threading.local()
 
 
 @serializable()
 class BeaverAction(ImmediateActionWithoutReply):
+    delivers_inputs = True
+
     def __init__(
         self,
         eps: ShareTensor,
@@ -83,6 +96,49 @@ class BeaverAction(ImmediateActionWithoutReply):
             BEAVER_CACHE[id_at_location] = result  # type: ignore
         else:
             raise Exception(f"Object at {id_at_location} should be a List or None")
+        BEAVER_CACHE_NOTIFIER.notify(keys=[id_at_location])
+
+    @staticmethod
+    def send(client: Any, action: "BeaverAction") -> None:
+        """Send the masked values to another party, or hold them back until the end of
+        the batched() block being executed.
+
+        Args:
+            client (Any): The client of the party.
+            action (BeaverAction): The action addressed to the party.
+        """
+        outbox = getattr(BEAVER_OUTBOX, "actions", None)
+        if outbox is None:
+            client.send_immediate_msg_without_reply(msg=action)
+        else:
+            outbox.setdefault(client, []).append(action)
+
+    @staticmethod
+    @contextmanager
+    def batched() -> Iterator[None]:
+        """Send the BeaverActions of the block as one BeaverBatchAction per party.
+
+        A round of SMPC actions opens the masks of all its multiplications in one
+        message to each party, instead of one message per multiplication. If the
+        block raises, nothing is sent, so no party gets a partial round.
+        """
+        previous = getattr(BEAVER_OUTBOX, "actions", None)
+        outbox: Dict[Any, List[BeaverAction]] = {}
+        BEAVER_OUTBOX.actions = outbox
+        try:
+            yield
+        finally:
+            BEAVER_OUTBOX.actions = previous
+        for client, actions in outbox.items():
+            batch = BeaverBatchAction(actions=actions, address=client.address)
+            client.send_immediate_msg_without_reply(msg=batch)
+
+    def read_ids(self) -> Optional[List[UID]]:
+        return []
+
+    def write_ids(self) -> Optional[List[UID]]:
+        # the shares are added to the values in BEAVER_CACHE instead of the store
+        return [self.eps_id, self.delta_id]
 
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         eps = self.eps
@@ -116,3 +172,50 @@ class BeaverAction(ImmediateActionWithoutReply):
     @staticmethod
     def get_protobuf_schema() -> GeneratedProtocolMessageType:
         return BeaverAction_PB
+
+
+@serializable()
+class BeaverBatchAction(ImmediateActionWithoutReply):
+    """The BeaverActions sent to a party by one round of SMPC actions."""
+
+    delivers_inputs = True
+
+    def __init__(
+        self,
+        actions: List[BeaverAction],
+        address: Address,
+        msg_id: Optional[UID] = None,
+    ):
+        super().__init__(address=address, msg_id=msg_id)
+        self.actions = actions
+
+    def __repr__(self) -> str:
+        return f"Beaver Batch Action: {len(self.actions)} actions"
+
+    def read_ids(self) -> Optional[List[UID]]:
+        return []
+
+    def write_ids(self) -> Optional[List[UID]]:
+        ids: List[UID] = []
+        for action in self.actions:
+            ids += action.write_ids()  # type: ignore
+        return ids
+
+    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        for action in self.actions:
+            action.execute_action(node, verify_key)
+
+    def _object2proto(self) -> BeaverBatchAction_PB:
+        actions = [sy.serialize(action) for action in self.actions]
+        addr = sy.serialize(self.address)
+        return BeaverBatchAction_PB(actions=actions, address=addr)
+
+    @staticmethod
+    def _proto2object(proto: BeaverBatchAction_PB) -> "BeaverBatchAction":
+        actions = [sy.deserialize(blob=action) for action in proto.actions]
+        addr = sy.deserialize(blob=proto.address)
+        return BeaverBatchAction(actions=actions, address=addr)
+
+    @staticmethod
+    def get_protobuf_schema() -> GeneratedProtocolMessageType:
+        return BeaverBatchAction_PB
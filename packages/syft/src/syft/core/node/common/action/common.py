@@ -1,5 +1,8 @@
 # stdlib
+from typing import List
+from typing import Optional
 from typing import Union
+from uuid import UUID
 
 # third party
 from nacl.signing import VerifyKey
@@ -9,17 +12,37 @@ from ....common.message import EventualSyftMessageWithoutReply
 from ....common.message import ImmediateSyftMessageWithReply
 from ....common.message import ImmediateSyftMessageWithoutReply
 from ....common.message import SyftMessage
+from ....common.uid import UID
 from ...abstract.node import AbstractNode
 
+# Stands for the CryptoStore of the node in Action.write_ids. The primitives are taken
+# from the store in the order they were put there, so the actions putting or taking
+# them have to run in the order they arrived, the same order on every party.
+CRYPTO_STORE_ID = UID(UUID(int=1))
+
 
 class Action(SyftMessage):
     """ """
 
+    # Actions which only store what other nodes send them (objects, shares of masked
+    # values) and never wait for anything. The ActionScheduler runs them apart from
+    # the other actions, so they can't be stuck behind the actions waiting for them.
+    delivers_inputs: bool = False
+
     def execute_action(
         self, node: AbstractNode, verify_key: VerifyKey
     ) -> Union[SyftMessage, None]:
         raise NotImplementedError
 
+    def read_ids(self) -> Optional[List[UID]]:
+        """Returns the ids of the objects the action reads, None if they are unknown.
+        The ActionScheduler runs the actions with unknown dependencies on their own."""
+        return None
+
+    def write_ids(self) -> Optional[List[UID]]:
+        """Returns the ids of the objects the action writes, None if they are unknown"""
+        return None
+
 
 class ImmediateActionWithoutReply(Action, ImmediateSyftMessageWithoutReply):
     """ """
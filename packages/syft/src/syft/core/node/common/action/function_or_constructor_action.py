@@ -27,9 +27,15 @@ from ....pointer.pointer import Pointer
 from ....store.storeable_object import StorableObject
 from ...abstract.node import AbstractNode
 from ..util import listify
+from .common import CRYPTO_STORE_ID
 from .common import ImmediateActionWithoutReply
 from .greenlets_switch import retrieve_object
 
+# the function putting crypto primitives in the CryptoStore of the node
+POPULATE_STORE_PATH = "syft.core.tensor.smpc.share_tensor.populate_store"
+# the function counting them, after the actions which change the CryptoStore
+COUNT_PRIMITIVES_PATH = "syft.core.tensor.smpc.share_tensor.count_primitives"
+
 
 @serializable()
 class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
@@ -78,6 +84,22 @@ class RunFunctionOrConstructorAction(ImmediateActionWithoutReply):
         # left and right have the same keys
         return {k: left[k] for k in intersection}
 
+    def read_ids(self) -> Optional[List[UID]]:
+        ids = [arg.id_at_location for arg in self.args if isinstance(arg, Pointer)]
+        ids += [
+            arg.id_at_location
+            for arg in self.kwargs.values()
+            if isinstance(arg, Pointer)
+        ]
+        if self.path == COUNT_PRIMITIVES_PATH:
+            ids.append(CRYPTO_STORE_ID)
+        return ids
+
+    def write_ids(self) -> Optional[List[UID]]:
+        if self.path == POPULATE_STORE_PATH:
+            return [self.id_at_location, CRYPTO_STORE_ID]
+        return [self.id_at_location]
+
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         method = node.lib_ast(self.path)
         result_read_permissions: Union[None, Dict[VerifyKey, UID]] = None
@@ -29,14 +29,19 @@ class GarbageCollectBatchedAction(EventualActionWithoutReply):
         super().__init__(address=address, msg_id=msg_id)
         self.ids_at_location = ids_at_location
 
+    def read_ids(self) -> Optional[List[UID]]:
+        return []
+
+    def write_ids(self) -> Optional[List[UID]]:
+        return list(self.ids_at_location)
+
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         try:
-            for id_at_location in self.ids_at_location:
-                node.store.delete(key=id_at_location)
+            node.store.delete_many(keys=self.ids_at_location)
         except Exception as e:
             critical(
                 "> GarbageCollectBatchedAction deletion exception "
-                + f"{id_at_location} {e}"
+                + f"{self.ids_at_location} {e}"
             )
 
     def _object2proto(self) -> GarbageCollectBatchedAction_PB:
@@ -51,7 +56,6 @@ class GarbageCollectBatchedAction(EventualActionWithoutReply):
     def _proto2object(
         proto: GarbageCollectBatchedAction_PB,
     ) -> "GarbageCollectBatchedAction":
-
         ids_at_location = []
         for id_at_location in proto.ids_at_location:
             ids_at_location.append(sy.deserialize(blob=id_at_location))
@@ -1,4 +1,5 @@
 # stdlib
+from typing import List
 from typing import Optional
 
 # third party
@@ -28,6 +29,12 @@ class GarbageCollectObjectAction(EventualActionWithoutReply):
         super().__init__(address=address, msg_id=msg_id)
         self.id_at_location = id_at_location
 
+    def read_ids(self) -> Optional[List[UID]]:
+        return []
+
+    def write_ids(self) -> Optional[List[UID]]:
+        return [self.id_at_location]
+
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         try:
             node.store.delete(key=self.id_at_location)
@@ -38,7 +45,6 @@ class GarbageCollectObjectAction(EventualActionWithoutReply):
             )
 
     def _object2proto(self) -> GarbageCollectObjectAction_PB:
-
         id_pb = sy.serialize(self.id_at_location)
         addr = sy.serialize(self.address)
 
@@ -51,7 +57,6 @@ class GarbageCollectObjectAction(EventualActionWithoutReply):
     def _proto2object(
         proto: GarbageCollectObjectAction_PB,
     ) -> "GarbageCollectObjectAction":
-
         id_at_location = sy.deserialize(blob=proto.id_at_location)
         addr = sy.deserialize(blob=proto.address)
 
@@ -1,51 +1,115 @@
-# third party
-import gevent
+# stdlib
+import os
+import time
+from typing import Callable
+from typing import List
+from typing import Optional
 
 # relative
 from .....logger import critical
+from .....logger import traceback_and_raise
 from ....common.uid import UID
+from ....store.key_notifier import KeyWatch
 from ....store.storeable_object import StorableObject
 from ...abstract.node import AbstractNode
 
+# The maximum number of seconds an action waits for the objects it needs. By default
+# it waits until the hard time limit set on the celery worker stops it.
+OBJECT_RETRIEVAL_TIMEOUT: Optional[float] = (
+    float(os.environ["OBJECT_RETRIEVAL_TIMEOUT"])
+    if "OBJECT_RETRIEVAL_TIMEOUT" in os.environ
+    else None
+)
+
+# how often to log that an action is still waiting for its objects
+WAITING_LOG_INTERVAL = 30.0
+
+
+def wait_until(
+    key_watch: KeyWatch,
+    is_ready: Callable[[], bool],
+    timeout: Optional[float],
+    log_waiting: Callable[[], str],
+) -> None:
+    """Checks is_ready every time the key_watch wakes up until it returns True"""
+    if timeout is None:
+        timeout = OBJECT_RETRIEVAL_TIMEOUT
+    start = time.monotonic()
+    while not is_ready():
+        elapsed = time.monotonic() - start
+        if timeout is not None and elapsed >= timeout:
+            traceback_and_raise(
+                TimeoutError(f"{log_waiting()} after waiting {timeout} seconds")
+            )
+        wait_for = WAITING_LOG_INTERVAL
+        if timeout is not None:
+            wait_for = min(wait_for, timeout - elapsed)
+        if not key_watch.wait(timeout=wait_for):
+            critical(log_waiting())
+
 
 def retrieve_object(
-    node: AbstractNode, id_at_location: UID, path: str
+    node: AbstractNode, id_at_location: UID, path: str, timeout: Optional[float] = None
 ) -> StorableObject:
-    # A hard time limit is set on celery worker which prevents infinite execution.
-    ctr = 0
-    while True:
-        store_obj = node.store.get_object(key=id_at_location)
-        if store_obj is None:
-            if ctr % 1500 == 0:
-                critical(
-                    f"execute_action on {path} failed due to missing object"
-                    + f" at: {id_at_location}"
-                )
-            # Implicit context switch between greenlets.
-            gevent.sleep(0)
-            ctr += 1
-        else:
-            return store_obj
+    return retrieve_objects(node, [id_at_location], path, timeout=timeout)[0]
+
+
+def retrieve_objects(
+    node: AbstractNode,
+    ids_at_location: List[UID],
+    path: str,
+    timeout: Optional[float] = None,
+) -> List[StorableObject]:
+    # fetch every object in one round trip and only wait for the missing ones
+    store_objs: List[Optional[StorableObject]] = list(
+        node.store.get_many(keys=ids_at_location)
+    )
+    missing = [i for i, store_obj in enumerate(store_objs) if store_obj is None]
+    if len(missing) == 0:
+        return store_objs  # type: ignore
+
+    def is_ready() -> bool:
+        # the objects set before the watch started are only found by checking again
+        nonlocal missing
+        retrieved = node.store.get_many(keys=[ids_at_location[i] for i in missing])
+        for i, store_obj in zip(missing, retrieved):
+            store_objs[i] = store_obj
+        missing = [i for i in missing if store_objs[i] is None]
+        return len(missing) == 0
+
+    def log_waiting() -> str:
+        return (
+            f"execute_action on {path} failed due to missing objects"
+            + f" at: {[ids_at_location[i] for i in missing]}"
+        )
+
+    # the store wakes the watch up when one of the objects is set, instead of
+    # checking the store again and again until they are there
+    with node.store.watch(keys=[ids_at_location[i] for i in missing]) as key_watch:
+        wait_until(key_watch, is_ready, timeout, log_waiting)
+    return store_objs  # type: ignore
 
 
 def beaver_retrieve_object(
-    node: AbstractNode, id_at_location: UID, nr_parties: int
+    node: AbstractNode,
+    id_at_location: UID,
+    nr_parties: int,
+    timeout: Optional[float] = None,
 ) -> StorableObject:
     # relative
     from .beaver_action import BEAVER_CACHE
+    from .beaver_action import BEAVER_CACHE_NOTIFIER
 
-    # A hard time limit is set on celery worker which prevents infinite execution.
-    ctr = 0
-    while True:
+    def is_ready() -> bool:
         store_obj = BEAVER_CACHE.get(id_at_location, None)  # type: ignore
-        if store_obj is None or len(store_obj.data) != nr_parties:
-            if ctr % 1500 == 0:
-                critical(
-                    f"Beaver Retrieval failed for {nr_parties} parties due to missing object"
-                    + f" at: {id_at_location} values: {store_obj}"
-                )
-            # Implicit context switch between greenlets.
-            gevent.sleep(0)
-            ctr += 1
-        else:
-            return store_obj
+        return store_obj is not None and len(store_obj.data) == nr_parties
+
+    def log_waiting() -> str:
+        return (
+            f"Beaver Retrieval failed for {nr_parties} parties due to missing object"
+            + f" at: {id_at_location} values: {BEAVER_CACHE.get(id_at_location, None)}"
+        )
+
+    with BEAVER_CACHE_NOTIFIER.watch(keys=[id_at_location]) as key_watch:
+        wait_until(key_watch, is_ready, timeout, log_waiting)
+    return BEAVER_CACHE[id_at_location]  # type: ignore
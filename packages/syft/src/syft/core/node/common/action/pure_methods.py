@@ -0,0 +1,163 @@
+# stdlib
+from typing import Any
+from typing import Iterable
+from typing import Set
+
+# relative
+from .....util import get_fully_qualified_name
+
+
+def _paths(klass: str, names: Iterable[str]) -> Set[str]:
+    return {f"{klass}.{name}" for name in names}
+
+
+# Methods which never change the object they are called on. RunClassMethodAction
+# trusts this list to skip the snapshot it otherwise takes of self to find out if a
+# method mutated it, so only add a method here if none of its arguments (e.g.
+# inplace=True) can make it write to self. Methods returning views (reshape, t, ...)
+# don't write to self either; writing to the view later is a method on the view.
+PURE_METHODS: Set[str] = _paths(
+    "torch.Tensor",
+    [
+        "__abs__",
+        "__add__",
+        "__and__",
+        "__eq__",
+        "__floordiv__",
+        "__ge__",
+        "__getitem__",
+        "__gt__",
+        "__invert__",
+        "__le__",
+        "__len__",
+        "__lt__",
+        "__matmul__",
+        "__mod__",
+        "__mul__",
+        "__ne__",
+        "__neg__",
+        "__or__",
+        "__pow__",
+        "__radd__",
+        "__rdiv__",
+        "__rfloordiv__",
+        "__rmul__",
+        "__rpow__",
+        "__rsub__",
+        "__rtruediv__",
+        "__sub__",
+        "__truediv__",
+        "__xor__",
+        "T",
+        "abs",
+        "add",
+        "all",
+        "any",
+        "argmax",
+        "argmin",
+        "bool",
+        "ceil",
+        "chunk",
+        "clamp",
+        "clone",
+        "contiguous",
+        "cos",
+        "cpu",
+        "cumsum",
+        "data",
+        "detach",
+        "dim",
+        "div",
+        "dot",
+        "double",
+        "eq",
+        "exp",
+        "expand",
+        "flatten",
+        "float",
+        "floor",
+        "ge",
+        "grad",
+        "gt",
+        "half",
+        "int",
+        "is_contiguous",
+        "is_floating_point",
+        "is_leaf",
+        "item",
+        "le",
+        "log",
+        "long",
+        "lt",
+        "matmul",
+        "max",
+        "mean",
+        "min",
+        "mm",
+        "mul",
+        "ndim",
+        "ne",
+        "neg",
+        "norm",
+        "numel",
+        "permute",
+        "pow",
+        "prod",
+        "reciprocal",
+        "relu",
+        "repeat",
+        "requires_grad",
+        "reshape",
+        "reshape_as",
+        "round",
+        "rsqrt",
+        "shape",
+        "sigmoid",
+        "sign",
+        "sin",
+        "size",
+        "split",
+        "sqrt",
+        "squeeze",
+        "std",
+        "sub",
+        "sum",
+        "t",
+        "tanh",
+        "tolist",
+        "transpose",
+        "trunc",
+        "unsqueeze",
+        "var",
+        "view",
+        "view_as",
+    ],
+) | _paths(
+    "numpy.ndarray",
+    [
+        "T",
+        "__add__",
+        "copy",
+        "item",
+        "itemsize",
+        "nbytes",
+        "ndim",
+        "shape",
+        "size",
+        "strides",
+        "sum",
+        "view",
+    ],
+)
+
+
+def is_pure_method(path: str, obj: Any) -> bool:
+    """Returns True if calling the method at path on obj is known not to mutate obj.
+    Subclasses and objects with their own attribute of the same name could do
+    anything, so this only holds when obj is exactly of the class in path."""
+    if path not in PURE_METHODS:
+        return False
+    klass, method_name = path.rsplit(".", 1)
+    if method_name in getattr(obj, "__dict__", {}):
+        return False
+    return get_fully_qualified_name(obj=obj) == klass
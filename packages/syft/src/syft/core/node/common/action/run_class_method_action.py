@@ -26,7 +26,9 @@ from ....io.address import Address
 from ....store.storeable_object import StorableObject
 from ...abstract.node import AbstractNode
 from .common import ImmediateActionWithoutReply
-from .greenlets_switch import retrieve_object
+from .greenlets_switch import retrieve_objects
+from .pure_methods import PURE_METHODS
+from .pure_methods import is_pure_method
 
 
 @serializable()
@@ -91,6 +93,20 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
         )
         return f"RunClassMethodAction {self_name}.{method_name}({arg_names}, {kwargs_names})"
 
+    def read_ids(self) -> Optional[List[UID]]:
+        ids = [arg.id_at_location for arg in self.args]
+        ids += [arg.id_at_location for arg in self.kwargs.values()]
+        if not self.is_static:
+            ids.append(self._self.id_at_location)
+        return ids
+
+    def write_ids(self) -> Optional[List[UID]]:
+        # the method might mutate self, unless it is known to be pure. The type of
+        # self is unknown before the action runs so only the path is checked here
+        if self.is_static or self.path in PURE_METHODS:
+            return [self.id_at_location]
+        return [self.id_at_location, self._self.id_at_location]
+
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         method = node.lib_ast(self.path)
 
@@ -106,9 +122,16 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
         ):
             mutating_internal = True
 
+        # resolve self, args and kwargs with a single bulk store lookup
+        ids_at_location = [arg.id_at_location for arg in self.args]
+        ids_at_location += [arg.id_at_location for arg in self.kwargs.values()]
+        if not self.is_static:
+            ids_at_location.append(self._self.id_at_location)
+        retrieved = retrieve_objects(node, ids_at_location, self.path)
+
         resolved_self = None
         if not self.is_static:
-            resolved_self = retrieve_object(node, self._self.id_at_location, self.path)
+            resolved_self = retrieved.pop()
             result_read_permissions = resolved_self.read_permissions  # type: ignore
             result_write_permissions = resolved_self.write_permissions  # type: ignore
         else:
@@ -117,22 +140,20 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
 
         resolved_args = list()
         tag_args = []
-        for arg in self.args:
-            r_arg = retrieve_object(node, arg.id_at_location, self.path)
+        for r_arg in retrieved[: len(self.args)]:
             result_read_permissions = self.intersect_keys(
-                result_read_permissions, r_arg.read_permissions  # type: ignore
+                result_read_permissions, r_arg.read_permissions
             )
-            resolved_args.append(r_arg.data)  # type: ignore
+            resolved_args.append(r_arg.data)
             tag_args.append(r_arg)
 
         resolved_kwargs = {}
         tag_kwargs = {}
-        for arg_name, arg in self.kwargs.items():
-            r_arg = retrieve_object(node, arg.id_at_location, self.path)
+        for arg_name, r_arg in zip(self.kwargs.keys(), retrieved[len(self.args) :]):
             result_read_permissions = self.intersect_keys(
-                result_read_permissions, r_arg.read_permissions  # type: ignore
+                result_read_permissions, r_arg.read_permissions
             )
-            resolved_kwargs[arg_name] = r_arg.data  # type: ignore
+            resolved_kwargs[arg_name] = r_arg.data
             tag_kwargs[arg_name] = r_arg
 
         (
@@ -149,9 +170,6 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
                     ValueError(f"Method {method} called, but self is None.")
                 )
 
-            resolved_self_previous_bytes = sy.serialize(
-                resolved_self.data, to_bytes=True
-            )
             method_name = self.path.split(".")[-1]
 
             target_method = getattr(resolved_self.data, method_name, None)
@@ -164,6 +182,22 @@ class RunClassMethodAction(ImmediateActionWithoutReply):
             else:
                 method = functools.partial(method, resolved_self.data)
 
+            # self is serialized before and after the call to find out if the method
+            # mutated it, which for a large tensor costs more than most methods. Skip
+            # it when the answer can't change anything: the method is already known
+            # to mutate, the mutation would not be kept without write permissions or
+            # the method is known to be pure (and self isn't also one of its args)
+            pure = (
+                is_pure_method(self.path, resolved_self.data)
+                and self._self.id_at_location not in ids_at_location[:-1]
+            )
+            if not (
+                mutating_internal or pure or verify_key not in result_write_permissions
+            ):
+                resolved_self_previous_bytes = sy.serialize(
+                    resolved_self.data, to_bytes=True
+                )
+
             result = method(*upcasted_args, **upcasted_kwargs)
 
         # TODO: add numpy support https://github.com/OpenMined/PySyft/issues/5164
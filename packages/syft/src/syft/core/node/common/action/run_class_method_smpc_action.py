@@ -28,6 +28,7 @@ from ....common.uid import UID
 from ....io.address import Address
 from ....store.storeable_object import StorableObject
 from ...abstract.node import AbstractNode
+from .common import CRYPTO_STORE_ID
 from .common import ImmediateActionWithoutReply
 from .greenlets_switch import retrieve_object
 
@@ -95,7 +96,25 @@ class RunClassMethodSMPCAction(ImmediateActionWithoutReply):
         )
         return f"RunClassMethodSMPCAction {self_name}.{method_name}({arg_names}, {kwargs_names})"
 
-    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+    def read_ids(self) -> Optional[List[UID]]:
+        ids = [arg.id_at_location for arg in self.args]
+        ids += [arg.id_at_location for arg in self.kwargs.values()]
+        ids.append(self._self.id_at_location)
+        return ids
+
+    def write_ids(self) -> Optional[List[UID]]:
+        # the steps take their crypto primitives from the CryptoStore of the node
+        return [self.id_at_location, CRYPTO_STORE_ID]
+
+    def smpc_actions(self, node: AbstractNode) -> List["SMPCActionMessage"]:
+        """Get the SMPCActionMessages this node runs for the method, in order.
+
+        Args:
+            node (AbstractNode): The node executing the action.
+
+        Returns:
+            List[SMPCActionMessage]: The steps of the method.
+        """
         # relative
         from . import smpc_action_functions
         from ..... import Tensor
@@ -172,15 +191,14 @@ class RunClassMethodSMPCAction(ImmediateActionWithoutReply):
         if isinstance(actions, (list, tuple)) and isinstance(
             actions[0], SMPCActionMessage
         ):
-            actions = SMPCActionMessage.filter_actions_after_rank(rank, actions)
-            for action in actions:
-                RunClassMethodSMPCAction.execute_smpc_action(node, action, verify_key)
+            return list(SMPCActionMessage.filter_actions_after_rank(rank, actions))
         elif isinstance(actions, SMPCActionSeqBatchMessage):
-            msg = actions
-            while msg.smpc_actions:
-                action = msg.smpc_actions[0]
-                RunClassMethodSMPCAction.execute_smpc_action(node, action, verify_key)
-                del msg.smpc_actions[0]
+            return list(actions.smpc_actions)
+        return []
+
+    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        for action in self.smpc_actions(node):
+            RunClassMethodSMPCAction.execute_smpc_action(node, action, verify_key)
 
     @staticmethod
     def execute_smpc_action(
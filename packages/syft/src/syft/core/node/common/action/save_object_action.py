@@ -1,4 +1,5 @@
 # stdlib
+from typing import List
 from typing import Optional
 
 # third party
@@ -22,6 +23,8 @@ from .common import ImmediateActionWithoutReply
 
 @serializable()
 class SaveObjectAction(ImmediateActionWithoutReply):
+    delivers_inputs = True
+
     def __init__(
         self,
         obj: StorableObject,
@@ -42,6 +45,12 @@ class SaveObjectAction(ImmediateActionWithoutReply):
         )
         return f"SaveObjectAction {obj_str}"
 
+    def read_ids(self) -> Optional[List[UID]]:
+        return []
+
+    def write_ids(self) -> Optional[List[UID]]:
+        return [self.obj.id]
+
     def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
         self.obj.read_permissions = {
             node.verify_key: node.id,
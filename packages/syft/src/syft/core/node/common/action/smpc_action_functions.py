@@ -197,8 +197,16 @@ def spdz_mask(
 
     for _, client in enumerate(clients):
         if client != curr_client:
-            beaver_action.address = client.address
-            client.send_immediate_msg_without_reply(msg=beaver_action)
+            BeaverAction.send(
+                client,
+                BeaverAction(
+                    eps=eps,
+                    eps_id=eps_id,
+                    delta=delta,
+                    delta_id=delta_id,
+                    address=client.address,
+                ),
+            )
 
 
 def smpc_mul(
@@ -0,0 +1,94 @@
+# stdlib
+from typing import List
+from typing import Optional
+
+# third party
+from google.protobuf.reflection import GeneratedProtocolMessageType
+from nacl.signing import VerifyKey
+
+# syft absolute
+import syft as sy
+
+# relative
+from .....proto.core.node.common.action.smpc_round_action_pb2 import (
+    SMPCRoundAction as SMPCRoundAction_PB,
+)
+from ....common.serde.serializable import serializable
+from ....common.uid import UID
+from ....io.address import Address
+from ...abstract.node import AbstractNode
+from .beaver_action import BeaverAction
+from .common import ImmediateActionWithoutReply
+from .run_class_method_smpc_action import RunClassMethodSMPCAction
+
+
+@serializable()
+class SMPCRoundAction(ImmediateActionWithoutReply):
+    """
+    The RunClassMethodSMPCActions of one round of an MPCSession, which don't depend on
+    each other, sent to a party in a single message.
+
+    The steps of the actions are executed in lockstep: the first step of every action,
+    then the second one, and so on. The masked values the multiplications of a step
+    open are sent to each other party in one BeaverBatchAction.
+
+    Attributes:
+         actions: the independent actions of the round, in the order they were issued.
+    """
+
+    def __init__(
+        self,
+        actions: List[RunClassMethodSMPCAction],
+        address: Address,
+        msg_id: Optional[UID] = None,
+    ):
+        super().__init__(address=address, msg_id=msg_id)
+        self.actions = actions
+
+    def __repr__(self) -> str:
+        return f"SMPCRoundAction {[action.pprint for action in self.actions]}"
+
+    def read_ids(self) -> Optional[List[UID]]:
+        ids: List[UID] = []
+        for action in self.actions:
+            ids += action.read_ids()  # type: ignore
+        return ids
+
+    def write_ids(self) -> Optional[List[UID]]:
+        ids: List[UID] = []
+        for action in self.actions:
+            ids += action.write_ids()  # type: ignore
+        return ids
+
+    def execute_action(self, node: AbstractNode, verify_key: VerifyKey) -> None:
+        # the steps are generated in the order the actions were issued, so every
+        # party takes the crypto primitives of the round from its store in that order
+        steps = [action.smpc_actions(node) for action in self.actions]
+        nr_steps = max((len(action_steps) for action_steps in steps), default=0)
+
+        for idx in range(nr_steps):
+            with BeaverAction.batched():
+                for action_steps in steps:
+                    if idx < len(action_steps):
+                        RunClassMethodSMPCAction.execute_smpc_action(
+                            node, action_steps[idx], verify_key
+                        )
+
+    def _object2proto(self) -> SMPCRoundAction_PB:
+        return SMPCRoundAction_PB(
+            actions=[sy.serialize(action) for action in self.actions],
+            address=sy.serialize(self.address),
+            msg_id=sy.serialize(self.id),
+        )
+
+    @staticmethod
+    def _proto2object(proto: SMPCRoundAction_PB) -> "SMPCRoundAction":
+        return SMPCRoundAction(
+            actions=[sy.deserialize(blob=action) for action in proto.actions],
+            address=sy.deserialize(blob=proto.address),
+            msg_id=sy.deserialize(blob=proto.msg_id),
+        )
+
+    @staticmethod
+    def get_protobuf_schema() -> GeneratedProtocolMessageType:
+        return SMPCRoundAction_PB
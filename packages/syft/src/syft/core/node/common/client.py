@@ -1,4 +1,5 @@
 # stdlib
+from itertools import islice
 import sys
 from typing import Any
 from typing import Dict
@@ -214,7 +215,6 @@ class Client(AbstractNodeClient):
         route_index: int = 0,
         timeout: Optional[float] = None,
     ) -> SyftMessage:
-
         # relative
         from .node_service.simple.simple_messages import NodeRunnableMessageWithReply
 
@@ -362,18 +362,36 @@ class Client(AbstractNodeClient):
 
 
 class StoreClient:
+    # the number of pointers asked for at a time when iterating over the store
+    page_size = 100
+
     def __init__(self, client: Client) -> None:
         self.client = client
 
-    @property
-    def store(self) -> List[Pointer]:
+    def _search(
+        self,
+        obj_id: Optional[UID] = None,
+        tags: Optional[List[str]] = None,
+        object_type: Optional[str] = None,
+        dataset: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Pointer], Optional[str]]:
         msg = ObjectSearchMessage(
-            address=self.client.address, reply_to=self.client.address
+            address=self.client.address,
+            reply_to=self.client.address,
+            obj_id=obj_id,
+            tags=tags,
+            object_type=object_type,
+            dataset=dataset,
+            name_prefix=name_prefix,
+            cursor=cursor,
+            limit=limit,
         )
 
-        results = getattr(
-            self.client.send_immediate_msg_with_reply(msg=msg), "results", None
-        )
+        reply = self.client.send_immediate_msg_with_reply(msg=msg)
+        results = getattr(reply, "results", None)
         if results is None:
             traceback_and_raise(ValueError("TODO"))
 
@@ -383,14 +401,43 @@ class StoreClient:
             result.gc_enabled = False
             result.client = self.client
 
-        return results
+        return results, getattr(reply, "next_cursor", None)
+
+    def search(
+        self,
+        tags: Optional[List[str]] = None,
+        object_type: Optional[str] = None,
+        dataset: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[Pointer]:
+        """Iterate over the pointers to the objects we're allowed to know about which
+        match the search, asking the node for page_size of them at a time."""
+        page_size = self.page_size if page_size is None else page_size
+        cursor = None
+        while True:
+            results, cursor = self._search(
+                tags=tags,
+                object_type=object_type,
+                dataset=dataset,
+                name_prefix=name_prefix,
+                cursor=cursor,
+                limit=page_size,
+            )
+            yield from results
+            if cursor is None:
+                return
+
+    @property
+    def store(self) -> List[Pointer]:
+        return list(self.search())
 
     def __len__(self) -> int:
         """Return the number of items in the object store we're allowed to know about"""
         return len(self.store)
 
     def __iter__(self) -> Iterator[Any]:
-        return self.store.__iter__()
+        return self.search()
 
     #
     # def __getitem__(self, key: Union[str, int, UID]) -> Pointer:
@@ -444,21 +491,14 @@ class StoreClient:
 
     def __getitem__(self, key: Union[str, int, UID]) -> Pointer:
         if isinstance(key, str):
-
             try:
                 return self[UID.from_string(key)]
-            except IndexError:
-
-                matches = 0
-                match_obj: Optional[Pointer] = None
-
-                for obj in self.store:
-                    if key in obj.tags:
-                        matches += 1
-                        match_obj = obj
-                if matches == 1 and match_obj is not None:
-                    return match_obj
-                elif matches > 1:
+            except (IndexError, ValueError):
+                # the node only needs to find two objects with the tag
+                matches = list(islice(self.search(tags=[key], page_size=2), 2))
+                if len(matches) == 1:
+                    return matches[0]
+                elif len(matches) > 1:
                     traceback_and_raise(
                         KeyError("More than one item with tag:" + str(key))
                     )
@@ -469,7 +509,7 @@ class StoreClient:
                     # think the user pass a key such short as part of id string.
                     str_key = str(key)
                     if len(str_key) >= 5:
-                        for obj in self.store:
+                        for obj in self.search():
                             if str_key in str(obj.id_at_location.value).replace(
                                 "-", ""
                             ):
@@ -486,22 +526,7 @@ class StoreClient:
         if isinstance(key, int):
             return self.store[key]
         elif isinstance(key, UID):
-            msg = ObjectSearchMessage(
-                address=self.client.address, reply_to=self.client.address, obj_id=key
-            )
-
-            results = getattr(
-                self.client.send_immediate_msg_with_reply(msg=msg), "results", None
-            )
-            if results is None:
-                traceback_and_raise(ValueError("TODO"))
-
-            # This is because of a current limitation in Pointer where we cannot
-            # serialize a client object. TODO: Fix limitation in Pointer so that we don't need this.
-            for result in results:
-                result.gc_enabled = False
-                result.client = self.client
-
+            results, _ = self._search(obj_id=key)
             return results[0]
         else:
             traceback_and_raise(KeyError("Please pass in a string or int key"))
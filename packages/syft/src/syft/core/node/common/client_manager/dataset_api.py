@@ -1,4 +1,5 @@
 # stdlib
+import hashlib
 import logging
 import sys
 from typing import Any
@@ -15,11 +16,22 @@ import pandas as pd
 from ..... import deserialize
 from .....core.tensor.autodp.adp_tensor import ADPTensor
 from .....core.tensor.tensor import Tensor
+from .....lib.python.util import upcast
 from ....common import UID
 from ....common.serde.serialize import _serialize as serialize  # noqa: F401
 from ...abstract.node import AbstractNodeClient
 from ...domain.enums import RequestAPIFields
 from ...domain.enums import ResponseObjectEnum
+from ..action.exception_action import ExceptionMessage
+from ..node_service.dataset_manager.asset_upload_messages import (
+    AssetChunkMessageWithReply,
+)
+from ..node_service.dataset_manager.asset_upload_messages import (
+    FinishAssetUploadMessageWithReply,
+)
+from ..node_service.dataset_manager.asset_upload_messages import (
+    StartAssetUploadMessageWithReply,
+)
 from ..node_service.dataset_manager.dataset_manager_messages import CreateDatasetMessage
 from ..node_service.dataset_manager.dataset_manager_messages import DeleteDatasetMessage
 from ..node_service.dataset_manager.dataset_manager_messages import GetDatasetMessage
@@ -27,6 +39,9 @@ from ..node_service.dataset_manager.dataset_manager_messages import GetDatasetsM
 from ..node_service.dataset_manager.dataset_manager_messages import UpdateDatasetMessage
 from .request_api import RequestAPI
 
+# the number of bytes of a serialized asset sent per message
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 initial_boilerplate = """<style>
         #myInput {
           background-position: 10px 12px; /* Position the search icon */
@@ -123,6 +138,92 @@ class DatasetRequestAPI(RequestAPI):
     def create_syft(self, **kwargs: Any) -> None:
         super().create(**kwargs)
 
+    def upload(
+        self,
+        assets: Dict[str, Any],
+        metadata: Optional[Dict[str, str]] = None,
+        dataset_id: Optional[str] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        max_retries: int = 3,
+    ) -> str:
+        """Uploads the assets into a dataset one after the other, in chunks.
+
+        Every asset is serialized on its own and sent chunk_size bytes at a time, so
+        neither side holds more than one serialized asset. A chunk which fails is
+        retried from the offset the domain received up to, and the domain checks the
+        SHA-256 of every asset before storing it.
+
+        Args:
+            assets (Dict[str, Any]): the assets to upload, by name.
+            metadata (Dict[str, str]): the metadata of the new dataset.
+            dataset_id (str): the dataset to add the assets to, a new one if None.
+            chunk_size (int): the number of bytes sent per message.
+            max_retries (int): how many times in a row a chunk is retried.
+
+        Returns:
+            str: the id of the dataset.
+        """
+        for name, asset in assets.items():
+            blob = serialize(asset, to_bytes=True)
+            # the assets after the first are added to the dataset it was added to
+            target = (
+                {"metadata": metadata if metadata is not None else {}}
+                if dataset_id is None
+                else {"dataset_id": dataset_id}
+            )
+            reply = self._upload_request(
+                StartAssetUploadMessageWithReply, name=name, size=len(blob), **target
+            )
+            self._upload_chunks(
+                upload_id=reply["upload_id"],
+                blob=blob,
+                chunk_size=chunk_size,
+                max_retries=max_retries,
+            )
+            # a new dataset is only registered once its first asset is stored
+            dataset_id = self._upload_request(
+                FinishAssetUploadMessageWithReply,
+                upload_id=reply["upload_id"],
+                sha256=hashlib.sha256(blob).hexdigest(),
+            )["dataset_id"]
+        return str(dataset_id)
+
+    def _upload_chunks(
+        self, upload_id: str, blob: bytes, chunk_size: int, max_retries: int
+    ) -> None:
+        view = memoryview(blob)
+        offset = 0
+        retries = 0
+        while offset < len(blob):
+            sys.stdout.write(f"\rLoading dataset... uploading... {offset}/{len(blob)}")
+            try:
+                offset = self._upload_request(
+                    AssetChunkMessageWithReply,
+                    upload_id=upload_id,
+                    offset=offset,
+                    data=bytes(view[offset : offset + chunk_size]),  # noqa: E203
+                )["offset"]
+                retries = 0
+            except Exception as e:
+                retries += 1
+                if retries > max_retries:
+                    raise e
+                # resume from what the domain received
+                offset = self._upload_request(
+                    StartAssetUploadMessageWithReply, upload_id=upload_id
+                )["offset"]
+
+    def _upload_request(self, syft_msg: Any, **content: Any) -> Dict[str, Any]:
+        signed_msg = (
+            syft_msg(kwargs=content)
+            .to(address=self.client.address, reply_to=self.client.address)
+            .sign(signing_key=self.client.signing_key)
+        )
+        response = self.client.send_immediate_msg_with_reply(msg=signed_msg)
+        if isinstance(response, ExceptionMessage):
+            raise response.exception_type
+        return upcast(response.payload.kwargs)
+
     def create_grid_ui(self, path: str, **kwargs) -> Dict[str, str]:  # type: ignore
         response = self.node.conn.send_files(  # type: ignore
             "/datasets", path, form_name="metadata", form_values=kwargs
@@ -389,9 +490,6 @@ class Dataset:
             value (dict): Value of the asset
         """
 
-        # relative
-        from .....lib.python.util import downcast
-
         if not skip_checks:
             if not isinstance(value, Tensor) or not isinstance(
                 getattr(value, "child", None), ADPTensor
@@ -431,17 +529,10 @@ class Dataset:
                     "Please use a different name."
                 )
 
-            asset = {name: value}
-            asset = downcast(asset)
-            binary_dataset = serialize(asset, to_bytes=True)
-
-            metadata = {"dataset_id": bytes(str(self.id), "utf-8")}
-            metadata = downcast(metadata)
-
             sys.stdout.write("\rLoading dataset... uploading...")
             # Add a new asset to the dataset pointer
-            DatasetRequestAPI(self.client).create_syft(
-                dataset=binary_dataset, metadata=metadata, platform="syft"
+            DatasetRequestAPI(self.client).upload(
+                assets={name: value}, dataset_id=str(self.id)
             )
             sys.stdout.write("\rLoading dataset... uploading... \nSUCCESS!")
             self.refresh()
@@ -9,6 +9,7 @@ Do NOT (without talking to trask):
 """
 
 # stdlib
+import threading
 from typing import Any
 from typing import Dict
 from typing import List
@@ -49,10 +50,12 @@ from ...io.route import Route
 from ...io.route import SoloRoute
 from ...io.virtual import create_virtual_connection
 from ..abstract.node import AbstractNode
+from .action.action_scheduler import ActionScheduler
 from .action.exception_action import ExceptionMessage
 from .action.exception_action import UnknownPrivateException
 from .client import Client
 from .metadata import Metadata
+from .node_manager.object_download_manager import ObjectDownloadManager
 from .node_manager.redis_store import RedisStore
 from .node_manager.setup_manager import SetupManager
 from .node_service.auth import AuthorizationException
@@ -67,6 +70,7 @@ from .node_service.msg_forwarding.msg_forwarding_service import (
 from .node_service.msg_forwarding.msg_forwarding_service import (
     SignedMessageWithoutReplyForwardingService,
 )
+from .node_service.msg_forwarding.routing_table import RoutingTable
 from .node_service.node_service import EventualNodeServiceWithoutReply
 from .node_service.node_service import ImmediateNodeServiceWithReply
 from .node_service.object_action.obj_action_service import (
@@ -78,6 +82,7 @@ from .node_service.object_action.obj_action_service import (
 from .node_service.object_action.obj_action_service import (
     ImmediateObjectActionServiceWithoutReply,
 )
+from .node_service.object_download.object_download_service import ObjectDownloadService
 from .node_service.object_search.obj_search_service import ImmediateObjectSearchService
 from .node_service.object_search_permission_update.obj_search_permission_service import (
     ImmediateObjectSearchPermissionUpdateService,
@@ -168,6 +173,10 @@ class Node(AbstractNode):
         # self.store is the elastic memory.
 
         self.store = store_type(db=self.db_engine)
+
+        # when set, the actions received by the node are executed by the
+        # ActionScheduler, concurrently, as soon as their dependencies are done
+        self.action_scheduler: Optional[ActionScheduler] = None
         self.setup = SetupManager(database=self.db_engine)
 
         # We need to register all the services once a node is created
@@ -243,6 +252,7 @@ class Node(AbstractNode):
         self.immediate_services_with_reply.append(ImmediateObjectSearchService)
         self.immediate_services_with_reply.append(GetReprService)
         self.immediate_services_with_reply.append(ResolvePointerTypeService)
+        self.immediate_services_with_reply.append(ObjectDownloadService)
 
         # for services which can run at a later time and do not return a reply
         self.eventual_services_without_reply = list()
@@ -294,6 +304,12 @@ class Node(AbstractNode):
         self.admin_verify_key_registry = set()
         self.cpl_ofcr_verify_key_registry = set()
         self.peer_route_clients: Dict[UID, Dict[str, Dict[str, Client]]] = {}
+        # messages are handled concurrently, so the routes are changed under a lock
+        self._peer_lock = threading.Lock()
+        # the clients messages for other nodes are forwarded with
+        self.routing_table = RoutingTable()
+        # the objects being downloaded in chunks with Pointer.get(stream=True)
+        self.object_downloads = ObjectDownloadManager()
         # TODO: remove hacky signaling_msgs when SyftMessages become Storable.
         self.signaling_msgs = {}
 
@@ -392,10 +408,11 @@ class Node(AbstractNode):
     def all_peer_clients(self) -> Dict[UID, List[Client]]:
         # get all the routes for each client and sort by VPN first
         all_clients = {}
-        for node_id in self.peer_route_clients.keys():
-            all_clients[node_id] = list(
-                self.peer_route_clients[node_id]["vpn"].values()
-            ) + list(self.peer_route_clients[node_id]["public"].values())
+        with self._peer_lock:
+            for node_id in self.peer_route_clients.keys():
+                all_clients[node_id] = list(
+                    self.peer_route_clients[node_id]["vpn"].values()
+                ) + list(self.peer_route_clients[node_id]["public"].values())
 
         return all_clients
 
@@ -405,18 +422,24 @@ class Node(AbstractNode):
         debug(f"Adding route {node_id}, {node_name}, {host_or_ip}, {is_vpn}")
         try:
             vpn_key = "vpn" if is_vpn else "public"
-            # make sure the node_id is in the Dict
-            node_id_dict: Dict[str, Dict[str, Client]] = {"vpn": {}, "public": {}}
-            if node_id in self.peer_route_clients:
-                node_id_dict = self.peer_route_clients[node_id]
+            with self._peer_lock:
+                known = host_or_ip in self.peer_route_clients.get(node_id, {}).get(
+                    vpn_key, {}
+                )
 
-            if host_or_ip not in node_id_dict[vpn_key]:
-                # connect and save the client
+            if not known:
+                # connect outside of the lock, then save the client unless another
+                # handler saved one for this route meanwhile
                 grid_url = GridURL.from_url(host_or_ip)
                 client = sy.connect(url=grid_url.with_path("/api/v1"), timeout=0.3)
-                node_id_dict[vpn_key][host_or_ip] = client
-
-            self.peer_route_clients[node_id] = node_id_dict
+                with self._peer_lock:
+                    # make sure the node_id is in the Dict
+                    node_id_dict = self.peer_route_clients.setdefault(
+                        node_id, {"vpn": {}, "public": {}}
+                    )
+                    node_id_dict[vpn_key].setdefault(host_or_ip, client)
+                # a VPN route may now be preferred over the one in the table
+                self.routing_table.invalidate(node_id)
         except Exception as e:
             debug(
                 f"Failed to add_route {node_id} {node_name} {host_or_ip} {is_vpn}. {e}"
@@ -429,8 +452,12 @@ class Node(AbstractNode):
             self.add_peer_routes(peer=peer)
 
         try:
-            if node_id in self.peer_route_clients.keys():
-                routes = self.peer_route_clients[node_id]
+            with self._peer_lock:
+                routes = {
+                    key: dict(clients)
+                    for key, clients in self.peer_route_clients.get(node_id, {}).items()
+                }
+            if routes:
                 # if we want VPN only then check there are some
                 if only_vpn and "vpn" in routes and len(routes["vpn"]) == 0:
                     # we want VPN only but there are none
@@ -0,0 +1,186 @@
+# stdlib
+from contextlib import contextmanager
+import hashlib
+import mmap
+import tempfile
+import threading
+import time
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+
+# third party
+from nacl.signing import VerifyKey
+
+# relative
+from ....common.uid import UID
+
+# the uploaded bytes of an asset are kept in memory up to this size and written to
+# a temporary file past it
+SPOOL_BYTES = 64 * 1024 * 1024
+# the largest serialized asset a domain accepts
+MAX_ASSET_SIZE = 16 * 1024 * 1024 * 1024
+
+
+class AssetUpload:
+    """
+    The bytes of an asset received so far, in the order of their offsets, and the
+    running SHA-256 of them which is checked against the one of the uploader when
+    the upload is finished. An upload into a new dataset has no dataset_id but the
+    metadata the dataset is registered with once the asset is stored.
+    """
+
+    def __init__(
+        self,
+        upload_id: str,
+        dataset_id: Optional[str],
+        name: str,
+        size: int,
+        verify_key: VerifyKey,
+        spool_bytes: int = SPOOL_BYTES,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.upload_id = upload_id
+        self.dataset_id = dataset_id
+        self.metadata = metadata if metadata is not None else {}
+        self.name = name
+        self.size = size
+        self.verify_key = verify_key
+        self.offset = 0
+        self.updated_at = time.monotonic()
+        self._hash = hashlib.sha256()
+        self._file = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+        self._lock = threading.Lock()
+
+    @property
+    def complete(self) -> bool:
+        return self.offset == self.size
+
+    def write(self, offset: int, data: bytes) -> int:
+        """
+        Appends the chunk of data starting at offset and returns the offset the next
+        chunk starts at. Chunks received again, e.g. when the uploader retries after
+        losing a reply, are skipped, and chunks past the offset are rejected by
+        returning the offset the uploader has to resume from.
+        """
+        with self._lock:
+            end = offset + len(data)
+            if offset <= self.offset < end and end <= self.size:
+                chunk = data[self.offset - offset :]  # noqa: E203
+                self._file.write(chunk)
+                self._hash.update(chunk)
+                self.offset = end
+            self.updated_at = time.monotonic()
+            return self.offset
+
+    def hexdigest(self) -> str:
+        with self._lock:
+            return self._hash.hexdigest()
+
+    @contextmanager
+    def mapped(self) -> Iterator[memoryview]:
+        """
+        The bytes received so far, memory-mapped from the temporary file so
+        deserializing a large asset doesn't need another copy of them in memory.
+        """
+        with self._lock:
+            self._file.flush()
+            # fileno() moves the bytes still held in memory to the file
+            with mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                with memoryview(data) as view:
+                    yield view
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class AssetUploadManager:
+    """
+    AssetUploadManager keeps the uploads of assets in progress on a domain, so a
+    dataset is sent as a series of bounded chunks instead of one message holding
+    every asset, and an interrupted upload resumes from the last chunk received.
+
+    Uploads which receive nothing for max_idle seconds are dropped, an asset can't
+    be larger than max_size bytes and a user can't start more than max_per_user
+    uploads at once, since each one holds a temporary file.
+    """
+
+    def __init__(
+        self,
+        max_idle: float = 60 * 60,
+        max_size: int = MAX_ASSET_SIZE,
+        max_per_user: int = 4,
+    ) -> None:
+        self.max_idle = max_idle
+        self.max_size = max_size
+        self.max_per_user = max_per_user
+        self._lock = threading.Lock()
+        self._uploads: Dict[str, AssetUpload] = {}
+
+    def __len__(self) -> int:
+        return len(self._uploads)
+
+    def start(
+        self,
+        dataset_id: Optional[str],
+        name: str,
+        size: int,
+        verify_key: VerifyKey,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> AssetUpload:
+        if not 0 < size <= self.max_size:
+            raise ValueError(
+                f"size must be between 1 and {self.max_size} bytes, got {size}"
+            )
+        self.expire()
+        with self._lock:
+            self._check_limit(verify_key=verify_key)
+            upload = AssetUpload(
+                upload_id=UID().no_dash,
+                dataset_id=dataset_id,
+                name=name,
+                size=size,
+                verify_key=verify_key,
+                metadata=metadata,
+            )
+            self._uploads[upload.upload_id] = upload
+        return upload
+
+    def _check_limit(self, verify_key: VerifyKey) -> None:
+        active = sum(
+            upload.verify_key == verify_key for upload in self._uploads.values()
+        )
+        if active >= self.max_per_user:
+            raise ValueError(
+                f"{active} uploads are already in progress, finish one of them first"
+            )
+
+    def get(self, upload_id: str, verify_key: VerifyKey) -> AssetUpload:
+        with self._lock:
+            upload = self._uploads.get(upload_id, None)
+        # only the uploader can resume or finish an upload
+        if upload is None or upload.verify_key != verify_key:
+            raise KeyError(f"Unknown upload {upload_id}")
+        return upload
+
+    def pop(self, upload_id: str) -> Optional[AssetUpload]:
+        with self._lock:
+            return self._uploads.pop(upload_id, None)
+
+    def expire(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            idle = [
+                upload_id
+                for upload_id, upload in self._uploads.items()
+                if now - upload.updated_at > self.max_idle
+            ]
+            for upload_id in idle:
+                self._uploads.pop(upload_id).close()
+
+    def clear(self) -> None:
+        with self._lock:
+            for upload in self._uploads.values():
+                upload.close()
+            self._uploads.clear()
@@ -2,13 +2,16 @@
 from copy import deepcopy
 from typing import Any
 from typing import Collection
+from typing import ContextManager
+from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
-from typing import cast
 
 # third party
+from nacl.signing import VerifyKey
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 
@@ -19,14 +22,37 @@ import syft as sy
 from ....common.uid import UID
 from ....node.common.node_table.bin_obj_dataset import BinObjDataset
 from ....store import ObjectStore
+from ....store.key_notifier import KeyNotifier
+from ....store.key_notifier import KeyWatch
 from ....store.storeable_object import StorableObject
+from ....store.storeable_object_metadata import StorableObjectMetadata
 from ..node_table.bin_obj_metadata import ObjectMetadata
+from ..node_table.bin_obj_metadata import delete_search_permissions
+from ..node_table.bin_obj_metadata import delete_tags
+from ..node_table.bin_obj_metadata import deserialize_permissions
+from ..node_table.bin_obj_metadata import search_metadata
+from ..node_table.bin_obj_metadata import to_storable_object_metadata
+from ..node_table.bin_obj_metadata import update_metadata
+from ..node_table.bin_obj_metadata import update_search_permissions
+from ..node_table.bin_obj_metadata import update_tags
+from ..node_table.bin_obj_search_permission import ObjectSearchPermission
+from ..node_table.bin_obj_tag import ObjectTag
+
+
+def _key_str_and_uid(key: Union[UID, str, bytes]) -> Tuple[str, UID]:
+    if isinstance(key, UID):
+        return str(key.value), key
+    elif isinstance(key, bytes):
+        key_str = str(key.decode("utf-8"))
+        return key_str, UID.from_string(key_str)
+    return key, UID.from_string(key)
 
 
 class DictStore(ObjectStore):
     def __init__(self, db: Session) -> None:
         self.db = db
         self.kv_store: dict[UID, Any] = {}
+        self._notifier = KeyNotifier()
 
     def get_object(self, key: UID) -> Optional[StorableObject]:
         try:
@@ -52,86 +78,205 @@ class DictStore(ObjectStore):
         return self.kv_store.keys()
 
     def values(self) -> List[StorableObject]:
-        keys = self.kv_store.keys()
         # this is bad we need to decouple getting the data from the search
-        all_values = []
-        for key in keys:
-            all_values.append(self.__getitem__(key))
-
-        return all_values
+        return [obj for obj in self.get_many(self.kv_store.keys()) if obj is not None]
 
     def __contains__(self, key: UID) -> bool:
         return key in self.kv_store
 
     def __getitem__(self, key: Union[UID, str, bytes]) -> StorableObject:
         try:
-            local_session = sessionmaker(bind=self.db)()
-
-            if isinstance(key, UID):
-                key_str = str(key.value)
-                key_uid = key
-            elif isinstance(key, bytes):
-                key_str = str(key.decode("utf-8"))
-                key_uid = UID.from_string(key_str)
-            else:
-                key_str = key
-                key_uid = UID.from_string(key_str)
-
-            store_obj = self.kv_store[key_uid]
-
-            # serialized contents
-            if isinstance(store_obj, bytes):
-                try:
-                    de = sy.deserialize(store_obj, from_bytes=True)
-                    obj = de
-                except Exception as e:
-                    raise Exception(f"Failed to deserialize obj at key {key_str}. {e}")
-            else:
-                # not serialized
-                try:
-                    obj = deepcopy(store_obj)
-                except Exception as e:
-                    raise Exception(
-                        f"DictStore should not contain unpickleable objects. {e}"
-                    )
-
-            if id(obj) == id(store_obj):
-                raise Exception("Objects must use deepcopy or mutation can occur")
+            key_str, key_uid = _key_str_and_uid(key)
+            obj = self._copy_from_store(key_uid=key_uid, key_str=key_str)
 
+            local_session = sessionmaker(bind=self.db)()
             obj_metadata = (
                 local_session.query(ObjectMetadata).filter_by(obj=key_str).first()
             )
+            local_session.close()
 
             if obj is None or obj_metadata is None:
                 raise KeyError(f"Object not found! for UID: {key_uid}")
 
-            obj = StorableObject(
-                id=key_uid,
-                data=obj.data,
-                description=obj_metadata.description,
-                tags=obj_metadata.tags,
-                read_permissions=dict(
-                    sy.deserialize(
-                        bytes.fromhex(obj_metadata.read_permissions), from_bytes=True
-                    )
-                ),
-                search_permissions=dict(
-                    sy.deserialize(
-                        bytes.fromhex(obj_metadata.search_permissions), from_bytes=True
-                    )
-                ),
-                write_permissions=dict(
-                    sy.deserialize(
-                        bytes.fromhex(obj_metadata.write_permissions), from_bytes=True
-                    )
-                ),
+            return self._storable_object(
+                key=key_uid, obj=obj, obj_metadata=obj_metadata
             )
-            local_session.close()
-            return obj
         except Exception as e:
             print(f"Cant get object {str(key)}", e)
             raise KeyError(f"Object not found! for UID: {str(key)}")
 
+    def get_many(
+        self, keys: Iterable[Union[UID, str, bytes]]
+    ) -> List[Optional[StorableObject]]:
+        keys_str_and_uid = [_key_str_and_uid(key) for key in keys]
+        if len(keys_str_and_uid) == 0:
+            return []
+        key_strs = [
+            key_str for key_str, key_uid in keys_str_and_uid if key_uid in self.kv_store
+        ]
+
+        # a single metadata query for all the keys
+        metadata_by_key: Dict[str, ObjectMetadata] = {}
+        if len(key_strs) > 0:
+            local_session = sessionmaker(bind=self.db)()
+            for obj_metadata in (
+                local_session.query(ObjectMetadata)
+                .filter(ObjectMetadata.obj.in_(set(key_strs)))
+                .order_by(ObjectMetadata.id.desc())
+            ):
+                # keep the first row like __getitem__
+                metadata_by_key[obj_metadata.obj] = obj_metadata
+            local_session.close()
+
+        values: List[Optional[StorableObject]] = []
+        for key_str, key_uid in keys_str_and_uid:
+            obj_metadata = metadata_by_key.get(key_str, None)
+            obj = None
+            if obj_metadata is not None:
+                try:
+                    obj = self._copy_from_store(key_uid=key_uid, key_str=key_str)
+                except Exception as e:
+                    print(f"Cant get object {key_str}", e)
+            if obj is None or obj_metadata is None:
+                values.append(None)
+            else:
+                values.append(
+                    self._storable_object(
+                        key=key_uid, obj=obj, obj_metadata=obj_metadata
+                    )
+                )
+        return values
+
+    def _copy_from_store(self, key_uid: UID, key_str: str) -> Any:
+        store_obj = self.kv_store[key_uid]
+
+        # serialized contents
+        if isinstance(store_obj, bytes):
+            try:
+                de = sy.deserialize(store_obj, from_bytes=True)
+                obj = de
+            except Exception as e:
+                raise Exception(f"Failed to deserialize obj at key {key_str}. {e}")
+        else:
+            # not serialized
+            try:
+                obj = deepcopy(store_obj)
+            except Exception as e:
+                raise Exception(
+                    f"DictStore should not contain unpickleable objects. {e}"
+                )
+
+        if id(obj) == id(store_obj):
+            raise Exception("Objects must use deepcopy or mutation can occur")
+        return obj
+
+    @staticmethod
+    def _storable_object(
+        key: UID, obj: Any, obj_metadata: ObjectMetadata
+    ) -> StorableObject:
+        return StorableObject(
+            id=key,
+            data=obj.data,
+            description=obj_metadata.description,
+            tags=obj_metadata.tags,
+            read_permissions=deserialize_permissions(obj_metadata.read_permissions),
+            search_permissions=deserialize_permissions(obj_metadata.search_permissions),
+            write_permissions=deserialize_permissions(obj_metadata.write_permissions),
+        )
+
+    def get_objects_metadata(
+        self, keys: Optional[Iterable[UID]] = None
+    ) -> List[StorableObjectMetadata]:
+        local_session = sessionmaker(bind=self.db)()
+        metadata_query = local_session.query(ObjectMetadata)
+        if keys is not None:
+            metadata_query = metadata_query.filter(
+                ObjectMetadata.obj.in_([str(key.value) for key in keys])
+            )
+        results = self._to_objects_metadata(
+            session=local_session,
+            metadata_objs=metadata_query.order_by(ObjectMetadata.id).all(),
+        )
+        local_session.close()
+        return results
+
+    def search_objects_metadata(
+        self,
+        verify_key: Optional[VerifyKey] = None,
+        tags: Optional[List[str]] = None,
+        object_type: Optional[str] = None,
+        dataset: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[StorableObjectMetadata], Optional[str]]:
+        local_session = sessionmaker(bind=self.db)()
+        metadata_objs, next_cursor = search_metadata(
+            session=local_session,
+            verify_key=verify_key,
+            tags=tags,
+            object_type=object_type,
+            dataset=dataset,
+            name_prefix=name_prefix,
+            cursor=cursor,
+            limit=limit,
+        )
+        results = self._to_objects_metadata(
+            session=local_session, metadata_objs=metadata_objs
+        )
+        local_session.close()
+        return results, next_cursor
+
+    def _to_objects_metadata(
+        self, session: Session, metadata_objs: List[ObjectMetadata]
+    ) -> List[StorableObjectMetadata]:
+        metadata_by_key: Dict[str, ObjectMetadata] = {}
+        for metadata_obj in metadata_objs:
+            # the metadata of objects which are not in the store
+            if UID.from_string(metadata_obj.obj) not in self.kv_store:
+                continue
+            # keep the first row like __getitem__
+            metadata_by_key.setdefault(metadata_obj.obj, metadata_obj)
+        if len(metadata_by_key) == 0:
+            return []
+
+        relation_by_key = {
+            relation.obj: relation
+            for relation in session.query(BinObjDataset).filter(
+                BinObjDataset.obj.in_(list(metadata_by_key.keys()))
+            )
+        }
+
+        # rows stored before the object_type and pointer columns existed are filled
+        # in once from their objects
+        outdated = [
+            metadata_obj
+            for metadata_obj in metadata_by_key.values()
+            if metadata_obj.object_type is None
+        ]
+        if len(outdated) > 0:
+            keys_outdated = [UID.from_string(row.obj) for row in outdated]
+            for key, metadata_obj, value in zip(
+                keys_outdated, outdated, self.get_many(keys_outdated)
+            ):
+                if value is None:
+                    del metadata_by_key[metadata_obj.obj]
+                else:
+                    update_metadata(metadata_obj=metadata_obj, key=key, value=value)
+            session.commit()
+
+        results = []
+        for key_str, metadata_obj in metadata_by_key.items():
+            relation = relation_by_key.get(key_str, None)
+            results.append(
+                to_storable_object_metadata(
+                    metadata_obj=metadata_obj,
+                    dataset=relation.dataset if relation else None,
+                    name=relation.name if relation else None,
+                )
+            )
+        return results
+
     def is_dataset(self, key: UID) -> bool:
         local_session = sessionmaker(bind=self.db)()
         is_dataset_obj = (
@@ -150,7 +295,66 @@ class DictStore(ObjectStore):
         return obj_dataset_relation
 
     def __setitem__(self, key: UID, value: StorableObject) -> None:
-        key_str = str(key.value)
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[UID, StorableObject]) -> None:
+        if len(items) == 0:
+            return
+        for key, value in items.items():
+            self._copy_to_store(key=key, value=value)
+        key_strs = [str(key.value) for key in items.keys()]
+
+        local_session = sessionmaker(bind=self.db)()
+        # use existing metadata row to prevent more than 1
+        metadata_by_key: Dict[str, ObjectMetadata] = {}
+        for metadata_obj in (
+            local_session.query(ObjectMetadata)
+            .filter(ObjectMetadata.obj.in_(key_strs))
+            .order_by(ObjectMetadata.id)
+        ):
+            metadata_by_key[metadata_obj.obj] = metadata_obj
+
+        relation_by_key: Dict[str, BinObjDataset] = {}
+        for obj_dataset_relation in (
+            local_session.query(BinObjDataset)
+            .filter(BinObjDataset.obj.in_(key_strs))
+            .order_by(BinObjDataset.id.desc())
+        ):
+            relation_by_key[obj_dataset_relation.obj] = obj_dataset_relation
+
+        for key, value in items.items():
+            key_str = str(key.value)
+            metadata_obj = metadata_by_key.get(key_str, None)
+            if metadata_obj is None:
+                # no metadata row exists lets insert one
+                metadata_obj = ObjectMetadata()
+                local_session.add(metadata_obj)
+            update_metadata(metadata_obj=metadata_obj, key=key, value=value)
+
+            obj_dataset_relation = relation_by_key.get(key_str, None)
+            if obj_dataset_relation:
+                # Create a object dataset relationship for the new object
+                local_session.add(
+                    BinObjDataset(
+                        # id=obj_dataset_relation.id,  NOTE: Commented temporarily
+                        name=obj_dataset_relation.name,
+                        obj=key_str,
+                        dataset=obj_dataset_relation.dataset,
+                        dtype=obj_dataset_relation.dtype,
+                        shape=obj_dataset_relation.shape,
+                    )
+                )
+
+        update_search_permissions(session=local_session, items=items)
+        update_tags(session=local_session, items=items)
+        local_session.commit()
+        local_session.close()
+        self._notifier.notify(keys=items.keys())
+
+    def watch(self, keys: Iterable[UID]) -> ContextManager[KeyWatch]:
+        return self._notifier.watch(keys=keys)
+
+    def _copy_to_store(self, key: UID, value: StorableObject) -> None:
         try:
             store_obj = deepcopy(value)
             self.kv_store[key] = store_obj
@@ -169,53 +373,6 @@ class DictStore(ObjectStore):
             else:
                 raise Exception(f"Failed to save object {type(value)}. {e}")
 
-        create_metadata = True
-        local_session = sessionmaker(bind=self.db)()
-        try:
-            # use existing metadata row to prevent more than 1
-            metadata_obj = (
-                local_session.query(ObjectMetadata).filter_by(obj=key_str).all()[-1]
-            )
-            create_metadata = False
-        except Exception:
-            pass
-            # no metadata row exists lets insert one
-            metadata_obj = ObjectMetadata()
-
-        metadata_obj.obj = str(key.value)
-        metadata_obj.tags = value.tags
-        metadata_obj.description = value.description
-        metadata_obj.read_permissions = cast(
-            bytes,
-            sy.serialize(sy.lib.python.Dict(value.read_permissions), to_bytes=True),
-        ).hex()
-        metadata_obj.search_permissions = cast(
-            bytes,
-            sy.serialize(sy.lib.python.Dict(value.search_permissions), to_bytes=True),
-        ).hex()
-        metadata_obj.write_permissions = cast(
-            bytes,
-            sy.serialize(sy.lib.python.Dict(value.write_permissions), to_bytes=True),
-        ).hex()
-
-        obj_dataset_relation = self._get_obj_dataset_relation(key)
-        if obj_dataset_relation:
-            # Create a object dataset relationship for the new object
-            obj_dataset_relation = BinObjDataset(
-                # id=obj_dataset_relation.id,  NOTE: Commented temporarily
-                name=obj_dataset_relation.name,
-                obj=str(key.value),
-                dataset=obj_dataset_relation.dataset,
-                dtype=obj_dataset_relation.dtype,
-                shape=obj_dataset_relation.shape,
-            )
-
-        if create_metadata:
-            local_session.add(metadata_obj)
-        local_session.add(obj_dataset_relation) if obj_dataset_relation else None
-        local_session.commit()
-        local_session.close()
-
     def delete(self, key: UID) -> None:
         try:
             del self.kv_store[key]
@@ -226,15 +383,39 @@ class DictStore(ObjectStore):
                 .first()
             )
             local_session.delete(metadata_to_delete)
+            delete_search_permissions(session=local_session, key_strs=[str(key.value)])
+            delete_tags(session=local_session, key_strs=[str(key.value)])
             local_session.commit()
             local_session.close()
         except Exception as e:
             print(f"{type(self)} Exception in __delitem__ error {key}. {e}")
 
+    def delete_many(self, keys: Iterable[UID]) -> None:
+        key_strs = []
+        for key in keys:
+            if self.kv_store.pop(key, None) is None:
+                print(f"{type(self)} Exception in delete_many error {key}.")
+            key_strs.append(str(key.value))
+        if len(key_strs) == 0:
+            return
+        try:
+            local_session = sessionmaker(bind=self.db)()
+            local_session.query(ObjectMetadata).filter(
+                ObjectMetadata.obj.in_(key_strs)
+            ).delete(synchronize_session=False)
+            delete_search_permissions(session=local_session, key_strs=key_strs)
+            delete_tags(session=local_session, key_strs=key_strs)
+            local_session.commit()
+            local_session.close()
+        except Exception as e:
+            print(f"{type(self)} Exception in delete_many error {key_strs}. {e}")
+
     def clear(self) -> None:
         self.kv_store = {}
         local_session = sessionmaker(bind=self.db)()
         local_session.query(ObjectMetadata).delete()
+        local_session.query(ObjectSearchPermission).delete()
+        local_session.query(ObjectTag).delete()
         local_session.commit()
         local_session.close()
 
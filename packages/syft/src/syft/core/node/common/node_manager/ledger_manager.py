@@ -3,22 +3,27 @@ from __future__ import annotations
 
 # stdlib
 from collections.abc import KeysView
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 # third party
 from nacl.encoding import HexEncoder
 from nacl.signing import VerifyKey
+from sqlalchemy import func
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 # relative
 from ....adp.entity import Entity
 from ....adp.idp_gaussian_mechanism import iDPGaussianMechanism
+from ....adp.idp_gaussian_mechanism import individual_RDP_gaussian_curve
 from ....common.serde import _serialize
 from ..node_table.entity import Entity as EntitySchema
 from ..node_table.ledger import Ledger
 from ..node_table.mechanism import Mechanism as MechanismSchema
+from ..node_table.rdp_accumulator import RDPAccumulator
 from ..node_table.user import SyftUser
 from .database_manager import DatabaseManager
 
@@ -60,6 +65,94 @@ class MechanismManager(DatabaseManager):
         return obj_id
 
 
+class RDPAccumulatorManager(DatabaseManager):
+    schema = RDPAccumulator
+
+    def __init__(self, database: Engine) -> None:
+        super().__init__(db=database, schema=RDPAccumulatorManager.schema)
+
+    def accumulate(self, mechanisms: list) -> None:
+        """Adds the RDP of the mechanisms to the accumulators of their entity and user"""
+        curves: Dict[Tuple[str, bytes], List[float]] = {}
+        for m in mechanisms:
+            key = (m.entity_name, _serialize(m.user_key, to_bytes=True))
+            private_rdp, public_rdp = individual_RDP_gaussian_curve(m.params)
+            curve = curves.setdefault(key, [0.0, 0.0, 0])
+            curve[0] += private_rdp
+            curve[1] += public_rdp
+            curve[2] += 1
+
+        session_local = sessionmaker(autocommit=False, autoflush=False, bind=self.db)()
+        for (entity_name, user_key), (private_rdp, public_rdp, n) in curves.items():
+            # the sums are done by the database so that concurrent registrations
+            # for the same entity and user don't overwrite each other
+            updated = (
+                session_local.query(self._schema)
+                .filter_by(entity_name=entity_name, user_key=user_key)
+                .update(
+                    {
+                        self._schema.private_rdp: self._schema.private_rdp
+                        + private_rdp,
+                        self._schema.public_rdp: self._schema.public_rdp + public_rdp,
+                        self._schema.n_mechanisms: self._schema.n_mechanisms + n,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            if updated == 0:
+                session_local.add(
+                    self._schema(
+                        entity_name=entity_name,
+                        user_key=user_key,
+                        private_rdp=private_rdp,
+                        public_rdp=public_rdp,
+                        n_mechanisms=n,
+                    )
+                )
+        session_local.commit()
+        session_local.close()
+
+    def total(
+        self, entity_name: str, user_key: Optional[bytes] = None
+    ) -> Tuple[float, float, int]:
+        """The summed RDP of the mechanisms of an entity, of every user if None"""
+        session_local = sessionmaker(autocommit=False, autoflush=False, bind=self.db)()
+        query = session_local.query(
+            func.sum(self._schema.private_rdp),
+            func.sum(self._schema.public_rdp),
+            func.sum(self._schema.n_mechanisms),
+        ).filter(self._schema.entity_name == entity_name)
+        if user_key is not None:
+            query = query.filter(self._schema.user_key == user_key)
+        private_rdp, public_rdp, n_mechanisms = query.one()
+        session_local.close()
+        return (
+            float(private_rdp or 0.0),
+            float(public_rdp or 0.0),
+            int(n_mechanisms or 0),
+        )
+
+    def totals(
+        self, user_key: Optional[bytes] = None
+    ) -> Dict[str, Tuple[float, float, int]]:
+        """The summed RDP of the mechanisms of every entity, in a single query"""
+        session_local = sessionmaker(autocommit=False, autoflush=False, bind=self.db)()
+        query = session_local.query(
+            self._schema.entity_name,
+            func.sum(self._schema.private_rdp),
+            func.sum(self._schema.public_rdp),
+            func.sum(self._schema.n_mechanisms),
+        )
+        if user_key is not None:
+            query = query.filter(self._schema.user_key == user_key)
+        rows = query.group_by(self._schema.entity_name).all()
+        session_local.close()
+        return {
+            entity_name: (float(private_rdp), float(public_rdp), int(n_mechanisms))
+            for entity_name, private_rdp, public_rdp, n_mechanisms in rows
+        }
+
+
 class AbstractLedger:
     def register_mechanisms(self, mechanisms: list) -> None:
         raise NotImplementedError
@@ -69,6 +162,22 @@ class AbstractLedger:
     ) -> List[iDPGaussianMechanism]:
         raise NotImplementedError
 
+    def get_rdp(
+        self, entity_name: str, user_key: Optional[VerifyKey] = None
+    ) -> Tuple[float, float, int]:
+        """
+        Returns the RDP at alpha = 1 of the mechanisms registered for an entity by a
+        user, or by every user if user_key is None, summed for their private and their
+        public values, and the number of these mechanisms.
+        """
+        raise NotImplementedError
+
+    def get_rdps(
+        self, user_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Tuple[float, float, int]]:
+        """Returns get_rdp for every entity with mechanisms, by entity name"""
+        raise NotImplementedError
+
     def keys(self) -> KeysView:
         raise NotImplementedError
 
@@ -82,9 +191,17 @@ class DictLedger(AbstractLedger):
         self._entity_dict: dict[str, iDPGaussianMechanism] = {}
         self._user_key_dict: dict[VerifyKey, iDPGaussianMechanism] = {}
         self._user_budget: dict[VerifyKey, float] = {}
+        self._rdp_dict: dict[Tuple[str, VerifyKey], List[float]] = {}
 
     def register_mechanisms(self, mechanisms: list) -> None:
         for m in mechanisms:
+            private_rdp, public_rdp = individual_RDP_gaussian_curve(m.params)
+            curve = self._rdp_dict.setdefault(
+                (m.entity_name, m.user_key), [0.0, 0.0, 0]
+            )
+            curve[0] += private_rdp
+            curve[1] += public_rdp
+            curve[2] += 1
             # if entity doesnt exist:
             if m.entity_name not in self._entity_dict:
                 # write to the entity table
@@ -115,6 +232,35 @@ class DictLedger(AbstractLedger):
 
         return mechanisms
 
+    def get_rdp(
+        self, entity_name: str, user_key: Optional[VerifyKey] = None
+    ) -> Tuple[float, float, int]:
+        private_rdp, public_rdp, n_mechanisms = 0.0, 0.0, 0
+        for (curve_entity_name, curve_user_key), curve in self._rdp_dict.items():
+            if curve_entity_name == entity_name and (
+                user_key is None or curve_user_key == user_key
+            ):
+                private_rdp += curve[0]
+                public_rdp += curve[1]
+                n_mechanisms += int(curve[2])
+        return private_rdp, public_rdp, n_mechanisms
+
+    def get_rdps(
+        self, user_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Tuple[float, float, int]]:
+        rdps: Dict[str, Tuple[float, float, int]] = {}
+        for (entity_name, curve_user_key), curve in self._rdp_dict.items():
+            if user_key is None or curve_user_key == user_key:
+                private_rdp, public_rdp, n_mechanisms = rdps.get(
+                    entity_name, (0.0, 0.0, 0)
+                )
+                rdps[entity_name] = (
+                    private_rdp + curve[0],
+                    public_rdp + curve[1],
+                    n_mechanisms + int(curve[2]),
+                )
+        return rdps
+
     def keys(self) -> KeysView:
         return self._entity_dict.keys()
 
@@ -133,6 +279,7 @@ class DatabaseLedger(DatabaseManager, AbstractLedger):
         super().__init__(db=database, schema=DatabaseLedger.schema)
         self.entity_manager = EntityManager(database)
         self.mechanism_manager = MechanismManager(database)
+        self.rdp_accumulator_manager = RDPAccumulatorManager(database)
 
     def get_user_budget(self, user_key: VerifyKey) -> float:
         session_local = sessionmaker(autocommit=False, autoflush=False, bind=self.db)()
@@ -156,6 +303,26 @@ class DatabaseLedger(DatabaseManager, AbstractLedger):
                 # write to the entity table
                 self.entity_manager.register(name=m.entity_name)
             self.mechanism_manager.register(m)  # type: ignore
+        self.rdp_accumulator_manager.accumulate(mechanisms)
+
+    def get_rdp(
+        self, entity_name: str, user_key: Optional[VerifyKey] = None
+    ) -> Tuple[float, float, int]:
+        return self.rdp_accumulator_manager.total(
+            entity_name=entity_name,
+            user_key=_serialize(user_key, to_bytes=True)
+            if user_key is not None
+            else None,
+        )
+
+    def get_rdps(
+        self, user_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Tuple[float, float, int]]:
+        return self.rdp_accumulator_manager.totals(
+            user_key=_serialize(user_key, to_bytes=True)
+            if user_key is not None
+            else None,
+        )
 
     def query(  # type: ignore
         self, entity_name: Optional[str] = None, user_key: Optional[str] = None
@@ -0,0 +1,195 @@
+# stdlib
+import hashlib
+import threading
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+# third party
+from nacl.signing import VerifyKey
+import numpy as np
+
+# relative
+from ....common.serde.serialize import _serialize as serialize
+from ....common.uid import UID
+
+# the number of bytes of an object sent per reply
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+# the bounds of the chunk size a downloader can ask for: smaller chunks mean a
+# manifest with a hash per chunk, larger ones a reply holding that many bytes
+MIN_DOWNLOAD_CHUNK_SIZE = 1024
+MAX_DOWNLOAD_CHUNK_SIZE = 8 * DOWNLOAD_CHUNK_SIZE
+
+# the formats the bytes of a download are in
+SYFT_FORMAT = "syft"
+NUMPY_FORMAT = "numpy"
+
+
+def check_chunk_size(chunk_size: int) -> int:
+    """
+    Returns chunk_size if it is within the bounds of a download chunk.
+
+    Raises:
+        ValueError: if chunk_size is out of bounds.
+    """
+    if not MIN_DOWNLOAD_CHUNK_SIZE <= chunk_size <= MAX_DOWNLOAD_CHUNK_SIZE:
+        raise ValueError(
+            f"chunk_size must be between {MIN_DOWNLOAD_CHUNK_SIZE} and "
+            f"{MAX_DOWNLOAD_CHUNK_SIZE} bytes, got {chunk_size}"
+        )
+    return chunk_size
+
+
+class ObjectDownload:
+    """
+    An object of the store being downloaded in ranges. Plain NumPy arrays are served
+    as their raw C-ordered bytes, so the downloader can write them straight into an
+    array of its own, and every other object as its serialization. The SHA-256 of
+    every chunk_size bytes is computed up front and sent in the manifest.
+    """
+
+    def __init__(
+        self,
+        download_id: str,
+        id_at_location: UID,
+        data: object,
+        chunk_size: int,
+        verify_key: VerifyKey,
+        delete_obj: bool,
+    ) -> None:
+        self.download_id = download_id
+        self.id_at_location = id_at_location
+        self.chunk_size = chunk_size
+        self.verify_key = verify_key
+        self.delete_obj = delete_obj
+        self.updated_at = time.monotonic()
+        self.dtype: Optional[str] = None
+        self.shape: Optional[List[int]] = None
+
+        self._buffer: Union[bytes, memoryview]
+        if type(data) is np.ndarray and not data.dtype.hasobject:
+            array = np.ascontiguousarray(data)
+            self.format = NUMPY_FORMAT
+            self.dtype = array.dtype.str
+            self.shape = list(array.shape)
+            self._buffer = memoryview(array).cast("B")
+        else:
+            self.format = SYFT_FORMAT
+            self._buffer = serialize(data, to_bytes=True)
+
+        self.size = len(self._buffer)
+        self.hashes = [
+            hashlib.sha256(self._buffer[start : start + chunk_size]).hexdigest()  # noqa: E203
+            for start in range(0, self.size, chunk_size)
+        ]
+
+    @property
+    def manifest(self) -> Dict:
+        return {
+            "download_id": self.download_id,
+            "format": self.format,
+            "size": self.size,
+            "chunk_size": self.chunk_size,
+            "hashes": self.hashes,
+            "dtype": self.dtype,
+            "shape": self.shape,
+        }
+
+    def read(self, offset: int, length: int) -> bytes:
+        """
+        Returns the length bytes of the download starting at offset.
+
+        Raises:
+            ValueError: if the range doesn't start within the object or isn't 1 to
+                chunk_size bytes long.
+        """
+        if not 0 <= offset <= self.size:
+            raise ValueError(
+                f"offset must be between 0 and {self.size} bytes, got {offset}"
+            )
+        if not 1 <= length <= self.chunk_size:
+            raise ValueError(
+                f"length must be between 1 and {self.chunk_size} bytes, got {length}"
+            )
+        self.updated_at = time.monotonic()
+        return bytes(self._buffer[offset : offset + length])  # noqa: E203
+
+
+class ObjectDownloadManager:
+    """
+    ObjectDownloadManager keeps the downloads in progress on a node, so a large
+    object is fetched as a series of bounded ranges instead of one reply holding
+    the whole object.
+
+    Downloads which aren't read from for max_idle seconds are dropped, and a user
+    can't start more than max_per_user downloads at once, since each one holds a
+    copy of its object in memory.
+    """
+
+    def __init__(self, max_idle: float = 5 * 60, max_per_user: int = 4) -> None:
+        self.max_idle = max_idle
+        self.max_per_user = max_per_user
+        self._lock = threading.Lock()
+        self._downloads: Dict[str, ObjectDownload] = {}
+
+    def __len__(self) -> int:
+        return len(self._downloads)
+
+    def start(
+        self,
+        id_at_location: UID,
+        data: object,
+        chunk_size: int,
+        verify_key: VerifyKey,
+        delete_obj: bool,
+    ) -> ObjectDownload:
+        self.expire()
+        with self._lock:
+            self._check_limit(verify_key=verify_key)
+        download = ObjectDownload(
+            download_id=UID().no_dash,
+            id_at_location=id_at_location,
+            data=data,
+            chunk_size=chunk_size,
+            verify_key=verify_key,
+            delete_obj=delete_obj,
+        )
+        with self._lock:
+            # other downloads of the user may have started meanwhile
+            self._check_limit(verify_key=verify_key)
+            self._downloads[download.download_id] = download
+        return download
+
+    def _check_limit(self, verify_key: VerifyKey) -> None:
+        active = sum(
+            download.verify_key == verify_key for download in self._downloads.values()
+        )
+        if active >= self.max_per_user:
+            raise ValueError(
+                f"{active} downloads are already in progress, finish one of them first"
+            )
+
+    def get(self, download_id: str, verify_key: VerifyKey) -> ObjectDownload:
+        with self._lock:
+            download = self._downloads.get(download_id, None)
+        # only the downloader can read from a download
+        if download is None or download.verify_key != verify_key:
+            raise KeyError(f"Unknown download {download_id}")
+        return download
+
+    def pop(self, download_id: str) -> Optional[ObjectDownload]:
+        with self._lock:
+            return self._downloads.pop(download_id, None)
+
+    def expire(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for download_id, download in list(self._downloads.items()):
+                if now - download.updated_at > self.max_idle:
+                    del self._downloads[download_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._downloads.clear()
@@ -1,12 +1,17 @@
 # stdlib
+from contextlib import contextmanager
+import time
 from typing import Collection
+from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
-from typing import cast
 
 # third party
+from nacl.signing import VerifyKey
 import redis
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
@@ -15,11 +20,66 @@ from sqlalchemy.orm.session import Session
 import syft
 
 # relative
+from .....logger import warning
 from ....common.uid import UID
 from ....node.common.node_table.bin_obj_dataset import BinObjDataset
 from ....store import ObjectStore
+from ....store.key_notifier import KeyWatch
 from ....store.storeable_object import StorableObject
+from ....store.storeable_object_metadata import StorableObjectMetadata
 from ..node_table.bin_obj_metadata import ObjectMetadata
+from ..node_table.bin_obj_metadata import delete_search_permissions
+from ..node_table.bin_obj_metadata import delete_tags
+from ..node_table.bin_obj_metadata import deserialize_permissions
+from ..node_table.bin_obj_metadata import search_metadata
+from ..node_table.bin_obj_metadata import to_storable_object_metadata
+from ..node_table.bin_obj_metadata import update_metadata
+from ..node_table.bin_obj_metadata import update_search_permissions
+from ..node_table.bin_obj_metadata import update_tags
+from ..node_table.bin_obj_search_permission import ObjectSearchPermission
+from ..node_table.bin_obj_tag import ObjectTag
+
+
+def _key_str_and_uid(key: Union[UID, str, bytes]) -> Tuple[str, UID]:
+    if isinstance(key, UID):
+        return str(key.value), key
+    elif isinstance(key, bytes):
+        key_str = str(key.decode("utf-8"))
+        return key_str, UID.from_string(key_str)
+    return key, UID.from_string(key)
+
+
+# every set of an object is published on the channel of its key, so that the actions
+# of any worker waiting for the object wake up
+OBJECT_SET_CHANNEL = "obj_set:{}"
+
+
+class RedisKeyWatch(KeyWatch):
+    # waiting without a timeout still wakes up regularly to stay interruptible
+    max_wait: float = 1.0
+    # how long redis has to confirm the subscriptions of a watch before the keys
+    # are polled instead
+    subscribe_timeout: float = 5.0
+
+    def __init__(self, pubsub: redis.client.PubSub) -> None:
+        self.pubsub = pubsub
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait_for = self.max_wait
+            if deadline is not None:
+                wait_for = min(wait_for, max(deadline - time.monotonic(), 0.0))
+            message = self.pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=wait_for
+            )
+            if message is not None:
+                # drop the other pending messages, the caller checks every key again
+                while self.pubsub.get_message(ignore_subscribe_messages=True):
+                    pass
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
 
 
 class RedisStore(ObjectStore):
@@ -58,63 +118,164 @@ class RedisStore(ObjectStore):
         return key_ids
 
     def values(self) -> List[StorableObject]:
-        key_bytes = self.redis.keys()
         # this is bad we need to decouple getting the data from the search
-        all_values = []
-        for key in key_bytes:
-            all_values.append(self.__getitem__(key))
-
-        return all_values
+        return [obj for obj in self.get_many(self.redis.keys()) if obj is not None]
 
     def __contains__(self, key: UID) -> bool:
         return str(key.value) in self.redis
 
     def __getitem__(self, key: Union[UID, str, bytes]) -> StorableObject:
+        key_str, key_uid = _key_str_and_uid(key)
         local_session = sessionmaker(bind=self.db)()
 
-        if isinstance(key, UID):
-            key_str = str(key.value)
-            key_uid = key
-        elif isinstance(key, bytes):
-            key_str = str(key.decode("utf-8"))
-            key_uid = UID.from_string(key_str)
-        else:
-            key_str = key
-            key_uid = UID.from_string(key_str)
-
         obj = self.redis.get(key_str)
         obj_metadata = (
             local_session.query(ObjectMetadata).filter_by(obj=key_str).first()
         )
+        local_session.close()
         if obj is None or obj_metadata is None:
             raise KeyError(f"Object not found! for UID: {key_str}")
 
-        obj = syft.deserialize(obj, from_bytes=True)
+        return self._storable_object(key=key_uid, obj=obj, obj_metadata=obj_metadata)
 
-        obj = StorableObject(
-            id=key_uid,
-            data=obj,
+    def get_many(
+        self, keys: Iterable[Union[UID, str, bytes]]
+    ) -> List[Optional[StorableObject]]:
+        keys_str_and_uid = [_key_str_and_uid(key) for key in keys]
+        if len(keys_str_and_uid) == 0:
+            return []
+        key_strs = [key_str for key_str, _ in keys_str_and_uid]
+
+        # a single MGET and a single metadata query for all the keys
+        objs = self.redis.mget(key_strs)
+        local_session = sessionmaker(bind=self.db)()
+        metadata_by_key: Dict[str, ObjectMetadata] = {}
+        for obj_metadata in (
+            local_session.query(ObjectMetadata)
+            .filter(ObjectMetadata.obj.in_(set(key_strs)))
+            .order_by(ObjectMetadata.id.desc())
+        ):
+            # keep the first row like __getitem__
+            metadata_by_key[obj_metadata.obj] = obj_metadata
+        local_session.close()
+
+        values: List[Optional[StorableObject]] = []
+        for (key_str, key_uid), obj in zip(keys_str_and_uid, objs):
+            obj_metadata = metadata_by_key.get(key_str, None)
+            if obj is None or obj_metadata is None:
+                values.append(None)
+            else:
+                values.append(
+                    self._storable_object(
+                        key=key_uid, obj=obj, obj_metadata=obj_metadata
+                    )
+                )
+        return values
+
+    @staticmethod
+    def _storable_object(
+        key: UID, obj: bytes, obj_metadata: ObjectMetadata
+    ) -> StorableObject:
+        return StorableObject(
+            id=key,
+            data=syft.deserialize(obj, from_bytes=True),
             description=obj_metadata.description,
             tags=obj_metadata.tags,
-            read_permissions=dict(
-                syft.deserialize(
-                    bytes.fromhex(obj_metadata.read_permissions), from_bytes=True
-                )
-            ),
-            search_permissions=dict(
-                syft.deserialize(
-                    bytes.fromhex(obj_metadata.search_permissions), from_bytes=True
-                )
-            ),
-            write_permissions=dict(
-                syft.deserialize(
-                    bytes.fromhex(obj_metadata.write_permissions), from_bytes=True
-                )
-            ),
+            read_permissions=deserialize_permissions(obj_metadata.read_permissions),
+            search_permissions=deserialize_permissions(obj_metadata.search_permissions),
+            write_permissions=deserialize_permissions(obj_metadata.write_permissions),
             # name=obj_metadata.name,
         )
+
+    def get_objects_metadata(
+        self, keys: Optional[Iterable[UID]] = None
+    ) -> List[StorableObjectMetadata]:
+        local_session = sessionmaker(bind=self.db)()
+        metadata_query = local_session.query(ObjectMetadata)
+        if keys is not None:
+            metadata_query = metadata_query.filter(
+                ObjectMetadata.obj.in_([str(key.value) for key in keys])
+            )
+        results = self._to_objects_metadata(
+            session=local_session,
+            metadata_objs=metadata_query.order_by(ObjectMetadata.id).all(),
+        )
         local_session.close()
-        return obj
+        return results
+
+    def search_objects_metadata(
+        self,
+        verify_key: Optional[VerifyKey] = None,
+        tags: Optional[List[str]] = None,
+        object_type: Optional[str] = None,
+        dataset: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[StorableObjectMetadata], Optional[str]]:
+        local_session = sessionmaker(bind=self.db)()
+        metadata_objs, next_cursor = search_metadata(
+            session=local_session,
+            verify_key=verify_key,
+            tags=tags,
+            object_type=object_type,
+            dataset=dataset,
+            name_prefix=name_prefix,
+            cursor=cursor,
+            limit=limit,
+        )
+        results = self._to_objects_metadata(
+            session=local_session, metadata_objs=metadata_objs
+        )
+        local_session.close()
+        return results, next_cursor
+
+    def _to_objects_metadata(
+        self, session: Session, metadata_objs: List[ObjectMetadata]
+    ) -> List[StorableObjectMetadata]:
+        metadata_by_key: Dict[str, ObjectMetadata] = {}
+        for metadata_obj in metadata_objs:
+            # keep the first row like __getitem__
+            metadata_by_key.setdefault(metadata_obj.obj, metadata_obj)
+        if len(metadata_by_key) == 0:
+            return []
+
+        relation_by_key = {
+            relation.obj: relation
+            for relation in session.query(BinObjDataset).filter(
+                BinObjDataset.obj.in_(list(metadata_by_key.keys()))
+            )
+        }
+
+        # rows stored before the object_type and pointer columns existed are filled
+        # in once from their objects
+        outdated = [
+            metadata_obj
+            for metadata_obj in metadata_by_key.values()
+            if metadata_obj.object_type is None
+        ]
+        if len(outdated) > 0:
+            keys_outdated = [UID.from_string(row.obj) for row in outdated]
+            for key, metadata_obj, value in zip(
+                keys_outdated, outdated, self.get_many(keys_outdated)
+            ):
+                if value is None:
+                    del metadata_by_key[metadata_obj.obj]
+                else:
+                    update_metadata(metadata_obj=metadata_obj, key=key, value=value)
+            session.commit()
+
+        results = []
+        for key_str, metadata_obj in metadata_by_key.items():
+            relation = relation_by_key.get(key_str, None)
+            results.append(
+                to_storable_object_metadata(
+                    metadata_obj=metadata_obj,
+                    dataset=relation.dataset if relation else None,
+                    name=relation.name if relation else None,
+                )
+            )
+        return results
 
     def is_dataset(self, key: UID) -> bool:
         local_session = sessionmaker(bind=self.db)()
@@ -134,62 +295,104 @@ class RedisStore(ObjectStore):
         return obj_dataset_relation
 
     def __setitem__(self, key: UID, value: StorableObject) -> None:
-        bin = syft.serialize(value.data, to_bytes=True)
-        self.redis.set(str(key.value), bin)
+        self.set_many({key: value})
 
-        key_str = str(key.value)
-        create_metadata = True
-        local_session = sessionmaker(bind=self.db)()
-        try:
-            # use existing metadata row to prevent more than 1
-            metadata_obj = (
-                local_session.query(ObjectMetadata).filter_by(obj=key_str).all()[-1]
-            )
-            create_metadata = False
-        except Exception:
-            pass
-            # no metadata row exists lets insert one
-            metadata_obj = ObjectMetadata()
-
-        metadata_obj.obj = str(key.value)
-        metadata_obj.tags = value.tags
-        metadata_obj.description = value.description
-        metadata_obj.read_permissions = cast(
-            bytes,
-            syft.serialize(syft.lib.python.Dict(value.read_permissions), to_bytes=True),
-        ).hex()
-        metadata_obj.search_permissions = cast(
-            bytes,
-            syft.serialize(
-                syft.lib.python.Dict(value.search_permissions), to_bytes=True
-            ),
-        ).hex()
-        metadata_obj.write_permissions = cast(
-            bytes,
-            syft.serialize(
-                syft.lib.python.Dict(value.write_permissions), to_bytes=True
-            ),
-        ).hex()
-
-        obj_dataset_relation = self._get_obj_dataset_relation(key)
-        if obj_dataset_relation:
-            # Create a object dataset relationship for the new object
-            obj_dataset_relation = BinObjDataset(
-                # id=obj_dataset_relation.id,  NOTE: Commented temporarily
-                name=obj_dataset_relation.name,
-                obj=str(key.value),
-                dataset=obj_dataset_relation.dataset,
-                dtype=obj_dataset_relation.dtype,
-                shape=obj_dataset_relation.shape,
-            )
+    def set_many(self, items: Dict[UID, StorableObject]) -> None:
+        if len(items) == 0:
+            return
+        key_strs = [str(key.value) for key in items.keys()]
+
+        pipeline = self.redis.pipeline(transaction=False)
+        for key_str, value in zip(key_strs, items.values()):
+            pipeline.set(key_str, syft.serialize(value.data, to_bytes=True))
+        pipeline.execute()
 
         local_session = sessionmaker(bind=self.db)()
-        if create_metadata:
-            local_session.add(metadata_obj)
-        local_session.add(obj_dataset_relation) if obj_dataset_relation else None
+        # use existing metadata row to prevent more than 1
+        metadata_by_key: Dict[str, ObjectMetadata] = {}
+        for metadata_obj in (
+            local_session.query(ObjectMetadata)
+            .filter(ObjectMetadata.obj.in_(key_strs))
+            .order_by(ObjectMetadata.id)
+        ):
+            metadata_by_key[metadata_obj.obj] = metadata_obj
+
+        relation_by_key: Dict[str, BinObjDataset] = {}
+        for obj_dataset_relation in (
+            local_session.query(BinObjDataset)
+            .filter(BinObjDataset.obj.in_(key_strs))
+            .order_by(BinObjDataset.id.desc())
+        ):
+            relation_by_key[obj_dataset_relation.obj] = obj_dataset_relation
+
+        for key, value in items.items():
+            key_str = str(key.value)
+            metadata_obj = metadata_by_key.get(key_str, None)
+            if metadata_obj is None:
+                # no metadata row exists lets insert one
+                metadata_obj = ObjectMetadata()
+                local_session.add(metadata_obj)
+            update_metadata(metadata_obj=metadata_obj, key=key, value=value)
+
+            obj_dataset_relation = relation_by_key.get(key_str, None)
+            if obj_dataset_relation:
+                # Create a object dataset relationship for the new object
+                local_session.add(
+                    BinObjDataset(
+                        # id=obj_dataset_relation.id,  NOTE: Commented temporarily
+                        name=obj_dataset_relation.name,
+                        obj=key_str,
+                        dataset=obj_dataset_relation.dataset,
+                        dtype=obj_dataset_relation.dtype,
+                        shape=obj_dataset_relation.shape,
+                    )
+                )
+
+        update_search_permissions(session=local_session, items=items)
+        update_tags(session=local_session, items=items)
         local_session.commit()
         local_session.close()
 
+        pipeline = self.redis.pipeline(transaction=False)
+        for key_str in key_strs:
+            pipeline.publish(OBJECT_SET_CHANNEL.format(key_str), key_str)
+        pipeline.execute()
+
+    @contextmanager
+    def watch(self, keys: Iterable[UID]) -> Iterator[KeyWatch]:
+        channels = {OBJECT_SET_CHANNEL.format(str(key.value)) for key in keys}
+        if len(channels) == 0:
+            yield KeyWatch()
+            return
+        pubsub = self.redis.pubsub()
+        try:
+            pubsub.subscribe(*channels)
+            # only return once redis confirmed the subscriptions, otherwise an object
+            # set right after could be missed by both the caller and the watch
+            deadline = time.monotonic() + RedisKeyWatch.subscribe_timeout
+            confirmed = 0
+            while confirmed < len(channels):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                message = pubsub.get_message(
+                    timeout=min(remaining, RedisKeyWatch.max_wait)
+                )
+                if message is not None and message["type"] == "subscribe":
+                    confirmed += 1
+            if confirmed < len(channels):
+                warning(
+                    f"Redis confirmed {confirmed} of {len(channels)} subscriptions, "
+                    + "polling the keys instead"
+                )
+                key_watch = KeyWatch()
+                key_watch.poll_interval = RedisKeyWatch.max_wait
+                yield key_watch
+            else:
+                yield RedisKeyWatch(pubsub=pubsub)
+        finally:
+            pubsub.close()
+
     def delete(self, key: UID) -> None:
         try:
             self.redis.delete(str(key.value))
@@ -200,15 +403,36 @@ class RedisStore(ObjectStore):
                 .first()
             )
             local_session.delete(metadata_to_delete)
+            delete_search_permissions(session=local_session, key_strs=[str(key.value)])
+            delete_tags(session=local_session, key_strs=[str(key.value)])
             local_session.commit()
             local_session.close()
         except Exception as e:
             print(f"{type(self)} Exception in __delitem__ error {key}. {e}")
 
+    def delete_many(self, keys: Iterable[UID]) -> None:
+        key_strs = [str(key.value) for key in keys]
+        if len(key_strs) == 0:
+            return
+        try:
+            self.redis.delete(*key_strs)
+            local_session = sessionmaker(bind=self.db)()
+            local_session.query(ObjectMetadata).filter(
+                ObjectMetadata.obj.in_(key_strs)
+            ).delete(synchronize_session=False)
+            delete_search_permissions(session=local_session, key_strs=key_strs)
+            delete_tags(session=local_session, key_strs=key_strs)
+            local_session.commit()
+            local_session.close()
+        except Exception as e:
+            print(f"{type(self)} Exception in delete_many error {key_strs}. {e}")
+
     def clear(self) -> None:
         self.redis.flushdb()
         local_session = sessionmaker(bind=self.db)()
         local_session.query(ObjectMetadata).delete()
+        local_session.query(ObjectSearchPermission).delete()
+        local_session.query(ObjectTag).delete()
         local_session.commit()
         local_session.close()
 
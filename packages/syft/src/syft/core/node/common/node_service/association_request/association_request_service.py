@@ -196,6 +196,7 @@ def recv_association_request_msg(
         node.node_route.update_route_for_node(  # type: ignore
             node_id=node_id, host_or_ip=msg.metadata["host_or_ip"], is_vpn=is_vpn
         )
+        node.routing_table.invalidate()  # type: ignore
     except Exception as e:
         error(f"Failed to save the node and node_route rows. {e}")
 
@@ -33,6 +33,7 @@ class ChildNodeLifecycleService(ImmediateNodeServiceWithoutReply):
         lookup_id = msg.lookup_id  # TODO: Fix, see above
 
         node.store[lookup_id] = StorableObject(id=lookup_id, data=addr)
+        node.routing_table.invalidate(lookup_id)  # type: ignore
 
         debug(
             (
@@ -0,0 +1,140 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+# third party
+from nacl.signing import VerifyKey
+from typing_extensions import final
+
+# relative
+from ...... import deserialize
+from ......lib.python.util import upcast
+from .....common.serde.serializable import serializable
+from ....domain.domain_interface import DomainInterface
+from ..generic_payload.messages import GenericPayloadMessage
+from ..generic_payload.messages import GenericPayloadMessageWithReply
+from ..generic_payload.messages import GenericPayloadReplyMessage
+from .dataset_manager_service import store_asset
+
+
+@serializable(recursive_serde=True)
+@final
+class AssetUploadMessage(GenericPayloadMessage):
+    ...
+
+
+@serializable(recursive_serde=True)
+@final
+class AssetUploadReplyMessage(GenericPayloadReplyMessage):
+    ...
+
+
+@serializable(recursive_serde=True)
+@final
+class StartAssetUploadMessageWithReply(GenericPayloadMessageWithReply):
+    """
+    Starts the upload of the serialized asset kwargs["name"] of kwargs["size"] bytes
+    into the dataset kwargs["dataset_id"], or into a new dataset registered with
+    kwargs["metadata"] when the asset is stored if there is no dataset_id. With
+    kwargs["upload_id"], returns the offset an interrupted upload resumes from
+    instead.
+    """
+
+    message_type = AssetUploadMessage
+    message_reply_type = AssetUploadReplyMessage
+
+    def run(
+        self, node: DomainInterface, verify_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Any]:
+        kwargs = upcast(self.kwargs)
+        upload_id = kwargs.get("upload_id", None)
+        if upload_id is not None:
+            upload = node.asset_uploads.get(  # type: ignore
+                upload_id=upload_id, verify_key=verify_key
+            )
+        else:
+            dataset_id = kwargs.get("dataset_id", None)
+            upload = node.asset_uploads.start(  # type: ignore
+                dataset_id=str(dataset_id) if dataset_id else None,
+                name=kwargs["name"],
+                size=int(kwargs["size"]),
+                verify_key=verify_key,
+                metadata=kwargs.get("metadata", {}),
+            )
+        return {
+            "upload_id": upload.upload_id,
+            "dataset_id": upload.dataset_id,
+            "offset": upload.offset,
+        }
+
+
+@serializable(recursive_serde=True)
+@final
+class AssetChunkMessageWithReply(GenericPayloadMessageWithReply):
+    """
+    Sends the bytes kwargs["data"] of the upload kwargs["upload_id"] starting at
+    kwargs["offset"], and returns the offset the next chunk has to start at.
+    """
+
+    message_type = AssetUploadMessage
+    message_reply_type = AssetUploadReplyMessage
+
+    def run(
+        self, node: DomainInterface, verify_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Any]:
+        kwargs = upcast(self.kwargs)
+        upload = node.asset_uploads.get(  # type: ignore
+            upload_id=kwargs["upload_id"], verify_key=verify_key
+        )
+        offset = upload.write(offset=int(kwargs["offset"]), data=kwargs["data"])
+        return {"upload_id": upload.upload_id, "offset": offset}
+
+
+@serializable(recursive_serde=True)
+@final
+class FinishAssetUploadMessageWithReply(GenericPayloadMessageWithReply):
+    """
+    Checks that every byte of the upload kwargs["upload_id"] was received and that
+    their SHA-256 is kwargs["sha256"], then stores the asset in its dataset,
+    registering the dataset first if the upload started a new one.
+    """
+
+    message_type = AssetUploadMessage
+    message_reply_type = AssetUploadReplyMessage
+
+    def run(
+        self, node: DomainInterface, verify_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Any]:
+        kwargs = upcast(self.kwargs)
+        upload = node.asset_uploads.get(  # type: ignore
+            upload_id=kwargs["upload_id"], verify_key=verify_key
+        )
+        if not upload.complete:
+            raise ValueError(
+                f"Upload {upload.upload_id} has {upload.offset} of {upload.size} bytes"
+            )
+        if upload.hexdigest() != kwargs["sha256"]:
+            node.asset_uploads.pop(upload.upload_id).close()  # type: ignore
+            raise ValueError(f"Upload {upload.upload_id} is corrupted")
+
+        node.asset_uploads.pop(upload.upload_id)  # type: ignore
+        try:
+            with upload.mapped() as data:
+                asset = deserialize(data, from_bytes=True)
+        finally:
+            upload.close()
+        dataset_id = upload.dataset_id
+        if dataset_id is None:
+            dataset_id = str(node.datasets.register(**upload.metadata))
+        obj_id = store_asset(
+            node=node,
+            verify_key=verify_key,  # type: ignore
+            dataset_id=dataset_id,
+            name=upload.name,
+            table=asset,
+        )
+        return {"dataset_id": dataset_id, "id": obj_id.no_dash}
@@ -0,0 +1,33 @@
+# stdlib
+from typing import List
+from typing import Type
+
+# third party
+from nacl.signing import VerifyKey
+
+# relative
+from ....domain.domain_interface import DomainInterface
+from ...exceptions import AuthorizationError
+from ..auth import service_auth
+from ..node_service import ImmediateNodeServiceWithReply
+from .asset_upload_messages import AssetUploadMessage
+from .asset_upload_messages import AssetUploadReplyMessage
+
+
+class AssetUploadService(ImmediateNodeServiceWithReply):
+    @staticmethod
+    @service_auth(guests_welcome=True)
+    def process(
+        node: DomainInterface,
+        msg: AssetUploadMessage,
+        verify_key: VerifyKey,
+    ) -> AssetUploadReplyMessage:
+        if not node.users.can_upload_data(verify_key=verify_key):
+            raise AuthorizationError("You're not allowed to upload data!")
+
+        result = msg.payload.run(node=node, verify_key=verify_key)
+        return type(msg.payload)(kwargs=result).back_to(address=msg.reply_to)
+
+    @staticmethod
+    def message_handler_types() -> List[Type[AssetUploadMessage]]:
+        return [AssetUploadMessage]
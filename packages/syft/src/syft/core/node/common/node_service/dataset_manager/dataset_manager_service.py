@@ -2,6 +2,7 @@
 import csv
 import io
 import tarfile
+from typing import Any
 from typing import Callable
 from typing import Dict as TypeDict
 from typing import List
@@ -88,6 +89,34 @@ def _handle_dataset_creation_grid_ui(
             )
 
 
+def store_asset(
+    node: DomainInterface,
+    verify_key: VerifyKey,
+    dataset_id: str,
+    name: str,
+    table: Any,
+) -> UID:
+    id_at_location = UID()
+    storable = StorableObject(
+        id=id_at_location,
+        data=table,
+        tags=[f"#{name}"],
+        search_permissions={VERIFYALL: None},
+        read_permissions={node.verify_key: node.id, verify_key: None},
+        write_permissions={node.verify_key: node.id, verify_key: None},
+    )
+    with tracer.start_as_current_span("save to DB"):
+        node.store[storable.id] = storable
+    node.datasets.add(
+        name=name,
+        dataset_id=str(dataset_id),
+        obj_id=str(id_at_location.value),
+        dtype=str(table.__class__.__name__),
+        shape=str(table.shape),
+    )
+    return id_at_location
+
+
 def _handle_dataset_creation_syft(
     msg: CreateDatasetMessage, node: DomainInterface, verify_key: VerifyKey
 ) -> None:
@@ -99,23 +128,12 @@ def _handle_dataset_creation_syft(
             dataset_id = node.datasets.register(**msg.metadata)
 
         for table_name, table in result.items():
-            id_at_location = UID()
-            storable = StorableObject(
-                id=id_at_location,
-                data=table,
-                tags=[f"#{table_name}"],
-                search_permissions={VERIFYALL: None},
-                read_permissions={node.verify_key: node.id, verify_key: None},
-                write_permissions={node.verify_key: node.id, verify_key: None},
-            )
-            with tracer.start_as_current_span("save to DB"):
-                node.store[storable.id] = storable
-            node.datasets.add(
+            store_asset(
+                node=node,
+                verify_key=verify_key,
+                dataset_id=dataset_id,
                 name=table_name,
-                dataset_id=str(dataset_id),
-                obj_id=str(id_at_location.value),
-                dtype=str(table.__class__.__name__),
-                shape=str(table.shape),
+                table=table,
             )
 
 
@@ -1,9 +1,13 @@
 # stdlib
+from typing import Any
+from typing import Callable
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 # third party
 from nacl.signing import VerifyKey
+import requests
 
 # relative
 from ......logger import debug
@@ -14,10 +18,109 @@ from .....common.message import ImmediateSyftMessageWithoutReply
 from .....common.message import SignedImmediateSyftMessageWithReply
 from .....common.message import SignedImmediateSyftMessageWithoutReply
 from .....common.message import SignedMessageT
+from .....common.uid import UID
+from .....io.address import Address
 from ....abstract.node import AbstractNode
 from ..node_service import SignedNodeServiceWithReply
 from ..node_service import SignedNodeServiceWithoutReply
 
+SEND_METHODS = ["send_immediate_msg_without_reply", "send_immediate_msg_with_reply"]
+
+# errors raised before any byte of a message is sent, so sending it again over
+# another route can't deliver it twice
+CONNECT_ERRORS = (ConnectionRefusedError, requests.exceptions.ConnectTimeout)
+
+
+def find_store_route(node: AbstractNode, node_id: UID, method: str) -> Optional[Any]:
+    """Looks up method of the object in the store of the node messages for node_id
+    are sent with, like the client of one of its children"""
+    if node_id in node.store:
+        func = getattr(node.store[node_id], method, None)
+        if callable(func):
+            return func
+        error(f"{node_id} in store does not have method {method}")
+    return None
+
+
+def find_peer_route(node: AbstractNode, node_id: UID) -> Optional[Any]:
+    """Looks up the client of the peer node_id of the node"""
+    try:
+        debug(f"> Lookup: {node_id.emoji()}")
+        return node.get_peer_client(node_id=node_id, only_vpn=False)  # type: ignore
+    except Exception as e:
+        error(f"No client for {node_id} in node.get_peer_client. {e}")
+    return None
+
+
+def _resolve_route(
+    node: AbstractNode, addr: Address, method: str
+) -> Tuple[UID, Callable, bool]:
+    """
+    Returns the id of the node a message to addr is sent to, the method sending it
+    and whether the route came from the routing table of the node. The store of the
+    node is searched first, then its peers, whose clients are kept in the routing
+    table since looking them up may need the database.
+    """
+    # order is important, vm, device, domain, network
+    scope_ids = [
+        scope_id
+        for scope_id in [addr.vm_id, addr.device_id, addr.domain_id, addr.network_id]
+        if scope_id is not None
+    ]
+    for scope_id in scope_ids:
+        func = find_store_route(node=node, node_id=scope_id, method=method)
+        if func is not None:
+            return scope_id, func, False
+
+    for scope_id in scope_ids:
+        known, route = node.routing_table.lookup(scope_id)  # type: ignore
+        if not known:
+            route = find_peer_route(node=node, node_id=scope_id)
+            node.routing_table.add(scope_id, route)  # type: ignore
+        func = getattr(route, method, None)
+        if callable(func):
+            return scope_id, func, known
+
+    debug(f"> ❌ {node.pprint} 🤷🏾‍♀️ {addr.target_emoji()}")
+    traceback_and_raise(
+        Exception("Address unknown - cannot forward message. Throwing it away.")
+    )
+
+
+def route_message(node: AbstractNode, addr: Address, method: str) -> Callable:
+    """
+    Returns the method sending a message to addr, from the store of the node, or
+    from its routing table if the route to the peer is known and by looking it up
+    otherwise.
+    """
+    _, func, _ = _resolve_route(node=node, addr=addr, method=method)
+    return func
+
+
+def forward_message(node: AbstractNode, msg: SignedMessageT, method: str) -> Any:
+    """
+    Sends msg to its address. If sending it over a route of the routing table fails
+    the route is dropped, since the peer may have moved. A message with reply whose
+    connection failed before it was sent is then sent once more over the route
+    looked up again. Any other failure is raised, since the peer may have received
+    the message already, and a message without reply is never sent twice.
+    """
+    scope_id, func, cached = _resolve_route(node=node, addr=msg.address, method=method)
+    try:
+        return func(msg=msg)
+    except Exception as e:
+        if not cached:
+            raise
+        node.routing_table.invalidate(scope_id)  # type: ignore
+        if method != "send_immediate_msg_with_reply" or not isinstance(
+            e, CONNECT_ERRORS
+        ):
+            raise
+        error(f"Connecting to {scope_id} failed, looking up its route again. {e}")
+
+    _, func, _ = _resolve_route(node=node, addr=msg.address, method=method)
+    return func(msg=msg)
+
 
 class SignedMessageWithoutReplyForwardingService(SignedNodeServiceWithoutReply):
     @staticmethod
@@ -28,43 +131,8 @@ class SignedMessageWithoutReplyForwardingService(SignedNodeServiceWithoutReply):
     ) -> Optional[SignedMessageT]:
         addr = msg.address
         debug(f"> Forwarding WithoutReply {msg.pprint} to {addr.target_emoji()}")
-        # order is important, vm, device, domain, network
-        for scope_id in [addr.vm_id, addr.device_id, addr.domain_id, addr.network_id]:
-            if scope_id is not None and scope_id in node.store:
-                obj = node.store[scope_id]
-                func = getattr(obj, "send_immediate_msg_without_reply", None)
-
-                if func is None:
-                    error(
-                        f"{addr} in store does not have method send_immediate_msg_without_reply"
-                    )
-                else:
-                    return func(msg=msg)
-
-        try:
-            for scope_id in [
-                addr.vm_id,
-                addr.device_id,
-                addr.domain_id,
-                addr.network_id,
-            ]:
-                if scope_id is not None:
-                    debug(f"> Lookup: {scope_id.emoji()}")
-                    client = node.get_peer_client(node_id=scope_id, only_vpn=False)
-                    if client:
-                        return client.send_immediate_msg_without_reply(msg=msg)
-                    else:
-                        raise Exception
-        except Exception as e:
-            # TODO: Need to not catch blanket exceptions
-            error(
-                f"Failed to forward {msg}. "
-                f"No client for {addr} in node.get_peer_client. {e}"
-            )
-            pass
-        debug(f"> ❌ {node.pprint} 🤷🏾‍♀️ {addr.target_emoji()}")
-        traceback_and_raise(
-            Exception("Address unknown - cannot forward message. Throwing it away.")
+        return forward_message(
+            node=node, msg=msg, method="send_immediate_msg_without_reply"
         )
 
     @staticmethod
@@ -81,43 +149,8 @@ class SignedMessageWithReplyForwardingService(SignedNodeServiceWithReply):
     ) -> SignedImmediateSyftMessageWithoutReply:
         addr = msg.address
         debug(f"> Forwarding WithReply {msg.pprint} to {addr.target_emoji()}")
-
-        # order is important, vm, device, domain, network
-        for scope_id in [addr.vm_id, addr.device_id, addr.domain_id, addr.network_id]:
-            if scope_id is not None and scope_id in node.store:
-                obj = node.store[scope_id]
-                func = getattr(obj, "send_immediate_msg_with_reply", None)
-                if func is None or not callable(func):
-                    error(
-                        f"{addr} in store does not have method send_immediate_msg_with_reply"
-                    )
-                else:
-                    return func(msg=msg)
-
-        try:
-            for scope_id in [
-                addr.vm_id,
-                addr.device_id,
-                addr.domain_id,
-                addr.network_id,
-            ]:
-                if scope_id is not None:
-                    debug(f"> Lookup: {scope_id.emoji()}")
-                    client = node.get_peer_client(node_id=scope_id, only_vpn=False)
-                    if client:
-                        return client.send_immediate_msg_with_reply(msg=msg)
-                    else:
-                        raise Exception
-        except Exception as e:
-            # TODO: Need to not catch blanket exceptions
-            error(
-                f"Failed to forward {msg}. "
-                f"No client for {addr} in node.get_peer_client. {e}"
-            )
-            pass
-        debug(f"> ❌ {node.pprint} 🤷🏾‍♀️ {addr.target_emoji()}")
-        traceback_and_raise(
-            Exception("Address unknown - cannot forward message. Throwing it away.")
+        return forward_message(
+            node=node, msg=msg, method="send_immediate_msg_with_reply"
         )
 
     @staticmethod
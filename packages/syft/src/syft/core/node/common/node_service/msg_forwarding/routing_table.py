@@ -0,0 +1,89 @@
+# stdlib
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+# relative
+from .....common.uid import UID
+
+
+class RoutingTable:
+    """
+    RoutingTable maps the ids of the peers a node forwards messages to onto their
+    clients, so forwarding a message to a peer is a dict lookup instead of
+    searching the database for every message. The children of the node in its
+    store are still looked up there first.
+
+    Destinations without a route are remembered for miss_ttl seconds, so messages
+    for unknown nodes don't hit the database every time either. The node
+    invalidates the table when its children, peers or routes change, the
+    forwarding service when sending a message over a route fails, and routes are
+    looked up again after ttl seconds in any case.
+
+    Attributes:
+        ttl (float): the number of seconds a route is kept.
+        miss_ttl (float): the number of seconds a destination without route is kept.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        miss_ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.miss_ttl = miss_ttl
+        self.clock = clock
+        self._lock = threading.Lock()
+        # the routes and when they were looked up
+        self._routes: Dict[UID, Tuple[Any, float]] = {}
+        # when the destinations without a route were looked up
+        self._misses: Dict[UID, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def __contains__(self, node_id: UID) -> bool:
+        return node_id in self._routes
+
+    def lookup(self, node_id: UID) -> Tuple[bool, Optional[Any]]:
+        """
+        Returns whether the route to node_id is known and the route, None if there
+        isn't any.
+        """
+        with self._lock:
+            if node_id in self._routes:
+                route, added_at = self._routes[node_id]
+                if self.clock() - added_at <= self.ttl:
+                    return True, route
+                del self._routes[node_id]
+            missed_at = self._misses.get(node_id, None)
+            if missed_at is not None:
+                if self.clock() - missed_at <= self.miss_ttl:
+                    return True, None
+                del self._misses[node_id]
+        return False, None
+
+    def add(self, node_id: UID, route: Optional[Any]) -> None:
+        """Saves the route to node_id, or that there is none if route is None"""
+        with self._lock:
+            if route is None:
+                self._routes.pop(node_id, None)
+                self._misses[node_id] = self.clock()
+            else:
+                self._misses.pop(node_id, None)
+                self._routes[node_id] = (route, self.clock())
+
+    def invalidate(self, node_id: Optional[UID] = None) -> None:
+        """Forgets the route to node_id, or every route if node_id is None"""
+        with self._lock:
+            if node_id is None:
+                self._routes.clear()
+                self._misses.clear()
+            else:
+                self._routes.pop(node_id, None)
+                self._misses.pop(node_id, None)
@@ -1,4 +1,5 @@
 # stdlib
+from typing import Callable
 from typing import List
 from typing import Set
 from typing import Type
@@ -11,12 +12,13 @@ from ......logger import error
 from .....common.message import ImmediateSyftMessageWithReply
 from .....common.uid import UID
 from ....abstract.node import AbstractNode
-from ....domain.client import DomainClient
+from ...client import Client
 from ..auth import service_auth
 from ..node_service import ImmediateNodeServiceWithReply
 from ..peer_discovery.peer_discovery_messages import node_id_to_peer_route_metadata
 from .network_search_messages import NetworkSearchMessage
 from .network_search_messages import NetworkSearchResponse
+from .tag_index import TagSets
 
 
 class NetworkSearchService(ImmediateNodeServiceWithReply):
@@ -32,26 +34,33 @@ class NetworkSearchService(ImmediateNodeServiceWithReply):
         # refresh any missing peer clients
         node.reload_peer_clients()  # type: ignore
 
-        def query_client_store(client: DomainClient, tags: Set[str]) -> bool:
-            # source is the domain in an association
-            for data in client.store:
-                if tags.issubset(set(data.tags)):
-                    return True
-            return False
+        def fetch_tags(node_id: UID, clients: List[Client]) -> Callable[[], TagSets]:
+            def fetch() -> TagSets:
+                # try each client / route one after the next
+                for client in clients:
+                    try:
+                        # source is the domain in an association
+                        return [frozenset(data.tags) for data in client.store]
+                    except Exception as e:
+                        error(f"Failed to query {node_id} with {client}. {e}")
+                raise Exception(f"No route to {node_id} answered")
 
-        tested_nodes: Set[UID] = set()
-        matching_nodes: Set[UID] = set()
-        for node_id, clients in node.all_peer_clients().items():  # type: ignore
-            # try each client / route one after the next
-            for client in clients:
-                try:
-                    # only check a client once
-                    if node_id not in tested_nodes and query_client_store(
-                        client=client, tags=queries
-                    ):
-                        matching_nodes.add(node_id)
-                except Exception as e:
-                    error(f"Failed to query {node_id} with {client}. {e}")
+            return fetch
+
+        # the index is refreshed concurrently, so a slow peer only delays the search
+        # by the timeout of the index instead of adding up with every other peer
+        # the peers which are gone are removed from the index by the refresh
+        tag_index = node.tag_index  # type: ignore
+        peer_clients = node.all_peer_clients()  # type: ignore
+        tag_index.refresh(
+            fetchers={
+                node_id: fetch_tags(node_id=node_id, clients=clients)
+                for node_id, clients in peer_clients.items()
+            }
+        )
+        matching_nodes: Set[UID] = tag_index.search(
+            tags=queries, node_ids=peer_clients.keys()
+        )
 
         peer_routes = []
         for node_id in matching_nodes:
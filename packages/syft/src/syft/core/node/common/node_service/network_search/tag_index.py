@@ -0,0 +1,156 @@
+# stdlib
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+import threading
+import time
+from typing import Callable
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+
+# relative
+from ......logger import error
+from .....common.uid import UID
+
+TagSets = List[FrozenSet[str]]
+
+
+class TagIndexEntry:
+    """The tags of the objects of one peer and when they were fetched"""
+
+    def __init__(self, tag_sets: Iterable[Iterable[str]], updated_at: float) -> None:
+        # one set per object, duplicates only have to be tested once
+        self.tag_sets: TagSets = list({frozenset(tags) for tags in tag_sets})
+        self.updated_at = updated_at
+
+    def matches(self, tags: Set[str]) -> bool:
+        return any(tags.issubset(tag_sets) for tag_sets in self.tag_sets)
+
+
+class NetworkTagIndex:
+    """
+    NetworkTagIndex keeps the tags of the objects of every peer domain of a network,
+    so a NetworkSearchMessage is answered from memory instead of listing the store
+    of every domain one after the other.
+
+    Domains can push their tags with update. Entries older than ttl are refreshed
+    by fetching the tags of the peers concurrently, waiting at most timeout for
+    them: a peer which doesn't answer in time keeps its previous entry, if it has
+    one, and its refresh carries on in the background for the next search. The
+    entries of the peers which are not given to refresh anymore are removed.
+
+    Attributes:
+        ttl (float): the number of seconds an entry is used before being refreshed.
+        timeout (float): the number of seconds a search waits for refreshes.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        timeout: float = 5.0,
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.timeout = timeout
+        self.clock = clock
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="NetworkTagIndex"
+        )
+        self._lock = threading.Lock()
+        self._entries: Dict[UID, TagIndexEntry] = {}
+        # the refreshes which haven't finished, so a slow peer is only asked once
+        self._refreshing: Dict[UID, Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, node_id: UID) -> bool:
+        return node_id in self._entries
+
+    def update(self, node_id: UID, tag_sets: Iterable[Iterable[str]]) -> None:
+        """Replaces the tags of the objects of a peer, e.g. when the peer pushes them"""
+        entry = TagIndexEntry(tag_sets=tag_sets, updated_at=self.clock())
+        with self._lock:
+            self._entries[node_id] = entry
+
+    def remove(self, node_id: UID) -> None:
+        with self._lock:
+            self._entries.pop(node_id, None)
+            # a refresh which is still running won't add the peer back
+            self._refreshing.pop(node_id, None)
+
+    def is_stale(self, node_id: UID) -> bool:
+        entry = self._entries.get(node_id, None)
+        return entry is None or self.clock() - entry.updated_at > self.ttl
+
+    def refresh(
+        self,
+        fetchers: Dict[UID, Callable[[], Iterable[Iterable[str]]]],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Fetches the tags of the stale peers concurrently and waits for them. The
+        peers which are not in fetchers are removed from the index.
+
+        Args:
+            fetchers (Dict[UID, Callable]): returns the tags of every object of a peer.
+            timeout (Optional[float]): how long to wait, self.timeout if None.
+        """
+        futures = []
+        with self._lock:
+            for node_id in set(self._entries) | set(self._refreshing):
+                if node_id not in fetchers:
+                    self._entries.pop(node_id, None)
+                    self._refreshing.pop(node_id, None)
+
+            for node_id, fetch in fetchers.items():
+                if not self.is_stale(node_id):
+                    continue
+                future = self._refreshing.get(node_id, None)
+                if future is None:
+                    future = self._pool.submit(self._refresh_peer, node_id, fetch)
+                    self._refreshing[node_id] = future
+                futures.append(future)
+
+        if futures:
+            wait(futures, timeout=self.timeout if timeout is None else timeout)
+
+    def _refresh_peer(
+        self, node_id: UID, fetch: Callable[[], Iterable[Iterable[str]]]
+    ) -> None:
+        try:
+            entry = TagIndexEntry(tag_sets=fetch(), updated_at=self.clock())
+        except Exception as e:
+            error(f"Failed to refresh the tags of {node_id}. {e}")
+            with self._lock:
+                self._refreshing.pop(node_id, None)
+            return
+
+        with self._lock:
+            # the peer was removed while its tags were fetched
+            if self._refreshing.pop(node_id, None) is None:
+                return
+            self._entries[node_id] = entry
+
+    def search(
+        self, tags: Iterable[str], node_ids: Optional[Iterable[UID]] = None
+    ) -> Set[UID]:
+        """Returns the peers with an object tagged with every one of tags, among
+        node_ids if given"""
+        query = set(tags)
+        with self._lock:
+            entries = list(self._entries.items())
+        peers = set(node_ids) if node_ids is not None else None
+        return {
+            node_id
+            for node_id, entry in entries
+            if (peers is None or node_id in peers) and entry.matches(query)
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
@@ -24,7 +24,10 @@ class ImmediateObjectActionServiceWithoutReply(ImmediateNodeServiceWithoutReply)
         msg: ImmediateActionWithoutReply,
         verify_key: Optional[VerifyKey] = None,
     ) -> None:
-        msg.execute_action(node=node, verify_key=verify_key)
+        if node.action_scheduler is not None:
+            node.action_scheduler.submit(action=msg, verify_key=verify_key)
+        else:
+            msg.execute_action(node=node, verify_key=verify_key)
 
     @staticmethod
     def message_handler_types() -> List[Type[ImmediateActionWithoutReply]]:
@@ -38,7 +41,10 @@ class EventualObjectActionServiceWithoutReply(EventualNodeServiceWithoutReply):
         msg: EventualActionWithoutReply,
         verify_key: Optional[VerifyKey] = None,
     ) -> None:
-        msg.execute_action(node=node, verify_key=verify_key)
+        if node.action_scheduler is not None:
+            node.action_scheduler.submit(action=msg, verify_key=verify_key)
+        else:
+            msg.execute_action(node=node, verify_key=verify_key)
 
     @staticmethod
     def message_handler_types() -> List[Type[EventualActionWithoutReply]]:
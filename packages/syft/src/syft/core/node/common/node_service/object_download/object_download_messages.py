@@ -0,0 +1,141 @@
+# future
+from __future__ import annotations
+
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+# third party
+from nacl.signing import VerifyKey
+import numpy as np
+from typing_extensions import final
+
+# relative
+from ......lib.python.util import upcast
+from ......logger import critical
+from .....common.serde.serializable import serializable
+from .....common.uid import UID
+from ....abstract.node import AbstractNode
+from ...node_manager.object_download_manager import DOWNLOAD_CHUNK_SIZE
+from ...node_manager.object_download_manager import check_chunk_size
+from ..auth import AuthorizationException
+from ..generic_payload.messages import GenericPayloadMessage
+from ..generic_payload.messages import GenericPayloadMessageWithReply
+from ..generic_payload.messages import GenericPayloadReplyMessage
+
+
+@serializable(recursive_serde=True)
+@final
+class ObjectDownloadMessage(GenericPayloadMessage):
+    ...
+
+
+@serializable(recursive_serde=True)
+@final
+class ObjectDownloadReplyMessage(GenericPayloadReplyMessage):
+    ...
+
+
+@serializable(recursive_serde=True)
+@final
+class StartObjectDownloadMessageWithReply(GenericPayloadMessageWithReply):
+    """
+    Starts the download of the object kwargs["id_at_location"] in chunks of
+    kwargs["chunk_size"] bytes and returns its manifest: the format, size and dtype
+    and shape of NumPy arrays, and the SHA-256 of every chunk. The chunk size must
+    be within MIN_DOWNLOAD_CHUNK_SIZE and MAX_DOWNLOAD_CHUNK_SIZE.
+    """
+
+    message_type = ObjectDownloadMessage
+    message_reply_type = ObjectDownloadReplyMessage
+
+    def run(
+        self, node: AbstractNode, verify_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Any]:
+        kwargs = upcast(self.kwargs)
+        chunk_size = check_chunk_size(
+            int(kwargs.get("chunk_size", DOWNLOAD_CHUNK_SIZE))
+        )
+        id_at_location = UID.from_string(kwargs["id_at_location"])
+        storable_object = node.store[id_at_location]
+
+        # if you are not the root user check if your verify_key has read_permission
+        if (
+            verify_key != node.root_verify_key
+            and verify_key not in storable_object.read_permissions
+        ):
+            raise AuthorizationException(
+                f"You do not have permission to .get() Object with ID: {id_at_location} "
+                + f"on node {node.name} Please submit a request."
+            )
+
+        # plain arrays are sent as their raw bytes, everything else as in a get
+        data = storable_object.data
+        if type(data) is not np.ndarray:
+            data = storable_object.clean_copy()
+        download = node.object_downloads.start(  # type: ignore
+            id_at_location=id_at_location,
+            data=data,
+            chunk_size=chunk_size,
+            verify_key=verify_key,
+            delete_obj=bool(kwargs.get("delete_obj", False)),
+        )
+        return download.manifest
+
+
+@serializable(recursive_serde=True)
+@final
+class ObjectChunkMessageWithReply(GenericPayloadMessageWithReply):
+    """
+    Returns the kwargs["length"] bytes of the download kwargs["download_id"] starting
+    at kwargs["offset"]. A range longer than the chunk size of the download or
+    starting outside of the object is refused.
+    """
+
+    message_type = ObjectDownloadMessage
+    message_reply_type = ObjectDownloadReplyMessage
+
+    def run(
+        self, node: AbstractNode, verify_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Any]:
+        kwargs = upcast(self.kwargs)
+        download = node.object_downloads.get(  # type: ignore
+            download_id=kwargs["download_id"], verify_key=verify_key
+        )
+        offset = int(kwargs["offset"])
+        return {
+            "offset": offset,
+            "data": download.read(offset=offset, length=int(kwargs["length"])),
+        }
+
+
+@serializable(recursive_serde=True)
+@final
+class FinishObjectDownloadMessageWithReply(GenericPayloadMessageWithReply):
+    """
+    Ends the download kwargs["download_id"], deleting the object from the store if
+    the download was started with delete_obj and kwargs["completed"] is set, which
+    it isn't when the downloader aborts.
+    """
+
+    message_type = ObjectDownloadMessage
+    message_reply_type = ObjectDownloadReplyMessage
+
+    def run(
+        self, node: AbstractNode, verify_key: Optional[VerifyKey] = None
+    ) -> Dict[str, Any]:
+        kwargs = upcast(self.kwargs)
+        download = node.object_downloads.get(  # type: ignore
+            download_id=kwargs["download_id"], verify_key=verify_key
+        )
+        node.object_downloads.pop(download.download_id)  # type: ignore
+        if download.delete_obj and kwargs.get("completed", True):
+            try:
+                if not node.store.is_dataset(key=download.id_at_location):  # type: ignore
+                    node.store.delete(key=download.id_at_location)
+            except Exception as e:
+                critical(
+                    f"> FinishObjectDownload delete exception {download.id_at_location} {e}"
+                )
+        return {"download_id": download.download_id}
@@ -0,0 +1,29 @@
+# stdlib
+from typing import List
+from typing import Type
+
+# third party
+from nacl.signing import VerifyKey
+
+# relative
+from ....abstract.node import AbstractNode
+from ..auth import service_auth
+from ..node_service import ImmediateNodeServiceWithReply
+from .object_download_messages import ObjectDownloadMessage
+from .object_download_messages import ObjectDownloadReplyMessage
+
+
+class ObjectDownloadService(ImmediateNodeServiceWithReply):
+    @staticmethod
+    @service_auth(guests_welcome=True)
+    def process(
+        node: AbstractNode,
+        msg: ObjectDownloadMessage,
+        verify_key: VerifyKey,
+    ) -> ObjectDownloadReplyMessage:
+        result = msg.payload.run(node=node, verify_key=verify_key)
+        return type(msg.payload)(kwargs=result).back_to(address=msg.reply_to)
+
+    @staticmethod
+    def message_handler_types() -> List[Type[ObjectDownloadMessage]]:
+        return [ObjectDownloadMessage]
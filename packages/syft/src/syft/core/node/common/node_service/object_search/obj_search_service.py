@@ -25,9 +25,7 @@ from ......proto.core.node.common.service.object_search_message_pb2 import (
 from ......proto.core.node.common.service.object_search_message_pb2 import (
     ObjectSearchReplyMessage as ObjectSearchReplyMessage_PB,
 )
-from ......util import obj2pointer_type
 from ......util import traceback_and_raise
-from .....common.group import VERIFYALL
 from .....common.message import ImmediateSyftMessageWithReply
 from .....common.message import ImmediateSyftMessageWithoutReply
 from .....common.serde.serializable import serializable
@@ -47,14 +45,28 @@ class ObjectSearchMessage(ImmediateSyftMessageWithReply):
         reply_to: Address,
         obj_id: Optional[UID] = None,
         msg_id: Optional[UID] = None,
+        tags: Optional[List[str]] = None,
+        object_type: Optional[str] = None,
+        dataset: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
     ):
         super().__init__(address=address, msg_id=msg_id, reply_to=reply_to)
         """By default this message just returns pointers to all the objects
-        the sender is allowed to see. In the future we'll add support so that
-        we can query for subsets."""
+        the sender is allowed to see. The search can be restricted to the objects
+        with all the given tags, of an object_type, of a dataset or whose name starts
+        with name_prefix. If a limit is given the results are returned one page at a
+        time: the reply has the cursor to send to get the next page."""
 
         # if you specify an object id then search will return a pointer to that
         self.obj_id = obj_id
+        self.tags = tags if tags else []
+        self.object_type = object_type
+        self.dataset = dataset
+        self.name_prefix = name_prefix
+        self.cursor = cursor
+        self.limit = limit
 
     def _object2proto(self) -> ObjectSearchMessage_PB:
         """Returns a protobuf serialization of self.
@@ -76,6 +88,12 @@ class ObjectSearchMessage(ImmediateSyftMessageWithReply):
             address=sy.serialize(self.address),
             reply_to=sy.serialize(self.reply_to),
             obj_id=sy.serialize(self.obj_id) if self.obj_id is not None else None,
+            tags=self.tags,
+            object_type=self.object_type if self.object_type else "",
+            dataset=self.dataset if self.dataset else "",
+            name_prefix=self.name_prefix if self.name_prefix else "",
+            cursor=self.cursor if self.cursor else "",
+            limit=self.limit if self.limit else 0,
         )
 
     @staticmethod
@@ -100,6 +118,12 @@ class ObjectSearchMessage(ImmediateSyftMessageWithReply):
             obj_id=sy.deserialize(blob=proto.obj_id)
             if proto.HasField("obj_id")
             else None,
+            tags=list(proto.tags),
+            object_type=proto.object_type if proto.object_type else None,
+            dataset=proto.dataset if proto.dataset else None,
+            name_prefix=proto.name_prefix if proto.name_prefix else None,
+            cursor=proto.cursor if proto.cursor else None,
+            limit=proto.limit if proto.limit else None,
         )
 
     @staticmethod
@@ -131,12 +155,14 @@ class ObjectSearchReplyMessage(ImmediateSyftMessageWithoutReply):
         results: List[Pointer],
         address: Address,
         msg_id: Optional[UID] = None,
+        next_cursor: Optional[str] = None,
     ):
         super().__init__(address=address, msg_id=msg_id)
         """By default this message just returns pointers to all the objects
-        the sender is allowed to see. In the future we'll add support so that
-        we can query for subsets."""
+        the sender is allowed to see. next_cursor is set when there are more
+        results to get with another ObjectSearchMessage."""
         self.results = results
+        self.next_cursor = next_cursor
 
     def _object2proto(self) -> ObjectSearchReplyMessage_PB:
         """Returns a protobuf serialization of self.
@@ -157,6 +183,7 @@ class ObjectSearchReplyMessage(ImmediateSyftMessageWithoutReply):
             msg_id=sy.serialize(self.id),
             address=sy.serialize(self.address),
             results=list(map(lambda x: sy.serialize(x, to_bytes=True), self.results)),
+            next_cursor=self.next_cursor if self.next_cursor else "",
         )
 
     @staticmethod
@@ -178,6 +205,7 @@ class ObjectSearchReplyMessage(ImmediateSyftMessageWithoutReply):
             msg_id=sy.deserialize(blob=proto.msg_id),
             address=sy.deserialize(blob=proto.address),
             results=[sy.deserialize(blob=x, from_bytes=True) for x in proto.results],
+            next_cursor=proto.next_cursor if proto.next_cursor else None,
         )
 
     @staticmethod
@@ -216,45 +244,58 @@ class ImmediateObjectSearchService(ImmediateNodeServiceWithReply):
                 "verification key."
             )
 
+        next_cursor: Optional[str] = None
         try:
-
-            # if no object is specified, return all objects
+            # only the metadata is fetched so that the data of the objects which are
+            # searched is only retrieved for the pointers which hold some of it
             if msg.obj_id is None:
-                objs = node.store.get_objects_of_type(obj_type=object)
-
-            # if object id is specified - return just that object
+                # the root user can search for every object
+                objs, next_cursor = node.store.search_objects_metadata(
+                    verify_key=None
+                    if verify_key == node.root_verify_key
+                    else verify_key,
+                    tags=msg.tags,
+                    object_type=msg.object_type,
+                    dataset=msg.dataset,
+                    name_prefix=msg.name_prefix,
+                    cursor=msg.cursor,
+                    limit=msg.limit,
+                )
             else:
-                objs = [node.store[msg.obj_id]]
+                # if object id is specified - return just that object
+                objs = [
+                    obj
+                    for obj in node.store.get_objects_metadata(keys=[msg.obj_id])
+                    if verify_key == node.root_verify_key
+                    or obj.is_searchable_by(verify_key)
+                ]
+
+            # the objects whose data creates their own pointers are fetched in
+            # one go, the pointers to the others are made from the metadata
+            own_pointer_keys = [obj.id for obj in objs if obj.own_pointer]
+            data_by_key = {
+                key: value.data
+                for key, value in zip(
+                    own_pointer_keys, node.store.get_many(keys=own_pointer_keys)
+                )
+                if value is not None
+            }
 
             for obj in objs:
-                # if this tensor allows anyone to search for it, then one of its keys
-                # has a VERIFYALL in it.
-                contains_all_in_permissions = any(
-                    key is VERIFYALL for key in obj.search_permissions.keys()
-                )
-                if (
-                    verify_key in obj.search_permissions.keys()
-                    or verify_key == node.root_verify_key
-                    or contains_all_in_permissions
+                if not obj.can_init_pointer or (
+                    obj.own_pointer and obj.id not in data_by_key
                 ):
-                    if hasattr(obj.data, "init_pointer"):
-                        ptr_constructor = obj.data.init_pointer  # type: ignore
-                    else:
-                        ptr_constructor = obj2pointer_type(obj=obj.data)
-
-                    ptr = ptr_constructor(
-                        client=node,
-                        id_at_location=obj.id,
-                        object_type=obj.object_type,
-                        tags=obj.tags,
-                        description=obj.description,
-                    )
-
-                    results.append(ptr)
+                    error(f"Can't create a pointer to {obj.object_type}")
+                    continue
+                results.append(
+                    obj.init_pointer(client=node, data=data_by_key.get(obj.id, None))
+                )
         except Exception as e:
             error(f"Error searching store. {e}")
 
-        return ObjectSearchReplyMessage(address=msg.reply_to, results=results)
+        return ObjectSearchReplyMessage(
+            address=msg.reply_to, results=results, next_cursor=next_cursor
+        )
 
     @staticmethod
     def message_handler_types() -> List[Type[ObjectSearchMessage]]:
@@ -1,11 +1,34 @@
+# stdlib
+from functools import lru_cache
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
 # third party
+from nacl.signing import VerifyKey
+from sqlalchemy import Boolean
 from sqlalchemy import Column
 from sqlalchemy import Integer
 from sqlalchemy import JSON
 from sqlalchemy import String
+from sqlalchemy.orm import Session
+
+# syft absolute
+import syft as sy
 
 # relative
 from . import Base
+from ....common.group import VERIFYALL
+from ....common.uid import UID
+from ....store.storeable_object import StorableObject
+from ....store.storeable_object_metadata import StorableObjectMetadata
+from .bin_obj_dataset import BinObjDataset
+from .bin_obj_search_permission import ObjectSearchPermission
+from .bin_obj_tag import ObjectTag
 
 
 class ObjectMetadata(Base):
@@ -21,3 +44,159 @@ class ObjectMetadata(Base):
     read_permissions = Column(JSON())
     search_permissions = Column(JSON())
     write_permissions = Column(JSON())
+    object_type = Column(String())
+    pointer_path = Column(String())
+    own_pointer = Column(Boolean())
+
+
+def serialize_permissions(permissions: Dict[Any, Any]) -> str:
+    return cast(
+        bytes, sy.serialize(sy.lib.python.Dict(permissions), to_bytes=True)
+    ).hex()
+
+
+@lru_cache(maxsize=1024)
+def _deserialize_permissions(permissions: str) -> Tuple[Tuple[Any, Any], ...]:
+    # most objects of a node share the same few permission columns so we only
+    # deserialize each of them once
+    return tuple(
+        dict(sy.deserialize(bytes.fromhex(permissions), from_bytes=True)).items()
+    )
+
+
+def deserialize_permissions(permissions: str) -> Dict[Any, Any]:
+    # always return a new dict as the permissions of a StorableObject are mutable
+    return dict(_deserialize_permissions(permissions))
+
+
+def update_metadata(
+    metadata_obj: ObjectMetadata, key: UID, value: StorableObject
+) -> None:
+    metadata_obj.obj = str(key.value)
+    metadata_obj.tags = value.tags
+    metadata_obj.description = value.description
+    metadata_obj.read_permissions = serialize_permissions(value.read_permissions)
+    metadata_obj.search_permissions = serialize_permissions(value.search_permissions)
+    metadata_obj.write_permissions = serialize_permissions(value.write_permissions)
+    metadata_obj.object_type = value.object_type
+    (
+        metadata_obj.pointer_path,
+        metadata_obj.own_pointer,
+    ) = StorableObjectMetadata.pointer_from_storable_object(value=value)
+
+
+def to_storable_object_metadata(
+    metadata_obj: ObjectMetadata,
+    dataset: Optional[str] = None,
+    name: Optional[str] = None,
+) -> StorableObjectMetadata:
+    return StorableObjectMetadata(
+        id=UID.from_string(metadata_obj.obj),
+        object_type=metadata_obj.object_type,
+        description=metadata_obj.description,
+        tags=metadata_obj.tags,
+        read_permissions=deserialize_permissions(metadata_obj.read_permissions),
+        search_permissions=deserialize_permissions(metadata_obj.search_permissions),
+        write_permissions=deserialize_permissions(metadata_obj.write_permissions),
+        pointer_path=metadata_obj.pointer_path,
+        own_pointer=bool(metadata_obj.own_pointer),
+        dataset=dataset,
+        name=name,
+    )
+
+
+def search_permission_key(verify_key: Any) -> str:
+    if verify_key is VERIFYALL:
+        return "VERIFYALL"
+    if isinstance(verify_key, VerifyKey):
+        return bytes(verify_key).hex()
+    return str(verify_key)
+
+
+def update_search_permissions(
+    session: Session, items: Dict[UID, StorableObject]
+) -> None:
+    delete_search_permissions(session=session, key_strs=[str(k.value) for k in items])
+    session.add_all(
+        [
+            ObjectSearchPermission(
+                obj=str(key.value), verify_key=search_permission_key(verify_key)
+            )
+            for key, value in items.items()
+            for verify_key in value.search_permissions.keys()
+        ]
+    )
+
+
+def delete_search_permissions(session: Session, key_strs: Iterable[str]) -> None:
+    session.query(ObjectSearchPermission).filter(
+        ObjectSearchPermission.obj.in_(list(key_strs))
+    ).delete(synchronize_session=False)
+
+
+def update_tags(session: Session, items: Dict[UID, StorableObject]) -> None:
+    delete_tags(session=session, key_strs=[str(k.value) for k in items])
+    session.add_all(
+        [
+            ObjectTag(obj=str(key.value), tag=tag)
+            for key, value in items.items()
+            for tag in set(value.tags or [])
+        ]
+    )
+
+
+def delete_tags(session: Session, key_strs: Iterable[str]) -> None:
+    session.query(ObjectTag).filter(ObjectTag.obj.in_(list(key_strs))).delete(
+        synchronize_session=False
+    )
+
+
+def search_metadata(
+    session: Session,
+    verify_key: Optional[VerifyKey] = None,
+    tags: Optional[List[str]] = None,
+    object_type: Optional[str] = None,
+    dataset: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Tuple[List[ObjectMetadata], Optional[str]]:
+    """Returns a page of the ObjectMetadata rows matching the search and the cursor
+    of the next page, which is the id of the last row read, or None after the last page.
+
+    The rows the verify_key can search for and the rows with the tags are found with the
+    ObjectSearchPermission and ObjectTag indexes so a search only reads the rows it returns.
+    """
+    query = session.query(ObjectMetadata)
+    if verify_key is not None:
+        searchable = session.query(ObjectSearchPermission.obj).filter(
+            ObjectSearchPermission.verify_key.in_(
+                [search_permission_key(verify_key), search_permission_key(VERIFYALL)]
+            )
+        )
+        query = query.filter(ObjectMetadata.obj.in_(searchable))
+    for tag in set(tags or []):
+        tagged = session.query(ObjectTag.obj).filter(ObjectTag.tag == tag)
+        query = query.filter(ObjectMetadata.obj.in_(tagged))
+    if object_type is not None:
+        query = query.filter(ObjectMetadata.object_type == object_type)
+    if dataset is not None or name_prefix is not None:
+        relations = session.query(BinObjDataset.obj)
+        if dataset is not None:
+            relations = relations.filter(BinObjDataset.dataset == dataset)
+        if name_prefix is not None:
+            relations = relations.filter(
+                BinObjDataset.name.startswith(name_prefix, autoescape=True)
+            )
+        query = query.filter(ObjectMetadata.obj.in_(relations))
+
+    last_id = int(cursor) if cursor else 0
+    results = (
+        query.filter(ObjectMetadata.id > last_id)
+        .order_by(ObjectMetadata.id)
+        .limit(limit)
+        .all()
+    )
+    if limit is None or len(results) < limit:
+        return results, None
+    return results, str(results[-1].id)
@@ -0,0 +1,15 @@
+# third party
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+# relative
+from . import Base
+
+
+class ObjectSearchPermission(Base):
+    __tablename__ = "obj_search_permission"
+
+    id = Column(Integer(), primary_key=True, autoincrement=True)
+    obj = Column(String(256), index=True)
+    verify_key = Column(String(256), index=True)
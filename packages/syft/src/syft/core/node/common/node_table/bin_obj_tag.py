@@ -0,0 +1,15 @@
+# third party
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+# relative
+from . import Base
+
+
+class ObjectTag(Base):
+    __tablename__ = "obj_tag"
+
+    id = Column(Integer(), primary_key=True, autoincrement=True)
+    obj = Column(String(256), index=True)
+    tag = Column(String(1024), index=True)
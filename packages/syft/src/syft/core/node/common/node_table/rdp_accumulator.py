@@ -0,0 +1,26 @@
+# third party
+from sqlalchemy import Column
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
+from sqlalchemy import String
+
+# relative
+from . import Base
+
+
+class RDPAccumulator(Base):
+    __tablename__ = "rdp_accumulator"
+
+    id = Column(Integer(), primary_key=True, autoincrement=True)
+
+    # the entity whose privacy was spent and the user who spent it
+    entity_name = Column(String(1024), index=True)
+    user_key = Column(LargeBinary(2048), default="")
+
+    # the Renyi DP of every mechanism registered for this entity and user, summed.
+    # The RDP of gaussian mechanisms is linear in the order alpha, so the whole
+    # curve is kept as its value at alpha = 1, for both values of the mechanisms
+    private_rdp = Column(Float(), default=0.0)
+    public_rdp = Column(Float(), default=0.0)
+    n_mechanisms = Column(Integer(), default=0)
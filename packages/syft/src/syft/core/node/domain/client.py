@@ -630,9 +630,6 @@ class DomainClient(Client):
             "\rLoading dataset... checking asset types...                              "
         )
 
-        # relative
-        from ....lib.python.util import downcast
-
         if not skip_checks:
             for _, asset in assets.items():
 
@@ -669,22 +666,12 @@ class DomainClient(Client):
                     # if pref == "n":
                     #     raise Exception("Dataset loading cancelled.")
 
-        metadata["name"] = bytes(name, "utf-8")  # type: ignore
-        metadata["description"] = bytes(description, "utf-8")  # type: ignore
-
-        for k, v in metadata.items():
-            if isinstance(v, str):  # type: ignore
-                metadata[k] = bytes(v, "utf-8")  # type: ignore
-
-        assets = downcast(assets)
-        metadata = downcast(metadata)
-
-        binary_dataset = serialize(assets, to_bytes=True)
+        metadata["name"] = name  # type: ignore
+        metadata["description"] = description  # type: ignore
 
         sys.stdout.write("\rLoading dataset... uploading...                        ")
-        self.datasets.create_syft(
-            dataset=binary_dataset, metadata=metadata, platform="syft"
-        )
+        # the assets are sent one after the other in chunks instead of as one blob
+        self.datasets.upload(assets=assets, metadata=metadata)
         sys.stdout.write(
             "\rLoading dataset... uploading... SUCCESS!                        "
         )
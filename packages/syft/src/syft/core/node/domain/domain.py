@@ -34,6 +34,7 @@ from ...io.location import SpecificLocation
 from ..common.action.get_object_action import GetObjectAction
 from ..common.client import Client
 from ..common.node import Node
+from ..common.node_manager.asset_upload_manager import AssetUploadManager
 from ..common.node_manager.association_request_manager import AssociationRequestManager
 from ..common.node_manager.dataset_manager import DatasetManager
 from ..common.node_manager.environment_manager import EnvironmentManager
@@ -46,6 +47,9 @@ from ..common.node_manager.user_manager import UserManager
 from ..common.node_service.association_request.association_request_service import (
     AssociationRequestService,
 )
+from ..common.node_service.dataset_manager.asset_upload_service import (
+    AssetUploadService,
+)
 from ..common.node_service.dataset_manager.dataset_manager_service import (
     DatasetManagerService,
 )
@@ -138,6 +142,7 @@ class Domain(Node):
         self.association_requests = AssociationRequestManager(db_engine)
         self.data_requests = RequestManager(db_engine)
         self.datasets = DatasetManager(db_engine)
+        self.asset_uploads = AssetUploadManager()
         self.node = NodeManager(db_engine)
         self.node_route = NodeRouteManager(db_engine)
         self.acc = AdversarialAccountant(db_engine=db_engine, max_budget=10000)
@@ -163,6 +168,7 @@ class Domain(Node):
         self.immediate_services_with_reply.append(RoleManagerService)
         self.immediate_services_with_reply.append(UserManagerService)
         self.immediate_services_with_reply.append(DatasetManagerService)
+        self.immediate_services_with_reply.append(AssetUploadService)
         # self.immediate_services_with_reply.append(TransferObjectService)
         self.immediate_services_with_reply.append(RequestService)
         self.immediate_services_with_reply.append(UserLoginService)
@@ -441,6 +447,7 @@ class Domain(Node):
             self.environments.clear()
             self.association_requests.clear()
             self.datasets.clear()
+            self.asset_uploads.clear()
             self.initial_setup()
             return True
 
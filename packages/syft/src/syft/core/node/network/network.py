@@ -36,6 +36,7 @@ from ..common.node_service.association_request.association_request_service impor
 from ..common.node_service.network_search.network_search_service import (
     NetworkSearchService,
 )
+from ..common.node_service.network_search.tag_index import NetworkTagIndex
 from ..common.node_service.node_setup.node_setup_messages import (
     CreateInitialSetUpMessage,
 )
@@ -104,6 +105,9 @@ class Network(Node):
         self.node_route = NodeRouteManager(db_engine)
         self.association_requests = AssociationRequestManager(db_engine)
 
+        # tags of the objects of the peer domains, to answer NetworkSearchMessage
+        self.tag_index = NetworkTagIndex()
+
         # Grid Network Services
         self.immediate_services_with_reply.append(AssociationRequestService)
         self.immediate_services_with_reply.append(NodeSetupService)
@@ -85,15 +85,21 @@ Example:
 
 """
 # stdlib
+import hashlib
 import time
 from typing import Any
+from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Type
 import warnings
 
 # third party
 from google.protobuf.reflection import GeneratedProtocolMessageType
 from nacl.signing import VerifyKey
+import numpy as np
 
 # syft absolute
 import syft as sy
@@ -111,12 +117,22 @@ from ..common.uid import UID
 from ..io.address import Address
 from ..node.abstract.node import AbstractNode
 from ..node.common.action.get_object_action import GetObjectAction
+from ..node.common.action.get_object_action import GetObjectResponseMessage
+from ..node.common.node_manager.object_download_manager import DOWNLOAD_CHUNK_SIZE
+from ..node.common.node_manager.object_download_manager import NUMPY_FORMAT
+from ..node.common.node_manager.object_download_manager import check_chunk_size
 from ..node.common.node_service.get_repr.get_repr_service import GetReprMessage
 from ..node.common.node_service.object_search_permission_update.obj_search_permission_messages import (
     ObjectSearchPermissionUpdateMessage,
 )
 from ..store.storeable_object import StorableObject
 
+if TYPE_CHECKING:
+    # relative
+    from ..node.common.node_service.generic_payload.messages import (
+        GenericPayloadMessageWithReply,
+    )
+
 
 # TODO: Fix the Client, Address, Location confusion
 @serializable()
@@ -217,12 +233,169 @@ class Pointer(AbstractPointer):
 
         return obj
 
+    def _download_request(
+        self, syft_msg: Type["GenericPayloadMessageWithReply"], content: Dict
+    ) -> Dict[str, Any]:
+        # relative
+        from ...lib.python.util import upcast
+        from ..node.common.action.exception_action import ExceptionMessage
+
+        signed_msg = (
+            syft_msg(kwargs=content)
+            .to(address=self.client.address, reply_to=self.client.address)
+            .sign(signing_key=self.client.signing_key)
+        )
+        response = self.client.send_immediate_msg_with_reply(msg=signed_msg)
+        if isinstance(response, ExceptionMessage):
+            raise response.exception_type(response.exception_msg)
+        return upcast(response.payload.kwargs)
+
+    def _start_download(self, chunk_size: int, delete_obj: bool) -> Dict[str, Any]:
+        """Starts a download of the remote object and returns its manifest, which
+        holds the SHA-256 of every chunk and comes in a signed reply."""
+
+        # relative
+        from ..node.common.node_service.object_download.object_download_messages import (
+            StartObjectDownloadMessageWithReply,
+        )
+
+        debug(
+            f"> StartObjectDownload for id_at_location={self.id_at_location} "
+            + f"with delete_obj={delete_obj}"
+        )
+        # the node refuses it too, but its errors don't reach the client
+        check_chunk_size(chunk_size)
+        return self._download_request(
+            StartObjectDownloadMessageWithReply,
+            {
+                "id_at_location": self.id_at_location.no_dash,
+                "chunk_size": chunk_size,
+                "delete_obj": delete_obj,
+            },
+        )
+
+    def _download_chunks(self, manifest: Dict[str, Any]) -> Iterator[bytes]:
+        # relative
+        from ..node.common.node_service.object_download.object_download_messages import (
+            ObjectChunkMessageWithReply,
+        )
+
+        chunk_size = manifest["chunk_size"]
+        for index, digest in enumerate(manifest["hashes"]):
+            reply = self._download_request(
+                ObjectChunkMessageWithReply,
+                {
+                    "download_id": manifest["download_id"],
+                    "offset": index * chunk_size,
+                    "length": chunk_size,
+                },
+            )
+            data = reply["data"]
+            if hashlib.sha256(data).hexdigest() != digest:
+                raise ValueError(
+                    f"Chunk {index} of download {manifest['download_id']} is corrupted"
+                )
+            yield data
+
+    def _finish_download(self, manifest: Dict[str, Any], completed: bool) -> None:
+        """Ends a download on the node, which only deletes the object when the
+        download was completed. Failing to end an aborted download is only logged,
+        so it doesn't hide why the download was aborted."""
+
+        # relative
+        from ..node.common.node_service.object_download.object_download_messages import (
+            FinishObjectDownloadMessageWithReply,
+        )
+
+        try:
+            self._download_request(
+                FinishObjectDownloadMessageWithReply,
+                {"download_id": manifest["download_id"], "completed": completed},
+            )
+        except Exception as e:
+            if completed:
+                raise
+            warning(f"Failed to end the download {manifest['download_id']}. {e}")
+
+    def iter_chunks(
+        self, chunk_size: int = DOWNLOAD_CHUNK_SIZE, delete_obj: bool = False
+    ) -> Iterator[bytes]:
+        """Downloads the remote object in chunks of at most chunk_size bytes, each
+        checked against the manifest before it is yielded. NumPy arrays come as their
+        raw C-ordered bytes and every other object as its serialization.
+
+        :return: an iterator over the bytes of the remote object
+        :rtype: Iterator[bytes]
+        """
+        manifest = self._start_download(chunk_size=chunk_size, delete_obj=delete_obj)
+        # the download is also ended on the node when the iterator is closed early
+        completed = False
+        try:
+            yield from self._download_chunks(manifest)
+            completed = True
+        finally:
+            self._finish_download(manifest, completed=completed)
+
+    def _get_streamed(
+        self,
+        delete_obj: bool = True,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        out: Optional[str] = None,
+    ) -> Any:
+        """Method to download a remote object in chunks from a pointer object if you
+        have the right permissions. The chunks are written into one preallocated
+        buffer, and NumPy arrays into the memory-mapped .npy file out if given.
+
+        :return: returns the downloaded data
+        :rtype: Any
+        """
+        manifest = self._start_download(chunk_size=chunk_size, delete_obj=delete_obj)
+
+        if manifest["format"] == NUMPY_FORMAT:
+            shape = tuple(manifest["shape"])
+            if out is not None:
+                array = np.lib.format.open_memmap(
+                    out, mode="w+", dtype=np.dtype(manifest["dtype"]), shape=shape
+                )
+            else:
+                array = np.empty(shape, dtype=np.dtype(manifest["dtype"]))
+            buffer = memoryview(array).cast("B") if array.size else memoryview(b"")
+        else:
+            buffer = memoryview(bytearray(manifest["size"]))
+
+        offset = 0
+        completed = False
+        try:
+            for data in self._download_chunks(manifest):
+                buffer[offset : offset + len(data)] = data  # noqa: E203
+                offset += len(data)
+            completed = True
+        finally:
+            self._finish_download(manifest, completed=completed)
+
+        if manifest["format"] == NUMPY_FORMAT:
+            if isinstance(array, np.memmap):
+                array.flush()
+            return array
+
+        storable_object = _deserialize(blob=buffer.tobytes(), from_bytes=True)
+        obj = GetObjectResponseMessage(
+            obj=storable_object, address=self.client.address
+        ).data
+        if self.is_enum:
+            enum_class = self.client.lib_ast.query(self.path_and_name).object_ref
+            return enum_class(obj)
+
+        return obj
+
     def get_copy(
         self,
         request_block: bool = False,
         timeout_secs: int = 20,
         reason: str = "",
         verbose: bool = False,
+        stream: bool = False,
+        out: Optional[str] = None,
     ) -> Optional[StorableObject]:
         """Method to download a remote object from a pointer object if you have the right
         permissions. Optionally can block while waiting for approval.
@@ -236,6 +409,8 @@ class Pointer(AbstractPointer):
             reason=reason,
             delete_obj=False,
             verbose=verbose,
+            stream=stream,
+            out=out,
         )
 
     def print(self) -> "Pointer":
@@ -322,10 +497,17 @@ class Pointer(AbstractPointer):
         reason: str = "",
         delete_obj: bool = True,
         verbose: bool = False,
+        stream: bool = False,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        out: Optional[str] = None,
     ) -> Optional[StorableObject]:
         """Method to download a remote object from a pointer object if you have the right
         permissions. Optionally can block while waiting for approval.
 
+        With stream=True the object is downloaded in chunks of chunk_size bytes
+        instead of a single reply, and NumPy arrays are written into the
+        memory-mapped .npy file out if given.
+
         :return: returns the downloaded data
         :rtype: Optional[StorableObject]
         """
@@ -340,8 +522,15 @@ class Pointer(AbstractPointer):
                 "Object has already been deleted. This pointer is exhausted"
             )
 
+        def _get() -> Any:
+            if stream:
+                return self._get_streamed(
+                    delete_obj=delete_obj, chunk_size=chunk_size, out=out
+                )
+            return self._get(delete_obj=delete_obj, verbose=verbose)
+
         if not request_block:
-            result = self._get(delete_obj=delete_obj, verbose=verbose)
+            result = _get()
         else:
             response_status = self.request(
                 reason=reason,
@@ -353,7 +542,7 @@ class Pointer(AbstractPointer):
                 response_status is not None
                 and response_status == RequestStatus.Accepted
             ):
-                result = self._get(delete_obj=delete_obj, verbose=verbose)
+                result = _get()
             else:
                 return None
 
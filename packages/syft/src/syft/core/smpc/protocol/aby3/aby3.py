@@ -8,12 +8,11 @@ from functools import reduce
 import secrets
 from typing import Any
 from typing import List
-from typing import Union
+from typing import Tuple
 from uuid import UUID
 
 # third party
 import numpy as np
-from tqdm import tqdm
 
 # relative
 from .....ast.klass import get_run_class_method
@@ -21,7 +20,6 @@ from ....common import UID
 from ....tensor.smpc.mpc_tensor import MPCTensor
 from ....tensor.smpc.share_tensor import ShareTensor
 from ....tensor.smpc.utils import get_nr_bits
-from ....tensor.tensor import Tensor
 from ...store.crypto_primitive_provider import CryptoPrimitiveProvider
 
 
@@ -100,58 +98,38 @@ class ABY3:
         return arith_share
 
     @staticmethod
-    def full_adder(a: List[MPCTensor], b: List[MPCTensor]) -> List[MPCTensor]:
-        """Perform bit addition on MPCTensors using a full adder.
+    def prefix_layers(ring_bits: int) -> List[Tuple[int, List[int], List[int]]]:
+        """Get the layers of a Kogge-Stone parallel prefix adder.
 
         Args:
-            a (List[MPCTensor]): MPCTensor with shares of bit.
-            b (List[MPCTensor]): MPCTensor with shares of bit.
+            ring_bits (int): Number of bits to add.
 
         Returns:
-            result (List[MPCTensor]): Result of the operation.
-
-        TODO: Should modify ripple carry adder to parallel prefix adder.
+            List[Tuple[int, List[int], List[int]]]: For each layer, the distance d it
+            combines over, and the bits whose generate and propagate are updated.
+            The carry out of the last bit is dropped, so it is never computed, and
+            propagates are only kept for the bits the following layers read.
         """
-        parties = a[0].parties
-        parties_info = a[0].parties_info
-
-        shape_x = tuple(a[0].shape)  # type: ignore
-        shape_y = tuple(b[0].shape)  # type: ignore
-        ring_size = 2**32
-
-        # For ring_size 2 we generate those before hand
-        CryptoPrimitiveProvider.generate_primitives(
-            "beaver_mul",
-            nr_instances=64,
-            parties=parties,
-            g_kwargs={
-                "a_shape": shape_x,
-                "b_shape": shape_y,
-                "parties_info": parties_info,
-            },
-            p_kwargs={"a_shape": shape_x, "b_shape": shape_y},
-            ring_size=2,
-        )
-
-        ring_bits = get_nr_bits(ring_size)
-        c = np.array([0], dtype=np.bool)  # carry bits of addition.
-        result: List[MPCTensor] = []
-        for idx in range(ring_bits):
-            print("Bit Number :", idx)
-            s_tmp = a[idx] + b[idx]
-            s = s_tmp + c
-            if idx != ring_bits - 1:
-                c = a[idx] * b[idx] + c * s_tmp
-                c.block
-            result.append(s)
-        return result
+        layers = []
+        distance = 1
+        while distance < ring_bits - 1:
+            generate_idx = list(range(distance, ring_bits - 1))
+            propagate_idx = list(range(2 * distance, ring_bits - 1))
+            layers.append((distance, generate_idx, propagate_idx))
+            distance *= 2
+        return layers
 
     @staticmethod
-    def full_adder_spdz_compiler(
+    def parallel_prefix_adder(
         a: List[MPCTensor], b: List[MPCTensor]
     ) -> List[MPCTensor]:
-        # Specialized for 3 parties
-        """Perform bit addition on MPCTensors using a full adder.
+        """Perform bit addition on MPCTensors using a Kogge-Stone parallel prefix adder.
+
+        Every bit computes its generate g = a * b and propagate p = a + b. Each layer
+        then combines the (g, p) of every bit with those of the bit d positions below,
+        doubling d, so the carries of n bits are known after log2(n) layers. All the
+        AND gates of a layer are sent before any of them is waited for, so a 32 bits
+        addition takes 6 communication rounds instead of 31.
 
         Args:
             a (List[MPCTensor]): MPCTensor with shares of bit.
@@ -159,20 +137,24 @@ class ABY3:
 
         Returns:
             result (List[MPCTensor]): Result of the operation.
-
-        TODO: Should modify ripple carry adder to parallel prefix adder.
         """
         parties = a[0].parties
         parties_info = a[0].parties_info
 
         shape_x = tuple(a[0].shape)  # type: ignore
         shape_y = tuple(b[0].shape)  # type: ignore
-        ring_size = 2**32
+        ring_bits = len(a)
+
+        layers = ABY3.prefix_layers(ring_bits)
+        nr_ands = ring_bits + sum(
+            len(generate_idx) + len(propagate_idx)
+            for _, generate_idx, propagate_idx in layers
+        )
 
         # For ring_size 2 we generate those before hand
-        CryptoPrimitiveProvider.generate_primitives(
+        CryptoPrimitiveProvider.request_primitives(
             "beaver_mul",
-            nr_instances=32,
+            nr_instances=nr_ands,
             parties=parties,
             g_kwargs={
                 "a_shape": shape_x,
@@ -183,45 +165,51 @@ class ABY3:
             ring_size=2,
         )
 
-        ring_bits = get_nr_bits(ring_size)
-
-        carry = np.zeros(a[0].mpc_shape, dtype=np.bool)
-        one = MPCTensor(
-            parties=parties,
-            secret=Tensor(np.ones(a[0].mpc_shape, dtype=np.bool)),
-            shape=a[0].mpc_shape,
-        )
-
-        result: List[MPCTensor] = []
-
-        def majority(
-            a: Union[MPCTensor, np.ndarray],
-            b: Union[MPCTensor, np.ndarray],
-            c: Union[MPCTensor, np.ndarray],
-        ) -> MPCTensor:
-            return (a + c + one) * (b + c) + b
-
-        for idx in tqdm(range(ring_bits), desc="Computing..."):
-            s = a[idx] + b[idx] + carry
-            if idx != ring_bits - 1:
-                carry = majority(a[idx], b[idx], carry)
-                # time.sleep(1)
-                carry.block
-            result.append(s)
+        def wait(bits: List[MPCTensor]) -> None:
+            for bit in bits:
+                bit.block
+
+        propagate = [a_bit + b_bit for a_bit, b_bit in zip(a, b)]
+        generate = [a_bit * b_bit for a_bit, b_bit in zip(a, b)]
+        wait(generate)
+
+        group_generate = list(generate)
+        group_propagate = list(propagate)
+        for distance, generate_idx, propagate_idx in layers:
+            # Both lists are only read from the previous layer, so all the AND gates
+            # of this layer are independent of each other.
+            next_generate = list(group_generate)
+            next_propagate = list(group_propagate)
+            for idx in generate_idx:
+                next_generate[idx] = (
+                    group_generate[idx]
+                    + group_propagate[idx] * group_generate[idx - distance]
+                )
+            for idx in propagate_idx:
+                next_propagate[idx] = (
+                    group_propagate[idx] * group_propagate[idx - distance]
+                )
+            wait([next_generate[idx] for idx in generate_idx])
+            wait([next_propagate[idx] for idx in propagate_idx])
+            group_generate, group_propagate = next_generate, next_propagate
+
+        # the carry into bit idx is the group generate of the bits below it
+        result: List[MPCTensor] = [propagate[0]]
+        for idx in range(1, ring_bits):
+            result.append(propagate[idx] + group_generate[idx - 1])
         return result
 
     @staticmethod
     def bit_decomposition(x: MPCTensor) -> List[MPCTensor]:
         """Perform ABY3 bit decomposition for conversion of arithmetic share to binary share.
 
+        The bits of the shares are added with a parallel prefix adder.
+
         Args:
             x (MPCTensor): Arithmetic shares of secret.
 
         Returns:
             bin_share (List[MPCTensor]): Returns binary shares of each bit of the secret.
-
-        TODO : Should be modified to use parallel prefix adder when multiprocessing
-        functionality is integrated
         """
         # relative
         from ....tensor import TensorPointer
@@ -264,11 +252,7 @@ class ABY3:
                 )
                 res_shares[i].append(mpc)
 
-        if nr_parties == 2:
-            # Specialized for two parties
-            bin_share = ABY3.full_adder_spdz_compiler(res_shares[0], res_shares[1])
-        else:
-            bin_share = reduce(ABY3.full_adder, res_shares)
+        bin_share = reduce(ABY3.parallel_prefix_adder, res_shares)
 
         return bin_share
 
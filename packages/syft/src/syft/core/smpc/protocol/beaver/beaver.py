@@ -7,26 +7,137 @@ Computer Science, pages 420–432. Springer, 1991.
 
 
 # stdlib
-from copy import deepcopy
+from collections import deque
+from functools import reduce
 import secrets
 from typing import Any
+from typing import Deque
 from typing import Dict
 from typing import List
+from typing import Optional
 from typing import Tuple
 
 # third party
 import numpy as np
 
 # relative
-from ....tensor.smpc.mpc_tensor import MPCTensor
+from ....common.serde.serializable import serializable
 from ....tensor.smpc.share_tensor import ShareTensor
 from ....tensor.smpc.utils import RING_SIZE_TO_TYPE
+from ....tensor.smpc.utils import get_shape
 from ...store import register_primitive_generator
 from ...store import register_primitive_store_add
 from ...store import register_primitive_store_get
 from ...store.exceptions import EmptyPrimitiveStore
 
-ttp_generator = np.random.default_rng()
+
+@serializable(recursive_serde=True)
+class SeededTriples:
+    """The Beaver triples a party holds, compressed to the seed they expand from.
+
+    Every party expands its shares of a, b and c from its own seed. Only the last,
+    "correction", party also receives its shares of c explicitly, as those make the
+    reconstructed c match the reconstructed a and b.
+
+    Attributes:
+        seed (str): The hex encoded 32 bytes seed of the party.
+        rank (int): The rank of the party.
+        parties_info (List[GridURL]): Parties connection information.
+        nr_instances (int): Number of triples.
+        c_share (Optional[np.ndarray]): The stacked shares of c of the correction party.
+    """
+
+    __attr_allowlist__ = ("seed", "rank", "parties_info", "nr_instances", "c_share")
+
+    def __init__(
+        self,
+        seed: str,
+        rank: int,
+        parties_info: List[Any],
+        nr_instances: int,
+        c_share: Optional[np.ndarray] = None,
+    ) -> None:
+        self.seed = seed
+        self.rank = rank
+        self.parties_info = parties_info
+        self.nr_instances = nr_instances
+        self.c_share = c_share
+
+
+def _expand_seed(
+    seed: str,
+    shapes: Tuple[Tuple[int, ...], ...],
+    nr_instances: int,
+    ring_size: int,
+) -> List[np.ndarray]:
+    """Expand a seed into the stacked shares of a party.
+
+    Args:
+        seed (str): The hex encoded seed of the party.
+        shapes (Tuple[Tuple[int, ...], ...]): The shape of each value to draw.
+        nr_instances (int): Number of instances, stacked on axis 0.
+        ring_size (int): Ring Size of the shares.
+
+    Returns:
+        List[np.ndarray]: A block of shape (nr_instances, *shape) for each shape.
+    """
+    generator = np.random.Generator(np.random.Philox(int(seed, 16)))
+    min_value, max_value = ShareTensor.compute_min_max_from_ring(ring_size)
+    return [
+        generator.integers(
+            low=min_value,
+            high=max_value,
+            size=(nr_instances, *shape),
+            endpoint=True,
+            dtype=RING_SIZE_TO_TYPE[ring_size],
+        )
+        for shape in shapes
+    ]
+
+
+def _stacked_op(
+    op_str: str,
+    cmd: Any,
+    a_rand: np.ndarray,
+    b_rand: np.ndarray,
+    a_shape: Tuple[int, ...],
+    b_shape: Tuple[int, ...],
+    c_shape: Tuple[int, ...],
+) -> np.ndarray:
+    """Apply the op to the stacked operands, instance by instance.
+
+    The operands are aligned on their trailing axes so that the op broadcasts the
+    same way it does for a single instance. For a matmul a 1-D operand is made a
+    matrix first, a row for a and a column for b, just like numpy does, and the
+    axis it got is dropped from the result.
+
+    Args:
+        op_str (str): Operator string.
+        cmd (Any): The op in the ring of the operands.
+        a_rand (np.ndarray): The values of a, of shape (nr_instances, *a_shape).
+        b_rand (np.ndarray): The values of b, of shape (nr_instances, *b_shape).
+        a_shape (Tuple[int, ...]): The shape of a.
+        b_shape (Tuple[int, ...]): The shape of b.
+        c_shape (Tuple[int, ...]): The shape of op(a, b).
+
+    Returns:
+        np.ndarray: The values of c, of shape (nr_instances, *c_shape).
+    """
+    nr_instances = a_rand.shape[0]
+    if op_str == "matmul":
+        a_shape = a_shape if len(a_shape) > 1 else (1,) + a_shape
+        b_shape = b_shape if len(b_shape) > 1 else b_shape + (1,)
+
+    nr_dims = max(len(a_shape), len(b_shape))
+    a_aligned = a_rand.reshape(
+        (nr_instances,) + (1,) * (nr_dims - len(a_shape)) + a_shape
+    )
+    b_aligned = b_rand.reshape(
+        (nr_instances,) + (1,) * (nr_dims - len(b_shape)) + b_shape
+    )
+    # only axes of size 1 are dropped here
+    c_val = np.asarray(cmd(a_aligned, b_aligned))
+    return c_val.reshape((nr_instances,) + c_shape)
 
 
 def _get_triples(
@@ -38,110 +149,150 @@ def _get_triples(
     nr_instances: int = 1,
     ring_size: int = 2**32,
     **kwargs: Dict[Any, Any],
-) -> Tuple[Tuple[Tuple[ShareTensor, ShareTensor, ShareTensor]]]:
+) -> List[SeededTriples]:
     """Get triples.
 
     The Trusted Third Party (TTP) or Crypto Provider should provide this triples Currently,
     the one that orchestrates the communication provides those triples.".
 
+    Each party gets a seed from which it expands its shares of all the nr_instances
+    triples, stacked in blocks of shape (nr_instances, *shape). The last party also
+    gets its shares of c, which are computed in a single vectorized pass so that
+    c = op(a, b) for every instance.
+
     Args:
         op_str (str): Operator string.
         nr_parties (int): Number of parties
         parties_info (List[Any]): Parties connection information.
         a_shape (Tuple[int]): Shape of a from beaver triples protocol.
         b_shape (Tuple[int]): Shape of b part from beaver triples protocol.
+        nr_instances (int): Number of triples to generate.
         ring_size (int) : Ring Size of the triples to generate.
         kwargs: Arbitrary keyword arguments for commands.
 
     Returns:
-        List[List[3 x List[ShareTensor, ShareTensor, ShareTensor]]]:
-        The generated triples a,b,c for each party.
+        List[SeededTriples]: The compressed triples of each party.
 
     Raises:
-        ValueError: If the triples are not consistent.
-        ValueError: If the share class is invalid.
+        ValueError: If the ring size or the operator is invalid.
     """
-    # relative
-    from ..... import Tensor
-
     numpy_type = RING_SIZE_TO_TYPE[ring_size]
     cmd = ShareTensor.get_op(ring_size, op_str)
+    add = ShareTensor.get_op(ring_size, "add")
 
-    min_value, max_value = ShareTensor.compute_min_max_from_ring(ring_size)
+    a_shape = tuple(a_shape)  # type: ignore
+    b_shape = tuple(b_shape)  # type: ignore
+    c_shape = get_shape(op_str, a_shape, b_shape)
 
-    triples = []
-    for _ in range(nr_instances):
-        seed_przs = secrets.randbits(32)
-        a_rand = Tensor(
-            ttp_generator.integers(
-                low=min_value,
-                high=max_value,
-                size=a_shape,
-                endpoint=True,
-                dtype=numpy_type,
-            )
-        )
+    seeds = [secrets.token_bytes(32).hex() for _ in range(nr_parties)]
+    shares = [
+        _expand_seed(seed, (a_shape, b_shape, c_shape), nr_instances, ring_size)
+        for seed in seeds
+    ]
+    a_rand = reduce(add, [a_share for a_share, _, _ in shares])
+    b_rand = reduce(add, [b_share for _, b_share, _ in shares])
 
-        a_shares = MPCTensor._get_shares_from_local_secret(
-            secret=deepcopy(a_rand),
-            parties_info=parties_info,  # type: ignore
-            shape=a_shape,
-            seed_przs=seed_przs,
-            ring_size=ring_size,
-        )
-        seed_przs = secrets.randbits(32)
-        b_rand = Tensor(
-            ttp_generator.integers(
-                low=min_value,
-                high=max_value,
-                size=b_shape,
-                endpoint=True,
-                dtype=numpy_type,
-            )
-        )
+    # TODO: bitwise and on passthorough tensor raises
+    # hence we do it on numpy array itself.
+    c_val = np.asarray(
+        _stacked_op(op_str, cmd, a_rand, b_rand, a_shape, b_shape, c_shape),
+        dtype=numpy_type,
+    )
 
-        b_shares = MPCTensor._get_shares_from_local_secret(
-            secret=deepcopy(b_rand),
-            parties_info=parties_info,  # type: ignore
-            shape=b_shape,
-            seed_przs=seed_przs,
-            ring_size=ring_size,
-        )
-        seed_przs = secrets.randbits(32)
-        # TODO: bitwise and on passthorough tensor raises
-        # hence we do it on numpy array itself.
-        c_val = Tensor(cmd(a_rand.child, b_rand.child))
-        c_shares = MPCTensor._get_shares_from_local_secret(
-            secret=deepcopy(c_val),
-            parties_info=parties_info,  # type: ignore
-            shape=c_val.shape,  # type: ignore
-            seed_przs=seed_przs,
-            ring_size=ring_size,
-        )
+    # the shares of c are subtracted elementwise, a broadcast would silently make
+    # the correction the wrong shape
+    assert c_val.shape == (nr_instances, *c_shape)  # nosec
 
-        # We are always creating an instance
-        triples.append((a_shares, b_shares, c_shares))
+    sub = ShareTensor.get_op(ring_size, "sub")
+    c_correction = c_val
+    for _, _, c_share in shares[:-1]:
+        c_correction = sub(c_correction, c_share)
 
     """
     Example -- for n_instances=2 and n_parties=2:
-    For Beaver Triples the "res" would look like:
-    res = [
-        ([a0_sh_p0, a0_sh_p1], [b0_sh_p0, b0_sh_p1], [c0_sh_p0, c0_sh_p1]),
-        ([a1_sh_p0, a1_sh_p1], [b1_sh_p0, b1_sh_p1], [c1_sh_p0, c1_sh_p1])
+    primitives = [
+        SeededTriples(seed_p0), # (Row 0)
+        SeededTriples(seed_p1, c_share=[c0_sh_p1, c1_sh_p1])  # (Row 1)
     ]
 
-    We want to send to each party the values they should hold:
+    The first party (party 0) receives Row 0 and the second party (party 1) receives
+    Row 1. The CryptoStore of each party expands its seed into the stacked shares
+    a_sh_p = [a0_sh_p, a1_sh_p], b_sh_p and c_sh_p, and keeps one view per instance.
+    """
     primitives = [
-        [[a0_sh_p0, b0_sh_p0, c0_sh_p0], [a1_sh_p0, b1_sh_p0, c1_sh_p0]], # (Row 0)
-        [[a0_sh_p1, b0_sh_p1, c0_sh_p1], [a1_sh_p1, b1_sh_p1, c1_sh_p1]]  # (Row 1)
+        SeededTriples(
+            seed=seed,
+            rank=rank,
+            parties_info=parties_info,
+            nr_instances=nr_instances,
+            c_share=c_correction if rank == nr_parties - 1 else None,
+        )
+        for rank, seed in enumerate(seeds)
     ]
 
-    The first party (party 0) receives Row 0 and the second party (party 1) receives Row 1
+    return primitives
+
+
+def _expand_triples(
+    primitives: SeededTriples,
+    op_str: str,
+    a_shape: Tuple[int, ...],
+    b_shape: Tuple[int, ...],
+    ring_size: int,
+) -> List[Tuple[ShareTensor, ...]]:
+    """Expand the compressed triples of a party into one triple per instance.
+
+    Args:
+        primitives (SeededTriples): The compressed triples of the party.
+        op_str (str): Operator string.
+        a_shape (Tuple[int]): The shape of the first operand.
+        b_shape (Tuple[int]): The shape of the second operand.
+        ring_size (int): Ring Size of the triples.
+
+    Returns:
+        List[Tuple[ShareTensor, ...]]: A triple for each instance, whose shares are
+        views into the stacked blocks.
     """
+    a_shape = tuple(a_shape)
+    b_shape = tuple(b_shape)
+    blocks = _expand_seed(
+        primitives.seed,
+        (a_shape, b_shape, get_shape(op_str, a_shape, b_shape)),
+        primitives.nr_instances,
+        ring_size,
+    )
+    if primitives.c_share is not None:
+        blocks[2] = primitives.c_share
+
+    instances = []
+    for idx in range(primitives.nr_instances):
+        instances.append(
+            tuple(
+                ShareTensor(
+                    value=block[idx],
+                    rank=primitives.rank,
+                    parties_info=primitives.parties_info,
+                    seed_przs=secrets.randbits(32),
+                    ring_size=ring_size,
+                )
+                for block in blocks
+            )
+        )
 
-    res_triples = list(zip(*[zip(*triple) for triple in triples]))
+    return instances
 
-    return res_triples  # type: ignore
+
+def _primitive_queue(store: Dict[str, Deque[Any]], config_key: str) -> Deque[Any]:
+    """Get the queue of primitives for config_key, creating it if needed.
+
+    The primitives are kept in a deque so they are popped in O(1). A store which was
+    deserialized holds lists, which are turned back into deques here.
+    """
+    primitives = store.get(config_key, None)
+    if not isinstance(primitives, deque):
+        primitives = deque(primitives if primitives is not None else [])
+        store[config_key] = primitives
+    return primitives
 
 
 # Beaver Operations defined for Multiplication
@@ -150,7 +301,7 @@ def _get_triples(
 @register_primitive_generator("beaver_mul")
 def get_triples_mul(
     *args: List[Any], **kwargs: Dict[Any, Any]
-) -> Tuple[Tuple[Tuple[ShareTensor, ShareTensor, ShareTensor]]]:
+) -> List[SeededTriples]:
     """Get the beaver triples for the multiplication operation.
 
     Args:
@@ -158,16 +309,16 @@ def get_triples_mul(
         **kwargs (List[ShareTensor]): Keyword arguments of :func:`beaver.__get_triples`.
 
     Returns:
-        Tuple[Tuple[ShareTensor, ShareTensor, ShareTensor]]: The generated triples a,b,c
-        for the mul operation.
+        List[SeededTriples]: The compressed triples a,b,c of each party for the
+        mul operation.
     """
     return _get_triples("mul", *args, **kwargs)  # type: ignore
 
 
 @register_primitive_store_add("beaver_mul")
 def mul_store_add(
-    store: Dict[str, List[Any]],
-    primitives: List[Any],
+    store: Dict[str, Deque[Any]],
+    primitives: SeededTriples,
     a_shape: Tuple[int],
     b_shape: Tuple[int],
     ring_size: int,
@@ -175,21 +326,19 @@ def mul_store_add(
     """Add the primitives required for the "mul" operation to the CryptoStore.
 
     Arguments:
-        store (Dict[str, List[Any]]): the CryptoStore
-        primitives (List[Any]): the list of primitives
+        store (Dict[str, Deque[Any]]): the CryptoStore
+        primitives (SeededTriples): the compressed triples of the party
         a_shape (Tuple[int]): the shape of the first operand
         b_shape (Tuple[int]): the shape of the second operand
     """
     config_key = f"beaver_mul_{a_shape}_{b_shape}_{ring_size}"
-    if config_key in store:
-        store[config_key].extend(list(primitives))
-    else:
-        store[config_key] = list(primitives)
+    instances = _expand_triples(primitives, "mul", a_shape, b_shape, ring_size)
+    _primitive_queue(store, config_key).extend(instances)
 
 
 @register_primitive_store_get("beaver_mul")
 def mul_store_get(
-    store: Dict[str, List[Any]],
+    store: Dict[str, Deque[Any]],
     a_shape: Tuple[int, ...],
     b_shape: Tuple[int, ...],
     ring_size: int,
@@ -200,7 +349,7 @@ def mul_store_get(
     Those are needed for executing the "mul" operation.
 
     Args:
-        store (Dict[str, List[Any]]): The CryptoStore.
+        store (Dict[str, Deque[Any]]): The CryptoStore.
         a_shape (Tuple[int]): The shape of the first operand.
         b_shape (Tuple[int]): The shape of the second operand.
         remove (bool): True if the primitives should be removed from the store.
@@ -213,20 +362,14 @@ def mul_store_get(
     """
     config_key = f"beaver_mul_{tuple(a_shape)}_{tuple(b_shape)}_{ring_size}"
 
-    try:
-        primitives = store[config_key]
-    except KeyError:
+    if config_key not in store:
         raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
 
-    try:
-        primitive = primitives[0]
-    except Exception:
+    primitives = _primitive_queue(store, config_key)
+    if not primitives:
         raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
 
-    if remove:
-        del primitives[0]
-
-    return primitive
+    return primitives.popleft() if remove else primitives[0]
 
 
 # Beaver Operations defined for Matrix Multiplication
@@ -235,7 +378,7 @@ def mul_store_get(
 @register_primitive_generator("beaver_matmul")
 def get_triples_matmul(
     *args: List[Any], **kwargs: Dict[Any, Any]
-) -> Tuple[List[ShareTensor], List[ShareTensor], List[ShareTensor]]:
+) -> List[SeededTriples]:
     """Get the beaver triples for the matmul  operation.
 
     Args:
@@ -243,16 +386,16 @@ def get_triples_matmul(
         **kwargs (List[ShareTensor]): Keyword arguments of :func:`beaver.__get_triples`.
 
     Returns:
-        Tuple[Tuple[ShareTensor, ShareTensor, ShareTensor]]: The generated triples a,b,c
-        for the matmul operation.
+        List[SeededTriples]: The compressed triples a,b,c of each party for the
+        matmul operation.
     """
     return _get_triples("matmul", *args, **kwargs)  # type: ignore
 
 
 @register_primitive_store_add("beaver_matmul")
 def matmul_store_add(
-    store: Dict[str, List[Any]],
-    primitives: List[Any],
+    store: Dict[str, Deque[Any]],
+    primitives: SeededTriples,
     a_shape: Tuple[int],
     b_shape: Tuple[int],
     ring_size: int,
@@ -260,22 +403,20 @@ def matmul_store_add(
     """Add the primitives required for the "matmul" operation to the CryptoStore.
 
     Args:
-        store (Dict[str, List[Any]]): The CryptoStore.
-        primitives (List[Any]): The list of primitives
+        store (Dict[str, Deque[Any]]): The CryptoStore.
+        primitives (SeededTriples): The compressed triples of the party.
         a_shape (Tuple[int]): The shape of the first operand.
         b_shape (Tuple[int]): The shape of the second operand.
 
     """
     config_key = f"beaver_matmul_{a_shape}_{b_shape}_{ring_size}"
-    if config_key in store:
-        store[config_key].extend(list(primitives))
-    else:
-        store[config_key] = list(primitives)
+    instances = _expand_triples(primitives, "matmul", a_shape, b_shape, ring_size)
+    _primitive_queue(store, config_key).extend(instances)
 
 
 @register_primitive_store_get("beaver_matmul")
 def matmul_store_get(
-    store: Dict[str, List[Any]],
+    store: Dict[str, Deque[Any]],
     a_shape: Tuple[int, ...],
     b_shape: Tuple[int, ...],
     ring_size: int,
@@ -286,7 +427,7 @@ def matmul_store_get(
     Those are needed for executing the "matmul" operation.
 
     Args:
-        store (Dict[str, List[Any]]): The CryptoStore.
+        store (Dict[str, Deque[Any]]): The CryptoStore.
         a_shape (Tuple[int]): The shape of the first operand.
         b_shape (Tuple[int]): The shape of the second operand.
         remove (bool): True if the primitives should be removed from the store.
@@ -299,17 +440,11 @@ def matmul_store_get(
     """
     config_key = f"beaver_matmul_{tuple(a_shape)}_{tuple(b_shape)}_{ring_size}"
 
-    try:
-        primitives = store[config_key]
-    except KeyError:
+    if config_key not in store:
         raise EmptyPrimitiveStore(f"{config_key} does not exists in the store")
 
-    try:
-        primitive = primitives[0]
-    except Exception:
+    primitives = _primitive_queue(store, config_key)
+    if not primitives:
         raise EmptyPrimitiveStore(f"No primitive in the store for {config_key}")
 
-    if remove:
-        del primitives[0]
-
-    return primitive
+    return primitives.popleft() if remove else primitives[0]
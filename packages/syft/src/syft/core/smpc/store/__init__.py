@@ -8,6 +8,7 @@ from typing import Callable
 # relative
 from .crypto_primitive_provider import CryptoPrimitiveProvider
 from .crypto_store import CryptoStore
+from .preprocessing_pool import PreprocessingPool
 
 
 def register_primitive_generator(name: str) -> Callable[..., Any]:
@@ -67,4 +68,4 @@ def register_primitive_store_get(name: str) -> Callable[..., Any]:
     return register_get
 
 
-__all__ = ["CryptoStore", "CryptoPrimitiveProvider"]
+__all__ = ["CryptoStore", "CryptoPrimitiveProvider", "PreprocessingPool"]
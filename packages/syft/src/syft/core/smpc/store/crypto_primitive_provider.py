@@ -8,6 +8,11 @@ from typing import DefaultDict
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # relative
+    from .preprocessing_pool import PreprocessingPool
 
 
 class CryptoPrimitiveProvider:
@@ -15,6 +20,7 @@ class CryptoPrimitiveProvider:
 
     _func_providers: Dict[str, Callable] = {}
     _ops_list: DefaultDict[str, List] = defaultdict(list)
+    _preprocessing_pool: Optional["PreprocessingPool"] = None
 
     def __init__(self) -> None:  # noqa
         raise ValueError("This class should not be initialized")
@@ -73,6 +79,57 @@ class CryptoPrimitiveProvider:
         # execute function we are using this.
         return primitives
 
+    @staticmethod
+    def preprocessing_pool() -> "PreprocessingPool":
+        """Get the pool which keeps the parties stocked with primitives.
+
+        Returns:
+            PreprocessingPool: The pool, created on first use.
+        """
+        if CryptoPrimitiveProvider._preprocessing_pool is None:
+            # relative
+            from .preprocessing_pool import PreprocessingPool
+
+            CryptoPrimitiveProvider._preprocessing_pool = PreprocessingPool()
+        return CryptoPrimitiveProvider._preprocessing_pool
+
+    @staticmethod
+    def request_primitives(
+        op_str: str,
+        parties: List[Any],
+        g_kwargs: Dict[str, Any],
+        p_kwargs: Dict[str, Any],
+        nr_instances: int = 1,
+        ring_size: int = 2**32,
+    ) -> None:
+        """Make sure the parties hold nr_instances "op_str" primitives.
+
+        Unlike generate_primitives, the primitives come from the preprocessing pool,
+        which only generates them on the spot if the parties ran out.
+
+        Args:
+            op_str (str): Operator.
+            parties (List[Any]): Parties to generate primitives for.
+            g_kwargs: Generate kwargs passed to the registered function.
+            p_kwargs: Populate kwargs passed to the registered populate function.
+            nr_instances (int): Number of primitives the operation consumes.
+            ring_size (int): Ring size of the primitives.
+
+        Raises:
+            ValueError: If op_str is not registered.
+        """
+        if op_str not in CryptoPrimitiveProvider._func_providers:
+            raise ValueError(f"{op_str} not registered")
+
+        CryptoPrimitiveProvider.preprocessing_pool().get_primitives(
+            op_str,
+            parties=parties,
+            g_kwargs=g_kwargs,
+            p_kwargs=p_kwargs,
+            nr_instances=nr_instances,
+            ring_size=ring_size,
+        )
+
     @staticmethod
     def _transfer_primitives_to_parties(
         op_str: str,
@@ -102,4 +159,7 @@ class CryptoPrimitiveProvider:
             str: CryptoProvider
         """
         res = f"Providers: {list(CryptoPrimitiveProvider._func_providers.keys())}\n"
+        if CryptoPrimitiveProvider._preprocessing_pool is not None:
+            levels = CryptoPrimitiveProvider._preprocessing_pool.levels()
+            res += f"Pool levels: {levels}\n"
         return res
@@ -6,11 +6,21 @@ from typing import Callable
 from typing import Dict
 from typing import Iterable
 from typing import List
+from typing import Sequence
 
 # relative
 from ...common.serde.serializable import serializable
 
 
+def _store_to_lists(store: Dict[Any, Sequence[Any]]) -> Dict[Any, List[Any]]:
+    # the primitives are kept in deques, which syft.serde does not support
+    return {key: list(primitives) for key, primitives in store.items()}
+
+
+def _identity(store: Dict[Any, Any]) -> Dict[Any, Any]:
+    return store
+
+
 @serializable(recursive_serde=True)
 class CryptoStore:
     """Manages items needed for MPC Computation.
@@ -22,6 +32,7 @@ class CryptoStore:
 
     __slots__ = ("store",)
     __attr_allowlist__ = ("store",)
+    __serde_overrides__ = {"store": [_store_to_lists, _identity]}
 
     _func_add_store: Dict[Any, Callable] = {}
     _func_get_store: Dict[Any, Callable] = {}
@@ -0,0 +1,266 @@
+"""Background preprocessing of crypto primitives."""
+
+# stdlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# relative
+from ....logger import error
+from ....logger import warning
+from .crypto_primitive_provider import CryptoPrimitiveProvider
+
+
+class PrimitivePool:
+    """The primitives of one config_key (op, shapes, ring size) already sent to a
+    group of parties and not consumed yet.
+
+    Attributes:
+        config_key (str): The op, shapes and ring size of the primitives.
+        level (int): The number of primitives the parties hold.
+        low_watermark (int): The level under which the pool is refilled.
+        high_watermark (int): The level the pool is refilled up to.
+        last_request (float): When the primitives were last requested.
+    """
+
+    def __init__(
+        self,
+        config_key: str,
+        op_str: str,
+        parties: List[Any],
+        g_kwargs: Dict[str, Any],
+        p_kwargs: Dict[str, Any],
+        ring_size: int,
+    ) -> None:
+        self.config_key = config_key
+        self.op_str = op_str
+        self.parties = parties
+        self.g_kwargs = g_kwargs
+        self.p_kwargs = p_kwargs
+        self.ring_size = ring_size
+        self.level = 0
+        self.low_watermark = 0
+        self.high_watermark = 0
+        self.last_request = time.monotonic()
+        self.requested = 0
+        self.generated = 0
+        self.misses = 0
+        self.resyncs = 0
+        self.refilling = False
+        self.requests: Deque[Tuple[float, int]] = deque()
+        # held while primitives are sent, so every party stores them in the same order
+        self.lock = threading.RLock()
+
+    def generate(self, nr_instances: int) -> None:
+        CryptoPrimitiveProvider.generate_primitives(
+            self.op_str,
+            parties=self.parties,
+            g_kwargs=self.g_kwargs,
+            p_kwargs=self.p_kwargs,
+            nr_instances=nr_instances,
+            ring_size=self.ring_size,
+        )
+        self.level += nr_instances
+        self.generated += nr_instances
+
+    def held(self) -> int:
+        """Ask every party how many of the primitives it holds.
+
+        Returns:
+            int: The lowest number of primitives held by a party.
+        """
+        share_tensor_modules = [
+            party.syft.core.tensor.smpc.share_tensor for party in self.parties
+        ]
+        pointers = [
+            module.count_primitives(self.config_key) for module in share_tensor_modules
+        ]
+        return min(int(pointer.get()) for pointer in pointers)
+
+    @property
+    def metrics(self) -> Dict[str, int]:
+        return {
+            "level": self.level,
+            "low_watermark": self.low_watermark,
+            "high_watermark": self.high_watermark,
+            "requested": self.requested,
+            "generated": self.generated,
+            "misses": self.misses,
+            "resyncs": self.resyncs,
+        }
+
+
+class PreprocessingPool:
+    """Keeps the parties stocked with crypto primitives between watermarks.
+
+    The orchestrator asks the pool for the primitives of an operation instead of
+    generating them. The pool hands out the ones the parties already hold, and refills
+    them in the background once they drop under the low watermark. The watermarks
+    only follow the number of primitives requested in the last demand_window seconds,
+    so the online phase only waits on generation when the demand outgrows the pool,
+    and a pool which isn't used anymore isn't refilled and is then forgotten.
+
+    The parties may hold fewer primitives than the pool counted, e.g. when another
+    orchestrator consumed some or a party restarted. Before a refill the pool asks the
+    parties for their actual number of primitives, so an empty store is refilled
+    instead of failing the next operation.
+
+    Attributes:
+        demand_window (float): The seconds of requests the watermarks follow.
+    """
+
+    def __init__(self, demand_window: float = 60.0, max_workers: int = 2) -> None:
+        self.demand_window = demand_window
+        self._lock = threading.Lock()
+        self._pools: Dict[Tuple[Any, ...], PrimitivePool] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="smpc-preprocessing"
+        )
+
+    def _pool(
+        self,
+        op_str: str,
+        parties: List[Any],
+        g_kwargs: Dict[str, Any],
+        p_kwargs: Dict[str, Any],
+        ring_size: int,
+    ) -> PrimitivePool:
+        a_shape = tuple(g_kwargs.get("a_shape", ()))
+        b_shape = tuple(g_kwargs.get("b_shape", ()))
+        config_key = f"{op_str}_{a_shape}_{b_shape}_{ring_size}"
+        key = (config_key, *[str(party.id) for party in parties])
+
+        with self._lock:
+            pool = self._pools.get(key, None)
+            if pool is None:
+                pool = PrimitivePool(
+                    config_key=config_key,
+                    op_str=op_str,
+                    parties=parties,
+                    g_kwargs=g_kwargs,
+                    p_kwargs=p_kwargs,
+                    ring_size=ring_size,
+                )
+                self._pools[key] = pool
+        return pool
+
+    def _learn_demand(self, pool: PrimitivePool, nr_instances: int = 0) -> None:
+        now = time.monotonic()
+        if nr_instances:
+            pool.requests.append((now, nr_instances))
+            pool.last_request = now
+        while pool.requests and now - pool.requests[0][0] > self.demand_window:
+            pool.requests.popleft()
+
+        demand = sum(instances for _, instances in pool.requests)
+        pool.high_watermark = demand
+        pool.low_watermark = demand // 2
+
+    def _forget_idle(self) -> None:
+        # the parties hold none of the primitives of an idle pool with level 0, so
+        # nothing is lost by creating it again when it is needed
+        now = time.monotonic()
+        with self._lock:
+            for key, pool in list(self._pools.items()):
+                if (
+                    pool.level == 0
+                    and not pool.refilling
+                    and now - pool.last_request > self.demand_window
+                ):
+                    del self._pools[key]
+
+    def get_primitives(
+        self,
+        op_str: str,
+        parties: List[Any],
+        g_kwargs: Dict[str, Any],
+        p_kwargs: Dict[str, Any],
+        nr_instances: int = 1,
+        ring_size: int = 2**32,
+    ) -> None:
+        """Make sure the parties hold nr_instances "op_str" primitives and count them
+        as consumed.
+
+        Args:
+            op_str (str): Operator.
+            parties (List[Any]): Parties to generate primitives for.
+            g_kwargs: Generate kwargs passed to the registered function.
+            p_kwargs: Populate kwargs passed to the registered populate function.
+            nr_instances (int): Number of primitives the operation consumes.
+            ring_size (int): Ring size of the primitives.
+        """
+        self._forget_idle()
+        pool = self._pool(op_str, parties, g_kwargs, p_kwargs, ring_size)
+
+        with pool.lock:
+            self._learn_demand(pool, nr_instances)
+            pool.requested += nr_instances
+            if pool.level < nr_instances:
+                pool.misses += 1
+                pool.generate(nr_instances - pool.level)
+            pool.level -= nr_instances
+
+            if pool.level < pool.low_watermark and not pool.refilling:
+                pool.refilling = True
+                self._executor.submit(self._refill, pool)
+
+    def _resync(self, pool: PrimitivePool) -> None:
+        try:
+            held = pool.held()
+        except Exception as e:
+            warning(f"Could not count the {pool.config_key} primitives: {e}")
+            return
+
+        # the parties may still have to consume primitives the pool handed out, so
+        # only a lower number of primitives than the level is trusted
+        if held < pool.level:
+            pool.resyncs += 1
+            pool.level = held
+
+    def _refill(self, pool: PrimitivePool) -> None:
+        try:
+            with pool.lock:
+                # the demand may have dropped since the refill was submitted
+                self._learn_demand(pool)
+                if pool.level < pool.high_watermark:
+                    self._resync(pool)
+                missing = pool.high_watermark - pool.level
+                if missing > 0:
+                    pool.generate(missing)
+        except Exception as e:
+            error(f"Could not refill the {pool.config_key} primitives: {e}")
+        finally:
+            pool.refilling = False
+
+    def levels(self) -> Dict[str, int]:
+        """Get the number of primitives the parties hold for each config_key.
+
+        Returns:
+            Dict[str, int]: The level of each pool.
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+        levels: Dict[str, int] = {}
+        for pool in pools:
+            levels[pool.config_key] = levels.get(pool.config_key, 0) + pool.level
+        return levels
+
+    def metrics(self) -> Dict[str, Dict[str, int]]:
+        """Get the level, watermarks and counters of each pool.
+
+        Returns:
+            Dict[str, Dict[str, int]]: The metrics of each pool.
+        """
+        with self._lock:
+            pools = list(self._pools.items())
+        return {"_".join(key): pool.metrics for key, pool in pools}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pools.clear()
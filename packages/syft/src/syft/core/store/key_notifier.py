@@ -0,0 +1,94 @@
+# stdlib
+from contextlib import contextmanager
+import threading
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Set
+
+# third party
+import gevent
+
+# relative
+from ..common.uid import UID
+
+
+class KeyWatch:
+    """
+    A KeyWatch is handed out by ObjectStore.watch to wait for some keys to be set.
+
+    This default implementation can't know when a key is set, so it only gives the
+    other greenlets a chance to run and lets the caller check the store again.
+    """
+
+    # how long to sleep between two checks of the store
+    poll_interval: float = 0.0
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until one of the watched keys may have been set since the previous call.
+
+        Args:
+            timeout (Optional[float]): the maximum number of seconds to wait for.
+
+        Returns:
+            bool: False if the timeout expired before any of the keys was set.
+        """
+        interval = self.poll_interval
+        if timeout is not None:
+            interval = min(interval, timeout)
+        # Implicit context switch between greenlets.
+        gevent.sleep(interval)
+        return True
+
+
+class EventKeyWatch(KeyWatch):
+    def __init__(self) -> None:
+        self.event = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        is_set = self.event.wait(timeout)
+        # the keys are set before the watches are notified so clearing the event
+        # after waking up can't hide a set from the next check of the store
+        self.event.clear()
+        return is_set
+
+
+class KeyNotifier:
+    """
+    KeyNotifier wakes up the watches of the keys which are set in a store living in
+    this process. Watches are plain threading.Events, so they work both for threads
+    and, with gevent monkey patching as in the celery workers, for greenlets.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._watches: Dict[UID, Set[EventKeyWatch]] = {}
+
+    @contextmanager
+    def watch(self, keys: Iterable[UID]) -> Iterator[KeyWatch]:
+        keys = list(keys)
+        key_watch = EventKeyWatch()
+        with self._lock:
+            for key in keys:
+                self._watches.setdefault(key, set()).add(key_watch)
+        try:
+            yield key_watch
+        finally:
+            with self._lock:
+                for key in keys:
+                    watches = self._watches.get(key, None)
+                    if watches is not None:
+                        watches.discard(key_watch)
+                        if len(watches) == 0:
+                            del self._watches[key]
+
+    def notify(self, keys: Iterable[UID]) -> None:
+        with self._lock:
+            key_watches: List[EventKeyWatch] = [
+                key_watch for key in keys for key_watch in self._watches.get(key, ())
+            ]
+        for key_watch in key_watches:
+            key_watch.event.set()
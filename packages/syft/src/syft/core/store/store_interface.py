@@ -1,15 +1,25 @@
 # stdlib
 from abc import ABC
+from contextlib import contextmanager
+from typing import Dict
 from typing import Iterable
+from typing import Iterator
+from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 
+# third party
+from nacl.signing import VerifyKey
+
 # relative
 from ...logger import debug
 from ...logger import traceback_and_raise
 from ..common.storeable_object import AbstractStorableObject
 from ..common.uid import UID
+from .key_notifier import KeyWatch
 from .storeable_object import StorableObject
+from .storeable_object_metadata import StorableObjectMetadata
 
 
 class ObjectStore(ABC):
@@ -126,6 +136,124 @@ class ObjectStore(ABC):
         """
         traceback_and_raise(NotImplementedError)
 
+    def get_many(self, keys: Iterable[UID]) -> List[Optional[StorableObject]]:
+        """
+        Method to retrieve several objects from the store at once. Stores which can fetch
+        many keys in a single round trip should override it.
+
+        Args:
+            keys (Iterable[UID]): the keys to be searched for in the store.
+
+        Returns:
+            List[Optional[StorableObject]]: the objects associated with the input keys, in the
+            same order, with None for the keys which are not present in the store.
+        """
+        return [self.get_object(key) for key in keys]
+
+    def set_many(self, items: Dict[UID, StorableObject]) -> None:
+        """
+        Method to store several objects in the store at once. Stores which can write
+        many objects in a single round trip should override it.
+
+        Args:
+            items (Dict[UID, StorableObject]): the StorableObjects to be stored by UID.
+        """
+        for key, value in items.items():
+            self.__setitem__(key, value)
+
+    def delete_many(self, keys: Iterable[UID]) -> None:
+        """
+        Method to remove several objects from the store at once. Stores which can delete
+        many keys in a single round trip should override it.
+
+        Args:
+            keys (Iterable[UID]): the keys at which to delete the objects.
+        """
+        for key in keys:
+            self.delete(key=key)
+
+    @contextmanager
+    def watch(self, keys: Iterable[UID]) -> Iterator[KeyWatch]:
+        """
+        Method to wait for objects to be set in the store. The watch starts before the
+        with block, so checking the store inside of the block and then waiting can't
+        miss an object set in between. Stores which can tell when a key is set should
+        override it, the default watch only lets the caller poll the store.
+
+        Args:
+            keys (Iterable[UID]): the keys at which the objects are awaited.
+
+        Returns:
+            KeyWatch: the watch to wait on for any of the keys to be set.
+        """
+        yield KeyWatch()
+
+    def get_objects_metadata(
+        self, keys: Optional[Iterable[UID]] = None
+    ) -> List[StorableObjectMetadata]:
+        """
+        Method to retrieve the metadata of the objects in the store, without their data. Stores
+        which keep the metadata apart from the data should override it so that searching the
+        store never fetches the data.
+
+        Args:
+            keys (Optional[Iterable[UID]]): the keys of the objects, or None for all of them.
+
+        Returns:
+            List[StorableObjectMetadata]: the metadata of the objects present in the store.
+        """
+        keys = list(self.keys()) if keys is None else list(keys)
+        return [
+            StorableObjectMetadata.from_storable_object(key=key, value=value)
+            for key, value in zip(keys, self.get_many(keys))
+            if value is not None
+        ]
+
+    def search_objects_metadata(
+        self,
+        verify_key: Optional[VerifyKey] = None,
+        tags: Optional[List[str]] = None,
+        object_type: Optional[str] = None,
+        dataset: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[StorableObjectMetadata], Optional[str]]:
+        """
+        Method to search the metadata of the objects in the store one page at a time. Stores
+        which index the search permissions of their objects should override it so that a search
+        only reads the objects it returns.
+
+        Args:
+            verify_key (Optional[VerifyKey]): only return the objects this key can search for,
+            or all of them if None.
+            tags (Optional[List[str]]): only return the objects which have all these tags.
+            object_type (Optional[str]): only return the objects of this object_type.
+            dataset (Optional[str]): only return the objects of this dataset.
+            name_prefix (Optional[str]): only return the objects whose name starts with it.
+            cursor (Optional[str]): the cursor returned with the previous page, if any.
+            limit (Optional[int]): the maximum number of objects in the page.
+
+        Returns:
+            Tuple[List[StorableObjectMetadata], Optional[str]]: the page of metadata and the
+            cursor of the next page, or None if this is the last page.
+        """
+        start = int(cursor) if cursor else 0
+        all_metadata = self.get_objects_metadata()
+        results: List[StorableObjectMetadata] = []
+        for position in range(start, len(all_metadata)):
+            obj = all_metadata[position]
+            if obj.is_searchable_by(verify_key) and obj.matches(
+                tags=tags,
+                object_type=object_type,
+                dataset=dataset,
+                name_prefix=name_prefix,
+            ):
+                results.append(obj)
+                if limit is not None and len(results) == limit:
+                    return results, str(position + 1)
+        return results, None
+
     def clear(self) -> None:
         """
         Clears all storage owned by the store.
@@ -1,7 +1,10 @@
 # stdlib
 from collections import OrderedDict
+from typing import ContextManager
+from typing import Dict
 from typing import Iterable
 from typing import KeysView
+from typing import List
 from typing import Optional
 from typing import ValuesView
 
@@ -13,6 +16,8 @@ from . import ObjectStore
 from ...logger import critical
 from ...logger import traceback_and_raise
 from ..common.uid import UID
+from .key_notifier import KeyNotifier
+from .key_notifier import KeyWatch
 from .storeable_object import StorableObject
 
 
@@ -24,14 +29,16 @@ class MemoryStore(ObjectStore):
         _objects (dict): the dict that backs the storage of the MemoryStorage.
         _search_engine (ObjectSearchEngine): the objects that handles searching by using tags or
         description.
+        _notifier (KeyNotifier): wakes up the watches of the keys which are set.
     """
 
-    __slots__ = ["_objects", "_search_engine"]
+    __slots__ = ["_objects", "_search_engine", "_notifier"]
 
     def __init__(self) -> None:
         super().__init__()
         self._objects: OrderedDict[UID, StorableObject] = OrderedDict()
         self._search_engine = None
+        self._notifier = KeyNotifier()
         self.post_init()
 
     def get_object(self, key: UID) -> Optional[StorableObject]:
@@ -67,6 +74,7 @@ class MemoryStore(ObjectStore):
 
     def __setitem__(self, key: UID, value: StorableObject) -> None:
         self._objects[key] = value
+        self._notifier.notify(keys=[key])
 
     def delete(self, key: UID) -> None:
         try:
@@ -78,6 +86,21 @@ class MemoryStore(ObjectStore):
         except Exception as e:
             critical(f"{type(self)} Exception in __delitem__ error {key}. {e}")
 
+    def get_many(self, keys: Iterable[UID]) -> List[Optional[StorableObject]]:
+        return [self._objects.get(key, None) for key in keys]
+
+    def set_many(self, items: Dict[UID, StorableObject]) -> None:
+        self._objects.update(items)
+        self._notifier.notify(keys=items.keys())
+
+    def watch(self, keys: Iterable[UID]) -> ContextManager[KeyWatch]:
+        return self._notifier.watch(keys=keys)
+
+    def delete_many(self, keys: Iterable[UID]) -> None:
+        for key in keys:
+            if self._objects.pop(key, None) is None:
+                critical(f"{type(self)} __delitem__ error {key}.")
+
     def clear(self) -> None:
         self._objects.clear()
 
@@ -0,0 +1,187 @@
+# stdlib
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# third party
+from nacl.signing import VerifyKey
+
+# syft absolute
+import syft as sy
+
+# relative
+from ...logger import debug
+from ...logger import warning
+from ...util import get_fully_qualified_name
+from ..common.group import VERIFYALL
+from ..common.uid import UID
+from .storeable_object import StorableObject
+
+# the lib_ast paths of the types whose pointers were looked up, so storing an object
+# doesn't query the lib_ast every time. Types without a pointer aren't kept, since
+# their library may be loaded later.
+_POINTER_PATHS: Dict[type, str] = {}
+
+
+class StorableObjectMetadata:
+    """
+    StorableObjectMetadata is everything an ObjectStore knows about a StorableObject except
+    its data, so that the store can be searched without fetching or deserializing the data.
+
+    Besides the tags, description and permissions it keeps what is needed to create a pointer
+    to the object: the path in the lib_ast of the type of the data, or, for the data which
+    creates its own pointers with init_pointer, that the pointer has to be made from the data.
+
+    Attributes:
+        id (UID): the id at which the data is stored.
+        object_type (str): the type of the data, as in StorableObject.object_type.
+        description (Optional[str]): the description of the stored object.
+        tags (Optional[List[str]]): the tags of the stored object.
+        pointer_path (Optional[str]): the lib_ast path of the type of the data.
+        own_pointer (bool): whether the data creates its own pointers with init_pointer.
+        dataset (Optional[str]): the id of the dataset the object belongs to, if any.
+        name (Optional[str]): the name of the object in its dataset, if any.
+    """
+
+    def __init__(
+        self,
+        id: UID,
+        object_type: str,
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        read_permissions: Optional[dict] = None,
+        search_permissions: Optional[dict] = None,
+        write_permissions: Optional[dict] = None,
+        pointer_path: Optional[str] = None,
+        own_pointer: bool = False,
+        dataset: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        self.id = id
+        self.object_type = object_type
+        self.description = description
+        self.tags = tags
+        self.read_permissions = read_permissions if read_permissions else {}
+        self.search_permissions = search_permissions if search_permissions else {}
+        self.write_permissions = write_permissions if write_permissions else {}
+        self.pointer_path = pointer_path
+        self.own_pointer = own_pointer
+        self.dataset = dataset
+        self.name = name
+
+    def is_searchable_by(self, verify_key: Optional[VerifyKey]) -> bool:
+        # no verify_key means that the search is not restricted (e.g. the root user)
+        if verify_key is None or verify_key in self.search_permissions:
+            return True
+        # if this object allows anyone to search for it, then one of its keys
+        # has a VERIFYALL in it.
+        return any(key is VERIFYALL for key in self.search_permissions.keys())
+
+    def matches(
+        self,
+        tags: Optional[List[str]] = None,
+        object_type: Optional[str] = None,
+        dataset: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+    ) -> bool:
+        if tags and not set(tags).issubset(self.tags or []):
+            return False
+        if object_type is not None and self.object_type != object_type:
+            return False
+        if dataset is not None and self.dataset != dataset:
+            return False
+        if name_prefix is not None and not (self.name or "").startswith(name_prefix):
+            return False
+        return True
+
+    @property
+    def can_init_pointer(self) -> bool:
+        return self.pointer_path is not None or self.own_pointer
+
+    def init_pointer(self, client: Any, data: Optional[Any] = None) -> Any:
+        """Creates a pointer to the object. The data is only needed, and only used, for
+        the objects whose data creates their own pointers (own_pointer)."""
+        if self.own_pointer:
+            if data is None:
+                raise Exception(f"The pointer to {self.id} is made from its data")
+            return data.init_pointer(
+                client=client,
+                id_at_location=self.id,
+                object_type=self.object_type,
+                tags=self.tags,
+                description=self.description,
+            )
+
+        if self.pointer_path is None:
+            raise Exception(f"Can't create a pointer to {self.id} from its metadata")
+
+        ptr_constructor = sy.lib_ast.query(self.pointer_path).pointer_type
+        return ptr_constructor(
+            client=client,
+            id_at_location=self.id,
+            object_type=self.object_type,
+            tags=self.tags,
+            description=self.description,
+        )
+
+    @staticmethod
+    def pointer_from_storable_object(
+        value: StorableObject,
+    ) -> Tuple[Optional[str], bool]:
+        """Returns the pointer_path and own_pointer to keep for value when stored"""
+        data = value.data
+        if hasattr(data, "init_pointer"):
+            # the pointer holds data of the object (e.g. the bounds of a private
+            # tensor) so it is made from the object when it is searched
+            return None, True
+
+        pointer_path = _POINTER_PATHS.get(type(data), None)
+        if pointer_path is not None:
+            return pointer_path, False
+
+        # the same lookup as obj2pointer_type
+        try:
+            fqn = get_fully_qualified_name(obj=data)
+        except Exception as e:
+            # sometimes the object doesn't have a __module__ so you need to use the
+            # type like: collections.OrderedDict
+            debug(f"Unable to get get_fully_qualified_name of {type(data)}. {e}")
+            fqn = get_fully_qualified_name(obj=type(data))
+        if data is None:
+            fqn = "syft.lib.python._SyNone"
+        try:
+            ref = sy.lib_ast.query(fqn, obj_type=type(data))
+        except Exception as e:
+            # objects which can't be pointed to are not searchable
+            warning(f"Can't create a pointer to {value.object_type}: {e}")
+            return None, False
+        if getattr(ref, "pointer_type", None) is None:
+            return None, False
+        _POINTER_PATHS[type(data)] = ref.path_and_name
+        return ref.path_and_name, False
+
+    @staticmethod
+    def from_storable_object(
+        key: UID, value: StorableObject, dataset: Optional[str] = None
+    ) -> "StorableObjectMetadata":
+        (
+            pointer_path,
+            own_pointer,
+        ) = StorableObjectMetadata.pointer_from_storable_object(value=value)
+        return StorableObjectMetadata(
+            id=key,
+            object_type=value.object_type,
+            description=value.description,
+            tags=value.tags,
+            read_permissions=value.read_permissions,
+            search_permissions=value.search_permissions,
+            write_permissions=value.write_permissions,
+            pointer_path=pointer_path,
+            own_pointer=own_pointer,
+            dataset=dataset,
+        )
+
+    def __repr__(self) -> str:
+        return f"<StorableObjectMetadata: {self.id} {self.object_type}>"
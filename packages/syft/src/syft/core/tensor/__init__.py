@@ -276,6 +276,10 @@ def create_tensor_ast(client: Optional[AbstractNodeClient] = None) -> Globals:
             "syft.core.tensor.smpc.share_tensor.populate_store",
             "syft.lib.python._SyNone",
         ),
+        (
+            "syft.core.tensor.smpc.share_tensor.count_primitives",
+            "syft.lib.python.Int",
+        ),
         (
             "syft.core.tensor.smpc.share_tensor.ShareTensor.bit_decomposition",
             "syft.lib.python._SyNone",
@@ -8,7 +8,6 @@ from typing import Union
 import numpy as np
 
 # relative
-from ...adp.entity import DataSubjectGroup
 from ...adp.vm_private_scalar_manager import VirtualMachinePrivateScalarManager
 from ...common.serde.serializable import serializable
 from ...common.uid import UID
@@ -87,17 +86,12 @@ class InitialGammaTensor(IntermediateGammaTensor, ADPTensor):
         else:
             flat_entities = self.entities
 
-        some_symbols = list()
-        for i in range(flat_values.shape[0]):
-            prime = self.scalar_manager.get_symbol(
-                min_val=flat_min_vals[i],
-                value=flat_values[i],
-                max_val=flat_max_vals[i],
-                entity=flat_entities[i]
-                if not isinstance(flat_entities, DataSubjectGroup)
-                else flat_entities,
-            )
-            some_symbols.append(prime)
+        some_symbols = self.scalar_manager.get_symbols(
+            min_vals=flat_min_vals,
+            values=flat_values,
+            max_vals=flat_max_vals,
+            entities=flat_entities,
+        )
 
         term_tensor = (
             np.array(some_symbols)
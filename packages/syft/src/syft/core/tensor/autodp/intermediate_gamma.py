@@ -20,10 +20,6 @@ from sympy.ntheory.factor_ import factorint
 from ....core.adp.entity import DataSubjectGroup
 from ....core.adp.entity import Entity
 from ....core.adp.scalar.intermediate_gamma_scalar import IntermediateGammaScalar
-from ....util import concurrency_count
-from ....util import list_sum
-from ....util import parallel_execution
-from ....util import split_rows
 from ...adp.publish import publish
 from ...adp.vm_private_scalar_manager import VirtualMachinePrivateScalarManager
 from ...common.serde.serializable import serializable
@@ -31,6 +27,7 @@ from ...tensor.passthrough import PassthroughTensor  # type: ignore
 from ...tensor.passthrough import is_acceptable_simple_type  # type: ignore
 from ..broadcastable import is_broadcastable
 from .adp_tensor import ADPTensor
+from .scalar_cache import ScalarCache
 
 SupportedChainType = Union[int, bool, float, np.ndarray, PassthroughTensor]
 
@@ -58,6 +55,15 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
         "n_entities",
     ]
 
+    # the attributes the cached scalar views are computed from
+    __scalar_view_attrs__ = frozenset(
+        ["term_tensor", "coeff_tensor", "bias_tensor", "value_tensor", "scalar_manager"]
+    )
+
+    # the default budget in bytes of the scalar cache of new tensors, None to keep
+    # every view. Very large tensors can set their own with set_scalar_cache_limit
+    scalar_cache_max_bytes: Optional[int] = None
+
     def __init__(
         self,
         term_tensor: np.ndarray,
@@ -129,59 +135,149 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
                 else:
                     raise Exception(f"{type(entity)}")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__scalar_view_attrs__:
+            self.invalidate_scalar_cache()
+
+    @property
+    def scalar_cache(self) -> ScalarCache:
+        """The views computed from the polynomials, shared by the accessors"""
+        # not set in __init__ since deserialized tensors are created without it
+        cache = self.__dict__.get("_scalar_cache", None)
+        if cache is None:
+            cache = ScalarCache(max_bytes=self.scalar_cache_max_bytes)
+            self.__dict__["_scalar_cache"] = cache
+        return cache
+
+    def set_scalar_cache_limit(self, max_bytes: Optional[int]) -> None:
+        """Bounds the memory of the cached scalar views, None to keep every view"""
+        self.scalar_cache.max_bytes = max_bytes
+        self.scalar_cache.clear()
+
+    def invalidate_scalar_cache(self) -> None:
+        """
+        Drops the cached scalar views. Assigning the terms, coefficients, bias,
+        values or scalar manager does it already, but changing them in place doesn't.
+        """
+        cache = self.__dict__.get("_scalar_cache", None)
+        if cache is not None:
+            cache.clear()
+
+    def _linear_terms(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        return self.scalar_cache.get("linear_terms", self._expand_terms)
+
+    def _expand_terms(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Expands every polynomial into bias + sum(weight * symbol) with NumPy.
+
+        A term which isn't a prime of the scalar manager is the product of some of
+        its primes, which contribute each symbol n_times * coeff, as in flat_scalars.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: the (polys, k)
+            indices into the unique primes, the matching weights, the mask of the
+            slots holding a symbol and the unique primes.
+        """
+        flattened_terms = self.term_tensor.reshape(-1, self.term_tensor.shape[-1])
+        flattened_coeffs = self.coeff_tensor.reshape(-1, self.coeff_tensor.shape[-1])
+
+        unique_terms = np.unique(flattened_terms)
+        factors: Dict[int, List[Tuple[int, int]]] = {
+            term: list(factorint(int(term)).items())
+            for term in unique_terms[~np.isin(unique_terms, self.scalar_manager.primes)]
+        }
+        n_factors = max([1] + [len(prime_list) for prime_list in factors.values()])
+
+        # one slot per prime factor of every term, only the first one for primes
+        primes = np.repeat(flattened_terms[..., np.newaxis], n_factors, axis=-1)
+        weights = np.zeros(primes.shape, dtype=np.result_type(flattened_coeffs, int))
+        weights[..., 0] = flattened_coeffs
+        is_symbol = np.zeros(primes.shape, dtype=bool)
+        is_symbol[..., 0] = True
+        for term, prime_list in factors.items():
+            is_term = flattened_terms == term
+            is_symbol[is_term] = False
+            for k, (prime, n_times) in enumerate(prime_list):
+                primes[is_term, k] = prime
+                weights[is_term, k] = flattened_coeffs[is_term] * n_times
+                is_symbol[is_term, k] = True
+
+        primes = primes.reshape(len(flattened_terms), -1)
+        weights = np.where(is_symbol, weights, 0).reshape(primes.shape)
+        is_symbol = is_symbol.reshape(primes.shape)
+
+        unique_primes, symbol_index = np.unique(
+            np.where(is_symbol, primes, 0), return_inverse=True
+        )
+        symbol_index = symbol_index.reshape(primes.shape)
+        # the 0 filling the empty slots isn't a symbol of the scalar manager
+        if not is_symbol.all():
+            unique_primes = unique_primes[1:]
+            symbol_index = np.where(is_symbol, symbol_index - 1, 0)
+        return symbol_index, weights, is_symbol, unique_primes
+
+    def _linear_values(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """The values, min values and max values of the flattened polynomials"""
+        return self.scalar_cache.get("linear_values", self._evaluate_terms)
+
+    def _evaluate_terms(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        symbol_index, weights, _, unique_primes = self._linear_terms()
+        min_vals, values, max_vals, _ = self.scalar_manager.symbol_arrays(unique_primes)
+        bias = self.bias_tensor.reshape(-1).astype(np.float64)
+        if len(unique_primes) == 0:
+            return bias, bias, bias
+
+        lower = weights * min_vals[symbol_index]
+        upper = weights * max_vals[symbol_index]
+        return (
+            bias + (weights * values[symbol_index]).sum(axis=-1),
+            bias + np.minimum(lower, upper).sum(axis=-1),
+            bias + np.maximum(lower, upper).sum(axis=-1),
+        )
+
     @property
     def flat_scalars(self) -> List[Any]:
+        return list(self.scalar_cache.get("flat_scalars", self._build_flat_scalars))
+
+    def _build_flat_scalars(self) -> List[Any]:
         flattened_terms = self.term_tensor.reshape(-1, self.term_tensor.shape[-1])
         flattened_coeffs = self.coeff_tensor.reshape(-1, self.coeff_tensor.shape[-1])
         flattened_bias = self.bias_tensor.reshape(-1)
-        # flattened_min_vals = self._min_values().reshape(-1)
-        # flattened_max_vals = self._max_values().reshape(-1)
 
-        known_primes: set[int] = set(self.scalar_manager.prime2symbol.keys())
+        scalar_manager = self.scalar_manager
+        symbol_index, weights, is_symbol, unique_primes = self._linear_terms()
+        symbols = [scalar_manager.symbol(prime) for prime in unique_primes]
+        _, min_vals, max_vals = self._linear_values()
 
         scalars = list()
         for i in range(len(flattened_terms)):
-
             single_poly_terms = flattened_terms[i]
             single_poly_coeffs = flattened_coeffs[i]
-            single_poly_bias = flattened_bias[i]
-            # single_poly_min_val = flattened_min_vals[i]
-            # single_poly_max_val = flattened_max_vals[i]
-
-            input_mp = [single_poly_bias]
-
-            for j in range(len(single_poly_terms)):
-                term = single_poly_terms[j]
-                coeff = single_poly_coeffs[j]
 
-                if term in known_primes:
-                    prime_list = [(term, 1)]
-                else:
-                    prime_list = factorint(term).items()
-
-                for prime, n_times in prime_list:
-                    input_scalar = self.scalar_manager.prime2symbol[prime]
-                    right = input_scalar * n_times * coeff
-                    input_mp.append(right)
-
-            num_process = min(concurrency_count(), len(input_mp))
-            if num_process > 1:
-                args = split_rows(input_mp, cpu_count=num_process)
-                output = parallel_execution(list_sum, cpu_bound=True)(args)
-                scalar: IntermediateGammaScalar = sum(output)  # type: ignore
-            else:
-                scalar: IntermediateGammaScalar = sum(input_mp)  # type: ignore
+            # the bounds of a sum of scalars are the sums of their bounds, which were
+            # computed for every polynomial at once, so only the polynomial is built
+            poly = None
+            for k in np.flatnonzero(is_symbol[i]):
+                right = symbols[symbol_index[i, k]].poly * weights[i, k]
+                poly = right + flattened_bias[i] if poly is None else poly + right
+            if poly is None:
+                poly = flattened_bias[i]
+
+            scalar = IntermediateGammaScalar(
+                poly=poly, min_val=min_vals[i], max_val=max_vals[i]
+            )
 
             # to optimize down stream we can prevent search on linear queries if we
             # know that all single_poly_terms are prime therefore the query is linear
             scalar.is_linear = True
+            j = len(single_poly_terms) - 1
             if j in single_poly_terms:
                 if (
-                    single_poly_terms[j] not in known_primes
+                    single_poly_terms[j] not in scalar_manager
                     or single_poly_coeffs[j] != 1
                 ):
                     scalar.is_linear = False
-                    break
 
             scalars.append(scalar)
 
@@ -216,9 +312,10 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
         DO NOT ADD THIS METHOD TO THE AST!!!
         """
-        return np.array(list(map(lambda x: x.value, self.flat_scalars))).reshape(
-            self.shape
-        )
+        if self.value_tensor is not None:
+            return np.array(list(self.value_tensor.flatten())).reshape(self.shape)
+
+        return self._linear_values()[0].reshape(self.shape).copy()
 
     def _max_values(self) -> np.array:
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
@@ -227,9 +324,7 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
         if self._max_vals_cache is not None:
             return self._max_vals_cache
 
-        return np.array(list(map(lambda x: x.max_val, self.flat_scalars))).reshape(
-            self.shape
-        )
+        return self._linear_values()[2].reshape(self.shape).copy()
 
     def _min_values(self) -> np.array:
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
@@ -239,55 +334,66 @@ class IntermediateGammaTensor(PassthroughTensor, ADPTensor):
         if self._min_vals_cache is not None:
             return self._min_vals_cache
 
-        return np.array(list(map(lambda x: x.min_val, self.flat_scalars))).reshape(
-            self.shape
-        )
+        return self._linear_values()[1].reshape(self.shape).copy()
+
+    @staticmethod
+    def _combine_entities(input_entities: Sequence[Any]) -> DataSubjectGroup:
+        # TODO: This will fail if the nested entity is any deeper than 2 levels- i.e. [A, [A, [A, B]]]. Recursive?
+        combined_entities = DataSubjectGroup()
+        for row in input_entities:
+            if isinstance(row, Entity) or isinstance(row, DataSubjectGroup):
+                combined_entities += row
+            elif isinstance(row, list):
+                for i in row:
+                    if isinstance(i, Entity) or isinstance(i, DataSubjectGroup):
+                        combined_entities += i
+                    else:
+                        raise Exception(f"Not implemented for i of type:{type(i)}")
+            else:
+                raise Exception(f"No plans for row type:{type(row)}")
+        return combined_entities
 
     def _entities_list(self) -> list:
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
         DO NOT ADD THIS METHOD TO THE AST!!!
         """
-
-        output_entities = []
-        for flat_scalar in self.flat_scalars:
-            # TODO: This will fail if the nested entity is any deeper than 2 levels- i.e. [A, [A, [A, B]]]. Recursive?
-            combined_entities = DataSubjectGroup()
-            for row in flat_scalar.input_entities:
-                if isinstance(row, Entity) or isinstance(row, DataSubjectGroup):
-                    combined_entities += row
-                elif isinstance(row, list):
-                    for i in row:
-                        if isinstance(i, Entity) or isinstance(i, DataSubjectGroup):
-                            combined_entities += i
-                        else:
-                            raise Exception(f"Not implemented for i of type:{type(i)}")
-                else:
-                    raise Exception(f"No plans for row type:{type(row)}")
-            output_entities.append(combined_entities)
-        return output_entities
+        return list(self.scalar_cache.get("entities", self._group_entities))
+
+    def _group_entities(self) -> List[DataSubjectGroup]:
+        symbol_index, _, is_symbol, unique_primes = self._linear_terms()
+        _, _, _, entities = self.scalar_manager.symbol_arrays(unique_primes)
+
+        # number the distinct entities so that the polynomials over the same
+        # entities are found with NumPy and share their DataSubjectGroup
+        entity_codes: Dict[Any, int] = {}
+        unique_entities: List[Any] = []
+        symbol_codes = np.empty(len(entities), dtype=np.int64)
+        for i, entity in enumerate(entities):
+            if entity not in entity_codes:
+                entity_codes[entity] = len(unique_entities)
+                unique_entities.append(entity)
+            symbol_codes[i] = entity_codes[entity]
+
+        if len(entities) > 0:
+            rows = np.where(is_symbol, symbol_codes[symbol_index], -1)
+        else:
+            rows = np.full(symbol_index.shape, -1)
+        unique_rows, row_index = np.unique(
+            np.sort(rows, axis=-1), axis=0, return_inverse=True
+        )
+        groups = [
+            self._combine_entities(
+                [unique_entities[code] for code in np.unique(row[row >= 0])]
+            )
+            for row in unique_rows
+        ]
+        return [groups[i] for i in row_index.reshape(-1)]
 
     def _entities(self) -> np.array:
         """WARNING: DO NOT MAKE THIS AVAILABLE TO THE POINTER!!!
         DO NOT ADD THIS METHOD TO THE AST!!!
         """
-
-        output_entities = []
-        for flat_scalar in self.flat_scalars:
-            # TODO: This will fail if the nested entity is any deeper than 2 levels- i.e. [A, [A, [A, B]]]. Recursive?
-            combined_entities = DataSubjectGroup()
-            for row in flat_scalar.input_entities:
-                if isinstance(row, Entity) or isinstance(row, DataSubjectGroup):
-                    combined_entities += row
-                elif isinstance(row, list):
-                    for i in row:
-                        if isinstance(i, Entity) or isinstance(i, DataSubjectGroup):
-                            combined_entities += i
-                        else:
-                            raise Exception(f"Not implemented for i of type:{type(i)}")
-                else:
-                    raise Exception(f"No plans for row type:{type(row)}")
-            output_entities.append(combined_entities)
-        return np.array(output_entities).reshape(self.shape)
+        return np.array(self._entities_list()).reshape(self.shape)
 
     def astype(self, np_type: np.dtype = np.int32) -> IntermediateGammaTensor:
         return self.__class__(
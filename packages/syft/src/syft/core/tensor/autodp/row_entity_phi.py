@@ -607,14 +607,14 @@ class RowEntityPhiTensor(PassthroughTensor, ADPTensor):
 
             min_val_sum += flat_min.sum()
             max_val_sum += flat_max.sum()
-            for i in range(len(flat_child)):
-                prime = self.scalar_manager.get_symbol(
-                    min_val=flat_min[i],
-                    value=flat_child[i],
-                    max_val=flat_max[i],
-                    entity=row.entity,
-                )
-                flat_symbols.append(prime)
+            flat_symbols.extend(
+                self.scalar_manager.get_symbols(
+                    min_vals=flat_min,
+                    values=flat_child,
+                    max_vals=flat_max,
+                    entities=row.entity,
+                ).tolist()
+            )
             unique_entities.add(row.entity)
 
         term_tensor = (
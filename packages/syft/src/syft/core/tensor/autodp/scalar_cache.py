@@ -0,0 +1,85 @@
+# stdlib
+from collections import OrderedDict
+import sys
+from typing import Any
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+
+# third party
+import numpy as np
+
+
+def approximate_nbytes(obj: Any) -> int:
+    """Estimates the memory used by the arrays, containers and objects of a view"""
+    if isinstance(obj, np.ndarray):
+        nbytes = obj.nbytes
+        if obj.dtype == object:
+            nbytes += sum(approximate_nbytes(item) for item in obj.flat)
+        return nbytes
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(approximate_nbytes(item) for item in obj)
+    nbytes = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        nbytes += sys.getsizeof(obj.__dict__)
+    return nbytes
+
+
+class ScalarCache:
+    """
+    ScalarCache keeps the views an IntermediateGammaTensor computes from its terms,
+    coefficients and bias (the expanded polynomials, the values and bounds, the
+    entities and the flat scalars), so every accessor reading them shares the same
+    computation instead of starting over.
+
+    By default every view is kept. With max_bytes set, the cache holds at most
+    that many bytes, evicting the least recently used views first, and views larger
+    than the whole budget are computed on every access instead of being kept.
+
+    Attributes:
+        max_bytes (Optional[int]): the budget of the cache, unbounded if None.
+        nbytes (int): the approximate memory used by the views kept.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._views: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._views
+
+    def get(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the view stored at key, computing and storing it if it is missing.
+
+        Args:
+            key (str): the name of the view.
+            compute (Callable[[], Any]): computes the view if it isn't cached.
+
+        Returns:
+            Any: the view.
+        """
+        if key in self._views:
+            self._views.move_to_end(key)
+            return self._views[key][0]
+
+        view = compute()
+        nbytes = approximate_nbytes(view) if self.max_bytes is not None else 0
+        if self.max_bytes is None or nbytes <= self.max_bytes:
+            self._views[key] = (view, nbytes)
+            self.nbytes += nbytes
+            self._evict()
+        return view
+
+    def _evict(self) -> None:
+        while self.max_bytes is not None and self.nbytes > self.max_bytes:
+            _, (_, nbytes) = self._views.popitem(last=False)
+            self.nbytes -= nbytes
+
+    def clear(self) -> None:
+        self._views.clear()
+        self.nbytes = 0
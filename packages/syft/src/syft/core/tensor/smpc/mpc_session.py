@@ -0,0 +1,111 @@
+"""Round-batched execution of MPCTensor operations."""
+
+# future
+from __future__ import annotations
+
+# stdlib
+import threading
+from types import TracebackType
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Type
+
+# relative
+from ...common.uid import UID
+from ...node.common.action.run_class_method_smpc_action import (
+    RunClassMethodSMPCAction,
+)
+from ...node.common.action.smpc_round_action import SMPCRoundAction
+
+
+class MPCSession:
+    """Records the operations on MPCTensors and sends them to the parties in rounds.
+
+    Outside of a session every operation sends one RunClassMethodSMPCAction per share,
+    each in its own request. Inside ``with MPCSession():`` the actions are recorded
+    instead, and each one is placed in the round after the last round which writes an
+    object it reads. When the session is flushed every party gets a single
+    SMPCRoundAction per round, which also opens the masks of all the multiplications
+    of the round with one BeaverBatchAction per party.
+
+    The session is flushed when it exits, and whenever a result is needed before
+    that, e.g. by MPCTensor.block or MPCTensor.reconstruct.
+
+    Example:
+        with MPCSession():
+            bits = ABY3.bit_decomposition(x)
+    """
+
+    _local = threading.local()
+
+    def __init__(self) -> None:
+        # the actions of each round, per client of the party they are sent to
+        self.rounds: List[Dict[Any, List[RunClassMethodSMPCAction]]] = []
+        self.round_of: Dict[UID, int] = {}
+        self.nr_actions = 0
+        self.nr_messages = 0
+        self._previous: Optional[MPCSession] = None
+
+    @staticmethod
+    def current() -> Optional[MPCSession]:
+        """Get the session of the current thread.
+
+        Returns:
+            Optional[MPCSession]: The innermost active session, if any.
+        """
+        return getattr(MPCSession._local, "session", None)
+
+    @staticmethod
+    def flush_current() -> None:
+        """Send the actions recorded by the session of the current thread, if any."""
+        session = MPCSession.current()
+        if session is not None:
+            session.flush()
+
+    def __enter__(self) -> MPCSession:
+        self._previous = MPCSession.current()
+        MPCSession._local.session = self
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        MPCSession._local.session = self._previous
+        self._previous = None
+        if exc_type is None:
+            self.flush()
+
+    def record(self, client: Any, action: RunClassMethodSMPCAction) -> None:
+        """Record an action for a party instead of sending it.
+
+        Args:
+            client (Any): The client of the party.
+            action (RunClassMethodSMPCAction): The action to send to the party.
+        """
+        round_idx = 1 + max(
+            (self.round_of.get(uid, -1) for uid in action.read_ids()),  # type: ignore
+            default=-1,
+        )
+        for uid in action.write_ids():  # type: ignore
+            self.round_of[uid] = round_idx
+
+        while len(self.rounds) <= round_idx:
+            self.rounds.append({})
+        self.rounds[round_idx].setdefault(client, []).append(action)
+        self.nr_actions += 1
+
+    def flush(self) -> None:
+        """Send every party one SMPCRoundAction per recorded round, in order."""
+        rounds, self.rounds = self.rounds, []
+        self.round_of = {}
+
+        for actions_per_party in rounds:
+            for client, actions in actions_per_party.items():
+                msg = SMPCRoundAction(actions=actions, address=client.address)
+                client.send_immediate_msg_without_reply(msg=msg)
+                self.nr_messages += 1
@@ -28,6 +28,7 @@ from ...smpc.protocol.spdz import spdz
 from ..passthrough import PassthroughTensor  # type: ignore
 from ..passthrough import SupportedChainType  # type: ignore
 from ..util import implements  # type: ignore
+from .mpc_session import MPCSession
 from .share_tensor import ShareTensor
 
 METHODS_FORWARD_ALL_SHARES = {
@@ -369,6 +370,7 @@ class MPCTensor(PassthroughTensor):
     @property
     def block(self) -> "MPCTensor":
         """Block until all shares have been created."""
+        MPCSession.flush_current()
         for share in self.child:
             share.block
 
@@ -376,6 +378,7 @@ class MPCTensor(PassthroughTensor):
 
     def block_with_timeout(self, secs: int, secs_per_poll: int = 1) -> "MPCTensor":
         """Block until all shares have been created or until timeout expires."""
+        MPCSession.flush_current()
 
         for share in self.child:
             share.block_with_timeout(secs=secs, secs_per_poll=secs_per_poll)
@@ -405,6 +408,7 @@ class MPCTensor(PassthroughTensor):
         if dtype is None:
             raise ValueError(f"Type for ring size {self.ring_size} was not found!")
 
+        MPCSession.flush_current()
         for share in self.child:
             if not share.exists:
                 raise Exception(
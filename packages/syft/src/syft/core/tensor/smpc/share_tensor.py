@@ -87,6 +87,11 @@ def populate_store(*args: List[Any], **kwargs: Dict[Any, Any]) -> None:
     ShareTensor.crypto_store.populate_store(*args, **kwargs)  # type: ignore
 
 
+def count_primitives(config_key: str) -> int:
+    """Get the number of primitives the CryptoStore holds for config_key."""
+    return len(ShareTensor.crypto_store.store.get(str(config_key), []))
+
+
 @serializable()
 class ShareTensor(PassthroughTensor):
     crypto_store = CryptoStore()
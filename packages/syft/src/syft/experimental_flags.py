@@ -20,6 +20,7 @@ class ExperimentalFlags:
     def __init__(self) -> None:
         self._APACHE_ARROW_TENSOR_SERDE = True
         self._APACHE_ARROW_COMPRESSION = ApacheArrowCompression.ZSTD
+        self._FLAT_RECURSIVE_SERDE = False
 
     @property
     def APACHE_ARROW_TENSOR_SERDE(self) -> bool:
@@ -41,6 +42,14 @@ class ExperimentalFlags:
     def APACHE_ARROW_COMPRESSION(self, value: ApacheArrowCompression) -> None:
         self._APACHE_ARROW_COMPRESSION = value
 
+    @property
+    def FLAT_RECURSIVE_SERDE(self) -> bool:
+        return self._FLAT_RECURSIVE_SERDE
+
+    @FLAT_RECURSIVE_SERDE.setter
+    def FLAT_RECURSIVE_SERDE(self, value: bool) -> None:
+        self._FLAT_RECURSIVE_SERDE = value
+
     @property
     def USE_NEW_SERVICE(self) -> bool:
         return str_to_bool(os.getenv("USE_NEW_SERVICE", "False"))
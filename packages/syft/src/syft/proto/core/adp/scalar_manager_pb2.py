@@ -15,10 +15,13 @@ _sym_db = _symbol_database.Default()
 
 
 # syft absolute
+from syft.proto.core.common import (
+    common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
+)
 from syft.proto.lib.python import dict_pb2 as proto_dot_lib_dot_python_dot_dict__pb2
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n#proto/core/adp/scalar_manager.proto\x12\rsyft.core.adp\x1a\x1bproto/lib/python/dict.proto"\x0e\n\x0cPrimeFactory"\x85\x01\n"VirtualMachinePrivateScalarManager\x12\x32\n\rprime_factory\x18\x01 \x01(\x0b\x32\x1b.syft.core.adp.PrimeFactory\x12+\n\x0cprime2symbol\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dictb\x06proto3'
+    b'\n#proto/core/adp/scalar_manager.proto\x12\rsyft.core.adp\x1a%proto/core/common/common_object.proto\x1a\x1bproto/lib/python/dict.proto"\x0e\n\x0cPrimeFactory"\xe0\x02\n"VirtualMachinePrivateScalarManager\x12\x32\n\rprime_factory\x18\x01 \x01(\x0b\x32\x1b.syft.core.adp.PrimeFactory\x12+\n\x0cprime2symbol\x18\x02 \x01(\x0b\x32\x15.syft.lib.python.Dict\x12\x0f\n\x07symbols\x18\x03 \x01(\x0c\x12\x10\n\x08\x65ntities\x18\x04 \x03(\x0c\x12\r\n\x05index\x18\x05 \x01(\x04\x12!\n\x02id\x18\x06 \x01(\x0b\x32\x15.syft.core.common.UID\x12\x12\n\ngeneration\x18\x07 \x01(\x04\x12+\n\x0creference_id\x18\x08 \x01(\x0b\x32\x15.syft.core.common.UID\x12\x1c\n\x14reference_generation\x18\t \x01(\x04\x12\x0e\n\x06offset\x18\n \x01(\x04\x12\x15\n\rentity_offset\x18\x0b \x01(\x04\x62\x06proto3'
 )
 
 
@@ -51,8 +54,8 @@ _sym_db.RegisterMessage(VirtualMachinePrivateScalarManager)
 if _descriptor._USE_C_DESCRIPTORS == False:
 
     DESCRIPTOR._options = None
-    _PRIMEFACTORY._serialized_start = 83
-    _PRIMEFACTORY._serialized_end = 97
-    _VIRTUALMACHINEPRIVATESCALARMANAGER._serialized_start = 100
-    _VIRTUALMACHINEPRIVATESCALARMANAGER._serialized_end = 233
+    _PRIMEFACTORY._serialized_start = 122
+    _PRIMEFACTORY._serialized_end = 136
+    _VIRTUALMACHINEPRIVATESCALARMANAGER._serialized_start = 139
+    _VIRTUALMACHINEPRIVATESCALARMANAGER._serialized_end = 491
 # @@protoc_insertion_point(module_scope)
@@ -15,11 +15,13 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b"\n'proto/core/common/recursive_serde.proto\x12\x10syft.core.common\"X\n\x0eRecursiveSerde\x12\x13\n\x0b\x66ields_name\x18\x01 \x03(\t\x12\x13\n\x0b\x66ields_data\x18\x02 \x03(\x0c\x12\x1c\n\x14\x66ully_qualified_name\x18\x03 \x01(\tb\x06proto3"
+    b'\n\'proto/core/common/recursive_serde.proto\x12\x10syft.core.common"\x8c\x01\n\x0eRecursiveSerde\x12\x13\n\x0b\x66ields_name\x18\x01 \x03(\t\x12\x13\n\x0b\x66ields_data\x18\x02 \x03(\x0c\x12\x1c\n\x14\x66ully_qualified_name\x18\x03 \x01(\t\x12\x32\n\x04\x66lat\x18\x04 \x01(\x0b\x32$.syft.core.common.FlatRecursiveSerde"y\n\x16\x46latRecursiveSerdeNode\x12\x11\n\ttype_name\x18\x01 \x01(\r\x12\x13\n\x0b\x66ields_name\x18\x02 \x03(\r\x12\x13\n\x0b\x66ields_node\x18\x03 \x03(\r\x12\x0f\n\x07\x63ontent\x18\x04 \x01(\x0c\x12\x11\n\trecursive\x18\x05 \x01(\x08"\\\n\x12\x46latRecursiveSerde\x12\r\n\x05names\x18\x01 \x03(\t\x12\x37\n\x05nodes\x18\x02 \x03(\x0b\x32(.syft.core.common.FlatRecursiveSerdeNodeb\x06proto3'
 )
 
 
 _RECURSIVESERDE = DESCRIPTOR.message_types_by_name["RecursiveSerde"]
+_FLATRECURSIVESERDENODE = DESCRIPTOR.message_types_by_name["FlatRecursiveSerdeNode"]
+_FLATRECURSIVESERDE = DESCRIPTOR.message_types_by_name["FlatRecursiveSerde"]
 RecursiveSerde = _reflection.GeneratedProtocolMessageType(
     "RecursiveSerde",
     (_message.Message,),
@@ -31,9 +33,35 @@ RecursiveSerde = _reflection.GeneratedProtocolMessageType(
 )
 _sym_db.RegisterMessage(RecursiveSerde)
 
+FlatRecursiveSerdeNode = _reflection.GeneratedProtocolMessageType(
+    "FlatRecursiveSerdeNode",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _FLATRECURSIVESERDENODE,
+        "__module__": "proto.core.common.recursive_serde_pb2"
+        # @@protoc_insertion_point(class_scope:syft.core.common.FlatRecursiveSerdeNode)
+    },
+)
+_sym_db.RegisterMessage(FlatRecursiveSerdeNode)
+
+FlatRecursiveSerde = _reflection.GeneratedProtocolMessageType(
+    "FlatRecursiveSerde",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _FLATRECURSIVESERDE,
+        "__module__": "proto.core.common.recursive_serde_pb2"
+        # @@protoc_insertion_point(class_scope:syft.core.common.FlatRecursiveSerde)
+    },
+)
+_sym_db.RegisterMessage(FlatRecursiveSerde)
+
 if _descriptor._USE_C_DESCRIPTORS == False:
 
     DESCRIPTOR._options = None
-    _RECURSIVESERDE._serialized_start = 61
-    _RECURSIVESERDE._serialized_end = 149
+    _RECURSIVESERDE._serialized_start = 62
+    _RECURSIVESERDE._serialized_end = 202
+    _FLATRECURSIVESERDENODE._serialized_start = 204
+    _FLATRECURSIVESERDENODE._serialized_end = 325
+    _FLATRECURSIVESERDE._serialized_start = 327
+    _FLATRECURSIVESERDE._serialized_end = 419
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: proto/core/node/common/action/smpc_round_action.proto
+"""Generated protocol buffer code."""
+# third party
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+# syft absolute
+from syft.proto.core.common import (
+    common_object_pb2 as proto_dot_core_dot_common_dot_common__object__pb2,
+)
+from syft.proto.core.io import address_pb2 as proto_dot_core_dot_io_dot_address__pb2
+from syft.proto.core.node.common.action import (
+    run_class_method_smpc_pb2 as proto_dot_core_dot_node_dot_common_dot_action_dot_run__class__method__smpc__pb2,
+)
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
+    b'\n5proto/core/node/common/action/smpc_round_action.proto\x12\x1csyft.core.node.common.action\x1a9proto/core/node/common/action/run_class_method_smpc.proto\x1a%proto/core/common/common_object.proto\x1a\x1bproto/core/io/address.proto"\xa9\x01\n\x0fSMPCRoundAction\x12G\n\x07actions\x18\x01 \x03(\x0b26.syft.core.node.common.action.RunClassMethodSMPCAction\x12&\n\x07address\x18\x02 \x01(\x0b2\x15.syft.core.io.Address\x12%\n\x06msg_id\x18\x03 \x01(\x0b2\x15.syft.core.common.UIDb\x06proto3'
+)
+
+
+_SMPCROUNDACTION = DESCRIPTOR.message_types_by_name["SMPCRoundAction"]
+SMPCRoundAction = _reflection.GeneratedProtocolMessageType(
+    "SMPCRoundAction",
+    (_message.Message,),
+    {
+        "DESCRIPTOR": _SMPCROUNDACTION,
+        "__module__": "proto.core.node.common.action.smpc_round_action_pb2"
+        # @@protoc_insertion_point(class_scope:syft.core.node.common.action.SMPCRoundAction)
+    },
+)
+_sym_db.RegisterMessage(SMPCRoundAction)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+    DESCRIPTOR._options = None
+    _SMPCROUNDACTION._serialized_start = 215
+    _SMPCROUNDACTION._serialized_end = 384
+# @@protoc_insertion_point(module_scope)
@@ -21,7 +21,7 @@ from syft.proto.core.common import (
 from syft.proto.core.io import address_pb2 as proto_dot_core_dot_io_dot_address__pb2
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n:proto/core/node/common/service/object_search_message.proto\x12\x1dsyft.core.node.common.service\x1a%proto/core/common/common_object.proto\x1a\x1bproto/core/io/address.proto"\xb4\x01\n\x13ObjectSearchMessage\x12%\n\x06msg_id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x02 \x01(\x0b\x32\x15.syft.core.io.Address\x12\'\n\x08reply_to\x18\x03 \x01(\x0b\x32\x15.syft.core.io.Address\x12%\n\x06obj_id\x18\x04 \x01(\x0b\x32\x15.syft.core.common.UID"z\n\x18ObjectSearchReplyMessage\x12%\n\x06msg_id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x02 \x01(\x0b\x32\x15.syft.core.io.Address\x12\x0f\n\x07results\x18\x03 \x03(\x0c\x62\x06proto3'
+    b'\n:proto/core/node/common/service/object_search_message.proto\x12\x1dsyft.core.node.common.service\x1a%proto/core/common/common_object.proto\x1a\x1bproto/core/io/address.proto"\x9c\x02\n\x13ObjectSearchMessage\x12%\n\x06msg_id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x02 \x01(\x0b\x32\x15.syft.core.io.Address\x12\'\n\x08reply_to\x18\x03 \x01(\x0b\x32\x15.syft.core.io.Address\x12%\n\x06obj_id\x18\x04 \x01(\x0b\x32\x15.syft.core.common.UID\x12\x0c\n\x04tags\x18\x05 \x03(\t\x12\x13\n\x0bobject_type\x18\x06 \x01(\t\x12\x0f\n\x07\x64\x61taset\x18\x07 \x01(\t\x12\x13\n\x0bname_prefix\x18\x08 \x01(\t\x12\x0e\n\x06\x63ursor\x18\t \x01(\t\x12\r\n\x05limit\x18\n \x01(\r"\x8f\x01\n\x18ObjectSearchReplyMessage\x12%\n\x06msg_id\x18\x01 \x01(\x0b\x32\x15.syft.core.common.UID\x12&\n\x07\x61\x64\x64ress\x18\x02 \x01(\x0b\x32\x15.syft.core.io.Address\x12\x0f\n\x07results\x18\x03 \x03(\x0c\x12\x13\n\x0bnext_cursor\x18\x04 \x01(\tb\x06proto3'
 )
 
 
@@ -53,7 +53,7 @@ if _descriptor._USE_C_DESCRIPTORS == False:
 
     DESCRIPTOR._options = None
     _OBJECTSEARCHMESSAGE._serialized_start = 162
-    _OBJECTSEARCHMESSAGE._serialized_end = 342
-    _OBJECTSEARCHREPLYMESSAGE._serialized_start = 344
-    _OBJECTSEARCHREPLYMESSAGE._serialized_end = 466
+    _OBJECTSEARCHMESSAGE._serialized_end = 446
+    _OBJECTSEARCHREPLYMESSAGE._serialized_start = 449
+    _OBJECTSEARCHREPLYMESSAGE._serialized_end = 592
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,146 @@
+# stdlib
+import math
+
+# third party
+from autodp.transformer_zoo import Composition
+from nacl.signing import SigningKey
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+
+# syft absolute
+from syft.core.adp import adversarial_accountant
+from syft.core.adp.adversarial_accountant import AdversarialAccountant
+from syft.core.adp.entity import DataSubjectGroup as DSG
+from syft.core.adp.entity import Entity
+from syft.core.adp.idp_gaussian_mechanism import iDPGaussianMechanism
+from syft.core.node.common.node_table import Base
+
+
+def make_mechanism(entity: Entity, user_key: SigningKey) -> iDPGaussianMechanism:
+    return iDPGaussianMechanism(
+        sigma=np.random.uniform(0.5, 2),
+        squared_l2_norm=np.random.uniform(0, 1),
+        squared_l2_norm_upper_bound=np.random.uniform(1, 2),
+        L=np.random.uniform(0.5, 1.5),
+        entity_name=entity.name,
+        user_key=user_key,
+    )
+
+
+@pytest.fixture(params=["database", "dict"])
+def acc(request: pytest.FixtureRequest) -> AdversarialAccountant:
+    db_engine = None
+    if request.param == "database":
+        db_engine = create_engine("sqlite://", echo=False)
+        Base.metadata.create_all(db_engine)  # type: ignore
+    return AdversarialAccountant(db_engine=db_engine)
+
+
+def test_accumulated_rdp_matches_recomposition(acc: AdversarialAccountant) -> None:
+    alice, bob = Entity(name="Alice"), Entity(name="Bob")
+    user_keys = [SigningKey.generate().verify_key for _ in range(2)]
+    mechanisms = [
+        make_mechanism(entity, user_key)
+        for entity in [alice, bob]
+        for user_key in user_keys
+        for _ in range(3)
+    ]
+    # registered in two batches like two publishes
+    acc.append({"first": mechanisms[:5]})
+    acc.append({"second": mechanisms[5:]})
+
+    # mechanisms of a publish in progress count too
+    temp_mechanism = make_mechanism(alice, user_keys[0])
+    acc.temp_append({alice: [temp_mechanism]})
+
+    for entity in [alice, bob]:
+        for user_key in user_keys + [None]:
+            history = [
+                m
+                for m in mechanisms
+                if m.entity_name == entity.name
+                and (user_key is None or m.user_key == user_key)
+            ]
+            if entity == alice:
+                history.append(temp_mechanism)
+            for private in [True, False]:
+                value_key = "private_value" if private else "public_value"
+                for m in history:
+                    m.params["value"] = m.params[value_key]
+
+                composed_mech = Composition()(history, [1] * len(history))
+                rdp, n_mechanisms = acc.get_rdp_for_entity(
+                    entity, user_key=user_key, returned_epsilon_is_private=private
+                )
+                assert n_mechanisms == len(history)
+                # the curve converted to approximate DP is the one of the recomposition
+                for alpha in [1.5, 2, 8, 64]:
+                    assert alpha * rdp == pytest.approx(composed_mech.RenyiDP(alpha))
+
+    assert acc.get_rdp_for_entity(Entity(name="Carol")) == (0.0, 0)
+    assert acc.get_eps_for_entity(Entity(name="Carol")) == 0
+
+
+def test_bulk_budget_matches_entity_budgets(
+    acc: AdversarialAccountant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # autodp's conversion to approximate DP can't run with every scipy version,
+    # any conversion growing with the RDP like the classic one is checked the same
+    monkeypatch.setattr(
+        adversarial_accountant,
+        "compose_RDP_gaussian_curve",
+        lambda rdp, delta: rdp + 2 * math.sqrt(rdp * math.log(1 / delta)),
+    )
+    user_key, other_user_key = [SigningKey.generate().verify_key for _ in range(2)]
+
+    entities = [Entity(name=str(i)) for i in range(50)]
+    acc.append(
+        {
+            "registered": [
+                make_mechanism(entity, user_key)
+                for entity in entities[:40]
+                for _ in range(np.random.randint(0, 10))
+            ]
+            + [make_mechanism(entity, other_user_key) for entity in entities]
+        }
+    )
+    temp_entities = {
+        entity: [make_mechanism(entity, user_key)] for entity in entities[30:]
+    }
+    temp_entities[entities[0] + entities[45]] = [make_mechanism(entities[0], user_key)]
+    acc.temp_append(temp_entities)
+
+    for private in [True, False]:
+        spends = [
+            acc.get_eps_for_entity(
+                entity, user_key=user_key, returned_epsilon_is_private=private
+            )
+            for entity in entities
+        ]
+        # some entities are over budget and some are not
+        budget = np.median(spends)
+        monkeypatch.setattr(
+            acc.entity2ledger, "get_user_budget", lambda user_key: budget
+        )
+
+        expected = set()
+        for entity in temp_entities:
+            members = entity.entity_set if isinstance(entity, DSG) else [entity]
+            for e in members:
+                if not acc.has_budget(
+                    e, user_key=user_key, returned_epsilon_is_private=private
+                ):
+                    expected.add(entity)
+        assert 0 < len(expected) < len(temp_entities)
+
+        overbudgeted = acc.overbudgeted_entities(
+            temp_entities=acc.temp_entity2ledger,
+            user_key=user_key,
+            returned_epsilon_is_private=private,
+        )
+        assert overbudgeted == expected
+
+        assert acc.user_budget(
+            user_key, returned_epsilon_is_private=private
+        ) == pytest.approx(max(spends))
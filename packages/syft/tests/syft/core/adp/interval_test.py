@@ -0,0 +1,53 @@
+# third party
+import pytest
+
+# syft absolute
+from syft.core.adp.entity import Entity
+from syft.core.adp.interval import interval_bounds
+from syft.core.adp.interval import interval_mul
+from syft.core.adp.interval import interval_pow
+from syft.core.adp.scalar.phi_scalar import PhiScalar
+from syft.core.adp.search import flatten_and_maximize_poly
+
+
+@pytest.fixture
+def scalars() -> tuple:
+    entity = Entity(name="Alice")
+    x = PhiScalar(min_val=0, value=1, max_val=5, entity=entity)
+    y = PhiScalar(min_val=-2, value=1, max_val=3, entity=entity)
+    z = PhiScalar(min_val=1, value=2, max_val=4, entity=entity)
+    return x, y, z
+
+
+def test_interval_operations() -> None:
+    assert interval_mul((-2, 3), (1, 4)) == (-8, 12)
+    assert interval_pow((-2, 3), 2) == (0, 9)
+    assert interval_pow((-3, -2), 2) == (4, 9)
+    assert interval_pow((-2, 3), 3) == (-8, 27)
+
+
+def test_bounds_match_search(scalars: tuple) -> None:
+    x, y, z = scalars
+    for scalar in [x + y * 2 - 3, x * y + z, x * y + z * 3 - x * z, y * y, y * y * y]:
+        bounds = interval_bounds(scalar.poly)
+        assert bounds is not None
+        assert bounds[0] == pytest.approx(
+            flatten_and_maximize_poly(scalar.poly)[-1].fun, abs=1e-6
+        )
+        assert bounds[1] == pytest.approx(
+            -flatten_and_maximize_poly(-scalar.poly)[-1].fun, abs=1e-6
+        )
+        assert (scalar.min_val, scalar.max_val) == bounds
+
+
+def test_loose_bounds_fall_back(scalars: tuple) -> None:
+    x, y, _ = scalars
+    # x * x - x is in [-0.25, 20] but interval arithmetic gives [-5, 25]
+    scalar = x * x - x
+    assert interval_bounds(scalar.poly) is None
+    assert scalar.min_val == pytest.approx(-0.25, abs=1e-6)
+    assert scalar.max_val == pytest.approx(20, abs=1e-6)
+
+    # unsupported expressions are left to the optimizer as well
+    assert interval_bounds(x.poly / y.poly) is None
+    assert interval_bounds(x.poly**0.5) is None
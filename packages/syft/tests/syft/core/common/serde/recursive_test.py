@@ -0,0 +1,106 @@
+# stdlib
+from typing import Generator
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.adp.entity import Entity
+from syft.core.smpc.store.crypto_store import CryptoStore
+from syft.core.tensor.autodp.dp_tensor_converter import convert_to_gamma_tensor
+from syft.core.tensor.autodp.intermediate_gamma import IntermediateGammaTensor as IGT
+from syft.core.tensor.autodp.single_entity_phi import SingleEntityPhiTensor as SEPT
+from syft.core.test.module_test import C
+from syft.experimental_flags import flags
+
+
+@pytest.fixture
+def flat_serde() -> Generator:
+    previous = flags.FLAT_RECURSIVE_SERDE
+    yield
+    flags.FLAT_RECURSIVE_SERDE = previous
+
+
+def make_nested_c() -> C:
+    inner = C()
+    inner.dynamic_object = [1, "two", 3.0, None]
+    outer = C()
+    outer.dynamic_object = C()
+    outer.dynamic_object.dynamic_object = inner
+    return outer
+
+
+def make_igt() -> IGT:
+    data = np.random.randint(low=5, high=50, size=(3, 4), dtype=np.int32)
+    return convert_to_gamma_tensor(
+        SEPT(
+            child=data,
+            min_vals=np.ones_like(data),
+            max_vals=np.ones_like(data) * 50,
+            entity=Entity(name="Ishan"),
+        )
+    )
+
+
+def serialize_with(obj: object, flat: bool) -> bytes:
+    flags.FLAT_RECURSIVE_SERDE = flat
+    return sy.serialize(obj, to_bytes=True)
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_nested_roundtrip(flat: bool, flat_serde: None) -> None:
+    obj = make_nested_c()
+    de = sy.deserialize(serialize_with(obj, flat=flat), from_bytes=True)
+
+    assert isinstance(de.dynamic_object, C)
+    assert isinstance(de.dynamic_object.dynamic_object, C)
+    assert de.dynamic_object.dynamic_object.dynamic_object == [1, "two", 3.0, None]
+
+
+@pytest.mark.parametrize("serialize_flat", [False, True])
+@pytest.mark.parametrize("deserialize_flat", [False, True])
+def test_formats_are_compatible(
+    serialize_flat: bool, deserialize_flat: bool, flat_serde: None
+) -> None:
+    obj = make_nested_c()
+    blob = serialize_with(obj, flat=serialize_flat)
+
+    flags.FLAT_RECURSIVE_SERDE = deserialize_flat
+    de = sy.deserialize(blob, from_bytes=True)
+    assert de.dynamic_object.dynamic_object.dynamic_object == [1, "two", 3.0, None]
+
+
+def test_flat_interns_type_names(flat_serde: None) -> None:
+    obj = make_nested_c()
+    type_name = b"syft.core.test.module_test.C"
+
+    # once in the DataMessage and once in the RecursiveSerde of every object
+    assert serialize_with(obj, flat=False).count(type_name) == 6
+    # once in the outer DataMessage and once in the type table
+    assert serialize_with(obj, flat=True).count(type_name) == 2
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_igt_roundtrip(flat: bool, flat_serde: None) -> None:
+    igt = make_igt()
+    de = sy.deserialize(serialize_with(igt, flat=flat), from_bytes=True)
+
+    assert isinstance(de, IGT)
+    assert (de.term_tensor == igt.term_tensor).all()
+    assert (de.coeff_tensor == igt.coeff_tensor).all()
+    assert (de.bias_tensor == igt.bias_tensor).all()
+    assert (
+        de.scalar_manager.prime2symbol.keys() == igt.scalar_manager.prime2symbol.keys()
+    )
+
+
+@pytest.mark.parametrize("flat", [False, True])
+def test_crypto_store_roundtrip(flat: bool, flat_serde: None) -> None:
+    store = CryptoStore()
+    store.store["beaver_mul"] = [1, 2, 3]
+    de = sy.deserialize(serialize_with(store, flat=flat), from_bytes=True)
+
+    assert isinstance(de, CryptoStore)
+    assert de.store == store.store
@@ -0,0 +1,50 @@
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.common.serde import registry
+from syft.core.common.serde.registry import lookup_type
+from syft.core.common.uid import UID
+from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
+from syft.core.test.module_test import A
+from syft.lib.python import List
+
+
+def test_lookup_type_matches_module_index() -> None:
+    assert lookup_type("syft.core.common.uid.UID") is UID
+    assert lookup_type("syft.core.test.module_test.A") is A
+    assert lookup_type("syft.lib.python.List") is List
+    assert lookup_type("builtins.NoneType") is sy.lib.python._SyNone
+
+
+def test_lookup_type_unknown_name() -> None:
+    with pytest.raises(ReferenceError):
+        lookup_type("not_syft.core.common.uid.UID")
+
+
+def test_nested_deserialize_never_walks_modules(
+    client: sy.VirtualMachineClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ptr = List([1, 2, 3]).send(client)
+    action = RunClassMethodAction(
+        path="syft.lib.python.List.append",
+        _self=ptr,
+        args=[ptr, ptr],
+        kwargs={"value": ptr},
+        id_at_location=UID(),
+        address=client.address,
+    )
+    blob = sy.serialize(action.sign(signing_key=client.signing_key), to_bytes=True)
+
+    # warm the dispatch table with the types used by the message
+    sy.deserialize(blob, from_bytes=True).message
+
+    def fail(fully_qualified_name: str) -> None:
+        raise AssertionError(f"{fully_qualified_name} was not in the dispatch table")
+
+    monkeypatch.setattr(registry, "index_syft_by_module_name", fail)
+    signed_msg = sy.deserialize(blob, from_bytes=True)
+    assert signed_msg.message.id == action.id
+    assert signed_msg.message.args[0].id_at_location == ptr.id_at_location
+    assert signed_msg.message.kwargs["value"].id_at_location == ptr.id_at_location
@@ -0,0 +1,280 @@
+# stdlib
+import threading
+from types import SimpleNamespace
+from typing import Any
+from typing import Generator
+from typing import List
+from typing import Optional
+
+# third party
+import pytest
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.node.common.action.action_scheduler import ActionScheduler
+from syft.core.node.common.action.common import CRYPTO_STORE_ID
+from syft.core.node.common.action.common import ImmediateActionWithoutReply
+from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
+from syft.core.store.store_memory import MemoryStore
+from syft.core.store.storeable_object import StorableObject
+
+
+class RecordingAction(ImmediateActionWithoutReply):
+    def __init__(
+        self,
+        name: str,
+        log: List[str],
+        reads: Optional[List[UID]] = None,
+        writes: Optional[List[UID]] = None,
+        gate: Optional[threading.Event] = None,
+        fail: bool = False,
+    ) -> None:
+        super().__init__(address=Address())
+        self.name = name
+        self.log = log
+        self.reads = reads
+        self.writes = writes
+        self.gate = gate
+        self.fail = fail
+
+    def read_ids(self) -> Optional[List[UID]]:
+        return self.reads
+
+    def write_ids(self) -> Optional[List[UID]]:
+        return self.writes
+
+    def execute_action(self, node: Any, verify_key: Any) -> None:
+        if node is not None:
+            for uid in self.reads or []:
+                assert uid in node.store
+        if self.gate is not None:
+            assert self.gate.wait(timeout=10)
+        if self.fail:
+            raise ValueError(self.name)
+        self.log.append(self.name)
+
+
+class ProducerAction(RecordingAction):
+    def execute_action(self, node: Any, verify_key: Any) -> None:
+        super().execute_action(node, verify_key)
+        for uid in self.writes or []:
+            node.store[uid] = StorableObject(id=uid, data=self.name)
+
+
+class DeliveryAction(ProducerAction):
+    delivers_inputs = True
+
+
+@pytest.fixture
+def scheduler() -> Generator[ActionScheduler, None, None]:
+    scheduler = ActionScheduler(node=None, max_workers=4)  # type: ignore
+    yield scheduler
+    scheduler.shutdown()
+
+
+@pytest.fixture
+def node_scheduler() -> Generator[ActionScheduler, None, None]:
+    node = SimpleNamespace(store=MemoryStore())
+    scheduler = ActionScheduler(node=node, max_workers=1)  # type: ignore
+    yield scheduler
+    scheduler.shutdown()
+
+
+def test_independent_actions_run_concurrently(scheduler: ActionScheduler) -> None:
+    log: List[str] = []
+    gate = threading.Event()
+    x, y = UID(), UID()
+
+    blocked = scheduler.submit(
+        RecordingAction("a", log, reads=[], writes=[x], gate=gate), verify_key=None
+    )
+    scheduler.submit(RecordingAction("b", log, reads=[], writes=[y]), None).result(10)
+
+    assert log == ["b"]
+    gate.set()
+    blocked.result(timeout=10)
+    assert log == ["b", "a"]
+    assert len(scheduler) == 0
+
+
+def test_dependent_actions_wait(scheduler: ActionScheduler) -> None:
+    log: List[str] = []
+    gate = threading.Event()
+    x, y, z = UID(), UID(), UID()
+
+    scheduler.submit(
+        RecordingAction("write x", log, reads=[], writes=[x], gate=gate), None
+    )
+    read_x = scheduler.submit(
+        RecordingAction("read x", log, reads=[x], writes=[y]), None
+    )
+    # writing an object waits for the earlier actions reading it
+    write_x_again = scheduler.submit(
+        RecordingAction("write x again", log, reads=[z], writes=[x]), None
+    )
+
+    assert len(scheduler) == 3
+    gate.set()
+    write_x_again.result(timeout=10)
+    assert read_x.done()
+    assert log == ["write x", "read x", "write x again"]
+
+
+def test_failure_propagates_to_readers(scheduler: ActionScheduler) -> None:
+    log: List[str] = []
+    gate = threading.Event()
+    x, y, z = UID(), UID(), UID()
+
+    failed = scheduler.submit(
+        RecordingAction("write x", log, reads=[], writes=[x], gate=gate, fail=True),
+        None,
+    )
+    reader = scheduler.submit(
+        RecordingAction("read x", log, reads=[x], writes=[y]), None
+    )
+    other = scheduler.submit(RecordingAction("other", log, reads=[], writes=[z]), None)
+    gate.set()
+
+    with pytest.raises(ValueError):
+        failed.result(timeout=10)
+    with pytest.raises(ValueError):
+        reader.result(timeout=10)
+    other.result(timeout=10)
+    assert log == ["other"]
+
+
+def test_unknown_dependencies_run_alone(scheduler: ActionScheduler) -> None:
+    log: List[str] = []
+    gate = threading.Event()
+    x, y = UID(), UID()
+
+    scheduler.submit(
+        RecordingAction("first", log, reads=[], writes=[x], gate=gate), None
+    )
+    barrier = scheduler.submit(RecordingAction("barrier", log), None)
+    last = scheduler.submit(RecordingAction("last", log, reads=[], writes=[y]), None)
+
+    assert not barrier.done()
+    gate.set()
+    last.result(timeout=10)
+    assert log == ["first", "barrier", "last"]
+
+
+def test_actions_missing_inputs_are_parked(node_scheduler: ActionScheduler) -> None:
+    log: List[str] = []
+    x, y, z = UID(), UID(), UID()
+
+    # with a single worker, a reader waiting for x on the worker would stop the
+    # independent action from running until x arrives
+    waiting = node_scheduler.submit(
+        RecordingAction("read x", log, reads=[x], writes=[y]), None
+    )
+    node_scheduler.submit(RecordingAction("other", log, reads=[], writes=[z]), None)
+    node_scheduler.submit(RecordingAction("other", log, reads=[], writes=[z]), None)
+    node_scheduler.submit(
+        RecordingAction("after other", log, reads=[], writes=[z]), None
+    ).result(timeout=10)
+    assert not waiting.done()
+
+    node_scheduler.node.store[x] = StorableObject(id=x, data=1)
+    waiting.result(timeout=10)
+    assert log == ["other", "other", "after other", "read x"]
+
+
+def test_deliveries_run_apart(node_scheduler: ActionScheduler) -> None:
+    log: List[str] = []
+    gate = threading.Event()
+    x, y, z = UID(), UID(), UID()
+
+    # the only worker is busy, the delivery still runs and wakes up the reader
+    node_scheduler.submit(
+        RecordingAction("busy", log, reads=[], writes=[z], gate=gate), None
+    )
+    reader = node_scheduler.submit(
+        RecordingAction("read x", log, reads=[x], writes=[y]), None
+    )
+    node_scheduler.submit(
+        DeliveryAction("deliver x", log, reads=[], writes=[x]), None
+    ).result(timeout=10)
+    assert log == ["deliver x"]
+
+    gate.set()
+    reader.result(timeout=10)
+    assert log == ["deliver x", "busy", "read x"]
+
+
+def test_reader_submitted_before_its_producer(
+    node_scheduler: ActionScheduler,
+) -> None:
+    log: List[str] = []
+    x, y = UID(), UID()
+
+    # the producer of x doesn't wait for the reader waiting for x
+    reader = node_scheduler.submit(
+        RecordingAction("read x", log, reads=[x], writes=[y]), None
+    )
+    producer = node_scheduler.submit(
+        ProducerAction("write x", log, reads=[], writes=[x]), None
+    )
+    producer.result(timeout=10)
+    reader.result(timeout=10)
+    assert log == ["write x", "read x"]
+
+
+def test_writer_waits_for_readers_of_the_stored_object(
+    node_scheduler: ActionScheduler,
+) -> None:
+    log: List[str] = []
+    gate = threading.Event()
+    x, y = UID(), UID()
+    node_scheduler.node.store[x] = StorableObject(id=x, data=1)
+
+    reader = node_scheduler.submit(
+        RecordingAction("read x", log, reads=[x], writes=[y], gate=gate), None
+    )
+    writer = node_scheduler.submit(
+        ProducerAction("write x", log, reads=[], writes=[x]), None
+    )
+    assert not writer.done()
+    gate.set()
+    writer.result(timeout=10)
+    assert reader.done()
+    assert log == ["read x", "write x"]
+
+
+def test_crypto_store_actions_keep_their_order(scheduler: ActionScheduler) -> None:
+    log: List[str] = []
+    gate = threading.Event()
+    x, y = UID(), UID()
+
+    first = RecordingAction("first", log, reads=[], writes=[x, CRYPTO_STORE_ID])
+    first.gate = gate
+    scheduler.submit(first, None)
+    second = scheduler.submit(
+        RecordingAction("second", log, reads=[], writes=[y, CRYPTO_STORE_ID]), None
+    )
+    gate.set()
+    second.result(timeout=10)
+    assert log == ["first", "second"]
+
+
+def test_pure_methods_only_read_self() -> None:
+    self_ptr = SimpleNamespace(id_at_location=UID())
+    result = UID()
+
+    def action(path: str) -> RunClassMethodAction:
+        return RunClassMethodAction(
+            path=path,
+            _self=self_ptr,
+            args=[],
+            kwargs={},
+            id_at_location=result,
+            address=Address(),
+        )
+
+    assert action("torch.Tensor.sum").write_ids() == [result]
+    assert action("torch.Tensor.add_").write_ids() == [
+        result,
+        self_ptr.id_at_location,
+    ]
@@ -0,0 +1,61 @@
+# stdlib
+from typing import Any
+from typing import List
+
+# third party
+import pytest
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.io.location import SpecificLocation
+from syft.core.node.common.action.beaver_action import BeaverAction
+from syft.core.node.common.action.beaver_action import BeaverBatchAction
+
+
+class RecordingClient:
+    def __init__(self) -> None:
+        self.address = Address(vm=SpecificLocation())
+        self.sent: List[Any] = []
+
+    def send_immediate_msg_without_reply(self, msg: Any) -> None:
+        self.sent.append(msg)
+
+
+def beaver_action(client: RecordingClient) -> BeaverAction:
+    return BeaverAction(
+        eps=None,  # type: ignore
+        eps_id=UID(),
+        delta=None,  # type: ignore
+        delta_id=UID(),
+        address=client.address,
+    )
+
+
+def test_batched_sends_one_batch_per_party() -> None:
+    client = RecordingClient()
+    actions = [beaver_action(client), beaver_action(client)]
+    with BeaverAction.batched():
+        for action in actions:
+            BeaverAction.send(client, action)
+        assert client.sent == []
+
+    assert len(client.sent) == 1
+    assert isinstance(client.sent[0], BeaverBatchAction)
+    assert client.sent[0].actions == actions
+
+    # outside of a batch the actions are sent right away
+    BeaverAction.send(client, actions[0])
+    assert client.sent[1] is actions[0]
+
+
+def test_batched_sends_nothing_when_the_block_raises() -> None:
+    client = RecordingClient()
+    with pytest.raises(ValueError):
+        with BeaverAction.batched():
+            BeaverAction.send(client, beaver_action(client))
+            raise ValueError("the round failed")
+
+    assert client.sent == []
+    BeaverAction.send(client, beaver_action(client))
+    assert len(client.sent) == 1
@@ -0,0 +1,47 @@
+# stdlib
+import threading
+from types import SimpleNamespace
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.node.common.action.greenlets_switch import retrieve_objects
+from syft.core.store.store_memory import MemoryStore
+from syft.core.store.storeable_object import StorableObject
+
+# the objects are set from another thread, which the in memory sqlite database of
+# the stores of the test nodes doesn't allow, so these nodes only have a MemoryStore
+
+
+def set_later(store: MemoryStore, key: UID, value: int) -> threading.Timer:
+    timer = threading.Timer(
+        0.1,
+        store.__setitem__,
+        args=(key, StorableObject(id=key, data=sy.lib.python.Int(value))),
+    )
+    timer.start()
+    return timer
+
+
+def test_retrieve_objects_waits_for_missing_objects() -> None:
+    node = SimpleNamespace(store=MemoryStore())
+    present, first, second = UID(), UID(), UID()
+    node.store[present] = StorableObject(id=present, data=sy.lib.python.Int(0))
+    timers = [set_later(node.store, first, 1), set_later(node.store, second, 2)]
+
+    store_objs = retrieve_objects(
+        node, [present, first, second], "test", timeout=10  # type: ignore
+    )
+
+    assert [store_obj.data for store_obj in store_objs] == [0, 1, 2]
+    for timer in timers:
+        timer.join()
+
+
+def test_retrieve_objects_timeout() -> None:
+    node = SimpleNamespace(store=MemoryStore())
+    with pytest.raises(TimeoutError):
+        retrieve_objects(node, [UID()], "test", timeout=0.1)  # type: ignore
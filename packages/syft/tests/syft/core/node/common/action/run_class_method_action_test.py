@@ -0,0 +1,95 @@
+# stdlib
+from typing import Any
+from typing import List
+
+# third party
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.node.common.action.pure_methods import is_pure_method
+from syft.core.node.common.action.run_class_method_action import RunClassMethodAction
+
+
+@pytest.fixture
+def serialized_tensors(monkeypatch: pytest.MonkeyPatch) -> List[Any]:
+    """Records the tensors passed to sy.serialize"""
+    tensors: List[Any] = []
+    serialize = sy.serialize
+
+    def recording_serialize(obj: Any, *args: Any, **kwargs: Any) -> Any:
+        if isinstance(obj, th.Tensor):
+            tensors.append(obj)
+        return serialize(obj, *args, **kwargs)
+
+    monkeypatch.setattr(sy, "serialize", recording_serialize)
+    return tensors
+
+
+def run_method(
+    node: sy.VirtualMachine, client: sy.VirtualMachineClient, path: str, ptr: Any
+) -> UID:
+    action = RunClassMethodAction(
+        path=path,
+        _self=ptr,
+        args=[],
+        kwargs={},
+        id_at_location=UID(),
+        address=client.address,
+    )
+    action.execute_action(node=node, verify_key=client.verify_key)
+    return action.id_at_location
+
+
+def test_is_pure_method() -> None:
+    assert is_pure_method("torch.Tensor.sum", th.tensor([1, 2]))
+    assert not is_pure_method("torch.Tensor.add_", th.tensor([1, 2]))
+    # subclasses may override the method
+    assert not is_pure_method("torch.Tensor.sum", th.nn.Parameter(th.tensor([1.0])))
+
+
+def test_pure_method_skips_snapshot(
+    node: sy.VirtualMachine,
+    root_client: sy.VirtualMachineClient,
+    serialized_tensors: List[Any],
+) -> None:
+    ptr = th.tensor([1, 2, 3]).send(root_client)
+    serialized_tensors.clear()
+
+    result_id = run_method(node, root_client, "torch.Tensor.sum", ptr)
+
+    assert serialized_tensors == []
+    assert node.store[result_id].data == 6
+
+
+def test_impure_methods(
+    node: sy.VirtualMachine,
+    root_client: sy.VirtualMachineClient,
+    serialized_tensors: List[Any],
+) -> None:
+    ptr = th.tensor([1, 2, 3]).send(root_client)
+    serialized_tensors.clear()
+
+    # in-place methods are known to mutate self
+    run_method(node, root_client, "torch.Tensor.abs_", ptr)
+    assert serialized_tensors == []
+    # unknown methods are serialized before and after the call
+    run_method(node, root_client, "torch.Tensor.unique", ptr)
+    assert len(serialized_tensors) == 2
+
+
+def test_no_snapshot_without_write_permissions(
+    node: sy.VirtualMachine,
+    root_client: sy.VirtualMachineClient,
+    client: sy.VirtualMachineClient,
+    serialized_tensors: List[Any],
+) -> None:
+    ptr = th.tensor([1, 2, 3]).send(root_client)
+    guest_ptr = client.store[ptr.id_at_location]
+    serialized_tensors.clear()
+
+    run_method(node, client, "torch.Tensor.unique", guest_ptr)
+
+    assert serialized_tensors == []
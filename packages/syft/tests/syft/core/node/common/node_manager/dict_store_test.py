@@ -0,0 +1,205 @@
+# stdlib
+from typing import Any
+from typing import List
+
+# third party
+from nacl.signing import SigningKey
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+# syft absolute
+import syft as sy
+from syft.core.common.group import VERIFYALL
+from syft.core.common.uid import UID
+from syft.core.node.common.action.garbage_collect_batched_action import (
+    GarbageCollectBatchedAction,
+)
+from syft.core.node.common.node_table.bin_obj_metadata import ObjectMetadata
+from syft.core.store import storeable_object_metadata
+from syft.core.store.storeable_object import StorableObject
+
+
+def make_objects(n: int) -> dict:
+    verify_key = SigningKey.generate().verify_key
+    items = {}
+    for i in range(n):
+        id = UID()
+        items[id] = StorableObject(
+            id=id,
+            data=sy.lib.python.Int(i),
+            tags=[f"tag{i}"],
+            description=f"object {i}",
+            read_permissions={verify_key: None},
+        )
+    return items
+
+
+def test_set_many_get_many(node: sy.VirtualMachine) -> None:
+    items = make_objects(5)
+    node.store.set_many(items)
+
+    missing = UID()
+    keys = list(items.keys())
+    objs = node.store.get_many([keys[3], missing, keys[0], keys[3]])
+
+    assert objs[1] is None
+    for key, obj in zip([keys[3], keys[0], keys[3]], [objs[0], objs[2], objs[3]]):
+        assert obj.id == key
+        assert obj.data == items[key].data
+        assert obj.tags == items[key].tags
+        assert obj.description == items[key].description
+        assert obj.read_permissions == items[key].read_permissions
+
+    # every object is a new copy even with the same key
+    assert objs[0] is not objs[3]
+    assert objs[0].read_permissions is not objs[3].read_permissions
+    assert len(node.store.values()) == 5
+
+
+def test_set_many_updates_existing(node: sy.VirtualMachine) -> None:
+    items = make_objects(3)
+    node.store.set_many(items)
+
+    key = list(items.keys())[1]
+    items[key].description = "updated"
+    node.store.set_many({key: items[key]})
+
+    assert node.store[key].description == "updated"
+    assert len(node.store.values()) == 3
+
+
+def test_delete_many(node: sy.VirtualMachine) -> None:
+    items = make_objects(4)
+    node.store.set_many(items)
+
+    keys = list(items.keys())
+    node.store.delete_many(keys[:3])
+
+    objs = node.store.get_many(keys)
+    assert objs[:3] == [None, None, None]
+    assert objs[3].id == keys[3]
+    assert len(node.store) == 1
+
+
+def test_garbage_collect_batched_action(
+    node: sy.VirtualMachine, root_client: sy.VirtualMachineClient
+) -> None:
+    ptrs = [sy.lib.python.Int(i).send(root_client) for i in range(3)]
+    ids = [ptr.id_at_location for ptr in ptrs]
+    assert all(obj is not None for obj in node.store.get_many(ids))
+
+    GarbageCollectBatchedAction(
+        ids_at_location=ids, address=root_client.address
+    ).execute_action(node=node, verify_key=root_client.verify_key)
+
+    assert node.store.get_many(ids) == [None, None, None]
+
+
+def test_get_objects_metadata(node: sy.VirtualMachine) -> None:
+    items = make_objects(3)
+    node.store.set_many(items)
+    keys = list(items.keys())
+
+    metadata = {obj.id: obj for obj in node.store.get_objects_metadata()}
+    assert metadata.keys() == set(keys)
+    for key in keys:
+        assert metadata[key].object_type == items[key].object_type
+        assert metadata[key].tags == items[key].tags
+        assert metadata[key].description == items[key].description
+        assert metadata[key].read_permissions == items[key].read_permissions
+        assert metadata[key].pointer_path == "syft.lib.python.Int"
+        assert not metadata[key].own_pointer
+
+    (obj,) = node.store.get_objects_metadata(keys=[keys[1]])
+    assert obj.id == keys[1]
+    assert node.store.get_objects_metadata(keys=[UID()]) == []
+
+
+def test_pointer_path_is_looked_up_once_per_type(
+    node: sy.VirtualMachine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    query = sy.lib_ast.query
+    queried: List[str] = []
+
+    def recording_query(path: Any, *args: Any, **kwargs: Any) -> Any:
+        queried.append(path)
+        return query(path, *args, **kwargs)
+
+    monkeypatch.setattr(storeable_object_metadata, "_POINTER_PATHS", {})
+    monkeypatch.setattr(sy.lib_ast, "query", recording_query)
+    node.store.set_many(make_objects(3))
+    assert queried.count("syft.lib.python.Int") == 1
+
+
+def test_get_objects_metadata_fills_outdated_rows(node: sy.VirtualMachine) -> None:
+    items = make_objects(2)
+    node.store.set_many(items)
+
+    # rows written before the object_type and pointer columns were added
+    local_session = sessionmaker(bind=node.store.db)()
+    local_session.query(ObjectMetadata).update(
+        {"object_type": None, "pointer_path": None}
+    )
+    local_session.commit()
+    local_session.close()
+
+    metadata = node.store.get_objects_metadata()
+    assert {obj.id for obj in metadata} == set(items.keys())
+    assert all(obj.pointer_path == "syft.lib.python.Int" for obj in metadata)
+
+    local_session = sessionmaker(bind=node.store.db)()
+    assert local_session.query(ObjectMetadata).filter_by(object_type=None).count() == 0
+    local_session.close()
+
+
+def test_search_objects_metadata(node: sy.VirtualMachine) -> None:
+    items = make_objects(5)
+    keys = list(items.keys())
+    verify_key = SigningKey.generate().verify_key
+    items[keys[1]].search_permissions = {verify_key: None}
+    items[keys[3]].search_permissions = {VERIFYALL: None}
+    node.store.set_many(items)
+
+    found, _ = node.store.search_objects_metadata(verify_key=verify_key)
+    assert sorted(str(obj.id) for obj in found) == sorted(str(keys[i]) for i in (1, 3))
+    found, _ = node.store.search_objects_metadata(verify_key=verify_key, tags=["tag3"])
+    assert [obj.id for obj in found] == [keys[3]]
+
+    # the root user can search everything, one page at a time
+    pages = []
+    cursor = None
+    while True:
+        found, cursor = node.store.search_objects_metadata(cursor=cursor, limit=2)
+        pages.append([obj.id for obj in found])
+        if cursor is None:
+            break
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert {key for page in pages for key in page} == set(keys)
+
+    # the index follows deletes
+    node.store.delete(keys[3])
+    found, _ = node.store.search_objects_metadata(verify_key=verify_key)
+    assert [obj.id for obj in found] == [keys[1]]
+
+
+def test_search_objects_metadata_pages_by_tag(node: sy.VirtualMachine) -> None:
+    items = make_objects(6)
+    keys = list(items.keys())
+    for key in keys[3:]:
+        items[key].tags = ["late", "match"]
+    node.store.set_many(items)
+
+    # the tags are filtered before the page is cut so the first page is full
+    found, cursor = node.store.search_objects_metadata(tags=["match"], limit=2)
+    assert [obj.id for obj in found] == keys[3:5]
+    found, cursor = node.store.search_objects_metadata(
+        tags=["match", "late"], limit=2, cursor=cursor
+    )
+    assert [obj.id for obj in found] == keys[5:]
+    assert cursor is None
+
+    # the index follows updates of the tags
+    items[keys[0]].tags = ["match"]
+    node.store.set_many({keys[0]: items[keys[0]]})
+    found, _ = node.store.search_objects_metadata(tags=["match"])
+    assert [obj.id for obj in found] == [keys[0]] + keys[3:]
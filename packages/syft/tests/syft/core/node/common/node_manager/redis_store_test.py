@@ -0,0 +1,52 @@
+# stdlib
+from typing import Any
+from typing import List
+from typing import Optional
+
+# third party
+import pytest
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.node.common.node_manager.redis_store import RedisKeyWatch
+from syft.core.node.common.node_manager.redis_store import RedisStore
+
+
+class SilentPubSub:
+    """A subscription redis never confirms"""
+
+    def __init__(self) -> None:
+        self.channels: List[str] = []
+        self.closed = False
+
+    def subscribe(self, *channels: str) -> None:
+        self.channels += channels
+
+    def get_message(self, timeout: Optional[float] = None, **kwargs: Any) -> None:
+        return None
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class SilentRedis:
+    def __init__(self) -> None:
+        self.pubsub_ = SilentPubSub()
+
+    def pubsub(self) -> SilentPubSub:
+        return self.pubsub_
+
+
+def test_watch_polls_when_subscriptions_are_not_confirmed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(RedisKeyWatch, "subscribe_timeout", 0.05)
+    monkeypatch.setattr(RedisKeyWatch, "max_wait", 0.01)
+    store = RedisStore(db=None)  # type: ignore
+    store.redis = SilentRedis()  # type: ignore
+
+    with store.watch(keys=[UID(), UID()]) as key_watch:
+        assert not isinstance(key_watch, RedisKeyWatch)
+        assert key_watch.poll_interval == 0.01
+        assert key_watch.wait(timeout=1)
+    assert store.redis.pubsub_.closed  # type: ignore
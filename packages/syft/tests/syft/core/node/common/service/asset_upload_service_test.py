@@ -0,0 +1,172 @@
+# stdlib
+import hashlib
+from typing import Any
+from typing import List
+
+# third party
+from nacl.encoding import HexEncoder
+from nacl.signing import SigningKey
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.adp.entity import Entity
+from syft.core.node.common.client import Client
+from syft.core.node.common.client_manager.dataset_api import DatasetRequestAPI
+from syft.core.node.common.node_manager.asset_upload_manager import AssetUpload
+from syft.core.node.common.node_manager.asset_upload_manager import (
+    AssetUploadManager,
+)
+from syft.core.node.common.node_service.dataset_manager.asset_upload_messages import (
+    AssetChunkMessageWithReply,
+)
+from syft.core.node.common.node_service.dataset_manager.asset_upload_messages import (
+    FinishAssetUploadMessageWithReply,
+)
+from syft.core.node.common.node_service.dataset_manager.asset_upload_messages import (
+    StartAssetUploadMessageWithReply,
+)
+from syft.core.tensor.tensor import Tensor
+
+
+@pytest.fixture
+def owner(domain: sy.Domain) -> Client:
+    def encode_key(key: Any) -> str:
+        return key.encode(encoder=HexEncoder).decode("utf-8")
+
+    key = SigningKey.generate()
+    domain.users.signup(
+        name="Owner",
+        email=f"{encode_key(key.verify_key)[:16]}@openmined.org",
+        password="changethis",
+        budget=0,
+        role=domain.roles.owner_role.id,
+        private_key=encode_key(key),
+        verify_key=encode_key(key.verify_key),
+    )
+    return domain.get_client(signing_key=key)
+
+
+def private(data: np.ndarray) -> Tensor:
+    entities = [Entity(name=f"entity{i}") for i in range(data.shape[0])]
+    return Tensor(data).private(min_val=0, max_val=100, entities=entities)
+
+
+def test_upload_assets_in_chunks(domain: sy.Domain, owner: Client) -> None:
+    x = np.random.randint(0, 100, size=(4, 5), dtype=np.int32)
+    y = np.random.randint(0, 100, size=(3, 2), dtype=np.int32)
+
+    api = DatasetRequestAPI(owner)
+    dataset_id = api.upload(
+        assets={"x": private(x), "y": private(y)},
+        metadata={"name": "chunked", "description": "uploaded in chunks"},
+        chunk_size=256,
+    )
+
+    dataset = [d for d in api.all() if d["id"] == dataset_id][0]
+    assert dataset["name"] == "chunked"
+    ids = {asset["name"]: asset["id"] for asset in dataset["data"]}
+    assert ids.keys() == {"x", "y"}
+    assert (owner.store[ids["x"]].get().child.child[0].child == x[0]).all()
+    assert len(domain.asset_uploads) == 0
+
+
+def test_upload_resumes_after_lost_reply(
+    owner: Client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    x = np.random.randint(0, 100, size=(4, 5), dtype=np.int32)
+    send = owner.send_immediate_msg_with_reply
+    failed: List[int] = []
+
+    def lose_a_reply(msg: Any) -> Any:
+        reply = send(msg=msg)
+        # the domain received the chunk but the uploader never hears back
+        payload = getattr(getattr(msg, "message", msg), "payload", None)
+        if isinstance(payload, AssetChunkMessageWithReply) and not failed:
+            failed.append(1)
+            raise ConnectionError("reply lost")
+        return reply
+
+    monkeypatch.setattr(owner, "send_immediate_msg_with_reply", lose_a_reply)
+    api = DatasetRequestAPI(owner)
+    dataset_id = api.upload(
+        assets={"x": private(x)},
+        metadata={"name": "resumed", "description": "resumed"},
+        chunk_size=128,
+    )
+
+    assert failed == [1]
+    dataset = [d for d in api.all() if d["id"] == dataset_id][0]
+    asset_id = dataset["data"][0]["id"]
+    assert (owner.store[asset_id].get().child.child[3].child == x[3]).all()
+
+
+def test_asset_upload_skips_repeated_chunks() -> None:
+    upload = AssetUpload(
+        upload_id="upload", dataset_id="dataset", name="x", size=6, verify_key=None  # type: ignore
+    )
+    assert upload.write(offset=0, data=b"abc") == 3
+    # a chunk sent again is skipped and one past the offset is refused
+    assert upload.write(offset=0, data=b"abc") == 3
+    assert upload.write(offset=4, data=b"ef") == 3
+    assert upload.write(offset=2, data=b"cde") == 5
+    assert not upload.complete
+    assert upload.write(offset=5, data=b"f") == 6
+    assert upload.complete
+    with upload.mapped() as data:
+        assert data.tobytes() == b"abcdef"
+
+
+def test_dataset_is_registered_when_its_asset_is_stored(owner: Client) -> None:
+    x = np.random.randint(0, 100, size=(4, 5), dtype=np.int32)
+    blob = sy.serialize(private(x), to_bytes=True)
+    api = DatasetRequestAPI(owner)
+    datasets = len(api.all())
+
+    reply = api._upload_request(
+        StartAssetUploadMessageWithReply,
+        name="x",
+        size=len(blob),
+        metadata={"name": "pending", "description": "not stored yet"},
+    )
+    assert reply["dataset_id"] is None
+    api._upload_chunks(
+        upload_id=reply["upload_id"], blob=blob, chunk_size=256, max_retries=0
+    )
+    # an upload which is abandoned now doesn't leave an empty dataset behind
+    assert len(api.all()) == datasets
+
+    dataset_id = api._upload_request(
+        FinishAssetUploadMessageWithReply,
+        upload_id=reply["upload_id"],
+        sha256=hashlib.sha256(blob).hexdigest(),
+    )["dataset_id"]
+    dataset = [d for d in api.all() if d["id"] == dataset_id][0]
+    assert dataset["name"] == "pending"
+    assert [asset["name"] for asset in dataset["data"]] == ["x"]
+
+
+def test_asset_size_is_bounded() -> None:
+    manager = AssetUploadManager(max_size=10)
+    for size in [0, -1, 11]:
+        with pytest.raises(ValueError, match="size must be between"):
+            manager.start(
+                dataset_id=None, name="x", size=size, verify_key=None  # type: ignore
+            )
+    assert len(manager) == 0
+
+
+def test_uploads_per_user_are_capped() -> None:
+    manager = AssetUploadManager(max_per_user=2)
+    user = SigningKey.generate().verify_key
+    for _ in range(2):
+        manager.start(dataset_id="dataset", name="x", size=1, verify_key=user)
+    with pytest.raises(ValueError, match="uploads are already in progress"):
+        manager.start(dataset_id="dataset", name="x", size=1, verify_key=user)
+
+    # the uploads of other users don't count
+    other = SigningKey.generate().verify_key
+    manager.start(dataset_id="dataset", name="x", size=1, verify_key=other)
+    assert len(manager) == 3
+    manager.clear()
@@ -0,0 +1,164 @@
+# stdlib
+from types import SimpleNamespace
+from typing import Any
+from typing import List
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.common.uid import UID
+from syft.core.io.address import Address
+from syft.core.io.location import SpecificLocation
+from syft.core.node.common.node_service.msg_forwarding.msg_forwarding_service import (
+    forward_message,
+)
+from syft.core.node.common.node_service.msg_forwarding.msg_forwarding_service import (
+    route_message,
+)
+from syft.core.node.common.node_service.msg_forwarding.routing_table import RoutingTable
+
+
+class PeerClient:
+    def __init__(self) -> None:
+        self.sent: List[Any] = []
+
+    def send_immediate_msg_without_reply(self, msg: Any) -> None:
+        self.sent.append(msg)
+
+    def send_immediate_msg_with_reply(self, msg: Any) -> Any:
+        self.sent.append(msg)
+        return msg
+
+
+class OfflineClient:
+    def __init__(self, error: Exception = ConnectionRefusedError("offline")) -> None:
+        self.error = error
+
+    def send_immediate_msg_without_reply(self, msg: Any) -> None:
+        raise self.error
+
+    def send_immediate_msg_with_reply(self, msg: Any) -> Any:
+        raise self.error
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_routing_table_remembers_misses_for_a_while() -> None:
+    clock = Clock()
+    table = RoutingTable(miss_ttl=5, clock=clock)
+    node_id = UID()
+
+    assert table.lookup(node_id) == (False, None)
+    table.add(node_id, None)
+    assert table.lookup(node_id) == (True, None)
+    clock.now += 6
+    assert table.lookup(node_id) == (False, None)
+
+    client = PeerClient()
+    table.add(node_id, client)
+    assert table.lookup(node_id) == (True, client)
+    table.invalidate(node_id)
+    assert node_id not in table
+
+
+def test_routing_table_expires_routes() -> None:
+    clock = Clock()
+    table = RoutingTable(ttl=60, clock=clock)
+    node_id = UID()
+    client = PeerClient()
+
+    table.add(node_id, client)
+    clock.now += 59
+    assert table.lookup(node_id) == (True, client)
+    clock.now += 2
+    assert table.lookup(node_id) == (False, None)
+    assert node_id not in table
+
+
+def test_forwarding_uses_the_routing_table(
+    node: sy.VirtualMachine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    peer_id = UID()
+    peer = PeerClient()
+    node.peer_route_clients[peer_id] = {"vpn": {}, "public": {"peer": peer}}
+    addr = Address(domain=SpecificLocation(id=peer_id))
+
+    route_message(node=node, addr=addr, method="send_immediate_msg_without_reply")(
+        msg="first"
+    )
+    assert peer_id in node.routing_table
+
+    # known routes to peers aren't looked up again
+    def fail(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("the route was looked up again")
+
+    monkeypatch.setattr(node, "get_peer_client", fail)
+    route_message(node=node, addr=addr, method="send_immediate_msg_without_reply")(
+        msg="second"
+    )
+    assert peer.sent == ["first", "second"]
+
+
+def test_forwarding_to_unknown_address_raises(node: sy.VirtualMachine) -> None:
+    addr = Address(domain=SpecificLocation(id=UID()))
+    with pytest.raises(Exception, match="Address unknown"):
+        route_message(node=node, addr=addr, method="send_immediate_msg_with_reply")
+    assert node.routing_table.lookup(addr.domain_id) == (True, None)
+
+
+def test_failed_connection_drops_the_route_and_retries_once(
+    node: sy.VirtualMachine,
+) -> None:
+    peer_id = UID()
+    node.routing_table.add(peer_id, OfflineClient())
+    peer = PeerClient()
+    node.peer_route_clients[peer_id] = {"vpn": {}, "public": {"peer": peer}}
+    msg = SimpleNamespace(address=Address(domain=SpecificLocation(id=peer_id)))
+
+    assert (
+        forward_message(node=node, msg=msg, method="send_immediate_msg_with_reply")
+        is msg
+    )
+    assert peer.sent == [msg]
+    assert node.routing_table.lookup(peer_id) == (True, peer)
+
+
+@pytest.mark.parametrize(
+    "method,error",
+    [
+        # the message may already have been delivered
+        ("send_immediate_msg_with_reply", ConnectionResetError("reset")),
+        # messages without reply are never sent twice
+        ("send_immediate_msg_without_reply", ConnectionRefusedError("offline")),
+    ],
+)
+def test_failed_send_drops_the_route_without_retrying(
+    node: sy.VirtualMachine, method: str, error: Exception
+) -> None:
+    peer_id = UID()
+    node.routing_table.add(peer_id, OfflineClient(error=error))
+    peer = PeerClient()
+    node.peer_route_clients[peer_id] = {"vpn": {}, "public": {"peer": peer}}
+    msg = SimpleNamespace(address=Address(domain=SpecificLocation(id=peer_id)))
+
+    with pytest.raises(type(error)):
+        forward_message(node=node, msg=msg, method=method)
+    assert peer.sent == []
+    assert peer_id not in node.routing_table
+
+
+def test_failed_send_over_a_new_route_raises(node: sy.VirtualMachine) -> None:
+    peer_id = UID()
+    node.peer_route_clients[peer_id] = {"vpn": {}, "public": {"peer": OfflineClient()}}
+    msg = SimpleNamespace(address=Address(domain=SpecificLocation(id=peer_id)))
+
+    with pytest.raises(ConnectionError):
+        forward_message(node=node, msg=msg, method="send_immediate_msg_without_reply")
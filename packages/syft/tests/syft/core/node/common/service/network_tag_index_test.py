@@ -0,0 +1,123 @@
+# stdlib
+import threading
+import time
+from typing import Generator
+from typing import List
+
+# third party
+import pytest
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.node.common.node_service.network_search.tag_index import NetworkTagIndex
+from syft.core.node.common.node_service.network_search.tag_index import TagSets
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture
+def index(clock: Clock) -> Generator[NetworkTagIndex, None, None]:
+    index = NetworkTagIndex(ttl=10, timeout=5, clock=clock)
+    yield index
+    index.shutdown(wait=False)
+
+
+def test_search_matches_every_tag(index: NetworkTagIndex) -> None:
+    hospital, clinic = UID(), UID()
+    index.update(hospital, [["mnist", "train"], ["mnist", "test"]])
+    index.update(clinic, [["mnist"], ["xray", "train"]])
+
+    assert index.search(["mnist"]) == {hospital, clinic}
+    assert index.search(["mnist", "train"]) == {hospital}
+    assert index.search(["train"]) == {hospital, clinic}
+    assert index.search(["cifar"]) == set()
+
+
+def test_refresh_only_fetches_stale_peers(index: NetworkTagIndex, clock: Clock) -> None:
+    peer = UID()
+    calls: List[int] = []
+
+    def fetch() -> TagSets:
+        calls.append(1)
+        return [frozenset(["mnist"])]
+
+    index.refresh({peer: fetch})
+    index.refresh({peer: fetch})
+    assert len(calls) == 1
+    assert index.search(["mnist"]) == {peer}
+
+    clock.now += 11
+    assert index.is_stale(peer)
+    index.refresh({peer: fetch})
+    assert len(calls) == 2
+
+
+def test_refresh_is_concurrent_and_bounded(index: NetworkTagIndex) -> None:
+    fast, slow = UID(), UID()
+    gate = threading.Event()
+
+    def fetch_slow() -> TagSets:
+        assert gate.wait(timeout=10)
+        return [frozenset(["mnist"])]
+
+    start = time.time()
+    index.refresh({fast: lambda: [frozenset(["mnist"])], slow: fetch_slow}, timeout=0.2)
+    assert time.time() - start < 2
+
+    # the slow peer is left out of this search and picked up by a later one
+    assert index.search(["mnist"]) == {fast}
+    gate.set()
+    index.refresh({slow: fetch_slow})
+    assert index.search(["mnist"]) == {fast, slow}
+
+
+def test_failed_refresh_keeps_previous_entry(
+    index: NetworkTagIndex, clock: Clock
+) -> None:
+    peer = UID()
+    index.update(peer, [["mnist"]])
+    clock.now += 11
+
+    def fail() -> TagSets:
+        raise ConnectionError("offline")
+
+    index.refresh({peer: fail})
+    assert index.search(["mnist"]) == {peer}
+
+
+def test_peers_which_are_gone_are_removed(index: NetworkTagIndex) -> None:
+    kept, gone = UID(), UID()
+    index.update(kept, [["mnist"]])
+    index.update(gone, [["mnist"]])
+
+    assert index.search(["mnist"], node_ids=[kept]) == {kept}
+    index.refresh({kept: lambda: [frozenset(["mnist"])]})
+    assert index.search(["mnist"]) == {kept}
+
+
+def test_removed_peer_is_not_added_back_by_its_refresh(
+    index: NetworkTagIndex,
+) -> None:
+    peer = UID()
+    gate = threading.Event()
+
+    def fetch() -> TagSets:
+        assert gate.wait(timeout=10)
+        return [frozenset(["mnist"])]
+
+    index.refresh({peer: fetch}, timeout=0.1)
+    index.remove(peer)
+    gate.set()
+    index.shutdown()
+    assert index.search(["mnist"]) == set()
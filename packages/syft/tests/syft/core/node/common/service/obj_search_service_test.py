@@ -0,0 +1,111 @@
+# third party
+import numpy as np
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.adp.entity import Entity
+from syft.core.node.common.node_manager.dict_store import DictStore
+from syft.core.tensor.autodp.single_entity_phi import (
+    TensorWrappedSingleEntityPhiTensorPointer,
+)
+from syft.core.tensor.tensor import Tensor
+
+
+def test_search_only_fetches_data_of_own_pointers(
+    node: sy.VirtualMachine,
+    root_client: sy.VirtualMachineClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    data = np.random.randint(low=0, high=10, size=(2, 3), dtype=np.int32)
+    tensor = Tensor(data).private(min_val=0, max_val=10, entities=Entity(name="Bob"))
+    tensor_ptr = tensor.send(root_client, tags=["private"])
+    list_ptr = sy.lib.python.List([1, 2, 3]).send(root_client, tags=["list"])
+    torch_ptr = th.tensor([1, 2, 3]).send(root_client, tags=["torch"])
+
+    fetched = []
+    copy_from_store = DictStore._copy_from_store
+
+    def record(self: DictStore, key_uid: sy.UID, key_str: str) -> object:
+        fetched.append(key_uid)
+        return copy_from_store(self, key_uid=key_uid, key_str=key_str)
+
+    monkeypatch.setattr(DictStore, "_copy_from_store", record)
+    results = {ptr.id_at_location: ptr for ptr in root_client.store}
+
+    # only the private tensor makes its pointer from its data
+    assert fetched == [tensor_ptr.id_at_location]
+    assert results.keys() == {
+        tensor_ptr.id_at_location,
+        list_ptr.id_at_location,
+        torch_ptr.id_at_location,
+    }
+    private = results[tensor_ptr.id_at_location]
+    assert isinstance(private, TensorWrappedSingleEntityPhiTensorPointer)
+    assert private.tags == ["private"]
+    assert (private.max_vals == tensor.child.max_vals).all()
+    assert type(results[list_ptr.id_at_location]).__name__ == "ListPointer"
+    assert results[list_ptr.id_at_location].tags == ["list"]
+    assert type(results[torch_ptr.id_at_location]).__name__ == "TensorPointer"
+    assert results[torch_ptr.id_at_location].object_type == str(th.Tensor)
+
+
+def test_search_by_id(root_client: sy.VirtualMachineClient) -> None:
+    ptr = sy.lib.python.List([1, 2, 3]).send(root_client, description="numbers")
+
+    obj = root_client.store[ptr.id_at_location]
+    assert obj.id_at_location == ptr.id_at_location
+    assert obj.description == "numbers"
+    assert obj.get() == [1, 2, 3]
+
+
+def test_search_permissions(
+    client: sy.VirtualMachineClient, root_client: sy.VirtualMachineClient
+) -> None:
+    hidden = sy.lib.python.List([1]).send(root_client, pointable=False)
+    visible = sy.lib.python.List([2]).send(root_client, pointable=True)
+
+    assert {ptr.id_at_location for ptr in client.store} == {visible.id_at_location}
+    assert {ptr.id_at_location for ptr in root_client.store} == {
+        hidden.id_at_location,
+        visible.id_at_location,
+    }
+
+
+def test_search_pages(client: sy.VirtualMachineClient) -> None:
+    ptrs = [sy.lib.python.Int(i).send(client, tags=[f"{i}"]) for i in range(5)]
+    ids = [ptr.id_at_location for ptr in ptrs]
+
+    results, cursor = client.store._search(limit=2)
+    assert [ptr.id_at_location for ptr in results] == ids[:2]
+    results, cursor = client.store._search(limit=2, cursor=cursor)
+    assert [ptr.id_at_location for ptr in results] == ids[2:4]
+    results, cursor = client.store._search(limit=2, cursor=cursor)
+    assert [ptr.id_at_location for ptr in results] == ids[4:]
+    assert cursor is None
+
+    assert [ptr.id_at_location for ptr in client.store.search(page_size=2)] == ids
+    assert len(client.store) == 5
+
+
+def test_search_filters(client: sy.VirtualMachineClient) -> None:
+    sy.lib.python.Int(1).send(client, tags=["a", "b"])
+    sy.lib.python.Int(2).send(client, tags=["a"])
+    sy.lib.python.List([3]).send(client, tags=["b"])
+
+    assert sorted(
+        ptr.get(delete_obj=False) for ptr in client.store.search(tags=["a"])
+    ) == [1, 2]
+    assert [
+        ptr.get(delete_obj=False) for ptr in client.store.search(tags=["a", "b"])
+    ] == [1]
+    assert [ptr.get(delete_obj=False) for ptr in client.store.search(tags=["c"])] == []
+
+    lists = list(client.store.search(object_type=str(sy.lib.python.List)))
+    assert [ptr.get(delete_obj=False) for ptr in lists] == [[3]]
+    # getting by tag needs a single match
+    sy.lib.python.Int(4).send(client, tags=["unique"])
+    assert client.store["unique"].get(delete_obj=False) == 4
+    with pytest.raises(KeyError):
+        client.store["a"]
@@ -0,0 +1,173 @@
+# stdlib
+from pathlib import Path
+
+# third party
+import numpy as np
+import pytest
+import torch as th
+
+# syft absolute
+import syft as sy
+from syft.core.node.common.node_manager.object_download_manager import (
+    MAX_DOWNLOAD_CHUNK_SIZE,
+)
+from syft.core.node.common.node_manager.object_download_manager import (
+    MIN_DOWNLOAD_CHUNK_SIZE,
+)
+from syft.core.node.common.node_manager.object_download_manager import NUMPY_FORMAT
+from syft.core.node.common.node_manager.object_download_manager import (
+    ObjectDownload,
+)
+from syft.core.node.common.node_manager.object_download_manager import SYFT_FORMAT
+from syft.core.node.common.node_manager.object_download_manager import (
+    check_chunk_size,
+)
+
+
+def test_get_streamed_array(
+    node: sy.VirtualMachine, client: sy.VirtualMachineClient
+) -> None:
+    x = np.arange(1000, dtype=np.float32).reshape(10, 100)
+    ptr = x.send(client)
+
+    result = ptr.get_copy(stream=True)
+    assert (result == x).all()
+    assert result.dtype == x.dtype
+    assert len(node.store) == 1
+
+    result = ptr.get(stream=True, chunk_size=1500)
+    assert (result == x).all()
+    assert len(node.store) == 0
+    assert len(node.object_downloads) == 0
+
+
+def test_get_streamed_array_into_memmap(
+    client: sy.VirtualMachineClient, tmp_path: Path
+) -> None:
+    x = np.random.randint(0, 100, size=(64, 8), dtype=np.int64)
+    out = str(tmp_path / "x.npy")
+
+    result = x.send(client).get(stream=True, chunk_size=1500, out=out)
+    assert isinstance(result, np.memmap)
+    assert (np.load(out) == x).all()
+
+
+def test_get_streamed_object(client: sy.VirtualMachineClient) -> None:
+    x = th.arange(1000)
+    assert (x.send(client).get(stream=True, chunk_size=1024) == x).all()
+
+
+def test_iter_chunks(client: sy.VirtualMachineClient) -> None:
+    x = np.arange(1000, dtype=np.int32)
+    chunks = list(x.send(client).iter_chunks(chunk_size=1024))
+    assert [len(chunk) for chunk in chunks] == [1024] * 3 + [928]
+    assert (np.frombuffer(b"".join(chunks), dtype=np.int32) == x).all()
+
+
+def test_object_download_manifest() -> None:
+    x = np.arange(10, dtype=np.int16)
+    download = ObjectDownload(
+        download_id="download",
+        id_at_location=sy.UID(),
+        data=x,
+        chunk_size=8,
+        verify_key=None,  # type: ignore
+        delete_obj=False,
+    )
+    manifest = download.manifest
+    assert manifest["format"] == NUMPY_FORMAT
+    assert manifest["size"] == 20
+    assert manifest["shape"] == [10]
+    assert len(manifest["hashes"]) == 3
+    assert download.read(offset=16, length=8) == x[8:].tobytes()
+
+    download = ObjectDownload(
+        download_id="download",
+        id_at_location=sy.UID(),
+        data=np.array(["a", 1], dtype=object),
+        chunk_size=8,
+        verify_key=None,  # type: ignore
+        delete_obj=False,
+    )
+    assert download.format == SYFT_FORMAT
+
+
+def test_unknown_download_is_refused(node: sy.VirtualMachine) -> None:
+    with pytest.raises(KeyError):
+        node.object_downloads.get(download_id="missing", verify_key=node.verify_key)
+
+
+def test_closing_iter_chunks_ends_the_download(
+    node: sy.VirtualMachine, client: sy.VirtualMachineClient
+) -> None:
+    x = np.arange(1000, dtype=np.int32)
+    chunks = x.send(client).iter_chunks(chunk_size=1024, delete_obj=True)
+    next(chunks)
+    assert len(node.object_downloads) == 1
+
+    chunks.close()
+    assert len(node.object_downloads) == 0
+    # an aborted download doesn't delete the object
+    assert len(node.store) == 1
+
+
+def test_downloads_per_user_are_capped(
+    node: sy.VirtualMachine,
+    client: sy.VirtualMachineClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(node.object_downloads, "max_per_user", 2)
+    ptr = np.arange(1000, dtype=np.int64).send(client)
+    started = [ptr.iter_chunks(chunk_size=1024) for _ in range(3)]
+
+    next(started[0])
+    next(started[1])
+    # the node only sends back that an exception was raised
+    with pytest.raises(Exception):
+        next(started[2])
+    assert len(node.object_downloads) == 2
+    with pytest.raises(ValueError, match="downloads are already in progress"):
+        node.object_downloads.start(
+            id_at_location=ptr.id_at_location,
+            data=np.arange(10),
+            chunk_size=1024,
+            verify_key=client.verify_key,
+            delete_obj=False,
+        )
+
+    started[0].close()
+    assert len(next(started[2])) == 1024
+    for chunks in started:
+        chunks.close()
+    assert len(node.object_downloads) == 0
+
+
+def test_chunk_size_is_bounded(client: sy.VirtualMachineClient) -> None:
+    assert check_chunk_size(MIN_DOWNLOAD_CHUNK_SIZE) == MIN_DOWNLOAD_CHUNK_SIZE
+    assert check_chunk_size(MAX_DOWNLOAD_CHUNK_SIZE) == MAX_DOWNLOAD_CHUNK_SIZE
+    for chunk_size in [0, -1, MIN_DOWNLOAD_CHUNK_SIZE - 1, MAX_DOWNLOAD_CHUNK_SIZE + 1]:
+        with pytest.raises(ValueError, match="chunk_size must be between"):
+            check_chunk_size(chunk_size)
+
+    ptr = np.arange(10).send(client)
+    with pytest.raises(ValueError, match="chunk_size must be between"):
+        ptr.get(stream=True, chunk_size=8)
+
+
+def test_read_range_is_bounded() -> None:
+    x = np.arange(1000, dtype=np.int32)
+    download = ObjectDownload(
+        download_id="download",
+        id_at_location=sy.UID(),
+        data=x,
+        chunk_size=1024,
+        verify_key=None,  # type: ignore
+        delete_obj=False,
+    )
+    assert download.read(offset=3072, length=1024) == x[768:].tobytes()
+    for length in [0, -1, 1025]:
+        with pytest.raises(ValueError, match="length must be between"):
+            download.read(offset=0, length=length)
+    for offset in [-1, 4001]:
+        with pytest.raises(ValueError, match="offset must be between"):
+            download.read(offset=offset, length=1024)
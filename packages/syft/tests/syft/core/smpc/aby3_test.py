@@ -0,0 +1,71 @@
+# stdlib
+import random
+from typing import Any
+from typing import List
+
+# third party
+import pytest
+
+# syft absolute
+from syft.core.smpc.protocol.aby3.aby3 import ABY3
+from syft.core.smpc.store import CryptoPrimitiveProvider
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.ands = 0
+
+
+class Bit:
+    """A plain bit standing in for the MPCTensor shares of a bit, counting the AND
+    gates computed with it."""
+
+    parties: List[Any] = []
+    parties_info: List[Any] = []
+    shape = (1,)
+
+    def __init__(self, value: int, counter: Counter) -> None:
+        self.value = value
+        self.counter = counter
+
+    def __add__(self, other: "Bit") -> "Bit":
+        return Bit(self.value ^ other.value, self.counter)
+
+    def __mul__(self, other: "Bit") -> "Bit":
+        self.counter.ands += 1
+        return Bit(self.value & other.value, self.counter)
+
+    @property
+    def block(self) -> "Bit":
+        return self
+
+
+@pytest.mark.parametrize("ring_bits", [1, 2, 3, 8, 32])
+def test_parallel_prefix_adder(ring_bits: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    requested: List[int] = []
+
+    def request_primitives(*args: Any, nr_instances: int, **kwargs: Any) -> None:
+        requested.append(nr_instances)
+
+    monkeypatch.setattr(
+        CryptoPrimitiveProvider, "request_primitives", staticmethod(request_primitives)
+    )
+
+    for _ in range(100):
+        x = random.getrandbits(ring_bits)
+        y = random.getrandbits(ring_bits)
+        counter = Counter()
+        a = [Bit((x >> idx) & 1, counter) for idx in range(ring_bits)]
+        b = [Bit((y >> idx) & 1, counter) for idx in range(ring_bits)]
+
+        res = ABY3.parallel_prefix_adder(a, b)  # type: ignore
+        assert sum(bit.value << idx for idx, bit in enumerate(res)) == (x + y) % (
+            1 << ring_bits
+        )
+        # exactly the requested triples are used
+        assert counter.ands == requested[-1]
+
+
+def test_prefix_layers_are_log_depth() -> None:
+    layers = ABY3.prefix_layers(32)
+    assert [distance for distance, _, _ in layers] == [1, 2, 4, 8, 16]
@@ -0,0 +1,33 @@
+# stdlib
+import timeit
+
+# third party
+import pytest
+
+# syft absolute
+from syft.core.smpc.protocol.beaver.beaver import _get_triples
+from syft.grid import GridURL
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("ring_size", [2, 2**32])
+def test_triples_per_second(ring_size: int) -> None:
+    nr_instances = 64
+    parties_info = [GridURL(port=port) for port in (9081, 9082, 9083)]
+
+    start = timeit.default_timer()
+    primitives = _get_triples(
+        "mul",
+        nr_parties=len(parties_info),
+        parties_info=parties_info,
+        a_shape=(100, 100),
+        b_shape=(100, 100),
+        nr_instances=nr_instances,
+        ring_size=ring_size,
+    )
+    end = timeit.default_timer()
+
+    assert len(primitives) == len(parties_info)
+    print(f"\nBeaver triples (100x100) in ring {ring_size}")
+    print("======================")
+    print(f"Generated {nr_instances / (end - start):.1f} triples/sec")
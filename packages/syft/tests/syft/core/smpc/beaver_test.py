@@ -0,0 +1,155 @@
+# stdlib
+from functools import reduce
+from typing import Any
+from typing import List
+
+# third party
+import numpy as np
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.smpc.protocol.beaver.beaver import SeededTriples
+from syft.core.smpc.protocol.beaver.beaver import _get_triples
+from syft.core.smpc.store.crypto_store import CryptoStore
+from syft.core.tensor.smpc.share_tensor import ShareTensor
+from syft.grid import GridURL
+
+PARTIES_INFO = [GridURL(port=port) for port in (9081, 9082, 9083)]
+
+
+def reconstruct(shares: List[Any], ring_size: int) -> np.ndarray:
+    op = ShareTensor.get_op(ring_size, "add")
+    return reduce(op, [share.child for share in shares])
+
+
+def populate(
+    primitives: List[SeededTriples],
+    a_shape: Any,
+    b_shape: Any,
+    ring_size: int,
+    op_str: str = "beaver_mul",
+) -> List[CryptoStore]:
+    stores = []
+    for primitive in primitives:
+        store = CryptoStore()
+        store.populate_store(
+            op_str,
+            primitive,
+            a_shape=a_shape,
+            b_shape=b_shape,
+            ring_size=ring_size,
+        )
+        stores.append(store)
+    return stores
+
+
+@pytest.mark.parametrize("ring_size", [2, 2**32])
+def test_expanded_triples_are_consistent(ring_size: int) -> None:
+    primitives = _get_triples(
+        "mul",
+        nr_parties=3,
+        parties_info=PARTIES_INFO,
+        a_shape=(2, 3),
+        b_shape=(3,),
+        nr_instances=5,
+        ring_size=ring_size,
+    )
+    stores = populate(primitives, (2, 3), (3,), ring_size)
+
+    cmd = ShareTensor.get_op(ring_size, "mul")
+    for _ in range(5):
+        triples = [
+            store.get_primitives_from_store(
+                "beaver_mul", a_shape=(2, 3), b_shape=(3,), ring_size=ring_size
+            )
+            for store in stores
+        ]
+        for rank, triple in enumerate(triples):
+            assert [share.rank for share in triple] == [rank] * 3
+        a, b, c = (
+            reconstruct([triple[idx] for triple in triples], ring_size)
+            for idx in range(3)
+        )
+        assert a.shape == (2, 3)
+        assert b.shape == (3,)
+        assert (cmd(a, b) == c).all()
+
+
+@pytest.mark.parametrize(
+    "a_shape, b_shape",
+    [
+        ((3, 4), (4,)),
+        ((4,), (4, 5)),
+        ((4,), (4,)),
+        ((2, 3, 4), (4,)),
+        ((4,), (2, 4, 5)),
+    ],
+)
+def test_matmul_triples_with_vectors(a_shape: Any, b_shape: Any) -> None:
+    ring_size = 2**32
+    primitives = _get_triples(
+        "matmul",
+        nr_parties=2,
+        parties_info=PARTIES_INFO[:2],
+        a_shape=a_shape,
+        b_shape=b_shape,
+        nr_instances=3,
+        ring_size=ring_size,
+    )
+    c_shape = (np.empty(a_shape) @ np.empty(b_shape)).shape
+    assert primitives[-1].c_share.shape == (3, *c_shape)
+    stores = populate(primitives, a_shape, b_shape, ring_size, "beaver_matmul")
+
+    cmd = ShareTensor.get_op(ring_size, "matmul")
+    for _ in range(3):
+        triples = [
+            store.get_primitives_from_store(
+                "beaver_matmul", a_shape=a_shape, b_shape=b_shape, ring_size=ring_size
+            )
+            for store in stores
+        ]
+        a, b, c = (
+            reconstruct([triple[idx] for triple in triples], ring_size)
+            for idx in range(3)
+        )
+        assert c.shape == c_shape
+        assert (cmd(a, b) == c).all()
+
+
+def test_only_the_last_party_receives_shares() -> None:
+    primitives = _get_triples(
+        "mul",
+        nr_parties=3,
+        parties_info=PARTIES_INFO,
+        a_shape=(10, 10),
+        b_shape=(10, 10),
+        nr_instances=4,
+    )
+
+    assert [p.c_share is None for p in primitives] == [True, True, False]
+    assert primitives[-1].c_share.shape == (4, 10, 10)
+    # a seed party sends a fraction of what the correction party sends
+    sizes = [len(sy.serialize(p, to_bytes=True)) for p in primitives]
+    assert sizes[0] * 10 < sizes[-1]
+
+
+def test_store_holds_views_per_instance() -> None:
+    primitives = _get_triples(
+        "mul",
+        nr_parties=2,
+        parties_info=PARTIES_INFO[:2],
+        a_shape=(4,),
+        b_shape=(4,),
+        nr_instances=3,
+    )
+    store = populate(primitives[:1], (4,), (4,), 2**32)[0]
+
+    first, _, _ = store.get_primitives_from_store(
+        "beaver_mul", a_shape=(4,), b_shape=(4,), ring_size=2**32
+    )
+    second, _, _ = store.get_primitives_from_store(
+        "beaver_mul", a_shape=(4,), b_shape=(4,), ring_size=2**32
+    )
+    assert first.child.shape == (4,)
+    assert np.shares_memory(first.child.base, second.child.base)
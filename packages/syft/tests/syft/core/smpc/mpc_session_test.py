@@ -0,0 +1,96 @@
+# stdlib
+from typing import Any
+from typing import List
+
+# third party
+import pytest
+
+# syft absolute
+import syft as sy
+from syft.core.node.common.action.smpc_round_action import SMPCRoundAction
+from syft.core.tensor.smpc.mpc_session import MPCSession
+
+
+class FakeAction:
+    def __init__(self, reads: List[sy.UID], writes: List[sy.UID]) -> None:
+        self.reads = reads
+        self.writes = writes
+
+    def read_ids(self) -> List[sy.UID]:
+        return self.reads
+
+    def write_ids(self) -> List[sy.UID]:
+        return self.writes
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.address = sy.Address()
+        self.sent: List[Any] = []
+
+    def send_immediate_msg_without_reply(self, msg: Any) -> None:
+        self.sent.append(msg)
+
+
+def test_independent_actions_share_a_round() -> None:
+    x, y, z, w = sy.UID(), sy.UID(), sy.UID(), sy.UID()
+    parties = [FakeClient(), FakeClient()]
+
+    with MPCSession() as session:
+        for client in parties:
+            session.record(client, FakeAction(reads=[x], writes=[z]))  # type: ignore
+            session.record(client, FakeAction(reads=[y], writes=[w]))  # type: ignore
+        assert len(session.rounds) == 1
+        assert all(client.sent == [] for client in parties)
+
+    for client in parties:
+        assert len(client.sent) == 1
+        assert isinstance(client.sent[0], SMPCRoundAction)
+        assert len(client.sent[0].actions) == 2
+    assert session.nr_actions == 4
+    assert session.nr_messages == 2
+    assert MPCSession.current() is None
+
+
+def test_dependent_actions_are_sent_in_order() -> None:
+    x, y, z, w = sy.UID(), sy.UID(), sy.UID(), sy.UID()
+    client = FakeClient()
+
+    with MPCSession() as session:
+        first = FakeAction(reads=[x], writes=[y])
+        second = FakeAction(reads=[y], writes=[z])
+        independent = FakeAction(reads=[x], writes=[w])
+        third = FakeAction(reads=[z, w], writes=[x])
+        for action in [first, second, independent, third]:
+            session.record(client, action)  # type: ignore
+
+    assert [msg.actions for msg in client.sent] == [
+        [first, independent],
+        [second],
+        [third],
+    ]
+
+
+def test_flush_current_sends_the_pending_rounds() -> None:
+    client = FakeClient()
+
+    MPCSession.flush_current()
+    with MPCSession() as session:
+        session.record(client, FakeAction(reads=[], writes=[sy.UID()]))  # type: ignore
+        MPCSession.flush_current()
+        assert len(client.sent) == 1
+        assert session.rounds == []
+
+    assert len(client.sent) == 1
+
+
+def test_session_is_not_flushed_on_error() -> None:
+    client = FakeClient()
+
+    with pytest.raises(ValueError):
+        with MPCSession() as session:
+            session.record(client, FakeAction(reads=[], writes=[]))  # type: ignore
+            raise ValueError
+
+    assert client.sent == []
+    assert MPCSession.current() is None
@@ -0,0 +1,132 @@
+# stdlib
+import time
+from types import SimpleNamespace
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# third party
+import pytest
+
+# syft absolute
+from syft.core.smpc.store import CryptoPrimitiveProvider
+from syft.core.smpc.store import PreprocessingPool
+
+
+class FakeParty:
+    def __init__(self, party_id: int) -> None:
+        self.id = party_id
+        self.received: List[Any] = []
+        # the number of primitives the party reports, len(received) if None
+        self.held: Optional[int] = None
+        share_tensor = SimpleNamespace(
+            populate_store=self.populate_store, count_primitives=self.count_primitives
+        )
+        self.syft = SimpleNamespace(
+            core=SimpleNamespace(
+                tensor=SimpleNamespace(smpc=SimpleNamespace(share_tensor=share_tensor))
+            )
+        )
+
+    def populate_store(self, op_str: str, primitives: Any, **kwargs: Any) -> None:
+        self.received.extend(primitives)
+
+    def count_primitives(self, config_key: str) -> Any:
+        held = len(self.received) if self.held is None else self.held
+        return SimpleNamespace(get=lambda: held)
+
+
+@pytest.fixture
+def generated(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    generated: List[int] = []
+
+    def generator(nr_instances: int, nr_parties: int, **kwargs: Any) -> List[Any]:
+        generated.append(nr_instances)
+        return [list(range(nr_instances)) for _ in range(nr_parties)]
+
+    monkeypatch.setitem(CryptoPrimitiveProvider._func_providers, "fake", generator)
+    return generated
+
+
+def wait_for_refill(pool: PreprocessingPool) -> None:
+    for _ in range(100):
+        if not any(p.refilling for p in pool._pools.values()):
+            return
+        time.sleep(0.01)
+
+
+def request(pool: PreprocessingPool, parties: List[FakeParty], n: int = 1) -> None:
+    kwargs: Dict[str, Any] = {"a_shape": (2,), "b_shape": (2,)}
+    pool.get_primitives(
+        "fake", parties=parties, g_kwargs=kwargs, p_kwargs=kwargs, nr_instances=n
+    )
+
+
+def test_pool_refills_in_background(generated: List[int]) -> None:
+    parties = [FakeParty(0), FakeParty(1)]
+    pool = PreprocessingPool()
+
+    # a single request is no demand to generate primitives ahead of
+    request(pool, parties)
+    wait_for_refill(pool)
+    assert generated == [1]
+
+    # the second one misses too and refills the pool up to the demand
+    request(pool, parties)
+    wait_for_refill(pool)
+    assert generated == [1, 1, 2]
+    assert pool.levels() == {"fake_(2,)_(2,)_4294967296": 2}
+
+    # requests above the low watermark are served from the pool
+    request(pool, parties)
+    assert generated == [1, 1, 2]
+
+    request(pool, parties)
+    wait_for_refill(pool)
+    assert generated == [1, 1, 2, 4]
+    assert all(len(party.received) == 8 for party in parties)
+
+    metrics = list(pool.metrics().values())[0]
+    assert metrics["requested"] == 4
+    assert metrics["misses"] == 2
+
+
+def test_pool_follows_demand(generated: List[int]) -> None:
+    parties = [FakeParty(0), FakeParty(1)]
+    pool = PreprocessingPool()
+
+    request(pool, parties, n=64)
+    wait_for_refill(pool)
+    assert generated == [64, 64]
+    metrics = list(pool.metrics().values())[0]
+    assert metrics["high_watermark"] == 64
+    assert metrics["low_watermark"] == 32
+
+
+def test_pool_resyncs_with_the_parties(generated: List[int]) -> None:
+    parties = [FakeParty(0), FakeParty(1)]
+    pool = PreprocessingPool()
+    request(pool, parties, n=64)
+    wait_for_refill(pool)
+
+    # a party lost its primitives, so the refill starts from an empty store
+    parties[1].held = 0
+    request(pool, parties, n=40)
+    wait_for_refill(pool)
+    assert generated == [64, 64, 104]
+
+    metrics = list(pool.metrics().values())[0]
+    assert metrics["level"] == 104
+    assert metrics["resyncs"] == 1
+
+
+def test_idle_pools_are_forgotten(generated: List[int]) -> None:
+    pool = PreprocessingPool(demand_window=0.05)
+    request(pool, [FakeParty(0), FakeParty(1)])
+    assert len(pool._pools) == 1
+
+    time.sleep(0.1)
+    request(pool, [FakeParty(2), FakeParty(3)])
+    assert len(pool._pools) == 1
+    assert generated == [1, 1]
@@ -0,0 +1,34 @@
+# stdlib
+import threading
+
+# syft absolute
+from syft.core.common.uid import UID
+from syft.core.store.key_notifier import KeyNotifier
+
+
+def test_notify_wakes_up_watches_of_the_key() -> None:
+    notifier = KeyNotifier()
+    key, other_key = UID(), UID()
+
+    with notifier.watch(keys=[key]) as key_watch:
+        notifier.notify(keys=[other_key])
+        assert key_watch.wait(timeout=0) is False
+
+        timer = threading.Timer(0.1, notifier.notify, kwargs={"keys": [key]})
+        timer.start()
+        assert key_watch.wait(timeout=10) is True
+        timer.join()
+        # waking up resets the watch
+        assert key_watch.wait(timeout=0) is False
+
+    # closed watches are forgotten
+    assert notifier._watches == {}
+
+
+def test_notify_before_wait_is_not_lost() -> None:
+    notifier = KeyNotifier()
+    key = UID()
+
+    with notifier.watch(keys=[key]) as key_watch:
+        notifier.notify(keys=[key])
+        assert key_watch.wait(timeout=0) is True
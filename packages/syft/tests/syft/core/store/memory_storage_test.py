@@ -166,3 +166,28 @@ def test_str() -> None:
         + r"{12}>, <Storable: tensor\(\[1\., 2\., 3\., 4\.\]\)>\)\]\)$"
     )
     assert store_regex.match(str(store))
+
+
+def test_bulk_operations() -> None:
+    """Tests that set_many, get_many and delete_many behave like their
+    single key counterparts."""
+
+    store = MemoryStore()
+    id1, obj1 = generate_id_obj(
+        data=th.Tensor([1, 2, 3, 4]),
+        description="Dummy tensor",
+        tags=["dummy", "tensor"],
+    )
+    id2, obj2 = generate_id_obj(
+        data=th.Tensor([1, 2, 3]),
+        description="Another dummy tensor",
+        tags=["another", "dummy", "tensor"],
+    )
+    missing = UID()
+
+    store.set_many({id1: obj1, id2: obj2})
+    assert store.get_many([id2, missing, id1]) == [obj2, None, obj1]
+
+    store.delete_many([id1, missing])
+    assert store.get_many([id1, id2]) == [None, obj2]
+    assert len(store) == 1
@@ -855,3 +855,74 @@ def test_squeeze(gamma_tensor_min: IGT) -> None:
         target = gamma_tensor_min._values().squeeze()
         output = gamma_tensor_min.squeeze()
         assert (target == output._values()).all()
+
+
+def test_vectorized_polynomials(ishan: Entity, traskmaster: Entity) -> None:
+    """Test that values, bounds and entities match the symbolic scalars"""
+    vsm = ScalarManager()
+    a = vsm.get_symbol(min_val=-2, value=3, max_val=5, entity=ishan)
+    b = vsm.get_symbol(min_val=0, value=1, max_val=4, entity=traskmaster)
+    c = vsm.get_symbol(min_val=1, value=2, max_val=3, entity=ishan)
+
+    # composite terms contribute each of their prime factors
+    terms = np.array([[[a, b], [a * b, c]], [[a * a, b], [c, c]]])
+    coeffs = np.array([[[2, -3], [1, 4]], [[-1, 2], [5, 0]]])
+    bias = np.array([[1, 0], [-2, 7]])
+    tensor = IGT(
+        term_tensor=terms, coeff_tensor=coeffs, bias_tensor=bias, scalar_manager=vsm
+    )
+
+    symbols = vsm.prime2symbol
+    expected = []
+    for poly_terms, poly_coeffs, poly_bias in zip(
+        terms.reshape(-1, 2), coeffs.reshape(-1, 2), bias.reshape(-1)
+    ):
+        scalar = poly_bias
+        for term, coeff in zip(poly_terms, poly_coeffs):
+            for prime in [a, b, c]:
+                n_times = 0
+                while term % prime == 0:
+                    term //= prime
+                    n_times += 1
+                if n_times > 0:
+                    scalar = scalar + symbols[prime] * n_times * coeff
+        expected.append(scalar)
+
+    assert tensor._values().shape == (2, 2)
+    assert np.allclose(tensor._values().flatten(), [s.value for s in expected])
+    assert np.allclose(tensor._min_values().flatten(), [s.min_val for s in expected])
+    assert np.allclose(tensor._max_values().flatten(), [s.max_val for s in expected])
+    assert list(tensor._entities().flatten()) == [
+        ishan + traskmaster,
+        ishan + traskmaster,
+        ishan + traskmaster,
+        DSG(ishan),
+    ]
+    assert tensor.unique_entities == {ishan, traskmaster}
+
+    flat_scalars = tensor.flat_scalars
+    assert [s.value for s in flat_scalars] == [s.value for s in expected]
+    assert [s.min_val for s in flat_scalars] == [s.min_val for s in expected]
+    assert [s.max_val for s in flat_scalars] == [s.max_val for s in expected]
+    for scalar, expected_scalar in zip(flat_scalars, expected):
+        assert set(scalar.input_scalars) == set(expected_scalar.input_scalars)
+
+
+def test_scalar_cache(gamma_tensor_min: IGT) -> None:
+    """Test that the scalar views are shared and dropped when the tensor changes"""
+    flat_scalars = gamma_tensor_min.flat_scalars
+    assert gamma_tensor_min.flat_scalars[0] is flat_scalars[0]
+
+    values = gamma_tensor_min._values()
+    # the accessors return copies of the cached arrays
+    gamma_tensor_min._values()[0, 0] = -1
+    assert (gamma_tensor_min._values() == values).all()
+
+    gamma_tensor_min.bias_tensor = gamma_tensor_min.bias_tensor + 1
+    assert len(gamma_tensor_min.scalar_cache) == 0
+    assert gamma_tensor_min.flat_scalars[0] is not flat_scalars[0]
+    assert (gamma_tensor_min._values() == values + 1).all()
+
+    gamma_tensor_min.set_scalar_cache_limit(1)
+    assert (gamma_tensor_min._values() == values + 1).all()
+    assert len(gamma_tensor_min.scalar_cache) == 0
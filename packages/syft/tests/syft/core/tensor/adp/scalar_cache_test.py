@@ -0,0 +1,42 @@
+# third party
+import numpy as np
+
+# syft absolute
+from syft.core.tensor.autodp.scalar_cache import ScalarCache
+from syft.core.tensor.autodp.scalar_cache import approximate_nbytes
+
+
+def test_views_are_computed_once() -> None:
+    cache = ScalarCache()
+    calls = []
+
+    def compute() -> np.ndarray:
+        calls.append(1)
+        return np.arange(10)
+
+    first = cache.get("view", compute)
+    assert cache.get("view", compute) is first
+    assert len(calls) == 1
+
+    cache.clear()
+    assert "view" not in cache
+    cache.get("view", compute)
+    assert len(calls) == 2
+
+
+def test_bounded_cache_evicts_least_recently_used() -> None:
+    view_nbytes = approximate_nbytes(np.zeros(100))
+    cache = ScalarCache(max_bytes=2 * view_nbytes)
+
+    cache.get("a", lambda: np.zeros(100))
+    cache.get("b", lambda: np.zeros(100))
+    cache.get("a", lambda: np.zeros(100))
+    cache.get("c", lambda: np.zeros(100))
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.nbytes == 2 * view_nbytes
+
+    # a view larger than the whole budget is never kept
+    cache.get("large", lambda: np.zeros(1000))
+    assert "large" not in cache
+    assert len(cache) == 2
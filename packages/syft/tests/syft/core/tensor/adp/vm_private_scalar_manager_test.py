@@ -1,7 +1,14 @@
+# third party
+import numpy as np
+import pytest
+
 # syft absolute
 import syft as sy
 from syft.core.adp.entity import Entity
+from syft.core.adp.scalar.gamma_scalar import GammaScalar
+from syft.core.adp.scalar_manager_registry import UnknownScalarManagerError
 from syft.core.adp.vm_private_scalar_manager import VirtualMachinePrivateScalarManager
+from syft.core.common.serde.scope import serde_scope
 
 
 def test_private_manager_serde() -> None:
@@ -43,3 +50,137 @@ def test_private_manager_serde() -> None:
 
     # the state is the same so the managers are the same
     assert manager_one == manager_two
+
+
+def test_bulk_symbols() -> None:
+    alice, bob = Entity("Alice"), Entity("Bob")
+    manager = VirtualMachinePrivateScalarManager()
+    single = manager.get_symbol(min_val=0, value=1, max_val=2, entity=alice)
+    primes = manager.get_symbols(
+        min_vals=np.zeros(4),
+        values=np.arange(4),
+        max_vals=10,
+        entities=[alice, bob, alice, bob],
+    )
+
+    assert len(manager) == 5
+    assert manager.entities == [alice, bob]
+    assert list(manager.prime2symbol.keys()) == [single] + primes.tolist()
+
+    min_vals, values, max_vals, entities = manager.symbol_arrays(primes[::-1])
+    assert (values == [3, 2, 1, 0]).all()
+    assert (max_vals == 10).all() and (min_vals == 0).all()
+    assert list(entities) == [bob, alice, bob, alice]
+    assert manager.symbol(primes[1]) == GammaScalar(
+        min_val=0, value=1, max_val=10, entity=bob, prime=int(primes[1])
+    )
+
+    manager_de = sy.deserialize(sy.serialize(manager, to_bytes=True), from_bytes=True)
+    assert manager_de == manager
+    assert hash(manager_de) == hash(manager)
+    assert manager_de.index == manager.index
+
+    with pytest.raises(KeyError):
+        manager.symbol_arrays(np.array([4]))
+
+
+def test_combine_renames_colliding_primes() -> None:
+    alice, bob = Entity("Alice"), Entity("Bob")
+    manager_one = VirtualMachinePrivateScalarManager()
+    manager_one.get_symbols(min_vals=0, values=np.arange(3), max_vals=5, entities=alice)
+    manager_two = VirtualMachinePrivateScalarManager()
+    manager_two.get_symbols(min_vals=0, values=np.arange(2), max_vals=5, entities=bob)
+
+    combined = manager_one.copy()
+    combined.combine_(manager_two)
+
+    assert manager_one.primes_allocated == [2, 3, 5]
+    assert len(combined) == 5
+    assert len(set(combined.primes_allocated)) == 5
+    assert set(manager_two.primes_allocated) <= set(combined.primes_allocated)
+    for prime in manager_two.primes_allocated:
+        assert combined.symbol(prime).entity == bob
+        assert combined.symbol(prime) == manager_two.symbol(prime)
+
+
+def columns(manager: VirtualMachinePrivateScalarManager) -> list:
+    return [manager.primes, manager.values, manager.entity_index, manager.entities]
+
+
+def assert_same_symbols(
+    a: VirtualMachinePrivateScalarManager, b: VirtualMachinePrivateScalarManager
+) -> None:
+    for column_a, column_b in zip(columns(a), columns(b)):
+        assert np.array_equal(column_a, column_b)
+
+
+def test_managers_shared_in_a_message_are_written_once() -> None:
+    manager = VirtualMachinePrivateScalarManager()
+    manager.get_symbols(
+        min_vals=0, values=np.arange(100), max_vals=5, entities=Entity()
+    )
+    result = manager.copy()
+    result.get_symbols(min_vals=0, values=np.arange(2), max_vals=5, entities=Entity())
+
+    full_size = len(sy.serialize(result, to_bytes=True))
+    with serde_scope():
+        blobs = [sy.serialize(m, to_bytes=True) for m in [manager, result, manager]]
+    # only the appended symbols of the copy are written, and nothing for a repeat
+    assert len(blobs[1]) < full_size / 4
+    assert len(blobs[2]) < full_size / 4
+
+    # the message is read back in a scope of its own
+    with serde_scope():
+        received = [sy.deserialize(blob, from_bytes=True) for blob in blobs]
+    assert_same_symbols(received[0], manager)
+    assert_same_symbols(received[1], result)
+    assert_same_symbols(received[2], manager)
+
+
+def test_messages_carry_whole_managers() -> None:
+    manager = VirtualMachinePrivateScalarManager()
+    manager.get_symbols(
+        min_vals=0, values=np.arange(100), max_vals=5, entities=Entity()
+    )
+    with serde_scope():
+        first = sy.serialize(manager, to_bytes=True)
+
+    # nothing acknowledges the first message, so the next one doesn't rely on it
+    manager.get_symbols(min_vals=0, values=1, max_vals=5, entities=Entity())
+    with serde_scope():
+        second = sy.serialize(manager, to_bytes=True)
+    assert len(second) > len(first)
+
+    with serde_scope():
+        received = sy.deserialize(second, from_bytes=True)
+    assert_same_symbols(received, manager)
+
+
+def test_unknown_reference() -> None:
+    manager = VirtualMachinePrivateScalarManager()
+    manager.get_symbols(min_vals=0, values=np.arange(10), max_vals=5, entities=Entity())
+    with serde_scope():
+        sy.serialize(manager, to_bytes=True)
+        blob = sy.serialize(manager.copy(), to_bytes=True)
+
+    with pytest.raises(UnknownScalarManagerError):
+        sy.deserialize(blob, from_bytes=True)
+
+
+def test_references_resolve_to_their_generation() -> None:
+    manager = VirtualMachinePrivateScalarManager()
+    manager.get_symbols(min_vals=0, values=np.arange(10), max_vals=5, entities=Entity())
+    with serde_scope():
+        blobs = [sy.serialize(manager, to_bytes=True)]
+        other = VirtualMachinePrivateScalarManager()
+        other.get_symbol(min_val=0, value=1, max_val=5, entity=Entity())
+        other.combine_(manager)
+        assert manager.generation == 1
+        # the new generation is written in full, next to the old one
+        blobs.append(sy.serialize(manager, to_bytes=True))
+        blobs.append(sy.serialize(manager.copy(), to_bytes=True))
+
+    with serde_scope():
+        received = [sy.deserialize(blob, from_bytes=True) for blob in blobs]
+    assert_same_symbols(received[1], manager)
+    assert_same_symbols(received[2], manager)